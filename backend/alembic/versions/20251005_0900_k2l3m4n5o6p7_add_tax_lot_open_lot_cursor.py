@@ -0,0 +1,69 @@
+"""add tax lot open-lot cursor
+
+Revision ID: k2l3m4n5o6p7
+Revises: 20251004_0900
+Create Date: 2025-10-05 09:00:00.000000
+
+Adds an open-lot queue to tax_lots so FIFO sales only touch the lots they consume.
+
+Changes to tax_lots:
+- remaining_quantity: NUMERIC(15,4) - quantity not yet matched against a disposal
+- check_tax_lot_non_negative_remaining_quantity: remaining_quantity >= 0
+- idx_tax_lot_open_fifo: partial index on (holding_id, purchase_date, created_at)
+  WHERE remaining_quantity > 0
+
+Backfill:
+- Lots never disposed: remaining_quantity = quantity
+- Lots with a disposal: remaining_quantity = quantity - disposal_quantity (floored at 0)
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'k2l3m4n5o6p7'
+down_revision = '20251004_0900'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add remaining_quantity cursor, backfill it and index open lots."""
+    op.add_column(
+        'tax_lots',
+        sa.Column('remaining_quantity', sa.Numeric(15, 4), nullable=True)
+    )
+
+    op.execute(
+        """
+        UPDATE tax_lots
+        SET remaining_quantity = CASE
+            WHEN disposal_date IS NULL THEN quantity
+            WHEN quantity - COALESCE(disposal_quantity, quantity) > 0
+                THEN quantity - COALESCE(disposal_quantity, quantity)
+            ELSE 0
+        END
+        """
+    )
+
+    op.alter_column('tax_lots', 'remaining_quantity', nullable=False)
+
+    op.create_check_constraint(
+        'check_tax_lot_non_negative_remaining_quantity',
+        'tax_lots',
+        'remaining_quantity >= 0'
+    )
+
+    op.create_index(
+        'idx_tax_lot_open_fifo',
+        'tax_lots',
+        ['holding_id', 'purchase_date', 'created_at'],
+        postgresql_where=sa.text('remaining_quantity > 0')
+    )
+
+
+def downgrade() -> None:
+    """Remove open-lot cursor and index."""
+    op.drop_index('idx_tax_lot_open_fifo', table_name='tax_lots')
+    op.drop_constraint('check_tax_lot_non_negative_remaining_quantity', 'tax_lots', type_='check')
+    op.drop_column('tax_lots', 'remaining_quantity')
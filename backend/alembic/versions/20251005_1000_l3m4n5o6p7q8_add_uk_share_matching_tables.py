@@ -0,0 +1,110 @@
+"""add uk share matching tables
+
+Revision ID: l3m4n5o6p7q8
+Revises: k2l3m4n5o6p7
+Create Date: 2025-10-05 10:00:00.000000
+
+Supports UK CGT share identification (same-day, 30-day, Section 104 pool).
+
+New Table: share_matches
+- One row per rule applied to a realized disposal
+- acquisition_date identifies the matched acquisition day (NULL for pool matches)
+- Indexed by (holding_id, disposal_date) and (holding_id, acquisition_date)
+  for incremental re-matching after back-dated trades
+
+New Table: section_104_pool_snapshots
+- Pool quantity and cost per holding at the end of each transaction date
+- Unique per (holding_id, snapshot_date)
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic
+revision = 'l3m4n5o6p7q8'
+down_revision = 'k2l3m4n5o6p7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create share matching tables."""
+    matching_rule_enum = postgresql.ENUM(
+        'SAME_DAY', 'BED_AND_BREAKFAST', 'SECTION_104',
+        name='matching_rule_enum',
+        create_type=True
+    )
+    matching_rule_enum.create(op.get_bind(), checkfirst=True)
+
+    op.create_table(
+        'share_matches',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column('holding_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('capital_gain_id', postgresql.UUID(as_uuid=True), nullable=False),
+
+        # Match Details
+        sa.Column('disposal_date', sa.Date(), nullable=False),
+        sa.Column(
+            'matching_rule',
+            postgresql.ENUM(name='matching_rule_enum', create_type=False),
+            nullable=False
+        ),
+        sa.Column('acquisition_date', sa.Date(), nullable=True),
+        sa.Column('quantity', sa.Numeric(precision=15, scale=4), nullable=False),
+        sa.Column('allowable_cost', sa.Numeric(precision=15, scale=2), nullable=False),
+
+        # Timestamp
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+
+        # Foreign Keys
+        sa.ForeignKeyConstraint(['holding_id'], ['investment_holdings.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['capital_gain_id'], ['capital_gains_realized.id'], ondelete='CASCADE'),
+
+        # Check Constraints
+        sa.CheckConstraint('quantity > 0', name='check_share_match_positive_quantity'),
+        sa.CheckConstraint('allowable_cost >= 0', name='check_share_match_non_negative_cost'),
+    )
+
+    op.create_index('ix_share_matches_holding_id', 'share_matches', ['holding_id'])
+    op.create_index('ix_share_matches_capital_gain_id', 'share_matches', ['capital_gain_id'])
+    op.create_index('idx_share_match_holding_disposal_date', 'share_matches', ['holding_id', 'disposal_date'])
+    op.create_index('idx_share_match_holding_acquisition_date', 'share_matches', ['holding_id', 'acquisition_date'])
+
+    op.create_table(
+        'section_104_pool_snapshots',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column('holding_id', postgresql.UUID(as_uuid=True), nullable=False),
+
+        # Pool State
+        sa.Column('snapshot_date', sa.Date(), nullable=False),
+        sa.Column('pool_quantity', sa.Numeric(precision=15, scale=4), nullable=False),
+        sa.Column('pool_cost', sa.Numeric(precision=15, scale=2), nullable=False),
+
+        # Timestamp
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+
+        # Foreign Keys
+        sa.ForeignKeyConstraint(['holding_id'], ['investment_holdings.id'], ondelete='CASCADE'),
+
+        # Constraints
+        sa.CheckConstraint('pool_quantity >= 0', name='check_pool_snapshot_non_negative_quantity'),
+        sa.CheckConstraint('pool_cost >= 0', name='check_pool_snapshot_non_negative_cost'),
+        sa.UniqueConstraint('holding_id', 'snapshot_date', name='uq_pool_snapshot_holding_date'),
+    )
+
+    op.create_index('ix_section_104_pool_snapshots_holding_id', 'section_104_pool_snapshots', ['holding_id'])
+
+
+def downgrade() -> None:
+    """Drop share matching tables."""
+    op.drop_index('ix_section_104_pool_snapshots_holding_id', table_name='section_104_pool_snapshots')
+    op.drop_table('section_104_pool_snapshots')
+
+    op.drop_index('idx_share_match_holding_acquisition_date', table_name='share_matches')
+    op.drop_index('idx_share_match_holding_disposal_date', table_name='share_matches')
+    op.drop_index('ix_share_matches_capital_gain_id', table_name='share_matches')
+    op.drop_index('ix_share_matches_holding_id', table_name='share_matches')
+    op.drop_table('share_matches')
+
+    postgresql.ENUM(name='matching_rule_enum').drop(op.get_bind(), checkfirst=True)
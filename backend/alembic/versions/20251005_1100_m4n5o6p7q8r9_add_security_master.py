@@ -0,0 +1,107 @@
+"""add security master
+
+Revision ID: m4n5o6p7q8r9
+Revises: l3m4n5o6p7q8
+Create Date: 2025-10-05 11:00:00.000000
+
+Shares the latest market price across holdings of the same security so that
+repricing writes one row per security instead of one row per holding.
+
+New Table: securities
+- One row per listing, unique on (ticker, exchange); '' = unspecified exchange
+- current_price is NULL until the first price is received
+
+Modified Table: investment_holdings
+- security_id: Nullable FK to securities (ON DELETE SET NULL)
+
+Backfill:
+- One security per distinct upper-cased holding ticker (exchange '')
+- Price taken from the most recently priced non-deleted holding of that ticker
+- Holdings linked to their security
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic
+revision = 'm4n5o6p7q8r9'
+down_revision = 'l3m4n5o6p7q8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create securities table and link holdings to it."""
+    op.create_table(
+        'securities',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+
+        # Identification
+        sa.Column('ticker', sa.String(length=20), nullable=False),
+        sa.Column('exchange', sa.String(length=20), nullable=False, server_default=''),
+        sa.Column('isin', sa.String(length=12), nullable=True),
+        sa.Column('security_name', sa.String(length=255), nullable=True),
+
+        # Latest Price
+        sa.Column('current_price', sa.Numeric(precision=15, scale=4), nullable=True),
+        sa.Column('price_currency', sa.String(length=3), nullable=True),
+        sa.Column('last_price_update', sa.DateTime(), nullable=True),
+
+        # Timestamps
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+
+        # Constraints
+        sa.CheckConstraint('current_price >= 0', name='check_security_non_negative_price'),
+        sa.UniqueConstraint('ticker', 'exchange', name='uq_security_ticker_exchange'),
+    )
+
+    op.add_column(
+        'investment_holdings',
+        sa.Column('security_id', postgresql.UUID(as_uuid=True), nullable=True)
+    )
+    op.create_foreign_key(
+        'fk_investment_holdings_security_id',
+        'investment_holdings', 'securities',
+        ['security_id'], ['id'],
+        ondelete='SET NULL'
+    )
+    op.create_index('ix_investment_holdings_security_id', 'investment_holdings', ['security_id'])
+
+    # Backfill one security per ticker, priced from its most recent holding price
+    op.execute("""
+        INSERT INTO securities (
+            id, ticker, exchange, isin, security_name, current_price,
+            price_currency, last_price_update, created_at, updated_at
+        )
+        SELECT DISTINCT ON (UPPER(TRIM(ticker)))
+            gen_random_uuid(), UPPER(TRIM(ticker)), '', isin, security_name,
+            current_price, purchase_currency, last_price_update, NOW(), NOW()
+        FROM investment_holdings
+        WHERE ticker IS NOT NULL AND TRIM(ticker) <> '' AND deleted = false
+        ORDER BY UPPER(TRIM(ticker)), last_price_update DESC NULLS LAST, updated_at DESC
+    """)
+
+    op.execute("""
+        UPDATE investment_holdings h
+        SET security_id = s.id
+        FROM securities s
+        WHERE s.ticker = UPPER(TRIM(h.ticker)) AND s.exchange = ''
+    """)
+
+
+def downgrade() -> None:
+    """Copy security prices back to holdings and drop the security master."""
+    op.execute("""
+        UPDATE investment_holdings h
+        SET current_price = s.current_price,
+            last_price_update = s.last_price_update
+        FROM securities s
+        WHERE h.security_id = s.id AND s.current_price IS NOT NULL
+    """)
+
+    op.drop_index('ix_investment_holdings_security_id', table_name='investment_holdings')
+    op.drop_constraint('fk_investment_holdings_security_id', 'investment_holdings', type_='foreignkey')
+    op.drop_column('investment_holdings', 'security_id')
+    op.drop_table('securities')
@@ -0,0 +1,103 @@
+"""add masked number suffixes
+
+Revision ID: n5o6p7q8r9s0
+Revises: m4n5o6p7q8r9
+Create Date: 2025-10-05 12:00:00.000000
+
+Stores the last 4 characters of encrypted account and policy numbers in
+plaintext so list and summary responses can show ****1234 without a Fernet
+decryption per row.
+
+Modified Tables:
+- savings_accounts: account_number_last_4 (nullable)
+- life_assurance_policies: policy_number_last_4 (nullable)
+- investment_accounts: account_number_last_4 already exists; backfilled
+  where missing
+
+Backfill:
+- Decrypts each number once (requires ENCRYPTION_KEY, but only when there
+  are rows to backfill; empty databases migrate without it)
+- Rows that cannot be decrypted keep NULL and display as ****
+"""
+
+import os
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'n5o6p7q8r9s0'
+down_revision = 'm4n5o6p7q8r9'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+# (table, encrypted column, suffix column)
+MASKED_COLUMNS = [
+    ('savings_accounts', 'account_number_encrypted', 'account_number_last_4'),
+    ('investment_accounts', 'account_number_encrypted', 'account_number_last_4'),
+    ('life_assurance_policies', 'policy_number_encrypted', 'policy_number_last_4'),
+]
+
+
+def _pending_rows(table: str, encrypted_column: str, suffix_column: str) -> list:
+    """Rows with an encrypted number but no stored suffix."""
+    return op.get_bind().execute(sa.text(
+        f"SELECT id, {encrypted_column} FROM {table} "
+        f"WHERE {suffix_column} IS NULL AND {encrypted_column} IS NOT NULL"
+    )).fetchall()
+
+
+def _backfill(table: str, suffix_column: str, rows: list) -> None:
+    """Fill missing suffixes by decrypting each row once, in batches."""
+    # Imported here so databases with nothing to backfill don't load app code
+    from utils.encryption import decrypt_value, masked_suffix
+
+    connection = op.get_bind()
+    update = sa.text(f"UPDATE {table} SET {suffix_column} = :suffix WHERE id = :id")
+    batch = []
+    for row_id, encrypted in rows:
+        try:
+            batch.append({'id': row_id, 'suffix': masked_suffix(decrypt_value(encrypted))})
+        except (TypeError, ValueError):
+            continue
+
+        if len(batch) >= BATCH_SIZE:
+            connection.execute(update, batch)
+            batch = []
+
+    if batch:
+        connection.execute(update, batch)
+
+
+def upgrade() -> None:
+    """Add masked suffix columns and backfill them."""
+    op.add_column(
+        'savings_accounts',
+        sa.Column('account_number_last_4', sa.String(length=4), nullable=True)
+    )
+    op.add_column(
+        'life_assurance_policies',
+        sa.Column('policy_number_last_4', sa.String(length=4), nullable=True)
+    )
+
+    pending = [
+        (table, suffix_column, _pending_rows(table, encrypted_column, suffix_column))
+        for table, encrypted_column, suffix_column in MASKED_COLUMNS
+    ]
+    if not any(rows for _, _, rows in pending):
+        return
+
+    if not os.getenv('ENCRYPTION_KEY'):
+        raise RuntimeError("ENCRYPTION_KEY must be set to backfill masked number suffixes")
+
+    for table, suffix_column, rows in pending:
+        if rows:
+            _backfill(table, suffix_column, rows)
+
+
+def downgrade() -> None:
+    """Drop the added suffix columns (investment_accounts keeps its column)."""
+    op.drop_column('life_assurance_policies', 'policy_number_last_4')
+    op.drop_column('savings_accounts', 'account_number_last_4')
@@ -0,0 +1,123 @@
+"""add user behavior daily aggregates
+
+Revision ID: o6p7q8r9s0t1
+Revises: n5o6p7q8r9s0
+Create Date: 2025-10-05 13:00:00.000000
+
+Per-user daily behavior counters, maintained as behavior events are written,
+so behavior analysis reads one row per day instead of every raw event.
+
+New Table: user_behavior_daily
+- One row per user per UTC day, unique on (user_id, activity_date)
+- total_actions, page_views {page: count}, feature_uses {feature: count},
+  hourly_actions (24 counts per UTC hour)
+
+Backfill:
+- Aggregates existing user_behavior rows, streamed in timestamp order
+"""
+
+import json
+import uuid
+from collections import Counter
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic
+revision = 'o6p7q8r9s0t1'
+down_revision = 'n5o6p7q8r9s0'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+
+def _backfill() -> None:
+    """Aggregate existing behavior rows into daily counters."""
+    connection = op.get_bind()
+    rows = connection.execution_options(stream_results=True).execute(sa.text(
+        "SELECT user_id, action_type, action_context, timestamp FROM user_behavior"
+    ))
+
+    summaries = {}
+    for user_id, action_type, action_context, timestamp in rows:
+        summary = summaries.setdefault((user_id, timestamp.date()), {
+            'total_actions': 0,
+            'page_views': Counter(),
+            'feature_uses': Counter(),
+            'hourly_actions': [0] * 24
+        })
+        summary['total_actions'] += 1
+        summary['hourly_actions'][timestamp.hour] += 1
+
+        if action_type not in ('PAGE_VIEW', 'FEATURE_USAGE'):
+            continue
+        try:
+            context = json.loads(action_context)
+        except (TypeError, ValueError):
+            continue
+        if not isinstance(context, dict):
+            continue
+        if action_type == 'PAGE_VIEW' and 'page' in context:
+            summary['page_views'][str(context['page'])] += 1
+        elif action_type == 'FEATURE_USAGE' and 'feature' in context:
+            summary['feature_uses'][str(context['feature'])] += 1
+
+    insert = sa.text("""
+        INSERT INTO user_behavior_daily (
+            id, user_id, activity_date, total_actions, page_views,
+            feature_uses, hourly_actions, updated_at
+        ) VALUES (
+            :id, :user_id, :activity_date, :total_actions, CAST(:page_views AS JSON),
+            CAST(:feature_uses AS JSON), CAST(:hourly_actions AS JSON), NOW()
+        )
+    """)
+    batch = []
+    for (user_id, activity_date), summary in summaries.items():
+        batch.append({
+            'id': uuid.uuid4(),
+            'user_id': user_id,
+            'activity_date': activity_date,
+            'total_actions': summary['total_actions'],
+            'page_views': json.dumps(summary['page_views']),
+            'feature_uses': json.dumps(summary['feature_uses']),
+            'hourly_actions': json.dumps(summary['hourly_actions'])
+        })
+        if len(batch) >= BATCH_SIZE:
+            connection.execute(insert, batch)
+            batch = []
+
+    if batch:
+        connection.execute(insert, batch)
+
+
+def upgrade() -> None:
+    """Create user_behavior_daily and backfill it from user_behavior."""
+    op.create_table(
+        'user_behavior_daily',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('activity_date', sa.Date(), nullable=False),
+
+        # Counters
+        sa.Column('total_actions', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('page_views', sa.JSON(), nullable=False),
+        sa.Column('feature_uses', sa.JSON(), nullable=False),
+        sa.Column('hourly_actions', sa.JSON(), nullable=False),
+
+        # Timestamps
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+
+        # Constraints
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.UniqueConstraint('user_id', 'activity_date', name='uq_user_behavior_daily_user_date'),
+        sa.CheckConstraint('total_actions >= 0', name='check_behavior_daily_non_negative_total'),
+    )
+
+    _backfill()
+
+
+def downgrade() -> None:
+    """Drop user_behavior_daily (raw user_behavior rows are untouched)."""
+    op.drop_table('user_behavior_daily')
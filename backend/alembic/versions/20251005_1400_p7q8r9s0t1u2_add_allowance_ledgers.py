@@ -0,0 +1,79 @@
+"""add ISA/TFSA allowance ledgers
+
+Revision ID: p7q8r9s0t1u2
+Revises: o6p7q8r9s0t1
+Create Date: 2025-10-05 14:00:00.000000
+
+Per-user, per-tax-year running totals of ISA and TFSA contributions, so
+allowance checks read one row instead of summing contributions.
+
+New Tables:
+- isa_allowance_ledgers: PK (user_id, tax_year); used, contribution_count
+- tfsa_allowance_ledgers: PK (user_id, tax_year); annual_used,
+  lifetime_used (user's all-time total, same on each of the user's rows),
+  contribution_count
+
+Backfill:
+- Aggregates existing isa_contributions / tfsa_contributions
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic
+revision = 'p7q8r9s0t1u2'
+down_revision = 'o6p7q8r9s0t1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create allowance ledgers and backfill them from contributions."""
+    op.create_table(
+        'isa_allowance_ledgers',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('tax_year', sa.String(7), nullable=False),
+        sa.Column('used', sa.Numeric(12, 2), nullable=False, server_default='0'),
+        sa.Column('contribution_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint('user_id', 'tax_year'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    )
+
+    op.create_table(
+        'tfsa_allowance_ledgers',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('tax_year', sa.String(7), nullable=False),
+        sa.Column('annual_used', sa.Numeric(12, 2), nullable=False, server_default='0'),
+        sa.Column('lifetime_used', sa.Numeric(12, 2), nullable=False, server_default='0'),
+        sa.Column('contribution_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint('user_id', 'tax_year'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    )
+
+    op.execute("""
+        INSERT INTO isa_allowance_ledgers (user_id, tax_year, used, contribution_count, updated_at)
+        SELECT user_id, tax_year, SUM(contribution_amount), COUNT(*), NOW()
+        FROM isa_contributions
+        GROUP BY user_id, tax_year
+    """)
+
+    op.execute("""
+        INSERT INTO tfsa_allowance_ledgers (
+            user_id, tax_year, annual_used, lifetime_used, contribution_count, updated_at
+        )
+        SELECT
+            user_id, tax_year, SUM(contribution_amount),
+            SUM(SUM(contribution_amount)) OVER (PARTITION BY user_id),
+            COUNT(*), NOW()
+        FROM tfsa_contributions
+        GROUP BY user_id, tax_year
+    """)
+
+
+def downgrade() -> None:
+    """Drop allowance ledgers (contributions are untouched)."""
+    op.drop_table('tfsa_allowance_ledgers')
+    op.drop_table('isa_allowance_ledgers')
@@ -0,0 +1,58 @@
+"""add rule evaluation tracking
+
+Revision ID: q8r9s0t1u2v3
+Revises: p7q8r9s0t1u2
+Create Date: 2025-10-05 15:00:00.000000
+
+Tracks when each user's rule inputs last changed and when batch jobs last
+evaluated their rules, so recommendation/alert rules re-run only for
+changed inputs.
+
+New Tables:
+- rule_input_changes: PK (user_id, input_name); changed_at
+- rule_evaluation_states: PK (user_id, evaluator); evaluated_at, clock
+  (calendar state at evaluation, JSON text)
+
+No backfill: users without evaluation state get a full evaluation on the
+next run.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic
+revision = 'q8r9s0t1u2v3'
+down_revision = 'p7q8r9s0t1u2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create rule_input_changes and rule_evaluation_states."""
+    op.create_table(
+        'rule_input_changes',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('input_name', sa.String(50), nullable=False),
+        sa.Column('changed_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint('user_id', 'input_name'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    )
+    op.create_index('idx_rule_input_changes_changed_at', 'rule_input_changes', ['changed_at'])
+
+    op.create_table(
+        'rule_evaluation_states',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('evaluator', sa.String(50), nullable=False),
+        sa.Column('evaluated_at', sa.DateTime(), nullable=False),
+        sa.Column('clock', sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint('user_id', 'evaluator'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    )
+
+
+def downgrade() -> None:
+    """Drop rule evaluation tracking tables."""
+    op.drop_table('rule_evaluation_states')
+    op.drop_index('idx_rule_input_changes_changed_at', table_name='rule_input_changes')
+    op.drop_table('rule_input_changes')
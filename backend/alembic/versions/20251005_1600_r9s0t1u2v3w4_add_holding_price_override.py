@@ -0,0 +1,35 @@
+"""add holding price override
+
+Revision ID: r9s0t1u2v3w4
+Revises: q8r9s0t1u2v3
+Create Date: 2025-10-05 16:00:00.000000
+
+Manual price edits apply to the edited holding only instead of writing the
+shared security master price.
+
+Modified Table: investment_holdings
+- price_overridden: When true, current_price is used even if the linked
+  security is priced (default false)
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'r9s0t1u2v3w4'
+down_revision = 'q8r9s0t1u2v3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add investment_holdings.price_overridden."""
+    op.add_column(
+        'investment_holdings',
+        sa.Column('price_overridden', sa.Boolean(), nullable=False, server_default='false')
+    )
+
+
+def downgrade() -> None:
+    """Drop investment_holdings.price_overridden."""
+    op.drop_column('investment_holdings', 'price_overridden')
@@ -10,6 +10,9 @@ This module provides RESTful API for financial goal planning:
 - POST /goals/{id}/link-account - Link account to goal
 - GET /goals/overview - Goals dashboard summary
 - POST /goals/optimize - Optimize goal allocation
+- POST /goals/optimize/frontier - Optimal allocations across budgets
+- POST /goals/checks/run - Nightly linked-account sync and achievement checks
+  (internal job)
 
 Business logic:
 - SMART criteria validation (done in schemas)
@@ -20,7 +23,7 @@ Business logic:
 - Intelligent prioritization and allocation
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, func
 from typing import List, Optional
@@ -29,7 +32,7 @@ from decimal import Decimal
 import logging
 
 from database import get_db
-from middleware.auth import get_current_user
+from middleware.auth import get_current_user, require_internal_service
 from models.goal import (
     FinancialGoal, GoalMilestone, GoalRecommendation,
     GoalType, GoalPriority, GoalStatus
@@ -37,17 +40,37 @@ from models.goal import (
 from schemas.goal import (
     CreateGoalRequest, UpdateGoalRequest, GoalResponse,
     GoalSummaryResponse, CreateMilestoneRequest, MilestoneResponse,
-    RecommendationResponse, GoalStatistics
+    RecommendationResponse, GoalStatistics, GoalCheckSummary
 )
 from services.goals.goal_service import (
     get_goal_service, ValidationError, NotFoundError, GoalLimitError
 )
-from services.goals.goal_optimization_service import get_goal_optimization_service
+from services.goals.goal_optimization_service import (
+    get_goal_optimization_service, ValidationError as OptimizationValidationError
+)
+from utils.pagination import PageParams, list_count_cache, page_params, paginate
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+list_count_cache.register(FinancialGoal)
+
+# Keyset sort orders for list_goals (each ends with id for a total order)
+GOAL_SORT_ORDERS = {
+    "priority": [(FinancialGoal.priority, True), (FinancialGoal.target_date, False), (FinancialGoal.id, False)],
+    "target_date": [(FinancialGoal.target_date, False), (FinancialGoal.id, False)],
+    "created_at": [(FinancialGoal.created_at, True), (FinancialGoal.id, True)],
+}
+
+
+def _map_goal_to_summary(goal: FinancialGoal) -> GoalSummaryResponse:
+    """Map FinancialGoal model to the lightweight list response."""
+    return GoalSummaryResponse.model_validate({
+        **goal.__dict__,
+        "on_track": goal.is_on_track()
+    })
+
 
 # ============================================================================
 # GOAL CREATION AND MANAGEMENT
@@ -134,25 +157,31 @@ async def create_goal(
 
 @router.get("", response_model=List[GoalSummaryResponse])
 async def list_goals(
+    response: Response,
     current_user_id: str = Depends(get_current_user),
     goal_type: Optional[GoalType] = Query(None, description="Filter by goal type"),
     status_filter: Optional[GoalStatus] = Query(None, alias="status", description="Filter by status"),
     priority: Optional[GoalPriority] = Query(None, description="Filter by priority"),
     sort_by: str = Query("priority", description="Sort by: priority, target_date, created_at"),
+    page: PageParams = Depends(page_params()),
     db: AsyncSession = Depends(get_db)
 ):
     """
     List all goals for the authenticated user with filtering and sorting.
 
     Retrieves user's financial goals with optional filtering by type, status, and priority.
-    Results can be sorted by priority, target date, or creation date.
+    Results can be sorted by priority, target date, or creation date, and
+    paged with limit/cursor (cursors are tied to the sort order) or
+    projected with fields (see utils/pagination.py).
 
     Args:
+        response: Response (for paging headers)
         current_user_id: Authenticated user ID
         goal_type: Optional filter by goal type
         status_filter: Optional filter by status
         priority: Optional filter by priority
         sort_by: Sort field (priority, target_date, created_at)
+        page: Pagination and projection parameters
         db: Database session
 
     Returns:
@@ -163,55 +192,37 @@ async def list_goals(
         500: Internal server error
     """
     try:
-        # Build query
-        query = select(FinancialGoal).where(
-            and_(
-                FinancialGoal.user_id == UUID(current_user_id),
-                FinancialGoal.deleted_at.is_(None)
-            )
-        )
-
-        # Apply filters
+        # Build filters
+        conditions = [
+            FinancialGoal.user_id == UUID(current_user_id),
+            FinancialGoal.deleted_at.is_(None)
+        ]
         if goal_type:
-            query = query.where(FinancialGoal.goal_type == goal_type)
+            conditions.append(FinancialGoal.goal_type == goal_type)
         if status_filter:
-            query = query.where(FinancialGoal.status == status_filter)
+            conditions.append(FinancialGoal.status == status_filter)
         if priority:
-            query = query.where(FinancialGoal.priority == priority)
-
-        # Apply sorting
-        if sort_by == "target_date":
-            query = query.order_by(FinancialGoal.target_date.asc())
-        elif sort_by == "created_at":
-            query = query.order_by(FinancialGoal.created_at.desc())
-        else:  # priority (default)
-            # Sort by priority (HIGH -> MEDIUM -> LOW), then target_date
-            query = query.order_by(
-                FinancialGoal.priority.desc(),
-                FinancialGoal.target_date.asc()
-            )
-
-        # Execute query
-        result = await db.execute(query)
-        goals = result.scalars().all()
+            conditions.append(FinancialGoal.priority == priority)
 
-        # Map to summary responses
-        responses = []
-        for goal in goals:
-            goal_dict = {
-                **goal.__dict__,
-                "on_track": goal.is_on_track()
-            }
-            response = GoalSummaryResponse.model_validate(goal_dict)
-            responses.append(response)
+        # Sort by priority (HIGH -> MEDIUM -> LOW), then target_date, unless requested otherwise
+        goals_page = await paginate(
+            db, FinancialGoal, conditions,
+            order_by=GOAL_SORT_ORDERS.get(sort_by, GOAL_SORT_ORDERS["priority"]),
+            page=page,
+            user_id=UUID(current_user_id),
+            schema=GoalSummaryResponse,
+            map_item=_map_goal_to_summary
+        )
 
         logger.info(
-            f"Retrieved {len(responses)} goals for user {current_user_id} "
+            f"Retrieved {len(goals_page.items)} goals for user {current_user_id} "
             f"(type={goal_type}, status={status_filter}, priority={priority})"
         )
 
-        return responses
+        return goals_page.respond(response)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to retrieve goals: {e}", exc_info=True)
         raise HTTPException(
@@ -760,3 +771,113 @@ async def optimize_goal_allocation(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to optimize allocation"
         )
+
+
+@router.post("/optimize/frontier")
+async def optimize_goal_allocation_frontier(
+    budgets: Optional[List[Decimal]] = Query(None, description="Monthly budgets to solve for (default: frontier breakpoints)"),
+    current_user_id: str = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Optimal allocation of monthly savings across goals for many budgets.
+
+    Solves the same priority-weighted allocation as /optimize for every
+    budget in one call, so clients can chart how goals become funded as the
+    budget grows.
+
+    Args:
+        budgets: Monthly budgets (default: zero and each budget at which
+                 another goal becomes fully funded)
+        current_user_id: Authenticated user ID
+        db: Database session
+
+    Returns:
+        Dict with goals (funding order, required monthly), total_required
+        and points (per budget: total_allocated, unallocated,
+        fully_funded_count, allocations per goal)
+
+    Raises:
+        400: Validation error (negative budget, past target date)
+        401: Unauthorized
+        500: Internal server error
+    """
+    try:
+        service = get_goal_optimization_service(db)
+
+        frontier = await service.allocation_frontier(
+            user_id=UUID(current_user_id),
+            budgets=budgets
+        )
+
+        logger.info(
+            f"Goal allocation frontier computed for user {current_user_id}: "
+            f"{len(frontier['points'])} budgets"
+        )
+
+        return frontier
+
+    except (ValidationError, OptimizationValidationError) as e:
+        logger.warning(f"Optimization validation failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error(f"Failed to compute allocation frontier: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to compute allocation frontier"
+        )
+
+
+# ============================================================================
+# INTERNAL JOBS
+# ============================================================================
+
+
+@router.post(
+    "/checks/run",
+    response_model=GoalCheckSummary,
+    summary="Run nightly goal checks (internal job)",
+    description=(
+        "Sync linked-account progress and check achievements for all users. "
+        "Requires the internal service credential (X-Internal-API-Key)."
+    )
+)
+async def run_goal_checks(
+    caller: str = Depends(require_internal_service),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Run the nightly goal checks for all users.
+
+    Normally triggered by the scheduler once a night; can be triggered
+    manually for testing or immediate updates.
+
+    Args:
+        caller: Internal service identity
+        db: Database session
+
+    Returns:
+        GoalCheckSummary: Goals updated and achieved, milestones achieved
+
+    Raises:
+        403: Missing or invalid service credential
+        500: Internal server error
+    """
+    try:
+        logger.info(f"Triggering nightly goal checks (requested by {caller})")
+
+        service = get_goal_service(db)
+        summary = await service.run_nightly_goal_checks()
+
+        return GoalCheckSummary(**summary)
+
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"Failed to run goal checks: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to run goal checks"
+        )
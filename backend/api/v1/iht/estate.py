@@ -4,8 +4,8 @@ Estate and IHT API endpoints.
 This module provides REST API endpoints for:
 - Estate asset CRUD operations (4 endpoints)
 - Estate liability CRUD operations (4 endpoints)
-- Estate valuation and IHT calculation (2 endpoints)
-- Gift and PET tracking (5 endpoints)
+- Estate valuation and IHT calculation (3 endpoints)
+- Gift and PET tracking (6 endpoints)
 - SA Estate Duty calculation (1 endpoint)
 
 Business logic:
@@ -16,13 +16,14 @@ Business logic:
 - Soft delete for audit trail
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from uuid import UUID
 from decimal import Decimal
 from datetime import date
+from dateutil.relativedelta import relativedelta
 import logging
 
 from database import get_db
@@ -34,18 +35,24 @@ from models.estate_iht import (
 from schemas.iht import (
     EstateAssetCreate, EstateAssetUpdate, EstateAssetResponse,
     EstateLiabilityCreate, EstateLiabilityUpdate, EstateLiabilityResponse,
-    EstateValuationResponse, IHTCalculationRequest, IHTCalculationResponse,
-    GiftCreate, GiftResponse, PotentialIHTResponse, ExemptionStatusResponse,
+    EstateValuationResponse, EstateValuationPointResponse,
+    IHTCalculationRequest, IHTCalculationResponse,
+    GiftCreate, GiftResponse, PotentialIHTResponse, GiftIHTExposureResponse,
+    ExemptionStatusResponse,
     SAEstateDutyCalculationRequest, SAEstateDutyCalculationResponse
 )
 from services.iht.estate_valuation_service import EstateValuationService
 from services.iht.gift_analysis_service import GiftAnalysisService
 from services.iht.sa_estate_duty_service import SAEstateDutyService
+from utils.pagination import PageParams, list_count_cache, page_params, paginate
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+list_count_cache.register(EstateAsset)
+list_count_cache.register(Gift)
+
 
 # ============================================================================
 # HELPER FUNCTIONS
@@ -197,9 +204,11 @@ async def create_estate_asset(
 
 @router.get("/estate/assets", response_model=List[EstateAssetResponse])
 async def get_all_estate_assets(
+    response: Response,
     current_user_id: str = Depends(get_current_user),
     asset_type: Optional[AssetType] = Query(None, description="Filter by asset type"),
     as_of_date: Optional[date] = Query(None, description="Temporal query date"),
+    page: PageParams = Depends(page_params()),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -209,10 +218,15 @@ async def get_all_estate_assets(
     - asset_type: Type of asset
     - as_of_date: Date for temporal queries (default: today)
 
+    Supports keyset pagination (limit, cursor) and field projection (fields);
+    see utils/pagination.py. Sorted newest first.
+
     Args:
+        response: Response (for paging headers)
         current_user_id: Authenticated user ID
         asset_type: Optional asset type filter
         as_of_date: Optional temporal query date
+        page: Pagination and projection parameters
         db: Database session
 
     Returns:
@@ -236,17 +250,19 @@ async def get_all_estate_assets(
                 (EstateAsset.effective_to > as_of_date)
             )
 
-        stmt = (
-            select(EstateAsset)
-            .where(and_(*conditions))
-            .order_by(EstateAsset.created_at.desc())
+        assets_page = await paginate(
+            db, EstateAsset, conditions,
+            order_by=[(EstateAsset.created_at, True), (EstateAsset.id, True)],
+            page=page,
+            user_id=UUID(current_user_id),
+            schema=EstateAssetResponse,
+            map_item=EstateAssetResponse.model_validate
         )
 
-        result = await db.execute(stmt)
-        assets = result.scalars().all()
-
-        return [EstateAssetResponse.model_validate(asset) for asset in assets]
+        return assets_page.respond(response)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to retrieve estate assets: {e}", exc_info=True)
         raise HTTPException(
@@ -652,15 +668,13 @@ async def get_estate_valuation(
         if as_of_date is None:
             as_of_date = date.today()
 
-        gross_estate = await service.calculate_gross_estate(UUID(current_user_id), as_of_date)
-        net_estate = await service.calculate_net_estate(UUID(current_user_id), as_of_date)
-
-        total_liabilities = gross_estate - net_estate
+        timeline = await service.get_estate_timeline(UUID(current_user_id))
+        valuation = timeline.value_at(as_of_date)
 
         return EstateValuationResponse(
-            gross_estate_value=gross_estate,
-            total_liabilities=total_liabilities,
-            net_estate_value=net_estate,
+            gross_estate_value=valuation['gross_estate'],
+            total_liabilities=valuation['total_liabilities'],
+            net_estate_value=valuation['net_estate'],
             currency='GBP',
             as_of_date=as_of_date,
             asset_breakdown=[]  # TODO: Add asset breakdown by type
@@ -674,6 +688,48 @@ async def get_estate_valuation(
         )
 
 
+@router.get("/estate/valuation/history", response_model=List[EstateValuationPointResponse])
+async def get_estate_valuation_history(
+    current_user_id: str = Depends(get_current_user),
+    months: int = Query(12, ge=1, le=240, description="Number of months back from the end date"),
+    end_date: Optional[date] = Query(None, description="Last valuation date (default: today)"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get monthly estate valuations for a historical trend chart.
+
+    The user's asset/liability timeline is loaded once and every point is
+    answered from it.
+
+    Args:
+        current_user_id: Authenticated user ID
+        months: Number of months back (returns months + 1 points, oldest first)
+        end_date: Last valuation date
+        db: Database session
+
+    Returns:
+        List[EstateValuationPointResponse]: Gross, net and RNRB-eligible values per date
+    """
+    try:
+        service = EstateValuationService(db)
+
+        if end_date is None:
+            end_date = date.today()
+
+        dates = [end_date - relativedelta(months=n) for n in range(months, -1, -1)]
+
+        series = await service.get_valuation_series(UUID(current_user_id), dates)
+
+        return [EstateValuationPointResponse(**point) for point in series]
+
+    except Exception as e:
+        logger.error(f"Failed to get estate valuation history: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get estate valuation history"
+        )
+
+
 @router.post("/calculate", response_model=IHTCalculationResponse)
 async def calculate_iht(
     data: IHTCalculationRequest,
@@ -816,9 +872,11 @@ async def record_gift(
 
 @router.get("/gifts", response_model=List[GiftResponse])
 async def get_all_gifts(
+    response: Response,
     current_user_id: str = Depends(get_current_user),
     gift_type: Optional[GiftType] = Query(None, description="Filter by gift type"),
     only_pet_period: bool = Query(False, description="Only gifts in PET period"),
+    page: PageParams = Depends(page_params()),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -828,10 +886,15 @@ async def get_all_gifts(
     - gift_type: PET, EXEMPT, CHARGEABLE
     - only_pet_period: Only gifts still in 7-year PET period
 
+    Supports keyset pagination (limit, cursor) and field projection (fields);
+    see utils/pagination.py. Sorted by gift date, most recent first.
+
     Args:
+        response: Response (for paging headers)
         current_user_id: Authenticated user ID
         gift_type: Optional gift type filter
         only_pet_period: Only PET period gifts
+        page: Pagination and projection parameters
         db: Database session
 
     Returns:
@@ -849,17 +912,19 @@ async def get_all_gifts(
         if only_pet_period:
             conditions.append(Gift.still_in_pet_period == True)
 
-        stmt = (
-            select(Gift)
-            .where(and_(*conditions))
-            .order_by(Gift.gift_date.desc())
+        gifts_page = await paginate(
+            db, Gift, conditions,
+            order_by=[(Gift.gift_date, True), (Gift.id, True)],
+            page=page,
+            user_id=UUID(current_user_id),
+            schema=GiftResponse,
+            map_item=GiftResponse.model_validate
         )
 
-        result = await db.execute(stmt)
-        gifts = result.scalars().all()
-
-        return [GiftResponse.model_validate(gift) for gift in gifts]
+        return gifts_page.respond(response)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to retrieve gifts: {e}", exc_info=True)
         raise HTTPException(
@@ -936,6 +1001,47 @@ async def calculate_potential_iht_on_pets(
         )
 
 
+@router.get("/gifts/iht-exposure", response_model=List[GiftIHTExposureResponse])
+async def get_gift_iht_exposure(
+    current_user_id: str = Depends(get_current_user),
+    years: int = Query(10, ge=0, le=50, description="Number of years ahead to project"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get IHT on lifetime gifts if death occurs today and on each anniversary ahead.
+
+    Shows how gift IHT falls as PETs age (taper relief, 7-year exemption)
+    and how much nil rate band is left for the estate each year.
+
+    Args:
+        current_user_id: Authenticated user ID
+        years: Number of years ahead (returns years + 1 points)
+        db: Database session
+
+    Returns:
+        List[GiftIHTExposureResponse]: Gift IHT exposure per death date
+    """
+    try:
+        service = GiftAnalysisService(db)
+
+        today = date.today()
+        death_dates = [today + relativedelta(years=n) for n in range(years + 1)]
+
+        exposure = await service.calculate_iht_exposure_sweep(
+            UUID(current_user_id),
+            death_dates
+        )
+
+        return [GiftIHTExposureResponse(**point) for point in exposure]
+
+    except Exception as e:
+        logger.error(f"Failed to calculate gift IHT exposure: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to calculate gift IHT exposure"
+        )
+
+
 @router.get("/exemptions/{tax_year:path}", response_model=ExemptionStatusResponse)
 async def get_exemption_status(
     tax_year: str,
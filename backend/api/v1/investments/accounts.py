@@ -35,6 +35,7 @@ from schemas.investment import (
     CreateAccountRequest,
     AccountResponse
 )
+from services.investment.asset_allocation_service import AssetAllocationService
 from services.investment.portfolio_service import get_portfolio_service
 
 logger = logging.getLogger(__name__)
@@ -251,6 +252,7 @@ async def delete_account(
             holding.deleted = True
 
         await db.commit()
+        await AssetAllocationService.invalidate_cache([UUID(current_user_id)])
 
         logger.info(
             f"Soft deleted investment account {account_id} and {len(holdings)} holdings "
@@ -332,15 +334,6 @@ async def _map_account_to_response(
     Returns:
         AccountResponse: Response schema
     """
-    # Get account number (last 4 digits)
-    try:
-        account_number = account.get_account_number()
-        # Mask all but last 4 digits
-        if len(account_number) > 4:
-            account_number = "****" + account_number[-4:]
-    except Exception:
-        account_number = "****"
-
     # Count holdings
     holdings_count_stmt = select(func.count(InvestmentHolding.id)).where(
         and_(
@@ -356,7 +349,7 @@ async def _map_account_to_response(
         user_id=account.user_id,
         account_type=account.account_type,
         provider=account.provider,
-        account_number=account_number,
+        account_number=account.masked_account_number,
         country=account.country,
         base_currency=account.base_currency,
         account_open_date=account.account_open_date,
@@ -6,7 +6,10 @@ This module provides operations for investment holdings:
 - Retrieve holdings with filtering
 - Get single holding details
 - Update holding price
+- Bulk price updates from a ticker,price file (internal market data job)
 - Sell holding (FIFO method for CGT)
+- Bulk sell several holdings in one transaction
+- Re-match UK disposals (same-day, 30-day, Section 104 pool)
 - Record dividend payments
 
 Business logic:
@@ -17,23 +20,28 @@ Business logic:
 - Realized gain calculation
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
-from sqlalchemy import select, and_
+from fastapi import (
+    APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile, status
+)
+from sqlalchemy import select, and_, case
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
+from datetime import date
 from decimal import Decimal
 import logging
 
 from database import get_db
-from middleware.auth import get_current_user
+from middleware.auth import get_current_user, get_current_active_user, require_internal_service
 from middleware.rate_limiter import limiter
 from models.investment import (
     InvestmentAccount,
     InvestmentHolding,
+    Security,
     SecurityType,
     AssetClass,
-    Region
+    Region,
+    holding_owners
 )
 from schemas.investment import (
     CreateHoldingRequest,
@@ -41,16 +49,48 @@ from schemas.investment import (
     UpdatePriceRequest,
     SellHoldingRequest,
     SellHoldingResponse,
+    BulkSellRequest,
+    BulkSellResponse,
+    ShareMatchingResponse,
+    BulkPriceUpdateResponse,
     RecordDividendRequest,
     DividendResponse
 )
 from services.investment.portfolio_service import get_portfolio_service
+from services.investment.price_update_service import get_price_update_service, parse_price_csv
+from services.investment.share_matching_service import get_share_matching_service
+from utils.pagination import PageParams, list_count_cache, page_params, paginate
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+list_count_cache.register(InvestmentHolding, owners=holding_owners)
+
+
+def _price_columns() -> Dict[str, Any]:
+    """
+    Projection expressions for the price fields of HoldingResponse.
+
+    _map_holding_to_response reads holding.market_price and
+    market_price_updated_at (the security master price unless overridden),
+    so ?fields= must select the same values rather than the raw columns.
+    """
+    def security_column(column):
+        return select(column).where(Security.id == InvestmentHolding.security_id).scalar_subquery()
+
+    security_price = security_column(Security.current_price)
+    use_security = and_(InvestmentHolding.price_overridden == False, security_price.is_not(None))
+    return {
+        'current_price': case((use_security, security_price), else_=InvestmentHolding.current_price),
+        'last_price_update': case(
+            (use_security, security_column(Security.last_price_update)),
+            else_=InvestmentHolding.last_price_update
+        ),
+    }
+
+
 # ============================================================================
 # HOLDINGS CRUD
 # ============================================================================
@@ -111,7 +151,8 @@ async def add_holding(
             asset_class=data.asset_class,
             region=data.region,
             sector=data.sector,
-            isin=data.isin
+            isin=data.isin,
+            exchange=data.exchange
         )
 
         logger.info(
@@ -139,14 +180,15 @@ async def add_holding(
 
 @router.get("/holdings", response_model=List[HoldingResponse])
 async def get_all_holdings(
+    response: Response,
     current_user_id: str = Depends(get_current_user),
     account_id: Optional[UUID] = Query(None, description="Filter by account ID"),
     ticker: Optional[str] = Query(None, description="Filter by ticker symbol"),
     asset_class: Optional[AssetClass] = Query(None, description="Filter by asset class"),
     region: Optional[Region] = Query(None, description="Filter by region"),
     sector: Optional[str] = Query(None, description="Filter by sector"),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
-    limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return"),
+    skip: int = Query(0, ge=0, deprecated=True, description="Number of records to skip (use cursor instead)"),
+    page: PageParams = Depends(page_params(default_limit=100, max_limit=100)),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -158,19 +200,22 @@ async def get_all_holdings(
     - asset_class: EQUITY, FIXED_INCOME, etc.
     - region: UK, US, EUROPE, etc.
     - sector: Sector name
-    - Pagination with skip and limit
+    - Keyset pagination with limit and cursor (skip is deprecated), and
+      field projection with fields (see utils/pagination.py)
 
-    Results sorted by current value (descending).
+    Pages are taken newest first; each page is sorted by current value
+    (descending).
 
     Args:
+        response: Response (for paging headers)
         current_user_id: Authenticated user ID
         account_id: Optional account filter
         ticker: Optional ticker filter
         asset_class: Optional asset class filter
         region: Optional region filter
         sector: Optional sector filter
-        skip: Number of records to skip (pagination)
-        limit: Maximum number of records to return
+        skip: Number of records to skip (deprecated OFFSET paging)
+        page: Pagination and projection parameters
         db: Database session
 
     Returns:
@@ -217,24 +262,26 @@ async def get_all_holdings(
         if sector is not None:
             conditions.append(InvestmentHolding.sector.ilike(f"%{sector}%"))
 
-        stmt = (
-            select(InvestmentHolding)
-            .where(and_(*conditions))
-            .offset(skip)
-            .limit(limit)
-        )
-
-        result = await db.execute(stmt)
-        holdings = result.scalars().all()
+        if not page.cursor:
+            page.skip = skip
 
-        # Sort by current value (descending) in Python since it's a computed property
-        holdings_sorted = sorted(
-            holdings,
-            key=lambda h: h.current_value,
-            reverse=True
+        holdings_page = await paginate(
+            db, InvestmentHolding, conditions,
+            order_by=[(InvestmentHolding.created_at, True), (InvestmentHolding.id, True)],
+            page=page,
+            user_id=UUID(current_user_id),
+            schema=HoldingResponse,
+            columns=_price_columns()
         )
 
-        return [_map_holding_to_response(h) for h in holdings_sorted]
+        if not holdings_page.projected:
+            # Sort by current value (descending) in Python since it's a computed property
+            holdings_page.items = [
+                _map_holding_to_response(h)
+                for h in sorted(holdings_page.items, key=lambda h: h.current_value, reverse=True)
+            ]
+
+        return holdings_page.respond(response)
 
     except HTTPException:
         raise
@@ -338,6 +385,68 @@ async def update_holding_price(
         )
 
 
+@router.post("/prices/bulk", response_model=BulkPriceUpdateResponse)
+async def bulk_update_prices(
+    file: UploadFile = File(..., description="CSV of ticker,price[,exchange] lines"),
+    caller: str = Depends(require_internal_service),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Reprice securities from a ticker,price[,exchange] file (market data feed).
+
+    Reprices every user's holdings, so it is restricted to internal jobs
+    holding the service credential (see require_internal_service), not
+    user sessions.
+
+    Each security in the file is updated once in the shared security master
+    with set-based UPDATE statements in chunks; holdings are valued from it
+    at read time. Cached dashboard data is invalidated only for users who
+    hold a repriced security.
+
+    Args:
+        file: CSV upload with one "ticker,price[,exchange]" per line (header optional)
+        caller: Internal service caller
+        db: Database session
+
+    Returns:
+        BulkPriceUpdateResponse: Counts of securities and users affected
+
+    Raises:
+        400: Malformed file or negative price
+        403: Missing or invalid service credential
+        500: Internal server error
+    """
+    try:
+        content = (await file.read()).decode("utf-8-sig")
+
+        price_service = get_price_update_service(db)
+        result = await price_service.bulk_update_prices(
+            parse_price_csv(content.splitlines())
+        )
+
+        logger.info(
+            f"Bulk price update by {caller}: "
+            f"securities_updated={result['securities_updated']}"
+        )
+
+        return BulkPriceUpdateResponse(**result)
+
+    except (ValueError, UnicodeDecodeError) as e:
+        logger.error(f"Validation error in bulk price update: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to bulk update prices: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to bulk update prices"
+        )
+
+
 # ============================================================================
 # SELLING HOLDINGS
 # ============================================================================
@@ -418,6 +527,142 @@ async def sell_holding(
         )
 
 
+@router.post("/holdings/bulk-sell", response_model=BulkSellResponse)
+@limiter.limit("10/minute")
+async def bulk_sell_holdings(
+    request: Request,
+    response: Response,
+    data: BulkSellRequest,
+    current_user_id: str = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Sell several holdings (partial or full) in a single transaction.
+
+    Disposals are applied in order using FIFO; if any disposal fails,
+    none are recorded. Rate limited to 10 requests per minute.
+
+    Args:
+        data: Disposals to apply
+        current_user_id: Authenticated user ID
+        db: Database session
+
+    Returns:
+        BulkSellResponse: Per-disposal sale details and total realized gain
+
+    Raises:
+        400: Validation error (quantity exceeds available, etc.)
+        404: Holding not found or not owned by user
+        429: Rate limit exceeded
+        500: Internal server error
+    """
+    try:
+        # Verify ownership of every distinct holding up front
+        for holding_id in dict.fromkeys(item.holding_id for item in data.disposals):
+            await _get_holding_or_404(holding_id, UUID(current_user_id), db)
+
+        portfolio_service = get_portfolio_service(db)
+
+        sales = await portfolio_service.sell_holdings_bulk([
+            {
+                "holding_id": item.holding_id,
+                "quantity_to_sell": item.quantity,
+                "sale_price": item.sale_price,
+                "sale_date": item.sale_date
+            }
+            for item in data.disposals
+        ])
+
+        total_realized_gain = sum(sale["realized_gain"] for sale in sales)
+
+        logger.info(
+            f"Bulk sold {len(sales)} disposals for user {current_user_id}: "
+            f"total_realized_gain={total_realized_gain}"
+        )
+
+        return BulkSellResponse(
+            sales=[SellHoldingResponse(**sale) for sale in sales],
+            total_realized_gain=total_realized_gain
+        )
+
+    except ValueError as e:
+        logger.error(f"Validation error in bulk sell: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to bulk sell holdings: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to bulk sell holdings"
+        )
+
+
+@router.post("/holdings/{holding_id}/share-matching", response_model=ShareMatchingResponse)
+@limiter.limit("10/minute")
+async def recalculate_share_matching(
+    request: Request,
+    response: Response,
+    holding_id: UUID,
+    changed_from: Optional[date] = Query(
+        None,
+        description="Earliest date of an inserted or changed trade (omit to replay all trades)"
+    ),
+    current_user_id: str = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Re-match a UK holding's disposals under the share identification rules.
+
+    Applies same-day, then 30-day (bed-and-breakfast), then Section 104 pool
+    matching and updates realized gains. With changed_from, only disposals
+    from 30 days before that date are re-matched. Back-dated purchases and
+    sales re-match automatically; this rebuilds on demand (e.g. after
+    editing past trades).
+
+    Args:
+        holding_id: Holding UUID
+        changed_from: Date of a back-dated trade (optional)
+        current_user_id: Authenticated user ID
+        db: Database session
+
+    Returns:
+        ShareMatchingResponse: Re-match summary and closing Section 104 pool
+
+    Raises:
+        400: Not a UK holding, or disposals exceed shares acquired
+        404: Holding not found or not owned by user
+        429: Rate limit exceeded
+        500: Internal server error
+    """
+    try:
+        # Verify ownership
+        await _get_holding_or_404(holding_id, UUID(current_user_id), db)
+
+        matching_service = get_share_matching_service(db)
+        result = await matching_service.recalculate_holding(holding_id, changed_from)
+
+        return ShareMatchingResponse(**result)
+
+    except ValueError as e:
+        logger.error(f"Validation error in share matching: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to recalculate share matching: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to recalculate share matching"
+        )
+
+
 # ============================================================================
 # DIVIDEND RECORDING
 # ============================================================================
@@ -621,14 +866,14 @@ def _map_holding_to_response(holding: InvestmentHolding) -> HoldingResponse:
         purchase_date=holding.purchase_date,
         purchase_price=holding.purchase_price,
         purchase_currency=holding.purchase_currency,
-        current_price=holding.current_price,
+        current_price=holding.market_price,
         current_value=holding.current_value,
         unrealized_gain=holding.unrealized_gain,
         unrealized_gain_percentage=holding.unrealized_gain_percentage,
         asset_class=holding.asset_class,
         region=holding.region,
         sector=holding.sector,
-        last_price_update=holding.last_price_update,
+        last_price_update=holding.market_price_updated_at,
         deleted=holding.deleted,
         created_at=holding.created_at,
         updated_at=holding.updated_at
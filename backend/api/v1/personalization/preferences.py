@@ -25,8 +25,10 @@ from schemas.personalization import (
     PersonalizedDashboardResponse,
     InsightResponse,
     PreferencesDictResponse,
-    BehaviorAnalysisResponse
+    BehaviorAnalysisResponse,
+    BehaviorBufferStatsResponse
 )
+from services.personalization.behavior_buffer import behavior_buffer
 from services.personalization.preference_service import PreferenceService
 
 router = APIRouter()
@@ -96,7 +98,8 @@ async def track_behavior(
     Track user behavior action.
 
     Logs user actions for personalization and analytics.
-    Actions are stored asynchronously and don't block the response.
+    Actions are buffered and written in batches in the background, so the
+    response doesn't wait for the database.
 
     Request Body:
     {
@@ -194,3 +197,17 @@ async def get_behavior_analysis(
     service = PreferenceService(db)
     analysis = await service.analyze_behavior(UUID(current_user_id), days)
     return analysis
+
+
+@router.get("/behavior/buffer-stats", response_model=BehaviorBufferStatsResponse)
+async def get_behavior_buffer_stats(
+    current_user_id: str = Depends(get_current_user)
+):
+    """
+    Get behavior tracking buffer metrics for this server process.
+
+    Returns:
+    - Events buffered, written and dropped (buffer full or batch rejected)
+    - Flush counts and the time of the last successful flush
+    """
+    return behavior_buffer.stats()
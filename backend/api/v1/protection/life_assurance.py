@@ -13,7 +13,8 @@ All endpoints require authentication and implement proper authorization checks.
 """
 
 import logging
-from typing import List, Optional
+from datetime import date
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
@@ -35,7 +36,8 @@ from services.protection.exceptions import (
     PolicyNotFoundError,
     PolicyPermissionError
 )
-from models.life_assurance import PolicyStatus
+from models.life_assurance import PolicyStatus, PolicyBeneficiary
+from utils.encryption import decrypt_values_async
 
 logger = logging.getLogger(__name__)
 
@@ -46,45 +48,83 @@ router = APIRouter(prefix="/life-assurance", tags=["Life Assurance"])
 # HELPER FUNCTIONS
 # ============================================================================
 
-def _map_policy_to_response(policy) -> PolicyResponse:
+async def _decrypt_beneficiary_pii(policies) -> Dict[UUID, Tuple[str, date, str]]:
+    """
+    Decrypt beneficiary PII for policies in one batch.
+
+    Args:
+        policies: LifeAssurancePolicy model instances
+
+    Returns:
+        Dict of beneficiary ID -> (name, date of birth, address); beneficiaries
+        that fail to decrypt are left out
+    """
+    beneficiaries = [ben for policy in policies for ben in policy.beneficiaries]
+    fields_per_beneficiary = len(PolicyBeneficiary.ENCRYPTED_FIELDS)
+    decrypted = await decrypt_values_async(
+        [getattr(ben, field) for ben in beneficiaries for field in PolicyBeneficiary.ENCRYPTED_FIELDS],
+        strict=False
+    )
+
+    pii = {}
+    for i, ben in enumerate(beneficiaries):
+        name, date_of_birth, address = decrypted[i * fields_per_beneficiary:(i + 1) * fields_per_beneficiary]
+        try:
+            if name is None or date_of_birth is None or address is None:
+                raise ValueError("Decryption failed")
+            pii[ben.id] = (name, date.fromisoformat(date_of_birth), address)
+        except ValueError as e:
+            logger.error(f"Error decrypting beneficiary {ben.id}: {e}")
+            # Skip beneficiary if decryption fails
+            continue
+    return pii
+
+
+async def _map_policies_to_response(policies) -> List[PolicyResponse]:
+    """
+    Map LifeAssurancePolicy models to PolicyResponse schemas.
+
+    Decrypts all beneficiary PII in one batch.
+
+    Args:
+        policies: LifeAssurancePolicy model instances
+
+    Returns:
+        List[PolicyResponse]: Response schemas with decrypted data
+    """
+    beneficiary_pii = await _decrypt_beneficiary_pii(policies)
+    return [_map_policy_to_response(policy, beneficiary_pii) for policy in policies]
+
+
+def _map_policy_to_response(policy, beneficiary_pii: Dict[UUID, Tuple[str, date, str]]) -> PolicyResponse:
     """
     Map LifeAssurancePolicy model to PolicyResponse schema.
 
-    Handles decryption of policy number and beneficiary PII.
+    Shows the masked policy number without decrypting it.
 
     Args:
         policy: LifeAssurancePolicy model instance
+        beneficiary_pii: Decrypted beneficiary PII (see _decrypt_beneficiary_pii)
 
     Returns:
         PolicyResponse: Response schema with decrypted data
     """
-    # Decrypt policy number (mask for security)
-    try:
-        policy_number = policy.get_policy_number()
-        # Mask all but last 4 characters
-        if len(policy_number) > 4:
-            policy_number = "****" + policy_number[-4:]
-    except Exception:
-        policy_number = "****"
-
-    # Map beneficiaries
+    # Map beneficiaries (skipping any that failed to decrypt)
     beneficiaries = []
     for ben in policy.beneficiaries:
-        try:
-            beneficiaries.append(BeneficiaryResponse(
-                id=ben.id,
-                name=ben.get_name(),
-                date_of_birth=ben.get_date_of_birth(),
-                relationship=ben.beneficiary_relationship,
-                percentage=ben.percentage,
-                address=ben.get_address(),
-                created_at=ben.created_at,
-                updated_at=ben.updated_at
-            ))
-        except Exception as e:
-            logger.error(f"Error decrypting beneficiary {ben.id}: {e}")
-            # Skip beneficiary if decryption fails
+        if ben.id not in beneficiary_pii:
             continue
+        name, date_of_birth, address = beneficiary_pii[ben.id]
+        beneficiaries.append(BeneficiaryResponse(
+            id=ben.id,
+            name=name,
+            date_of_birth=date_of_birth,
+            relationship=ben.beneficiary_relationship,
+            percentage=ben.percentage,
+            address=address,
+            created_at=ben.created_at,
+            updated_at=ben.updated_at
+        ))
 
     # Map trust details
     trust_details = None
@@ -102,7 +142,7 @@ def _map_policy_to_response(policy) -> PolicyResponse:
 
     return PolicyResponse(
         id=policy.id,
-        policy_number=policy_number,
+        policy_number=policy.masked_policy_number,
         provider=policy.provider,
         provider_country=policy.provider_country,
         policy_type=policy.policy_type,
@@ -178,7 +218,7 @@ async def create_policy(
             f"{policy.provider} - {policy.cover_amount} {policy.currency.value}"
         )
 
-        return _map_policy_to_response(policy)
+        return (await _map_policies_to_response([policy]))[0]
 
     except PolicyValidationError as e:
         logger.warning(f"Policy validation error: {e.message}")
@@ -235,7 +275,7 @@ async def list_policies(
 
         logger.info(f"Retrieved {len(policies)} policies for user {current_user_id}")
 
-        return [_map_policy_to_response(policy) for policy in policies]
+        return await _map_policies_to_response(policies)
 
     except Exception as e:
         logger.error(f"Failed to retrieve policies: {e}", exc_info=True)
@@ -279,7 +319,7 @@ async def get_policy(
 
         logger.info(f"Retrieved policy {policy_id} for user {current_user_id}")
 
-        return _map_policy_to_response(policy)
+        return (await _map_policies_to_response([policy]))[0]
 
     except PolicyNotFoundError as e:
         logger.warning(f"Policy not found: {e.message}")
@@ -350,7 +390,7 @@ async def update_policy(
 
         logger.info(f"Updated policy {policy_id} for user {current_user_id}")
 
-        return _map_policy_to_response(policy)
+        return (await _map_policies_to_response([policy]))[0]
 
     except PolicyNotFoundError as e:
         logger.warning(f"Policy not found: {e.message}")
@@ -123,8 +123,8 @@ async def generate_recommendations(
     recommendations across all modules (protection, ISA, TFSA, emergency fund, etc.).
 
     This is an idempotent operation - will analyze current financial state
-    and create new recommendations. Consider checking for recent recommendations
-    before calling to avoid duplicates.
+    and create new recommendations. A recommendation matching an open one
+    (same type and title) updates it instead of creating a duplicate.
 
     Args:
         data: Generation request (optional base_currency)
@@ -149,15 +149,11 @@ async def generate_recommendations(
             base_currency=data.base_currency
         )
 
-        # Persist recommendations to database
-        for rec in recommendations:
-            db.add(rec)
-
-        await db.commit()
-
-        # Refresh to get IDs
-        for rec in recommendations:
-            await db.refresh(rec)
+        # Bulk-upsert (regenerated open recommendations are updated, not duplicated)
+        recommendations = await service.save_recommendations(
+            user_id=UUID(current_user_id),
+            recommendations=recommendations
+        )
 
         # Map to response schemas
         responses = [
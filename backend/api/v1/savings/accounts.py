@@ -3,7 +3,7 @@ Savings account API endpoints.
 
 This module provides CRUD operations for savings accounts:
 - Create account with ISA/TFSA contribution tracking
-- Retrieve accounts with filtering
+- Retrieve accounts with filtering, keyset pagination and field projection
 - Update account details
 - Delete account (soft delete)
 - Update balance with history tracking
@@ -18,7 +18,7 @@ Business logic:
 - Summary aggregation across all accounts
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
@@ -50,11 +50,14 @@ from services.isa_tfsa_tracking import ISATrackingService, TFSATrackingService
 from services.interest_calculation import InterestCalculationService
 from services.emergency_fund_assessment import EmergencyFundAssessmentService
 from services.currency_conversion import CurrencyConversionService
+from utils.pagination import PageParams, list_count_cache, page_params, paginate
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+list_count_cache.register(SavingsAccount)
+
 
 # ============================================================================
 # CRUD OPERATIONS
@@ -192,11 +195,13 @@ async def create_savings_account(
 
 @router.get("/accounts", response_model=List[SavingsAccountResponse])
 async def get_all_accounts(
+    response: Response,
     current_user_id: str = Depends(get_current_user),
     account_type: Optional[AccountType] = Query(None, description="Filter by account type"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     currency: Optional[Currency] = Query(None, description="Filter by currency"),
     purpose: Optional[AccountPurpose] = Query(None, description="Filter by purpose"),
+    page: PageParams = Depends(page_params()),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -208,12 +213,17 @@ async def get_all_accounts(
     - currency: GBP, ZAR, USD, EUR
     - purpose: EMERGENCY_FUND, SAVINGS_GOAL, GENERAL
 
+    Supports keyset pagination (limit, cursor) and field projection (fields);
+    see utils/pagination.py. Sorted newest first.
+
     Args:
+        response: Response (for paging headers)
         current_user_id: Authenticated user ID
         account_type: Optional account type filter
         is_active: Optional active status filter
         currency: Optional currency filter
         purpose: Optional purpose filter
+        page: Pagination and projection parameters
         db: Database session
 
     Returns:
@@ -238,15 +248,19 @@ async def get_all_accounts(
         if purpose is not None:
             conditions.append(SavingsAccount.purpose == purpose)
 
-        stmt = select(SavingsAccount).where(and_(*conditions)).order_by(
-            SavingsAccount.created_at.desc()
+        accounts_page = await paginate(
+            db, SavingsAccount, conditions,
+            order_by=[(SavingsAccount.created_at, True), (SavingsAccount.id, True)],
+            page=page,
+            user_id=UUID(current_user_id),
+            schema=SavingsAccountResponse,
+            map_item=_map_account_to_response
         )
 
-        result = await db.execute(stmt)
-        accounts = result.scalars().all()
-
-        return [_map_account_to_response(account) for account in accounts]
+        return accounts_page.respond(response)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to retrieve savings accounts: {e}", exc_info=True)
         raise HTTPException(
@@ -792,7 +806,7 @@ def _map_account_to_response(account: SavingsAccount) -> SavingsAccountResponse:
     """
     Map SavingsAccount model to response schema.
 
-    Decrypts account number (masked in production).
+    Shows the masked account number without decrypting it.
 
     Args:
         account: SavingsAccount model instance
@@ -800,21 +814,12 @@ def _map_account_to_response(account: SavingsAccount) -> SavingsAccountResponse:
     Returns:
         SavingsAccountResponse: Response schema
     """
-    # Decrypt account number (consider masking in production)
-    try:
-        account_number = account.get_account_number()
-        # Mask all but last 4 digits
-        if len(account_number) > 4:
-            account_number = "****" + account_number[-4:]
-    except Exception:
-        account_number = "****"
-
     return SavingsAccountResponse(
         id=account.id,
         user_id=account.user_id,
         bank_name=account.bank_name,
         account_name=account.account_name,
-        account_number=account_number,
+        account_number=account.masked_account_number,
         account_type=account.account_type,
         currency=account.currency,
         current_balance=account.current_balance,
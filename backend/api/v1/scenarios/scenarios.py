@@ -8,11 +8,15 @@ Provides REST API for scenario analysis:
 - PUT /api/v1/scenarios/{id} - Update scenario
 - DELETE /api/v1/scenarios/{id} - Delete scenario
 - POST /api/v1/scenarios/{id}/run - Run scenario
+- GET /api/v1/scenarios/{id}/results/{series} - Get a range of a result series
 - POST /api/v1/scenarios/compare - Compare scenarios
+- POST /api/v1/scenarios/run-and-compare - Run scenarios together and compare
 - POST /api/v1/scenarios/retirement-age - Model retirement age
+- POST /api/v1/scenarios/retirement-age/sweep - Sweep retirement ages x growth rates
 - POST /api/v1/scenarios/career-change - Model career change
 - POST /api/v1/scenarios/property-purchase - Model property purchase
 - POST /api/v1/scenarios/monte-carlo - Run Monte Carlo simulation
+- GET /api/v1/scenarios/monte-carlo/cache-stats - Monte Carlo cache metrics
 
 All endpoints require authentication.
 """
@@ -20,9 +24,10 @@ All endpoints require authentication.
 import logging
 from typing import List, Optional
 from uuid import UUID
+from datetime import date
 from decimal import Decimal
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database import get_db
@@ -31,23 +36,44 @@ from models.user import User
 from models.scenario import ScenarioType, ScenarioStatus
 from schemas.scenario import (
     ScenarioCreate, ScenarioUpdate, ScenarioResponse,
-    ScenarioExecutionRequest, ScenarioResultResponse,
+    ScenarioExecutionRequest, ScenarioResultResponse, ScenarioResultSeriesResponse,
     ScenarioComparisonRequest, ScenarioComparisonResponse,
+    ScenarioRunComparisonRequest,
     RetirementAgeScenarioRequest, RetirementAgeScenarioResponse,
+    RetirementAgeSweepRequest, RetirementAgeSweepResponse,
     CareerChangeScenarioRequest, CareerChangeScenarioResponse,
     PropertyScenarioRequest, PropertyScenarioResponse,
-    MonteCarloRequest, MonteCarloResponse
+    MonteCarloRequest, MonteCarloResponse, MonteCarloCacheStatsResponse
 )
 from services.scenarios import (
     ScenarioService, RetirementAgeScenarioService,
     CareerChangeScenarioService, PropertyScenarioService,
     MonteCarloService
 )
+from services.scenarios.monte_carlo_service import monte_carlo_cache
 
 router = APIRouter(prefix="/scenarios", tags=["scenarios"])
 logger = logging.getLogger(__name__)
 
 
+def _current_age(user: User) -> int:
+    """
+    User's age today from their date of birth.
+
+    Raises:
+        HTTPException: 400 if the profile has no date of birth
+    """
+    if user.date_of_birth is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Date of birth is required to model retirement ages; add it to your profile"
+        )
+
+    today = date.today()
+    born = user.date_of_birth
+    return today.year - born.year - ((today.month, today.day) < (born.month, born.day))
+
+
 @router.post("", response_model=ScenarioResponse, status_code=status.HTTP_201_CREATED)
 async def create_scenario(
     scenario_data: ScenarioCreate,
@@ -235,6 +261,46 @@ async def run_scenario(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to run scenario")
 
 
+@router.get("/{scenario_id}/results/{series}", response_model=ScenarioResultSeriesResponse)
+async def get_result_series(
+    scenario_id: UUID,
+    series: str,
+    start_year: Optional[int] = Query(None, ge=1, description="First projection year"),
+    end_year: Optional[int] = Query(None, ge=1, description="Last projection year"),
+    max_points: Optional[int] = Query(None, ge=2, le=1000, description="Downsample to at most this many points"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get a range of a scenario result series.
+
+    Parameters:
+    - series: net_worth or tax_liability
+    - start_year / end_year: Year range (inclusive, default: all years)
+    - max_points: Evenly downsample, keeping the first and last year
+
+    Returns:
+    - Columnar values (e.g. year, age, net_worth) for the range
+    """
+    try:
+        service = ScenarioService(db)
+
+        return await service.get_result_series(
+            scenario_id, current_user.id, series,
+            start_year=start_year, end_year=end_year, max_points=max_points
+        )
+
+    except Exception as e:
+        logger.error(f"Error getting result series: {str(e)}")
+        if "not found" in str(e).lower() or "no calculated results" in str(e).lower():
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        if "permission" in str(e).lower():
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+        if "unknown series" in str(e).lower():
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to get result series")
+
+
 @router.post("/compare", response_model=ScenarioComparisonResponse)
 async def compare_scenarios(
     comparison_request: ScenarioComparisonRequest,
@@ -266,6 +332,46 @@ async def compare_scenarios(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to compare scenarios")
 
 
+@router.post("/run-and-compare", response_model=ScenarioComparisonResponse)
+async def run_and_compare_scenarios(
+    comparison_request: ScenarioRunComparisonRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Run multiple scenarios and compare them side-by-side.
+
+    The user's baseline is built once and the scenarios are projected
+    concurrently with the same execution parameters.
+
+    Parameters:
+    - scenario_ids: List of 2-5 scenario IDs
+    - execution: Execution parameters (see /{scenario_id}/run)
+
+    Returns:
+    - Comparison with metrics, trade-offs, and recommendations
+    """
+    try:
+        service = ScenarioService(db)
+
+        execution_dict = comparison_request.execution.model_dump()
+        comparison = await service.run_and_compare_scenarios(
+            comparison_request.scenario_ids, current_user.id, execution_dict
+        )
+
+        return comparison
+
+    except Exception as e:
+        logger.error(f"Error running scenario comparison: {str(e)}")
+        if "not found" in str(e).lower():
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        if "permission" in str(e).lower():
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+        if "validation" in str(e).lower():
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to run scenario comparison")
+
+
 @router.post("/retirement-age", response_model=RetirementAgeScenarioResponse)
 async def model_retirement_age(
     request: RetirementAgeScenarioRequest,
@@ -304,6 +410,57 @@ async def model_retirement_age(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
+@router.post("/retirement-age/sweep", response_model=RetirementAgeSweepResponse)
+async def sweep_retirement_ages(
+    request: RetirementAgeSweepRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Model every retirement age in range against several growth assumptions.
+
+    Parameters:
+    - current_pension_pot: Current pension value (optional)
+    - annual_contributions: Annual contributions (optional)
+    - growth_rates: Growth rates to compare (%, default: 4, 6, 8)
+    - min_retirement_age / max_retirement_age: Age range (default: 55-70)
+    - life_expectancy: Expected life expectancy (default: 90)
+
+    Returns:
+    - Pot, income, depletion age and replacement ratio for each
+      growth rate x retirement age (ages below the user's current age,
+      from their profile date of birth, are skipped)
+
+    Raises:
+    - 400 if the user's profile has no date of birth
+    """
+    current_age = _current_age(current_user)
+
+    try:
+        service = RetirementAgeScenarioService(db)
+
+        result = await service.sweep_retirement_ages(
+            current_user.id,
+            current_age,
+            request.current_pension_pot or Decimal('0'),
+            request.annual_contributions or Decimal('0'),
+            growth_rates=request.growth_rates,
+            retirement_ages=range(
+                max(request.min_retirement_age, current_age),
+                request.max_retirement_age + 1
+            ),
+            life_expectancy=request.life_expectancy
+        )
+
+        return result
+
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error sweeping retirement ages: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
 @router.post("/career-change", response_model=CareerChangeScenarioResponse)
 async def model_career_change(
     request: CareerChangeScenarioRequest,
@@ -428,3 +585,17 @@ async def run_monte_carlo(
     except Exception as e:
         logger.error(f"Error running Monte Carlo: {str(e)}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.get("/monte-carlo/cache-stats", response_model=MonteCarloCacheStatsResponse)
+async def get_monte_carlo_cache_stats(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get Monte Carlo result cache metrics for this server process.
+
+    Returns:
+    - Lookups, hits (in-process and Redis), misses and hit rate (%)
+    - Simulation time spent and saved by cache hits (seconds)
+    """
+    return monte_carlo_cache.stats()
@@ -15,7 +15,7 @@ Business logic:
 - Foreign income and DTA tracking
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional, Dict
@@ -41,11 +41,14 @@ from services.currency_conversion import (
     get_sa_tax_year
 )
 from services.income_tax_treatment import IncomeTaxTreatmentService
+from utils.pagination import PageParams, list_count_cache, page_params, paginate
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/income", tags=["Income"])
 
+list_count_cache.register(UserIncome)
+
 
 @router.post("", response_model=IncomeResponse, status_code=status.HTTP_201_CREATED)
 async def create_income(
@@ -208,11 +211,13 @@ async def create_income(
 
 @router.get("", response_model=List[IncomeResponse])
 async def get_all_income(
+    response: Response,
     current_user_id: str = Depends(get_current_user),
     tax_year_uk: Optional[str] = Query(None, description="Filter by UK tax year (e.g., '2023/24')"),
     tax_year_sa: Optional[str] = Query(None, description="Filter by SA tax year (e.g., '2023/24')"),
     income_type: Optional[str] = Query(None, description="Filter by income type"),
     source_country: Optional[str] = Query(None, description="Filter by source country"),
+    page: PageParams = Depends(page_params()),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -223,9 +228,11 @@ async def get_all_income(
     - tax_year_sa: Filter by SA tax year
     - income_type: Filter by income type
     - source_country: Filter by source country
+    - limit, cursor, fields: Keyset pagination and field projection
+      (see utils/pagination.py)
 
     Returns:
-        List of income records (excluding soft-deleted)
+        List of income records (excluding soft-deleted), most recent income date first
     """
     try:
         # Build query with filters
@@ -246,13 +253,19 @@ async def get_all_income(
         if source_country:
             conditions.append(UserIncome.source_country == source_country)
 
-        stmt = select(UserIncome).where(and_(*conditions)).order_by(UserIncome.income_date.desc())
-
-        result = await db.execute(stmt)
-        income_records = result.scalars().all()
+        income_page = await paginate(
+            db, UserIncome, conditions,
+            order_by=[(UserIncome.income_date, True), (UserIncome.id, True)],
+            page=page,
+            user_id=UUID(current_user_id),
+            schema=IncomeResponse,
+            map_item=_map_income_to_response
+        )
 
-        return [_map_income_to_response(income) for income in income_records]
+        return income_page.respond(response)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to retrieve income: {e}", exc_info=True)
         raise HTTPException(
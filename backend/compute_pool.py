@@ -0,0 +1,78 @@
+"""
+Compute pool for CPU-bound work off the event loop.
+
+This module provides a shared thread pool with:
+- Lazy start on first use (no startup hook required)
+- An awaitable run() for synchronous functions
+- Shutdown during application teardown
+
+Use cases:
+- NumPy projections and simulations (NumPy releases the GIL in array
+  operations, so several projections run in parallel)
+- Any calculation that would otherwise block request handling
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from config import settings
+
+T = TypeVar('T')
+
+
+class ComputePool:
+    """
+    Thread pool wrapper for running CPU-bound functions from async code.
+
+    Attributes:
+        executor: Thread pool executor (created on first use)
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """Initialize compute pool (the executor starts lazily)."""
+        self.max_workers = max_workers
+        self.executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the executor, creating it if needed."""
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.max_workers or settings.COMPUTE_POOL_WORKERS,
+                thread_name_prefix="compute"
+            )
+        return self.executor
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a synchronous function on the pool and await its result.
+
+        Args:
+            func: Function to run
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            The function's return value (exceptions propagate)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(),
+            functools.partial(func, *args, **kwargs)
+        )
+
+    async def shutdown(self) -> None:
+        """
+        Shut down the pool, waiting for running work to finish.
+
+        The wait happens on a worker thread so the event loop keeps serving
+        other shutdown hooks. Should be called during application shutdown.
+        """
+        executor, self.executor = self.executor, None
+        if executor is not None:
+            await asyncio.to_thread(executor.shutdown, True)
+
+
+# Global compute pool instance
+compute_pool = ComputePool()
@@ -62,6 +62,14 @@ class Settings(BaseSettings):
     REDIS_DB: int = Field(default=0, description="Redis database number")
     REDIS_MAX_CONNECTIONS: int = Field(default=10, description="Redis connection pool size")
 
+    # Compute pool (CPU-bound projections)
+    COMPUTE_POOL_WORKERS: int = Field(default=4, description="Worker threads for CPU-bound calculations")
+
+    # Behavior tracking write-behind buffer
+    BEHAVIOR_BUFFER_MAX_SIZE: int = Field(default=10000, description="Buffered behavior events before new events are dropped")
+    BEHAVIOR_BUFFER_FLUSH_SIZE: int = Field(default=500, description="Buffered behavior events that trigger a flush")
+    BEHAVIOR_BUFFER_FLUSH_INTERVAL: float = Field(default=5.0, description="Seconds between behavior buffer flushes")
+
     # Security - JWT (RS256 with asymmetric keys)
     JWT_ALGORITHM: str = Field(default="RS256", description="JWT algorithm (RS256 for asymmetric signing)")
     JWT_PRIVATE_KEY_PATH: str = Field(
@@ -92,6 +100,16 @@ class Settings(BaseSettings):
         default=None,
         description="Encryption key for sensitive data (AES-256)"
     )
+    ENCRYPTION_KEYS_PREVIOUS: Optional[str] = Field(
+        default=None,
+        description="Comma-separated retired encryption keys, still accepted for decryption during key rotation"
+    )
+
+    # Internal Jobs
+    INTERNAL_API_KEY: Optional[str] = Field(
+        default=None,
+        description="Shared secret for internal job endpoints (market data feed, nightly batches); unset disables them"
+    )
 
     # Email Configuration
     EMAIL_BACKEND: str = Field(
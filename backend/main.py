@@ -17,6 +17,8 @@ from typing import AsyncGenerator
 from config import settings
 from database import engine, Base
 from redis_client import redis_client
+from compute_pool import compute_pool
+from services.personalization.behavior_buffer import behavior_buffer
 
 # Configure logging
 logging.basicConfig(
@@ -62,6 +64,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.warning(f"Error closing Redis connection: {e}")
 
+    # Write buffered behavior events
+    try:
+        await behavior_buffer.close()
+        logger.info("Behavior buffer flushed")
+    except Exception as e:
+        logger.warning(f"Error flushing behavior buffer: {e}")
+
+    # Stop compute pool
+    await compute_pool.shutdown()
+    logger.info("Compute pool stopped")
+
 
 # Initialize FastAPI application
 app = FastAPI(
@@ -12,6 +12,7 @@ Key Features:
 - User context injection into endpoints
 - Comprehensive error handling with 401 responses
 - Optional authentication for public endpoints
+- Service credential for internal job endpoints (X-Internal-API-Key)
 
 Usage:
     @router.get("/protected")
@@ -31,12 +32,14 @@ Performance:
 """
 
 import logging
+import secrets
 from typing import Optional
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, Header, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from config import settings
 from database import get_db
 from utils.jwt import verify_token
 from services.session import session_service
@@ -216,6 +219,44 @@ async def get_current_active_user(
     return user_id
 
 
+async def require_internal_service(
+    x_internal_api_key: Optional[str] = Header(None),
+) -> str:
+    """
+    Dependency for internal job endpoints (market data feed, nightly batches).
+
+    These act on every user's data, so an ordinary user session is not
+    enough: the caller must present the INTERNAL_API_KEY shared secret in
+    the X-Internal-API-Key header. With no key configured the endpoints are
+    disabled.
+
+    Args:
+        x_internal_api_key: X-Internal-API-Key header value
+
+    Returns:
+        str: Caller identity for logging ("internal")
+
+    Raises:
+        HTTPException: 403 Forbidden if the key is missing, wrong or not configured
+
+    Example:
+        @router.post("/jobs/reprice")
+        async def reprice(caller: str = Depends(require_internal_service)):
+            ...
+    """
+    expected = settings.INTERNAL_API_KEY
+    if not expected or not x_internal_api_key or not secrets.compare_digest(
+        x_internal_api_key.encode(), expected.encode()
+    ):
+        logger.warning("Rejected internal job request: invalid or missing service credential")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Internal service credential required",
+        )
+
+    return "internal"
+
+
 def _extract_bearer_token(authorization: Optional[str]) -> str:
     """
     Extract Bearer token from Authorization header.
@@ -20,11 +20,15 @@ from .life_assurance import (
 )
 from .investment import (
     InvestmentAccount,
+    Security,
     InvestmentHolding,
     TaxLot,
     DividendIncome,
     CapitalGainRealized,
     TaxAdvantagedInvestment,
+    ShareMatch,
+    Section104PoolSnapshot,
+    MatchingRule,
 )
 from .recommendation import (
     Recommendation,
@@ -72,11 +76,17 @@ from .scenario import (
 from .personalization import (
     UserPreference,
     UserBehavior,
+    UserBehaviorDaily,
     PersonalizedInsight,
     PreferenceType,
     ActionType,
     InsightType,
 )
+from .rule_evaluation import (
+    RuleInput,
+    RuleInputChange,
+    RuleEvaluationState,
+)
 
 __all__ = [
     "User",
@@ -102,11 +112,15 @@ __all__ = [
     "PolicyTrustDetail",
     "PolicyDocument",
     "InvestmentAccount",
+    "Security",
     "InvestmentHolding",
     "TaxLot",
     "DividendIncome",
     "CapitalGainRealized",
     "TaxAdvantagedInvestment",
+    "ShareMatch",
+    "Section104PoolSnapshot",
+    "MatchingRule",
     "Recommendation",
     "RecommendationType",
     "RecommendationPriority",
@@ -144,8 +158,12 @@ __all__ = [
     "ScenarioStatus",
     "UserPreference",
     "UserBehavior",
+    "UserBehaviorDaily",
     "PersonalizedInsight",
     "PreferenceType",
     "ActionType",
     "InsightType",
+    "RuleInput",
+    "RuleInputChange",
+    "RuleEvaluationState",
 ]
@@ -3,10 +3,12 @@ Investment account and holdings models for portfolio tracking.
 
 This module provides SQLAlchemy models for:
 - Investment accounts (ISA, GIA, VCT, EIS, SEIS, SA accounts)
+- Security master with shared latest prices
 - Investment holdings with encrypted account numbers
 - Tax lot tracking for FIFO CGT calculations
 - Dividend income tracking
 - Realized capital gains tracking
+- UK share matching (same-day, 30-day, Section 104 pool)
 
 Business logic:
 - Account number encryption for security
@@ -20,18 +22,19 @@ Business logic:
 import uuid
 from datetime import datetime, date
 from decimal import Decimal
-from typing import Optional, List
+from typing import Optional, List, Sequence
 import enum
 
 from sqlalchemy import (
     Column, String, ForeignKey, Numeric, Boolean, DateTime,
-    Date, Text, CheckConstraint, Index, Enum as SQLEnum, Integer
+    Date, Text, CheckConstraint, Index, Enum as SQLEnum, Integer, text,
+    UniqueConstraint, case, func, select
 )
-from sqlalchemy.orm import relationship, validates
+from sqlalchemy.orm import Session, relationship, validates
 
 from database import Base
 from models.user import GUID
-from utils.encryption import encrypt_value, decrypt_value
+from utils.encryption import encrypt_value, decrypt_value, masked_suffix, mask_value
 from dateutil.relativedelta import relativedelta
 
 
@@ -99,6 +102,13 @@ class DisposalMethod(str, enum.Enum):
     SPECIFIC_IDENTIFICATION = 'SPECIFIC_IDENTIFICATION'
 
 
+class MatchingRule(str, enum.Enum):
+    """UK CGT share identification rule, in order of priority."""
+    SAME_DAY = 'SAME_DAY'
+    BED_AND_BREAKFAST = 'BED_AND_BREAKFAST'
+    SECTION_104 = 'SECTION_104'
+
+
 class SourceCountry(str, enum.Enum):
     """Source country enumeration for dividends."""
     UK = 'UK'
@@ -135,6 +145,9 @@ class InvestmentAccount(Base):
 
     __tablename__ = 'investment_accounts'
 
+    # Fernet-encrypted attributes (re-encrypted by key rotation)
+    ENCRYPTED_FIELDS = ('account_number_encrypted',)
+
     # Primary Key
     id = Column(GUID, primary_key=True, default=uuid.uuid4)
     user_id = Column(
@@ -202,20 +215,29 @@ class InvestmentAccount(Base):
         """
         self.account_number_encrypted = encrypt_value(account_number)
         # Store last 4 digits for display
-        if len(account_number) >= 4:
-            self.account_number_last_4 = account_number[-4:]
-        else:
-            self.account_number_last_4 = account_number
+        self.account_number_last_4 = masked_suffix(account_number)
 
     def get_account_number(self) -> str:
         """
         Decrypt and return account number.
 
+        Only for explicit reveals; use masked_account_number for display.
+
         Returns:
             str: Decrypted account number
         """
         return decrypt_value(self.account_number_encrypted)
 
+    @property
+    def masked_account_number(self) -> str:
+        """
+        Get the account number masked for display (no decryption).
+
+        Returns:
+            str: e.g. "****1234"
+        """
+        return mask_value(self.account_number_last_4)
+
     def __repr__(self) -> str:
         return (
             f"<InvestmentAccount(id={self.id}, user_id={self.user_id}, "
@@ -223,6 +245,56 @@ class InvestmentAccount(Base):
         )
 
 
+class Security(Base):
+    """
+    Security master with the latest market price.
+
+    One row per listed security (ticker + exchange), shared by every holding
+    of that security, so repricing writes one row per security rather than
+    one row per holding.
+    """
+
+    __tablename__ = 'securities'
+
+    # Primary Key
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
+
+    # Identification ('' exchange = unspecified listing)
+    ticker = Column(String(20), nullable=False)
+    exchange = Column(String(20), nullable=False, default='')
+    isin = Column(String(12), nullable=True)
+    security_name = Column(String(255), nullable=True)
+
+    # Latest Price (NULL until the first price is received)
+    current_price = Column(Numeric(15, 4), nullable=True)
+    price_currency = Column(String(3), nullable=True)
+    last_price_update = Column(DateTime, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False
+    )
+
+    # Relationships
+    holdings = relationship("InvestmentHolding", back_populates="security")
+
+    # Table Constraints
+    __table_args__ = (
+        CheckConstraint('current_price >= 0', name='check_security_non_negative_price'),
+        UniqueConstraint('ticker', 'exchange', name='uq_security_ticker_exchange'),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<Security(id={self.id}, ticker={self.ticker}, "
+            f"exchange={self.exchange}, current_price={self.current_price})>"
+        )
+
+
 class InvestmentHolding(Base):
     """
     Investment holding tracking with calculated metrics.
@@ -255,12 +327,24 @@ class InvestmentHolding(Base):
     isin = Column(String(12), nullable=True)
     security_name = Column(String(255), nullable=False)
 
+    # Shared security master row; when priced, its price overrides current_price
+    security_id = Column(
+        GUID,
+        ForeignKey('securities.id', ondelete='SET NULL'),
+        nullable=True,
+        index=True
+    )
+
     # Quantity and Pricing
     quantity = Column(Numeric(15, 4), nullable=False)
     purchase_date = Column(Date, nullable=False)
     purchase_price = Column(Numeric(15, 4), nullable=False)
     purchase_currency = Column(String(3), nullable=False)
+    # Holding's own price: used for unlisted holdings, until the security is
+    # priced, or when the user entered it manually (price_overridden)
     current_price = Column(Numeric(15, 4), nullable=False)
+    # Manual price edits apply to this holding only, never the shared security
+    price_overridden = Column(Boolean, default=False, nullable=False)
 
     # Asset Classification
     asset_class = Column(
@@ -290,6 +374,8 @@ class InvestmentHolding(Base):
 
     # Relationships
     account = relationship("InvestmentAccount", back_populates="holdings")
+    # selectin: priced with one extra IN query per batch of holdings loaded
+    security = relationship("Security", back_populates="holdings", lazy="selectin")
     tax_lots = relationship(
         "TaxLot",
         back_populates="holding",
@@ -321,15 +407,54 @@ class InvestmentHolding(Base):
         Index('idx_investment_holding_ticker', 'ticker'),
     )
 
+    def _priced_security(self) -> Optional["Security"]:
+        """
+        Return the linked security if it is loaded, has a price and the
+        holding's price was not entered manually.
+
+        Reads the instance dict so a property never triggers a lazy load
+        (which is not allowed on async sessions).
+        """
+        if self.price_overridden:
+            return None
+        security = self.__dict__.get('security')
+        if security is not None and security.current_price is not None:
+            return security
+        return None
+
+    @property
+    def market_price(self) -> Decimal:
+        """
+        Get the price used for valuation.
+
+        Returns:
+            Decimal: Security master price if priced (and not overridden),
+            else the holding's current_price
+        """
+        security = self._priced_security()
+        price = security.current_price if security else self.current_price
+        return Decimal(str(price))
+
+    @property
+    def market_price_updated_at(self) -> Optional[datetime]:
+        """
+        Get the timestamp of the price used for valuation.
+
+        Returns:
+            datetime: Last price update, or None if never updated
+        """
+        security = self._priced_security()
+        return security.last_price_update if security else self.last_price_update
+
     @property
     def current_value(self) -> Decimal:
         """
         Calculate current value of holding.
 
         Returns:
-            Decimal: Current value (current_price * quantity)
+            Decimal: Current value (market_price * quantity)
         """
-        return Decimal(str(self.current_price)) * Decimal(str(self.quantity))
+        return self.market_price * Decimal(str(self.quantity))
 
     @property
     def unrealized_gain(self) -> Decimal:
@@ -339,7 +464,7 @@ class InvestmentHolding(Base):
         Returns:
             Decimal: Unrealized gain (can be negative for loss)
         """
-        return (Decimal(str(self.current_price)) - Decimal(str(self.purchase_price))) * Decimal(str(self.quantity))
+        return (self.market_price - Decimal(str(self.purchase_price))) * Decimal(str(self.quantity))
 
     @property
     def unrealized_gain_percentage(self) -> Decimal:
@@ -351,7 +476,7 @@ class InvestmentHolding(Base):
         """
         if self.purchase_price == 0:
             return Decimal('0.00')
-        percentage = ((Decimal(str(self.current_price)) - Decimal(str(self.purchase_price))) / Decimal(str(self.purchase_price))) * 100
+        percentage = ((self.market_price - Decimal(str(self.purchase_price))) / Decimal(str(self.purchase_price))) * 100
         # Round to 2 decimal places for display
         return percentage.quantize(Decimal('0.01'))
 
@@ -362,6 +487,48 @@ class InvestmentHolding(Base):
         )
 
 
+def market_price_expression():
+    """
+    SQL equivalent of InvestmentHolding.market_price.
+
+    The query must outer-join Security on InvestmentHolding.security_id.
+    """
+    return case(
+        (InvestmentHolding.price_overridden == True, InvestmentHolding.current_price),
+        else_=func.coalesce(Security.current_price, InvestmentHolding.current_price)
+    )
+
+
+def holding_owners(session: Session, holdings: Sequence[InvestmentHolding]) -> List[Optional[uuid.UUID]]:
+    """
+    Owning users of holdings (holdings reference their account, not the user).
+
+    For flush listeners: accounts pending in the session are read directly
+    and the rest are resolved with one account_id IN (...) query. Owners are
+    cached on the session, as an account never changes owner.
+
+    Args:
+        session: Session being flushed
+        holdings: Holdings to resolve
+
+    Returns:
+        Owning user ID per holding (None if the account doesn't exist)
+    """
+    owners = session.info.setdefault('account_owners', {})
+    for instance in session.new:
+        if isinstance(instance, InvestmentAccount) and instance.id is not None:
+            owners[instance.id] = instance.user_id
+
+    missing = {holding.account_id for holding in holdings} - owners.keys() - {None}
+    if missing:
+        owners.update(session.connection().execute(
+            select(InvestmentAccount.id, InvestmentAccount.user_id)
+            .where(InvestmentAccount.id.in_(missing))
+        ).all())
+
+    return [owners.get(holding.account_id) for holding in holdings]
+
+
 class TaxLot(Base):
     """
     Tax lot tracking for FIFO CGT calculations.
@@ -369,7 +536,8 @@ class TaxLot(Base):
     Tracks individual purchase lots for accurate capital gains tax calculation with:
     - Purchase details and cost basis
     - Multi-currency cost basis (GBP and ZAR)
-    - Disposal tracking
+    - Open-lot cursor (remaining_quantity) so partially sold lots stay in the queue
+    - Disposal tracking (cumulative across partial disposals)
     - FIFO, average cost, or specific identification methods
     """
 
@@ -395,6 +563,14 @@ class TaxLot(Base):
     cost_basis_zar = Column(Numeric(15, 2), nullable=False)
     exchange_rate = Column(Numeric(10, 6), nullable=False)
 
+    # Open-lot cursor: quantity not yet matched against a disposal.
+    # Defaults to the purchased quantity so new lots enter the FIFO queue open.
+    remaining_quantity = Column(
+        Numeric(15, 4),
+        nullable=False,
+        default=lambda context: context.get_current_parameters()['quantity']
+    )
+
     # Disposal Details
     disposal_date = Column(Date, nullable=True)
     disposal_quantity = Column(Numeric(15, 4), nullable=True)
@@ -420,9 +596,27 @@ class TaxLot(Base):
         CheckConstraint('cost_basis_zar >= 0', name='check_tax_lot_non_negative_cost_basis_zar'),
         CheckConstraint('disposal_quantity IS NULL OR disposal_quantity > 0', name='check_tax_lot_positive_disposal_quantity'),
         CheckConstraint('disposal_proceeds IS NULL OR disposal_proceeds >= 0', name='check_tax_lot_non_negative_disposal_proceeds'),
+        CheckConstraint('remaining_quantity >= 0', name='check_tax_lot_non_negative_remaining_quantity'),
         Index('idx_tax_lot_holding_disposal', 'holding_id', 'disposal_date'),
+        # Partial index over open lots only: FIFO sales never scan fully disposed lots
+        Index(
+            'idx_tax_lot_open_fifo',
+            'holding_id', 'purchase_date', 'created_at',
+            postgresql_where=text('remaining_quantity > 0'),
+            sqlite_where=text('remaining_quantity > 0'),
+        ),
     )
 
+    @property
+    def is_open(self) -> bool:
+        """
+        Check whether the lot still has quantity available for disposal.
+
+        Returns:
+            bool: True if remaining_quantity > 0
+        """
+        return self.remaining_quantity is not None and self.remaining_quantity > 0
+
     def __repr__(self) -> str:
         return (
             f"<TaxLot(id={self.id}, holding_id={self.holding_id}, "
@@ -535,6 +729,11 @@ class CapitalGainRealized(Base):
 
     # Relationships
     holding = relationship("InvestmentHolding", back_populates="capital_gains")
+    share_matches = relationship(
+        "ShareMatch",
+        back_populates="capital_gain",
+        cascade="all, delete-orphan"
+    )
 
     # Table Constraints
     __table_args__ = (
@@ -552,6 +751,109 @@ class CapitalGainRealized(Base):
         )
 
 
+class ShareMatch(Base):
+    """
+    UK share identification match for a realized disposal.
+
+    Each row records how part of a disposal was matched under the UK CGT
+    share identification rules:
+    - SAME_DAY: acquisitions on the disposal date
+    - BED_AND_BREAKFAST: acquisitions in the 30 days after the disposal
+    - SECTION_104: the pooled average cost (acquisition_date is NULL)
+
+    Matches dated against later acquisitions let back-dated trades be
+    re-matched incrementally without replaying the whole transaction log.
+    """
+
+    __tablename__ = 'share_matches'
+
+    # Primary Key
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
+    holding_id = Column(
+        GUID,
+        ForeignKey('investment_holdings.id', ondelete='CASCADE'),
+        nullable=False,
+        index=True
+    )
+    capital_gain_id = Column(
+        GUID,
+        ForeignKey('capital_gains_realized.id', ondelete='CASCADE'),
+        nullable=False,
+        index=True
+    )
+
+    # Match Details
+    disposal_date = Column(Date, nullable=False)
+    matching_rule = Column(
+        SQLEnum(MatchingRule, name='matching_rule_enum', create_type=False, values_callable=lambda x: [e.value for e in x]),
+        nullable=False
+    )
+    acquisition_date = Column(Date, nullable=True)  # NULL for Section 104 pool matches
+    quantity = Column(Numeric(15, 4), nullable=False)
+    allowable_cost = Column(Numeric(15, 2), nullable=False)
+
+    # Timestamp
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationships
+    capital_gain = relationship("CapitalGainRealized", back_populates="share_matches")
+
+    # Table Constraints
+    __table_args__ = (
+        CheckConstraint('quantity > 0', name='check_share_match_positive_quantity'),
+        CheckConstraint('allowable_cost >= 0', name='check_share_match_non_negative_cost'),
+        Index('idx_share_match_holding_disposal_date', 'holding_id', 'disposal_date'),
+        Index('idx_share_match_holding_acquisition_date', 'holding_id', 'acquisition_date'),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ShareMatch(id={self.id}, capital_gain_id={self.capital_gain_id}, "
+            f"rule={self.matching_rule}, quantity={self.quantity})>"
+        )
+
+
+class Section104PoolSnapshot(Base):
+    """
+    Section 104 pool state for a holding at the end of a transaction date.
+
+    One row per date on which the pool changed. The latest snapshot before a
+    back-dated trade is the starting point for incremental re-matching.
+    """
+
+    __tablename__ = 'section_104_pool_snapshots'
+
+    # Primary Key
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
+    holding_id = Column(
+        GUID,
+        ForeignKey('investment_holdings.id', ondelete='CASCADE'),
+        nullable=False,
+        index=True
+    )
+
+    # Pool State
+    snapshot_date = Column(Date, nullable=False)
+    pool_quantity = Column(Numeric(15, 4), nullable=False)
+    pool_cost = Column(Numeric(15, 2), nullable=False)
+
+    # Timestamp
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Table Constraints
+    __table_args__ = (
+        CheckConstraint('pool_quantity >= 0', name='check_pool_snapshot_non_negative_quantity'),
+        CheckConstraint('pool_cost >= 0', name='check_pool_snapshot_non_negative_cost'),
+        UniqueConstraint('holding_id', 'snapshot_date', name='uq_pool_snapshot_holding_date'),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<Section104PoolSnapshot(holding_id={self.holding_id}, date={self.snapshot_date}, "
+            f"quantity={self.pool_quantity}, cost={self.pool_cost})>"
+        )
+
+
 class TaxAdvantagedInvestment(Base):
     """
     Tax-advantaged investment tracking (EIS, SEIS, VCT).
@@ -31,7 +31,7 @@ from sqlalchemy.orm import relationship, validates
 
 from database import Base
 from models.user import GUID
-from utils.encryption import encrypt_value, decrypt_value
+from utils.encryption import encrypt_value, decrypt_value, masked_suffix, mask_value
 
 
 class ProviderCountry(str, enum.Enum):
@@ -114,6 +114,9 @@ class LifeAssurancePolicy(Base):
 
     __tablename__ = 'life_assurance_policies'
 
+    # Fernet-encrypted attributes (re-encrypted by key rotation)
+    ENCRYPTED_FIELDS = ('policy_number_encrypted',)
+
     # Primary Key
     id = Column(GUID, primary_key=True, default=uuid.uuid4)
     user_id = Column(
@@ -125,6 +128,7 @@ class LifeAssurancePolicy(Base):
 
     # Policy Details
     policy_number_encrypted = Column(Text, nullable=False)  # Encrypted policy number
+    policy_number_last_4 = Column(String(4), nullable=True)  # Last 4 characters for display
     provider = Column(String(255), nullable=False)
     provider_country = Column(
         SQLEnum(ProviderCountry, name='provider_country_enum', create_type=False, values_callable=lambda x: [e.value for e in x]),
@@ -248,16 +252,29 @@ class LifeAssurancePolicy(Base):
             policy_number: Plain text policy number
         """
         self.policy_number_encrypted = encrypt_value(policy_number)
+        self.policy_number_last_4 = masked_suffix(policy_number)
 
     def get_policy_number(self) -> str:
         """
         Decrypt and return policy number.
 
+        Only for explicit reveals; use masked_policy_number for display.
+
         Returns:
             str: Decrypted policy number
         """
         return decrypt_value(self.policy_number_encrypted)
 
+    @property
+    def masked_policy_number(self) -> str:
+        """
+        Get the policy number masked for display (no decryption).
+
+        Returns:
+            str: e.g. "****1234"
+        """
+        return mask_value(self.policy_number_last_4)
+
     def calculate_annual_premium(self) -> Decimal:
         """
         Calculate annual premium based on frequency.
@@ -323,6 +340,9 @@ class PolicyBeneficiary(Base):
 
     __tablename__ = 'policy_beneficiaries'
 
+    # Fernet-encrypted attributes (re-encrypted by key rotation)
+    ENCRYPTED_FIELDS = ('name_encrypted', 'date_of_birth_encrypted', 'address_encrypted')
+
     # Primary Key
     id = Column(GUID, primary_key=True, default=uuid.uuid4)
     policy_id = Column(
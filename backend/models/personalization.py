@@ -4,6 +4,7 @@ Personalization Engine database models.
 This module provides SQLAlchemy models for:
 - User preferences (dashboard layout, currency, notifications, etc.)
 - User behavior tracking (page views, feature usage, clicks)
+- Daily behavior aggregates (incrementally maintained counters)
 - Personalized insights (tailored recommendations)
 
 Business logic:
@@ -21,8 +22,8 @@ from decimal import Decimal
 from typing import Optional
 
 from sqlalchemy import (
-    Column, String, ForeignKey, Numeric, Boolean, DateTime,
-    Text, Index, Enum as SQLEnum, CheckConstraint
+    Column, String, ForeignKey, Numeric, Boolean, DateTime, Date, Integer,
+    Text, Index, Enum as SQLEnum, CheckConstraint, UniqueConstraint
 )
 from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.orm import relationship, Mapped
@@ -193,6 +194,59 @@ class UserBehavior(Base):
         )
 
 
+class UserBehaviorDaily(Base):
+    """
+    Per-user daily behavior aggregates.
+
+    One row per user per UTC day, updated as behavior events are written
+    (see services/personalization/behavior_aggregates.py), so analysis reads
+    one row per day instead of every raw event.
+
+    Counters:
+    - total_actions: All actions that day
+    - page_views: {page: count} from PAGE_VIEW actions
+    - feature_uses: {feature: count} from FEATURE_USAGE actions
+    - hourly_actions: 24 counts, actions per UTC hour of day
+    """
+
+    __tablename__ = 'user_behavior_daily'
+
+    # Primary Key
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
+    user_id = Column(
+        GUID,
+        ForeignKey('users.id', ondelete='CASCADE'),
+        nullable=False
+    )
+    activity_date = Column(Date, nullable=False, doc="UTC day")
+
+    # Counters
+    total_actions = Column(Integer, default=0, nullable=False)
+    page_views = Column(JSON, default=dict, nullable=False, doc="Page -> view count")
+    feature_uses = Column(JSON, default=dict, nullable=False, doc="Feature -> use count")
+    hourly_actions = Column(JSON, nullable=False, doc="Actions per UTC hour (24 counts)")
+
+    # Timestamps
+    updated_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False
+    )
+
+    # Table Constraints
+    __table_args__ = (
+        UniqueConstraint('user_id', 'activity_date', name='uq_user_behavior_daily_user_date'),
+        CheckConstraint('total_actions >= 0', name='check_behavior_daily_non_negative_total'),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<UserBehaviorDaily(user_id={self.user_id}, date={self.activity_date}, "
+            f"total_actions={self.total_actions})>"
+        )
+
+
 class PersonalizedInsight(Base):
     """
     Personalized insights for users.
@@ -102,6 +102,9 @@ class UKPension(Base):
 
     __tablename__ = 'uk_pensions'
 
+    # Fernet-encrypted attributes (re-encrypted by key rotation)
+    ENCRYPTED_FIELDS = ('scheme_reference_encrypted',)
+
     # Primary Key
     id = Column(GUID, primary_key=True, default=uuid.uuid4)
     user_id = Column(
@@ -1237,6 +1240,9 @@ class SARetirementFund(Base):
 
     __tablename__ = 'sa_retirement_funds'
 
+    # Fernet-encrypted attributes (re-encrypted by key rotation)
+    ENCRYPTED_FIELDS = ('fund_number_encrypted',)
+
     # Primary Key
     id = Column(GUID, primary_key=True, default=uuid.uuid4)
     user_id = Column(
@@ -0,0 +1,210 @@
+"""
+Rule evaluation tracking models.
+
+Recommendation and proactive alert rules declare the inputs they read
+(see services/ai/rule_engine.py). These models record when each user's
+inputs last changed and when rules were last evaluated for them, so batch
+jobs re-run only the rules whose inputs changed.
+
+Business logic:
+- Input changes are collected on flush from writes to the tracked models
+  and stamped when the transaction commits (one row per user per input,
+  holding the latest change time)
+- Calendar inputs (tax years, allowance deadlines, month) change with time,
+  not writes; the evaluator compares them against the stored clock instead
+- A user with no evaluation state has every rule evaluated
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from uuid import UUID
+import enum
+
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Index, event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from database import Base
+from models.user import GUID
+from models.tax_status import UserTaxStatus
+from models.income import UserIncome
+from models.savings_account import SavingsAccount, ISAContribution, TFSAContribution
+from models.investment import InvestmentAccount, InvestmentHolding, holding_owners
+from models.life_assurance import CoverageNeedsAnalysis
+from models.goal import FinancialGoal
+
+
+class RuleInput(str, enum.Enum):
+    """Data a rule can depend on."""
+    # Changed by writes (tracked below)
+    TAX_STATUS = 'tax_status'
+    COVERAGE = 'coverage'
+    INCOME = 'income'
+    SAVINGS = 'savings'
+    INVESTMENTS = 'investments'
+    ISA_ALLOWANCE = 'isa_allowance'
+    TFSA_ALLOWANCE = 'tfsa_allowance'
+    GOALS = 'goals'
+
+    # Changed by time passing
+    UK_TAX_YEAR = 'clock:uk_tax_year'
+    SA_TAX_YEAR = 'clock:sa_tax_year'
+    UK_ALLOWANCE_DEADLINE = 'clock:uk_allowance_deadline'
+    SA_ALLOWANCE_DEADLINE = 'clock:sa_allowance_deadline'
+    MONTH = 'clock:month'
+
+
+class RuleInputChange(Base):
+    """
+    Latest change time of one of a user's rule inputs.
+
+    One row per (user, input), upserted whenever a tracked model is written.
+    """
+
+    __tablename__ = 'rule_input_changes'
+
+    user_id = Column(
+        GUID,
+        ForeignKey('users.id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    input_name = Column(String(50), primary_key=True)
+    changed_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index('idx_rule_input_changes_changed_at', 'changed_at'),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<RuleInputChange(user_id={self.user_id}, "
+            f"input_name={self.input_name}, changed_at={self.changed_at})>"
+        )
+
+
+class RuleEvaluationState(Base):
+    """
+    When a batch evaluator last ran a user's rules.
+
+    clock is the JSON calendar state (tax years, deadline windows, month)
+    at that evaluation, serialized with sorted keys so it can be compared
+    in SQL.
+    """
+
+    __tablename__ = 'rule_evaluation_states'
+
+    user_id = Column(
+        GUID,
+        ForeignKey('users.id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    evaluator = Column(String(50), primary_key=True)  # e.g. "proactive_alerts"
+
+    evaluated_at = Column(DateTime, nullable=False)
+    clock = Column(Text, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<RuleEvaluationState(user_id={self.user_id}, "
+            f"evaluator={self.evaluator}, evaluated_at={self.evaluated_at})>"
+        )
+
+
+# ============================================================================
+# INPUT CHANGE TRACKING
+# ============================================================================
+
+def _user_owners(session: Session, instances: Sequence[Any]) -> List[Optional[UUID]]:
+    """Owning users of models with a user_id column."""
+    return [instance.user_id for instance in instances]
+
+
+# Model -> (input it changes, owning users resolver)
+TRACKED_MODELS: Dict[type, tuple] = {
+    UserTaxStatus: (RuleInput.TAX_STATUS, _user_owners),
+    CoverageNeedsAnalysis: (RuleInput.COVERAGE, _user_owners),
+    UserIncome: (RuleInput.INCOME, _user_owners),
+    SavingsAccount: (RuleInput.SAVINGS, _user_owners),
+    InvestmentAccount: (RuleInput.INVESTMENTS, _user_owners),
+    InvestmentHolding: (RuleInput.INVESTMENTS, holding_owners),
+    ISAContribution: (RuleInput.ISA_ALLOWANCE, _user_owners),
+    TFSAContribution: (RuleInput.TFSA_ALLOWANCE, _user_owners),
+    FinancialGoal: (RuleInput.GOALS, _user_owners),
+}
+
+
+def upsert_input_changes(connection, user_ids: Iterable[UUID], rule_input: RuleInput) -> None:
+    """
+    Record that an input changed for users (for writes that bypass the ORM,
+    e.g. bulk UPDATEs).
+
+    Args:
+        connection: Connection in the writing transaction
+        user_ids: Users whose input changed
+        rule_input: Input that changed
+    """
+    now = datetime.utcnow()
+    _upsert(connection, [
+        {'user_id': user_id, 'input_name': rule_input.value, 'changed_at': now}
+        for user_id in sorted(user_ids, key=str)
+    ])
+
+
+def _upsert(connection, rows) -> None:
+    """INSERT ... ON CONFLICT DO UPDATE, so concurrent writers never collide."""
+    if not rows:
+        return
+    insert = postgresql.insert if connection.dialect.name == 'postgresql' else sqlite.insert
+    stmt = insert(RuleInputChange).values(rows)
+    connection.execute(stmt.on_conflict_do_update(
+        index_elements=['user_id', 'input_name'],
+        set_={'changed_at': stmt.excluded.changed_at}
+    ))
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_rule_input_changes(session, flush_context, instances):
+    """Record (user, input) pairs written in this flush."""
+    pending = session.info.setdefault('rule_input_changes', set())
+    written: Dict[type, List[Any]] = {}
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if type(instance) not in TRACKED_MODELS:
+            continue
+        if instance in session.dirty and not session.is_modified(instance):
+            continue
+        written.setdefault(type(instance), []).append(instance)
+    # One owner lookup per model, not per instance
+    for model, instances in written.items():
+        rule_input, owners = TRACKED_MODELS[model]
+        for user_id in owners(session, instances):
+            if user_id is not None:
+                pending.add((user_id, rule_input))
+
+
+@event.listens_for(Session, "before_commit")
+def _write_rule_input_changes(session):
+    """
+    Upsert change times as the transaction commits.
+
+    Stamping at commit rather than at each flush keeps a change from being
+    dated before an evaluator run that starts while the transaction is still
+    open (that run can't see the change, and the next one would skip it).
+    """
+    # before_commit runs ahead of the final autoflush; flush so its writes are collected
+    session.flush()
+    pending = session.info.pop('rule_input_changes', None)
+    if not pending:
+        return
+    # Rows in a stable order, so concurrent transactions lock them in the same order
+    now = datetime.utcnow()
+    _upsert(session.connection(), [
+        {'user_id': user_id, 'input_name': rule_input.value, 'changed_at': now}
+        for user_id, rule_input in sorted(pending, key=lambda pair: (str(pair[0]), pair[1].value))
+    ])
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_rule_input_changes(session, previous_transaction):
+    # A savepoint rollback leaves the outer transaction (and its changes) open
+    if previous_transaction.parent is None:
+        session.info.pop('rule_input_changes', None)
@@ -13,6 +13,7 @@ Business logic:
 - ISA and TFSA mutual exclusivity
 - Soft delete for audit trail
 - Multi-currency with conversion support
+- ISA/TFSA allowance ledgers kept in step with contributions on flush
 """
 
 import uuid
@@ -21,16 +22,19 @@ from decimal import Decimal
 from typing import Optional
 import enum
 
+from collections import defaultdict
+
 from sqlalchemy import (
-    Column, String, ForeignKey, Numeric, Boolean, DateTime,
+    Column, String, ForeignKey, Numeric, Boolean, DateTime, Integer,
     Date, Text, CheckConstraint, UniqueConstraint, Index,
-    Enum as SQLEnum, func
+    Enum as SQLEnum, event, func, inspect, select
 )
-from sqlalchemy.orm import relationship, validates
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, relationship, validates
 
 from database import Base
 from models.user import GUID
-from utils.encryption import encrypt_account_number, decrypt_account_number
+from utils.encryption import encrypt_account_number, decrypt_account_number, masked_suffix, mask_value
 
 
 class AccountType(str, enum.Enum):
@@ -97,6 +101,9 @@ class SavingsAccount(Base):
 
     __tablename__ = 'savings_accounts'
 
+    # Fernet-encrypted attributes (re-encrypted by key rotation)
+    ENCRYPTED_FIELDS = ('account_number_encrypted',)
+
     # Primary Key
     id = Column(GUID, primary_key=True, default=uuid.uuid4)
     user_id = Column(
@@ -110,6 +117,7 @@ class SavingsAccount(Base):
     bank_name = Column(String(255), nullable=False)
     account_name = Column(String(255), nullable=False)  # User-defined name
     account_number_encrypted = Column(Text, nullable=False)  # Encrypted account number
+    account_number_last_4 = Column(String(4), nullable=True)  # Last 4 digits for display
 
     account_type = Column(
         SQLEnum(AccountType, name='savings_account_type_enum', create_type=False, values_callable=lambda x: [e.value for e in x]),
@@ -207,16 +215,29 @@ class SavingsAccount(Base):
             account_number: Plain text account number
         """
         self.account_number_encrypted = encrypt_account_number(account_number)
+        self.account_number_last_4 = masked_suffix(account_number)
 
     def get_account_number(self) -> str:
         """
         Decrypt and return account number.
 
+        Only for explicit reveals; use masked_account_number for display.
+
         Returns:
             str: Decrypted account number
         """
         return decrypt_account_number(self.account_number_encrypted)
 
+    @property
+    def masked_account_number(self) -> str:
+        """
+        Get the account number masked for display (no decryption).
+
+        Returns:
+            str: e.g. "****1234"
+        """
+        return mask_value(self.account_number_last_4)
+
     def __repr__(self) -> str:
         return (
             f"<SavingsAccount(id={self.id}, user_id={self.user_id}, "
@@ -426,6 +447,188 @@ class TFSAContribution(Base):
         )
 
 
+class ISAAllowanceLedger(Base):
+    """
+    Running ISA allowance usage per user per UK tax year.
+
+    One row per (user, tax year), so allowance checks are a primary-key
+    lookup instead of summing contributions. Maintained on flush from
+    ISAContribution inserts, updates and deletes (see below).
+    """
+
+    __tablename__ = 'isa_allowance_ledgers'
+
+    user_id = Column(
+        GUID,
+        ForeignKey('users.id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    tax_year = Column(String(7), primary_key=True)  # Format: "2024/25"
+
+    used = Column(Numeric(12, 2), nullable=False, default=Decimal('0.00'))
+    contribution_count = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ISAAllowanceLedger(user_id={self.user_id}, "
+            f"tax_year={self.tax_year}, used={self.used})>"
+        )
+
+
+class TFSAAllowanceLedger(Base):
+    """
+    Running TFSA allowance usage per user per SA tax year.
+
+    annual_used covers the row's tax year; lifetime_used is the user's
+    running total across all tax years, kept current on every one of the
+    user's rows so any row answers the lifetime check. Maintained on flush
+    from TFSAContribution inserts, updates and deletes (see below).
+    """
+
+    __tablename__ = 'tfsa_allowance_ledgers'
+
+    user_id = Column(
+        GUID,
+        ForeignKey('users.id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    tax_year = Column(String(7), primary_key=True)  # Format: "2024/25"
+
+    annual_used = Column(Numeric(12, 2), nullable=False, default=Decimal('0.00'))
+    lifetime_used = Column(Numeric(12, 2), nullable=False, default=Decimal('0.00'))
+    contribution_count = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<TFSAAllowanceLedger(user_id={self.user_id}, tax_year={self.tax_year}, "
+            f"annual_used={self.annual_used}, lifetime_used={self.lifetime_used})>"
+        )
+
+
+# ===== ALLOWANCE LEDGER MAINTENANCE =====
+
+def _committed_value(instance, key: str):
+    """Attribute value as last loaded from the database (before pending changes)."""
+    history = inspect(instance).attrs[key].history
+    return history.deleted[0] if history.deleted else getattr(instance, key)
+
+
+def _contribution_deltas(session: Session, model) -> dict:
+    """
+    Net (amount, count) change per (user_id, tax_year) from a flush.
+
+    Inserts add, deletes subtract, and updates move the old amount out of
+    the old (user, tax year) and the new amount into the new one.
+    """
+    deltas = defaultdict(lambda: [Decimal('0'), 0])
+
+    def add(user_id, tax_year, amount, count):
+        delta = deltas[(user_id, tax_year)]
+        delta[0] += Decimal(str(amount))
+        delta[1] += count
+
+    for instance in session.new:
+        if isinstance(instance, model):
+            add(instance.user_id, instance.tax_year, instance.contribution_amount, 1)
+    for instance in session.deleted:
+        if isinstance(instance, model):
+            add(
+                _committed_value(instance, 'user_id'),
+                _committed_value(instance, 'tax_year'),
+                -_committed_value(instance, 'contribution_amount'),
+                -1
+            )
+    for instance in session.dirty:
+        if isinstance(instance, model) and session.is_modified(instance):
+            add(
+                _committed_value(instance, 'user_id'),
+                _committed_value(instance, 'tax_year'),
+                -_committed_value(instance, 'contribution_amount'),
+                -1
+            )
+            add(instance.user_id, instance.tax_year, instance.contribution_amount, 1)
+
+    return {key: delta for key, delta in deltas.items() if delta[0] or delta[1]}
+
+
+def ensure_allowance_ledger(connection, model, user_id, tax_year: str) -> None:
+    """
+    Insert an empty ledger row for (user, tax year) if there is none.
+
+    Runs INSERT ... ON CONFLICT DO NOTHING, so a following SELECT ... FOR
+    UPDATE always has a row to lock, even before the first contribution of
+    the year. Concurrent first contributions then queue on that row instead
+    of both passing the allowance check and colliding on the primary key.
+    A new TFSA row starts from the user's current lifetime total.
+
+    Args:
+        connection: Connection or Session in the writing transaction
+        model: ISAAllowanceLedger or TFSAAllowanceLedger
+        user_id: User UUID
+        tax_year: Tax year string
+    """
+    values = {'user_id': user_id, 'tax_year': tax_year}
+    if model is TFSAAllowanceLedger:
+        values['lifetime_used'] = select(
+            func.coalesce(func.max(TFSAAllowanceLedger.lifetime_used), Decimal('0.00'))
+        ).where(TFSAAllowanceLedger.user_id == user_id).scalar_subquery()
+
+    dialect = connection.get_bind().dialect if isinstance(connection, Session) else connection.dialect
+    insert = postgresql.insert if dialect.name == 'postgresql' else sqlite.insert
+    connection.execute(
+        insert(model).values(**values).on_conflict_do_nothing(index_elements=['user_id', 'tax_year'])
+    )
+
+
+def _locked(session: Session, stmt):
+    """Run a ledger SELECT ... FOR UPDATE, refreshing any rows already in the session."""
+    return session.execute(
+        stmt.with_for_update().execution_options(populate_existing=True)
+    ).scalars().all()
+
+
+@event.listens_for(Session, "before_flush")
+def _update_allowance_ledgers(session, flush_context, instances):
+    """Apply contribution changes in this flush to the allowance ledgers."""
+    for (user_id, tax_year), (amount, count) in _contribution_deltas(session, ISAContribution).items():
+        ensure_allowance_ledger(session, ISAAllowanceLedger, user_id, tax_year)
+        ledger = _locked(session, select(ISAAllowanceLedger).where(
+            ISAAllowanceLedger.user_id == user_id,
+            ISAAllowanceLedger.tax_year == tax_year
+        ))[0]
+        ledger.used += amount
+        ledger.contribution_count += count
+
+    tfsa_deltas = _contribution_deltas(session, TFSAContribution)
+    for user_id in {user_id for user_id, _ in tfsa_deltas}:
+        user_deltas = {
+            tax_year: delta for (delta_user_id, tax_year), delta in tfsa_deltas.items()
+            if delta_user_id == user_id
+        }
+        for tax_year in user_deltas:
+            ensure_allowance_ledger(session, TFSAAllowanceLedger, user_id, tax_year)
+
+        ledgers = {
+            ledger.tax_year: ledger
+            for ledger in _locked(session, select(TFSAAllowanceLedger).where(
+                TFSAAllowanceLedger.user_id == user_id
+            ))
+        }
+        lifetime_used = next(iter(ledgers.values())).lifetime_used
+
+        for tax_year, (amount, count) in user_deltas.items():
+            ledgers[tax_year].annual_used += amount
+            ledgers[tax_year].contribution_count += count
+            lifetime_used += amount
+
+        for ledger in ledgers.values():
+            ledger.lifetime_used = lifetime_used
+
+
 # Create indexes explicitly for better control
 Index(
     "idx_savings_account_type",
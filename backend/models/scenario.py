@@ -34,6 +34,7 @@ from sqlalchemy.orm import relationship
 
 from database import Base
 from models.user import GUID
+from utils.projection_series import ProjectionSeries
 
 
 class ScenarioType(str, enum.Enum):
@@ -288,9 +289,9 @@ class ScenarioResult(Base):
         calculation_date: When results were calculated
         calculation_version: Version of calculation engine used
         projection_years: Number of years projected
-        net_worth_projection: Net worth projection over time (JSON array)
+        net_worth_projection: Net worth projection over time (columnar series)
         retirement_income_projection: Retirement income projection (JSON)
-        tax_liability_projection: Tax liability over time (JSON array)
+        tax_liability_projection: Tax liability over time (columnar series)
         goal_achievement_projection: Goal achievement likelihood (JSON)
         detailed_breakdown: Full detailed results (JSON)
         total_lifetime_tax: Total tax paid over projection period
@@ -348,11 +349,12 @@ class ScenarioResult(Base):
         doc="Number of years projected"
     )
 
-    # Projection Results (stored as JSON for flexibility)
+    # Projection Results (stored as JSON for flexibility; year-by-year
+    # series use the compact columnar layout from utils.projection_series)
     net_worth_projection = Column(
         JSON,
         nullable=True,
-        doc="Net worth projection over time (array of year objects)"
+        doc="Net worth projection over time (columnar series)"
     )
     retirement_income_projection = Column(
         JSON,
@@ -362,7 +364,7 @@ class ScenarioResult(Base):
     tax_liability_projection = Column(
         JSON,
         nullable=True,
-        doc="Tax liability over time (array of year objects)"
+        doc="Tax liability over time (columnar series)"
     )
     goal_achievement_projection = Column(
         JSON,
@@ -419,6 +421,26 @@ class ScenarioResult(Base):
     # Relationships
     scenario = relationship("Scenario", back_populates="results")
 
+    @property
+    def net_worth_series(self) -> Optional[ProjectionSeries]:
+        """
+        Get the net worth projection as a lazily decoded series.
+
+        Returns:
+            ProjectionSeries: Net worth by year, or None if not calculated
+        """
+        return ProjectionSeries.load(self.net_worth_projection)
+
+    @property
+    def tax_liability_series(self) -> Optional[ProjectionSeries]:
+        """
+        Get the tax liability projection as a lazily decoded series.
+
+        Returns:
+            ProjectionSeries: Tax by year, or None if not calculated
+        """
+        return ProjectionSeries.load(self.tax_liability_projection)
+
     # Constraints
     __table_args__ = (
         CheckConstraint(
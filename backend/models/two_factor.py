@@ -51,6 +51,9 @@ class User2FA(Base):
 
     __tablename__ = "user_2fa"
 
+    # Fernet-encrypted attributes (re-encrypted by key rotation)
+    ENCRYPTED_FIELDS = ('_secret_encrypted', '_backup_codes_encrypted')
+
     # Primary Key
     id = Column(
         GUID,
@@ -118,27 +121,25 @@ class User2FA(Base):
 
     def _get_cipher(self):
         """
-        Get Fernet cipher instance for encryption/decryption.
+        Get MultiFernet cipher instance for encryption/decryption.
+
+        Encrypts with ENCRYPTION_KEY and also decrypts with retired keys in
+        ENCRYPTION_KEYS_PREVIOUS during key rotation.
 
         Returns:
-            Fernet cipher instance
+            MultiFernet cipher instance
 
         Raises:
             ValueError: If ENCRYPTION_KEY not configured
         """
-        from cryptography.fernet import Fernet
+        from utils.encryption import build_multi_fernet
 
         if not settings.ENCRYPTION_KEY:
             raise ValueError(
                 "ENCRYPTION_KEY not configured. Cannot encrypt/decrypt 2FA data."
             )
 
-        # Ensure key is bytes
-        key = settings.ENCRYPTION_KEY
-        if isinstance(key, str):
-            key = key.encode()
-
-        return Fernet(key)
+        return build_multi_fernet(settings.ENCRYPTION_KEY, settings.ENCRYPTION_KEYS_PREVIOUS)
 
     @property
     def secret(self) -> str:
@@ -555,3 +555,15 @@ class GoalStatistics(BaseModel):
                 "at_risk_count": 1
             }
         }
+
+
+class GoalCheckSummary(BaseModel):
+    """Summary response for the nightly goal checks (internal job endpoint)."""
+
+    goals_updated: int = Field(..., ge=0, description="Goals whose progress changed from linked accounts")
+    goals_achieved: int = Field(..., ge=0, description="Goals achieved (by sync or manual progress)")
+    milestones_achieved: int = Field(..., ge=0, description="Milestones achieved")
+    timestamp: datetime = Field(
+        default_factory=datetime.utcnow,
+        description="When the checks were triggered"
+    )
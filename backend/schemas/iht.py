@@ -170,6 +170,15 @@ class EstateValuationResponse(BaseModel):
     asset_breakdown: List[Dict[str, Any]] = Field(default=[], description="Asset breakdown by type")
 
 
+class EstateValuationPointResponse(BaseModel):
+    """Response schema for one point of an estate valuation history."""
+    as_of_date: date = Field(..., description="Valuation date")
+    gross_estate: Decimal = Field(..., description="Gross estate value (all assets)")
+    total_liabilities: Decimal = Field(..., description="Total deductible liabilities")
+    net_estate: Decimal = Field(..., description="Net estate value (gross - liabilities)")
+    residence_value: Decimal = Field(..., description="RNRB-eligible residential property value")
+
+
 class IHTCalculationRequest(BaseModel):
     """Request schema for IHT calculation."""
     transferable_nrb_percent: Decimal = Field(
@@ -272,6 +281,16 @@ class PotentialIHTResponse(BaseModel):
     potential_iht: Decimal
 
 
+class GiftIHTExposureResponse(BaseModel):
+    """Response schema for IHT on lifetime gifts at a hypothetical death date."""
+    death_date: date
+    chargeable_gifts: int = Field(..., description="Gifts within 7 years of death")
+    chargeable_value: Decimal = Field(..., description="Value of gifts within 7 years of death")
+    gift_iht: Decimal = Field(..., description="IHT due on gifts after NRB and taper relief")
+    nrb_used_by_gifts: Decimal = Field(..., description="Nil rate band absorbed by gifts")
+    nrb_remaining: Decimal = Field(..., description="Nil rate band left for the estate")
+
+
 class ExemptionStatusResponse(BaseModel):
     """Response schema for exemption status."""
     annual_exemption_limit: Decimal
@@ -232,6 +232,12 @@ class CreateHoldingRequest(BaseModel):
         description="ISIN code (optional)"
     )
 
+    exchange: Optional[str] = Field(
+        None,
+        max_length=20,
+        description="Listing exchange code, e.g. LSE (optional)"
+    )
+
     @field_validator('purchase_date')
     @classmethod
     def validate_purchase_date(cls, v: date) -> date:
@@ -349,6 +355,33 @@ class UpdatePriceRequest(BaseModel):
         }
 
 
+class BulkPriceUpdateResponse(BaseModel):
+    """
+    Schema for bulk price update response.
+
+    Includes:
+    - Distinct securities in the feed
+    - Securities repriced and users affected
+    - Number of chunked UPDATE statements
+    """
+
+    securities_received: int
+    securities_updated: int
+    users_affected: int
+    chunks: int
+
+    class Config:
+        from_attributes = True
+        json_schema_extra = {
+            "example": {
+                "securities_received": 2500,
+                "securities_updated": 2410,
+                "users_affected": 41200,
+                "chunks": 3
+            }
+        }
+
+
 class SellHoldingRequest(BaseModel):
     """
     Schema for selling a holding.
@@ -433,6 +466,97 @@ class SellHoldingResponse(BaseModel):
         }
 
 
+class BulkSellItem(SellHoldingRequest):
+    """
+    Schema for a single disposal within a bulk sell request.
+
+    Inherits quantity, sale price and sale date validation from SellHoldingRequest.
+    """
+
+    holding_id: UUID = Field(
+        ...,
+        description="Holding to sell from"
+    )
+
+
+class BulkSellRequest(BaseModel):
+    """
+    Schema for selling several holdings in one transaction.
+
+    Validates:
+    - Between 1 and 500 disposals
+    """
+
+    disposals: List[BulkSellItem] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="Disposals applied in order, atomically"
+    )
+
+    class Config:
+        from_attributes = True
+        json_schema_extra = {
+            "example": {
+                "disposals": [
+                    {
+                        "holding_id": "770e8400-e29b-41d4-a716-446655440000",
+                        "quantity": 50,
+                        "sale_price": 102.00,
+                        "sale_date": "2024-06-15"
+                    }
+                ]
+            }
+        }
+
+
+class BulkSellResponse(BaseModel):
+    """
+    Schema for bulk sell response.
+
+    Includes:
+    - Per-disposal sale details
+    - Total realized gain/loss across the batch
+    """
+
+    sales: List[SellHoldingResponse]
+    total_realized_gain: float
+
+    class Config:
+        from_attributes = True
+
+
+class ShareMatchingResponse(BaseModel):
+    """
+    Schema for UK share matching recalculation response.
+
+    Includes:
+    - Rebuild point (None for a full replay)
+    - Number of disposals re-matched and gains changed
+    - Closing Section 104 pool
+    """
+
+    holding_id: str
+    rebuilt_from: Optional[date] = None
+    disposals_rematched: int
+    gains_updated: int
+    pool_quantity: Decimal
+    pool_cost: Decimal
+
+    class Config:
+        from_attributes = True
+        json_schema_extra = {
+            "example": {
+                "holding_id": "770e8400-e29b-41d4-a716-446655440000",
+                "rebuilt_from": "2024-05-02",
+                "disposals_rematched": 2,
+                "gains_updated": 1,
+                "pool_quantity": 150,
+                "pool_cost": 14250.00
+            }
+        }
+
+
 # ============================================================================
 # DIVIDEND SCHEMAS
 # ============================================================================
@@ -194,6 +194,7 @@ class BehaviorAnalysisResponse(BaseModel):
     most_used_features: List[str] = Field(..., description="Most frequently used features")
     engagement_score: int = Field(..., ge=0, le=100, description="Overall engagement score (0-100)")
     total_actions: int = Field(..., ge=0, description="Total number of actions tracked")
+    hourly_activity: List[int] = Field(default_factory=list, description="Actions per UTC hour of day (24 values)")
 
     model_config = {
         "json_schema_extra": {
@@ -207,6 +208,19 @@ class BehaviorAnalysisResponse(BaseModel):
     }
 
 
+class BehaviorBufferStatsResponse(BaseModel):
+    """Behavior tracking write-behind buffer metrics for this process."""
+
+    buffered: int = Field(..., ge=0, description="Events waiting to be written")
+    max_size: int = Field(..., ge=0, description="Buffer capacity (events)")
+    recorded: int = Field(..., ge=0, description="Events accepted into the buffer")
+    flushed: int = Field(..., ge=0, description="Events written to the database")
+    dropped: int = Field(..., ge=0, description="Events dropped (buffer full or batch rejected)")
+    flushes: int = Field(..., ge=0, description="Successful flushes")
+    failed_flushes: int = Field(..., ge=0, description="Failed flushes")
+    last_flush_at: Optional[datetime] = Field(None, description="Time of the last successful flush (UTC)")
+
+
 # ============================================================================
 # PREFERENCES DICT SCHEMA
 # ============================================================================
@@ -19,6 +19,7 @@ from uuid import UUID
 from pydantic import BaseModel, Field, field_validator
 
 from models.scenario import ScenarioType, ScenarioStatus
+from utils.projection_series import ProjectionSeries
 
 
 # ============================================================================
@@ -174,10 +175,25 @@ class ScenarioResultResponse(BaseModel):
 
     created_at: datetime
 
+    @field_validator('net_worth_projection', 'tax_liability_projection', mode='before')
+    @classmethod
+    def expand_series(cls, v):
+        """Expand stored columnar series to year-by-year objects."""
+        series = ProjectionSeries.load(v)
+        return series.to_rows() if series is not None else None
+
     class Config:
         from_attributes = True
 
 
+class ScenarioResultSeriesResponse(BaseModel):
+    """Response schema for a range of a result series (columnar)."""
+    scenario_id: UUID
+    series: str = Field(..., description="Series name")
+    total_points: int = Field(..., description="Points in the full series")
+    columns: Dict[str, List[Any]] = Field(..., description="Values by column (e.g. year, net_worth)")
+
+
 # ============================================================================
 # SCENARIO COMPARISON SCHEMAS
 # ============================================================================
@@ -199,6 +215,14 @@ class ScenarioComparisonRequest(BaseModel):
         return v
 
 
+class ScenarioRunComparisonRequest(ScenarioComparisonRequest):
+    """Request schema for running scenarios and comparing them."""
+    execution: ScenarioExecutionRequest = Field(
+        default_factory=ScenarioExecutionRequest,
+        description="Execution parameters shared by all scenarios"
+    )
+
+
 class MetricComparison(BaseModel):
     """Comparison of a single metric across scenarios."""
     metric_name: str = Field(..., description="Name of the metric")
@@ -258,6 +282,63 @@ class RetirementAgeScenarioResponse(BaseModel):
     comparison_to_base: Optional[Dict[str, Any]] = Field(None, description="Comparison to base case")
 
 
+class RetirementAgeSweepRequest(BaseModel):
+    """Request for a retirement age x growth rate sensitivity sweep."""
+    current_pension_pot: Optional[Decimal] = Field(None, ge=0, description="Current pension pot value")
+    annual_contributions: Optional[Decimal] = Field(None, ge=0, description="Annual pension contributions")
+    growth_rates: List[Decimal] = Field(
+        default_factory=lambda: [Decimal('4.00'), Decimal('6.00'), Decimal('8.00')],
+        min_length=1,
+        max_length=10,
+        description="Annual growth rates to compare (%)"
+    )
+    min_retirement_age: int = Field(55, ge=55, le=70, description="Youngest retirement age to model")
+    max_retirement_age: int = Field(70, ge=55, le=70, description="Oldest retirement age to model")
+    life_expectancy: int = Field(90, ge=71, le=120, description="Expected life expectancy")
+
+    @field_validator('growth_rates')
+    @classmethod
+    def validate_growth_rates(cls, v):
+        """Validate growth rates are reasonable."""
+        for rate in v:
+            if rate < Decimal('-10') or rate > Decimal('20'):
+                raise ValueError("Growth rates must be between -10% and 20%")
+        return v
+
+    @field_validator('max_retirement_age')
+    @classmethod
+    def validate_age_range(cls, v, info):
+        """Ensure the age range is not empty."""
+        min_age = info.data.get('min_retirement_age')
+        if min_age is not None and v < min_age:
+            raise ValueError("max_retirement_age must not be below min_retirement_age")
+        return v
+
+
+class RetirementAgeSweepPoint(BaseModel):
+    """One retirement age under one growth assumption."""
+    growth_rate: Decimal
+    retirement_age: int
+    years_to_retirement: int
+    pension_pot_at_retirement: Decimal
+    tax_free_lump_sum: Decimal
+    annual_retirement_income: Decimal
+    monthly_retirement_income: Decimal
+    pot_depletion_age: Optional[int] = Field(None, description="Age when pot depletes (None if lasts)")
+    replacement_ratio: Decimal = Field(..., description="Income replacement ratio (%)")
+    adequate: bool = Field(..., description="Replacement ratio meets the 70% target")
+
+
+class RetirementAgeSweepResponse(BaseModel):
+    """Response for a retirement age sensitivity sweep."""
+    current_age: int
+    retirement_ages: List[int]
+    growth_rates: List[Decimal]
+    scenarios: List[RetirementAgeSweepPoint] = Field(
+        ..., description="One entry per growth rate x retirement age (growth rate order, then age)"
+    )
+
+
 class CareerChangeScenarioRequest(BaseModel):
     """Request for career change scenario modeling."""
     new_salary: Decimal = Field(..., gt=0, description="New annual salary")
@@ -334,3 +415,16 @@ class MonteCarloResponse(BaseModel):
     worst_case: Decimal
     best_case: Decimal
     expected_value: Decimal
+
+
+class MonteCarloCacheStatsResponse(BaseModel):
+    """Monte Carlo result cache metrics for this process."""
+    lookups: int = Field(..., description="Cache lookups")
+    memory_hits: int = Field(..., description="Hits served from the in-process LRU")
+    redis_hits: int = Field(..., description="Hits served from Redis")
+    misses: int = Field(..., description="Lookups that ran a simulation")
+    hit_rate: Decimal = Field(..., description="Hits as a percentage of lookups")
+    entries: int = Field(..., description="Entries held in process")
+    max_entries: int = Field(..., description="In-process LRU capacity")
+    compute_seconds: Decimal = Field(..., description="Total simulation time (seconds)")
+    compute_seconds_saved: Decimal = Field(..., description="Simulation time avoided by hits (seconds)")
@@ -39,6 +39,7 @@ from models.life_assurance import LifeAssurancePolicy
 from models.goal import FinancialGoal, GoalStatus
 from services.ai.llm_service import LLMService, AdviceType, PROMPT_TEMPLATES
 from services.dashboard_aggregation import DashboardAggregationService
+from services.retirement.income_projection_service import IncomeProjectionService
 
 logger = logging.getLogger(__name__)
 
@@ -96,11 +97,9 @@ class AIAdvisoryService:
         if not user:
             raise ValueError(f"User {user_id} not found")
 
-        # Get pensions
-        result = await self.db.execute(
-            select(UKPension).where(UKPension.user_id == user_id)
-        )
-        uk_pensions = result.scalars().all()
+        # Get pensions (shared retirement inputs bundle)
+        retirement_inputs = await IncomeProjectionService(self.db).get_retirement_inputs(user_id)
+        uk_pensions = retirement_inputs['pensions']
 
         result = await self.db.execute(
             select(SARetirementFund).where(SARetirementFund.user_id == user_id)
@@ -13,6 +13,10 @@ Features:
 - Deduplication to prevent alert spam
 - Rate limiting per user
 
+Detection rules are registered in CHANGE_RULES / OPPORTUNITY_RULES with the
+inputs they read (services/ai/rule_engine.py). The daily analysis only
+re-runs, per user, the rules whose inputs changed since its last run.
+
 Alert Types:
 - ALLOWANCE: Unused ISA/TFSA allowances
 - GOAL: Goal progress updates (milestones, falling behind)
@@ -24,7 +28,7 @@ Alert Types:
 
 import logging
 from decimal import Decimal
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime, date, timedelta
 from enum import Enum
@@ -41,11 +45,17 @@ from models.retirement import UKPension, SARetirementFund, AnnualAllowanceTracki
 from models.life_assurance import LifeAssurancePolicy
 from models.goal import FinancialGoal, GoalStatus
 from models.recommendation import Recommendation, RecommendationType, RecommendationPriority, Currency
+from models.rule_evaluation import RuleInput
 from services.ai.llm_service import LLMService, AdviceType
+from services.ai.rule_engine import RuleRegistry, ChangeDrivenEvaluator
 from services.dashboard_aggregation import DashboardAggregationService
 
 logger = logging.getLogger(__name__)
 
+# Detection rules, in evaluation order
+CHANGE_RULES = RuleRegistry()       # (service, user_id, lookback_days) -> changes
+OPPORTUNITY_RULES = RuleRegistry()  # (service, user_id) -> opportunities
+
 
 class AlertType(str, Enum):
     """Alert type enumeration."""
@@ -98,6 +108,9 @@ class ProactiveAlertsService:
     # Maximum alerts per user per run
     MAX_ALERTS_PER_USER = 10
 
+    # Evaluation state name for the daily analysis
+    DAILY_EVALUATOR = "proactive_alerts"
+
     def __init__(self, db: AsyncSession):
         """
         Initialize proactive alerts service.
@@ -112,7 +125,8 @@ class ProactiveAlertsService:
     async def analyze_financial_changes(
         self,
         user_id: UUID,
-        lookback_days: int = 30
+        lookback_days: int = 30,
+        changed_inputs: Optional[Iterable[RuleInput]] = None
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
         Analyze user's financial data for significant changes.
@@ -127,6 +141,7 @@ class ProactiveAlertsService:
         Args:
             user_id: User UUID
             lookback_days: Number of days to analyze (default: 30)
+            changed_inputs: Only run rules reading these inputs (default: all rules)
 
         Returns:
             Dictionary with:
@@ -146,41 +161,11 @@ class ProactiveAlertsService:
         if not user:
             raise ValueError(f"User {user_id} not found")
 
-        # 1. Detect spending changes
-        spending_changes = await self._detect_spending_changes(user_id, lookback_days)
-        changes.extend(spending_changes)
-
-        # 2. Detect income changes
-        income_changes = await self._detect_income_changes(user_id, lookback_days)
-        changes.extend(income_changes)
-
-        # 3. Detect balance drops
-        balance_changes = await self._detect_balance_drops(user_id, lookback_days)
-        changes.extend(balance_changes)
-
-        # 4. Detect goal progress changes
-        goal_changes = await self._detect_goal_changes(user_id)
-        changes.extend(goal_changes)
+        for rule in CHANGE_RULES.affected_by(changed_inputs):
+            changes.extend(await rule.evaluate(self, user_id, lookback_days))
 
-        # 5. Detect investment performance
-        investment_changes = await self._detect_investment_changes(user_id, lookback_days)
-        changes.extend(investment_changes)
-
-        # 6. Identify allowance opportunities
-        allowance_opps = await self._identify_allowance_opportunities(user_id)
-        opportunities.extend(allowance_opps)
-
-        # 7. Identify tax opportunities
-        tax_opps = await self._identify_tax_opportunities(user_id)
-        opportunities.extend(tax_opps)
-
-        # 8. Identify emergency fund opportunities
-        emergency_opps = await self._identify_emergency_fund_opportunities(user_id)
-        opportunities.extend(emergency_opps)
-
-        # 9. Identify portfolio rebalancing opportunities
-        portfolio_opps = await self._identify_portfolio_opportunities(user_id)
-        opportunities.extend(portfolio_opps)
+        for rule in OPPORTUNITY_RULES.affected_by(changed_inputs):
+            opportunities.extend(await rule.evaluate(self, user_id))
 
         logger.info(f"Detected {len(changes)} changes and {len(opportunities)} opportunities for user {user_id}")
 
@@ -778,14 +763,17 @@ Make it clear and compelling. Focus on the long-term benefit.
 
     async def schedule_daily_analysis(self) -> Dict[str, int]:
         """
-        Daily background job to analyze all users and generate alerts.
+        Daily background job to analyze changed users and generate alerts.
+
+        Runs for active users whose rule inputs changed since the last run
+        (every active user on their first run):
+        1. Re-run the rules reading the changed inputs
+        2. Generate alerts
+        3. Store in database, with the user's evaluation state
+        4. Trigger notifications
 
-        Runs for all active users:
-        1. Analyze past 30 days for changes
-        2. Identify opportunities
-        3. Generate alerts
-        4. Store in database
-        5. Trigger notifications
+        Unchanged users cost nothing, so the job scales with the day's data
+        changes rather than users x rules.
 
         Returns:
             Summary:
@@ -793,26 +781,34 @@ Make it clear and compelling. Focus on the long-term benefit.
                 - alerts_generated: Total alerts created
                 - errors: Number of errors
         """
-        logger.info("Starting daily analysis for all users")
+        logger.info("Starting daily analysis for changed users")
 
-        # Get all active users
-        result = await self.db.execute(
-            select(User).where(User.status == "ACTIVE")
+        evaluator = ChangeDrivenEvaluator(
+            self.db,
+            self.DAILY_EVALUATOR,
+            CHANGE_RULES.inputs | OPPORTUNITY_RULES.inputs
         )
-        users = result.scalars().all()
+        pending = await evaluator.pending_users()
 
         users_analyzed = 0
         alerts_generated = 0
         errors = 0
 
-        for user in users:
+        for user_id, changed_inputs in pending.items():
             try:
                 # Analyze changes and opportunities
-                analysis = await self.analyze_financial_changes(user.id, lookback_days=30)
+                analysis = await self.analyze_financial_changes(
+                    user_id,
+                    lookback_days=30,
+                    changed_inputs=changed_inputs
+                )
+
+                # Committed with the alerts
+                await evaluator.mark_evaluated(user_id)
 
                 # Generate alerts
                 alerts = await self.generate_alerts(
-                    user.id,
+                    user_id,
                     analysis["changes"],
                     analysis["opportunities"]
                 )
@@ -820,10 +816,12 @@ Make it clear and compelling. Focus on the long-term benefit.
                 users_analyzed += 1
                 alerts_generated += len(alerts)
 
-                logger.info(f"Generated {len(alerts)} alerts for user {user.id}")
+                logger.info(f"Generated {len(alerts)} alerts for user {user_id}")
 
             except Exception as e:
-                logger.error(f"Error in daily analysis for user {user.id}: {str(e)}")
+                # Not marked evaluated, so the user is retried next run
+                logger.error(f"Error in daily analysis for user {user_id}: {str(e)}")
+                await self.db.rollback()
                 errors += 1
 
         await self.db.commit()
@@ -840,6 +838,7 @@ Make it clear and compelling. Focus on the long-term benefit.
 
     # ==================== PRIVATE HELPER METHODS ====================
 
+    @CHANGE_RULES.rule(RuleInput.SAVINGS)
     async def _detect_spending_changes(
         self,
         user_id: UUID,
@@ -850,6 +849,7 @@ Make it clear and compelling. Focus on the long-term benefit.
         # For now, return empty list (would need transaction data)
         return []
 
+    @CHANGE_RULES.rule(RuleInput.INCOME)
     async def _detect_income_changes(
         self,
         user_id: UUID,
@@ -880,6 +880,7 @@ Make it clear and compelling. Focus on the long-term benefit.
 
         return changes
 
+    @CHANGE_RULES.rule(RuleInput.SAVINGS)
     async def _detect_balance_drops(
         self,
         user_id: UUID,
@@ -890,8 +891,15 @@ Make it clear and compelling. Focus on the long-term benefit.
         # Would need historical balance snapshots
         return []
 
-    async def _detect_goal_changes(self, user_id: UUID) -> List[Dict[str, Any]]:
-        """Detect goal progress changes (milestones, falling behind)."""
+    @CHANGE_RULES.rule(RuleInput.GOALS, RuleInput.MONTH)
+    async def _detect_goal_changes(self, user_id: UUID, lookback_days: int = 30) -> List[Dict[str, Any]]:
+        """
+        Detect goal progress changes (milestones, falling behind).
+
+        Goal state is current rather than historical, so lookback_days is
+        unused. Re-checked monthly as well as on writes, since falling behind
+        depends on elapsed time.
+        """
         changes = []
 
         # Get active goals
@@ -937,6 +945,7 @@ Make it clear and compelling. Focus on the long-term benefit.
 
         return changes
 
+    @CHANGE_RULES.rule(RuleInput.INVESTMENTS)
     async def _detect_investment_changes(
         self,
         user_id: UUID,
@@ -947,6 +956,15 @@ Make it clear and compelling. Focus on the long-term benefit.
         # Would need historical performance data
         return []
 
+    @OPPORTUNITY_RULES.rule(
+        RuleInput.TAX_STATUS,
+        RuleInput.ISA_ALLOWANCE,
+        RuleInput.TFSA_ALLOWANCE,
+        RuleInput.UK_TAX_YEAR,
+        RuleInput.SA_TAX_YEAR,
+        RuleInput.UK_ALLOWANCE_DEADLINE,
+        RuleInput.SA_ALLOWANCE_DEADLINE
+    )
     async def _identify_allowance_opportunities(self, user_id: UUID) -> List[Dict[str, Any]]:
         """Identify unused ISA/TFSA allowances."""
         opportunities = []
@@ -1026,6 +1044,7 @@ Make it clear and compelling. Focus on the long-term benefit.
 
         return opportunities
 
+    @OPPORTUNITY_RULES.rule(RuleInput.INCOME)
     async def _identify_tax_opportunities(self, user_id: UUID) -> List[Dict[str, Any]]:
         """Identify tax optimization opportunities."""
         opportunities = []
@@ -1051,6 +1070,7 @@ Make it clear and compelling. Focus on the long-term benefit.
 
         return opportunities
 
+    @OPPORTUNITY_RULES.rule(RuleInput.SAVINGS, RuleInput.INCOME)
     async def _identify_emergency_fund_opportunities(self, user_id: UUID) -> List[Dict[str, Any]]:
         """Identify emergency fund inadequacies."""
         opportunities = []
@@ -1089,6 +1109,7 @@ Make it clear and compelling. Focus on the long-term benefit.
 
         return opportunities
 
+    @OPPORTUNITY_RULES.rule(RuleInput.INVESTMENTS)
     async def _identify_portfolio_opportunities(self, user_id: UUID) -> List[Dict[str, Any]]:
         """Identify portfolio rebalancing opportunities."""
         # TODO: Implement portfolio rebalancing detection
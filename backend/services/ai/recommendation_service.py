@@ -18,21 +18,29 @@ Priority Assignment:
 - MEDIUM: Good opportunities (£500-£1,000/year savings)
 - LOW: Nice to have (<£500/year impact)
 
+Pipeline:
+1. Load one immutable UserFinancialSnapshot (fixed number of queries,
+   see services/ai/recommendation_snapshot.py)
+2. Evaluate the rules in RECOMMENDATION_RULES against it (pure, no I/O);
+   each rule declares the inputs it reads, so a caller that knows which
+   inputs changed can re-run only the affected rules
+3. Bulk-upsert the results (save_recommendations)
+
 Performance:
-- Target: <3 seconds for full recommendation generation
-- Async/await patterns throughout
-- Database query optimization
+- Target: <300ms for full recommendation generation
+- Query count doesn't grow with accounts, holdings or incomes
+- Rules are in-memory checks, so they run in one pass rather than as
+  concurrent tasks (there is no I/O left to overlap)
 """
 
 import logging
 from decimal import Decimal
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any
 from uuid import UUID
 from datetime import datetime, date
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func, or_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, and_
 
 from models.recommendation import (
     Recommendation,
@@ -40,16 +48,16 @@ from models.recommendation import (
     RecommendationPriority,
     Currency
 )
-from models.user import User
-from models.life_assurance import LifeAssurancePolicy, CoverageNeedsAnalysis
-from models.savings_account import SavingsAccount, ISAContribution, TFSAContribution, AccountPurpose
-from models.income import UserIncome
-from models.investment import InvestmentAccount, InvestmentHolding, AccountType as InvAccountType
-from models.tax_status import UserTaxStatus
-from services.emergency_fund_assessment import EmergencyFundAssessmentService
+from models.rule_evaluation import RuleInput
+from services.ai.recommendation_snapshot import UserFinancialSnapshot, load_user_snapshot
+from services.ai.rule_engine import RuleRegistry
 
 logger = logging.getLogger(__name__)
 
+# Rules evaluated by generate_recommendations, in output order:
+# (service, snapshot) -> recommendations
+RECOMMENDATION_RULES = RuleRegistry()
+
 
 class RecommendationService:
     """Service for generating and managing financial recommendations."""
@@ -62,6 +70,9 @@ class RecommendationService:
     HIGH_SAVINGS_THRESHOLD = Decimal('1000.00')  # £1,000/year
     MEDIUM_SAVINGS_THRESHOLD = Decimal('500.00')  # £500/year
 
+    # Fields refreshed when a regenerated recommendation matches an open one
+    UPSERT_FIELDS = ('priority', 'description', 'action_items', 'potential_savings', 'currency')
+
     def __init__(self, db: AsyncSession):
         """
         Initialize recommendation service.
@@ -79,8 +90,8 @@ class RecommendationService:
         """
         Generate all recommendations for a user.
 
-        Analyzes user's complete financial data and generates personalized
-        recommendations across all modules.
+        Loads the user's financial snapshot once and evaluates every rule
+        against it.
 
         Args:
             user_id: User UUID
@@ -94,25 +105,83 @@ class RecommendationService:
         """
         logger.info(f"Generating recommendations for user {user_id}")
 
-        # Verify user exists
-        user = await self._get_user(user_id)
-        if not user:
+        snapshot = await load_user_snapshot(self.db, user_id, base_currency)
+        if snapshot is None:
             raise ValueError(f"User {user_id} not found")
 
-        recommendations = []
-
-        # Generate recommendations from each category
-        recommendations.extend(await self._generate_protection_recommendations(user_id, base_currency))
-        recommendations.extend(await self._generate_isa_recommendations(user_id, base_currency))
-        recommendations.extend(await self._generate_tfsa_recommendations(user_id, base_currency))
-        recommendations.extend(await self._generate_emergency_fund_recommendations(user_id, base_currency))
-        recommendations.extend(await self._generate_tax_efficiency_recommendations(user_id, base_currency))
-        recommendations.extend(await self._generate_pension_recommendations(user_id, base_currency))
+        recommendations = self.evaluate_rules(snapshot)
 
         logger.info(f"Generated {len(recommendations)} recommendations for user {user_id}")
 
         return recommendations
 
+    def evaluate_rules(
+        self,
+        snapshot: UserFinancialSnapshot,
+        changed_inputs: Optional[Iterable[RuleInput]] = None
+    ) -> List[Recommendation]:
+        """
+        Evaluate recommendation rules against a snapshot.
+
+        Args:
+            snapshot: User's financial snapshot
+            changed_inputs: Only evaluate rules reading these inputs (default: all rules)
+
+        Returns:
+            List of Recommendation objects (not yet persisted)
+        """
+        recommendations = []
+        for rule in RECOMMENDATION_RULES.affected_by(changed_inputs):
+            recommendations.extend(rule.evaluate(self, snapshot))
+        return recommendations
+
+    async def save_recommendations(
+        self,
+        user_id: UUID,
+        recommendations: List[Recommendation]
+    ) -> List[Recommendation]:
+        """
+        Bulk-upsert generated recommendations.
+
+        A recommendation matching one of the user's open recommendations
+        (same type and title, not dismissed, completed or deleted) updates
+        it in place; the rest are inserted. One SELECT and one flush,
+        however many recommendations there are.
+
+        Args:
+            user_id: User UUID
+            recommendations: Generated recommendations (not yet persisted)
+
+        Returns:
+            Saved Recommendation objects (updated or inserted), in input order
+        """
+        if not recommendations:
+            return []
+
+        stmt = select(Recommendation).where(
+            Recommendation.user_id == user_id,
+            Recommendation.recommendation_type.in_({rec.recommendation_type for rec in recommendations}),
+            Recommendation.deleted == False,
+            Recommendation.dismissed == False,
+            Recommendation.completed == False
+        )
+        result = await self.db.execute(stmt)
+        existing = {(rec.recommendation_type, rec.title): rec for rec in result.scalars()}
+
+        saved = []
+        for rec in recommendations:
+            current = existing.get((rec.recommendation_type, rec.title))
+            if current is None:
+                self.db.add(rec)
+                saved.append(rec)
+                continue
+            for field in self.UPSERT_FIELDS:
+                setattr(current, field, getattr(rec, field))
+            saved.append(current)
+
+        await self.db.commit()
+        return saved
+
     async def get_user_recommendations(
         self,
         user_id: UUID,
@@ -253,32 +322,12 @@ class RecommendationService:
 
         return recommendation
 
-    # ===== HELPER METHODS =====
-
-    async def _get_user(self, user_id: UUID) -> Optional[User]:
-        """Get user by ID."""
-        stmt = select(User).where(User.id == user_id)
-        result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
-
-    async def _get_current_tax_status(self, user_id: UUID) -> Optional[UserTaxStatus]:
-        """Get user's current tax status."""
-        stmt = (
-            select(UserTaxStatus)
-            .where(
-                UserTaxStatus.user_id == user_id,
-                UserTaxStatus.effective_to.is_(None)
-            )
-        )
-        result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
-
     # ===== PROTECTION RECOMMENDATIONS =====
 
-    async def _generate_protection_recommendations(
+    @RECOMMENDATION_RULES.rule(RuleInput.COVERAGE)
+    def _generate_protection_recommendations(
         self,
-        user_id: UUID,
-        base_currency: str
+        snapshot: UserFinancialSnapshot
     ) -> List[Recommendation]:
         """
         Generate protection (life assurance) recommendations.
@@ -289,29 +338,19 @@ class RecommendationService:
         """
         recommendations = []
 
-        # Get current coverage analysis
-        stmt = (
-            select(CoverageNeedsAnalysis)
-            .where(
-                CoverageNeedsAnalysis.user_id == user_id,
-                CoverageNeedsAnalysis.effective_to.is_(None)
-            )
-        )
-        result = await self.db.execute(stmt)
-        analysis = result.scalar_one_or_none()
-
+        analysis = snapshot.coverage
         if not analysis:
             # No analysis yet - user should create one
             return recommendations
 
         # Check for coverage gap
         if analysis.coverage_gap > 0:
-            gap = Decimal(str(analysis.coverage_gap))
-            current_cover = Decimal(str(analysis.current_total_cover))
-            recommended_cover = Decimal(str(analysis.recommended_cover))
+            gap = analysis.coverage_gap
+            current_cover = analysis.current_total_cover
+            recommended_cover = analysis.recommended_cover
 
             recommendation = Recommendation(
-                user_id=user_id,
+                user_id=snapshot.user_id,
                 recommendation_type=RecommendationType.PROTECTION,
                 priority=RecommendationPriority.HIGH,
                 title="Increase your life assurance cover",
@@ -335,10 +374,15 @@ class RecommendationService:
 
     # ===== ISA RECOMMENDATIONS =====
 
-    async def _generate_isa_recommendations(
+    @RECOMMENDATION_RULES.rule(
+        RuleInput.TAX_STATUS,
+        RuleInput.ISA_ALLOWANCE,
+        RuleInput.UK_TAX_YEAR,
+        RuleInput.UK_ALLOWANCE_DEADLINE
+    )
+    def _generate_isa_recommendations(
         self,
-        user_id: UUID,
-        base_currency: str
+        snapshot: UserFinancialSnapshot
     ) -> List[Recommendation]:
         """
         Generate ISA (UK) recommendations.
@@ -352,28 +396,13 @@ class RecommendationService:
         recommendations = []
 
         # Check if UK tax resident
-        tax_status = await self._get_current_tax_status(user_id)
-        if not tax_status or not tax_status.uk_tax_resident:
+        if not snapshot.uk_tax_resident:
             return recommendations
 
-        # Get current UK tax year (April 6 - April 5)
-        today = date.today()
-        if today.month < 4 or (today.month == 4 and today.day < 6):
-            tax_year = f"{today.year - 1}/{str(today.year)[-2:]}"
-        else:
-            tax_year = f"{today.year}/{str(today.year + 1)[-2:]}"
-
-        # Calculate ISA contributions for current tax year
-        stmt = (
-            select(func.sum(ISAContribution.contribution_amount))
-            .where(
-                ISAContribution.user_id == user_id,
-                ISAContribution.tax_year == tax_year
-            )
-        )
-        result = await self.db.execute(stmt)
-        total_contributed = result.scalar() or Decimal('0.00')
-        total_contributed = Decimal(str(total_contributed))
+        # Current UK tax year (April 6 - April 5)
+        today = snapshot.as_of
+        tax_year = snapshot.uk_tax_year
+        total_contributed = snapshot.isa_used
 
         # Calculate remaining allowance
         remaining = self.ISA_ANNUAL_ALLOWANCE - total_contributed
@@ -399,7 +428,7 @@ class RecommendationService:
                 priority = RecommendationPriority.MEDIUM
 
             recommendation = Recommendation(
-                user_id=user_id,
+                user_id=snapshot.user_id,
                 recommendation_type=RecommendationType.ISA,
                 priority=priority,
                 title="Use your remaining ISA allowance",
@@ -423,10 +452,15 @@ class RecommendationService:
 
     # ===== TFSA RECOMMENDATIONS =====
 
-    async def _generate_tfsa_recommendations(
+    @RECOMMENDATION_RULES.rule(
+        RuleInput.TAX_STATUS,
+        RuleInput.TFSA_ALLOWANCE,
+        RuleInput.SA_TAX_YEAR,
+        RuleInput.SA_ALLOWANCE_DEADLINE
+    )
+    def _generate_tfsa_recommendations(
         self,
-        user_id: UUID,
-        base_currency: str
+        snapshot: UserFinancialSnapshot
     ) -> List[Recommendation]:
         """
         Generate TFSA (SA) recommendations.
@@ -441,37 +475,14 @@ class RecommendationService:
         recommendations = []
 
         # Check if SA tax resident
-        tax_status = await self._get_current_tax_status(user_id)
-        if not tax_status or not tax_status.sa_tax_resident:
+        if not snapshot.sa_tax_resident:
             return recommendations
 
-        # Get current SA tax year (March 1 - Feb 28/29)
-        today = date.today()
-        if today.month < 3:
-            tax_year = f"{today.year - 1}/{today.year}"
-        else:
-            tax_year = f"{today.year}/{today.year + 1}"
-
-        # Calculate TFSA contributions for current tax year
-        stmt_annual = (
-            select(func.sum(TFSAContribution.contribution_amount))
-            .where(
-                TFSAContribution.user_id == user_id,
-                TFSAContribution.tax_year == tax_year
-            )
-        )
-        result = await self.db.execute(stmt_annual)
-        annual_contributed = result.scalar() or Decimal('0.00')
-        annual_contributed = Decimal(str(annual_contributed))
-
-        # Calculate lifetime contributions
-        stmt_lifetime = (
-            select(func.sum(TFSAContribution.contribution_amount))
-            .where(TFSAContribution.user_id == user_id)
-        )
-        result = await self.db.execute(stmt_lifetime)
-        lifetime_contributed = result.scalar() or Decimal('0.00')
-        lifetime_contributed = Decimal(str(lifetime_contributed))
+        # Current SA tax year (March 1 - Feb 28/29)
+        today = snapshot.as_of
+        tax_year = snapshot.sa_tax_year
+        annual_contributed = snapshot.tfsa_annual_used
+        lifetime_contributed = snapshot.tfsa_lifetime_used
 
         # Calculate remaining allowances
         annual_remaining = self.TFSA_ANNUAL_ALLOWANCE - annual_contributed
@@ -494,7 +505,7 @@ class RecommendationService:
                 priority = RecommendationPriority.MEDIUM
 
             recommendation = Recommendation(
-                user_id=user_id,
+                user_id=snapshot.user_id,
                 recommendation_type=RecommendationType.TFSA,
                 priority=priority,
                 title="Maximize your Tax-Free Savings Account",
@@ -518,40 +529,28 @@ class RecommendationService:
 
     # ===== EMERGENCY FUND RECOMMENDATIONS =====
 
-    async def _generate_emergency_fund_recommendations(
+    @RECOMMENDATION_RULES.rule(RuleInput.SAVINGS, RuleInput.INCOME)
+    def _generate_emergency_fund_recommendations(
         self,
-        user_id: UUID,
-        base_currency: str
+        snapshot: UserFinancialSnapshot
     ) -> List[Recommendation]:
         """
         Generate emergency fund recommendations.
 
         Rules:
         - HIGH priority if < 3 months expenses
-        - Use EmergencyFundAssessmentService
+        - Emergency fund = active accounts marked EMERGENCY_FUND, in base currency
         """
         recommendations = []
 
-        # Get emergency fund service
-        ef_service = EmergencyFundAssessmentService(self.db)
-
-        # Get user's monthly income (use as proxy for expenses if not available)
-        stmt = (
-            select(func.sum(UserIncome.amount))
-            .where(
-                UserIncome.user_id == user_id,
-                UserIncome.deleted_at.is_(None)
-            )
-        )
-        result = await self.db.execute(stmt)
-        monthly_income = result.scalar() or Decimal('0.00')
-        monthly_income = Decimal(str(monthly_income))
+        # User's monthly income (used as proxy for expenses)
+        monthly_income = snapshot.income_total
 
         # Estimate monthly expenses as 70% of income
         monthly_expenses = monthly_income * Decimal('0.70') if monthly_income > 0 else Decimal('2000.00')
 
-        # Get current emergency fund
-        current_ef = await ef_service.get_current_emergency_fund(user_id, base_currency)
+        # Current emergency fund
+        current_ef = snapshot.emergency_fund_total
 
         # Calculate months covered
         if monthly_expenses > 0:
@@ -565,7 +564,7 @@ class RecommendationService:
             shortfall = recommended - current_ef
 
             recommendation = Recommendation(
-                user_id=user_id,
+                user_id=snapshot.user_id,
                 recommendation_type=RecommendationType.EMERGENCY_FUND,
                 priority=RecommendationPriority.HIGH,
                 title="Build your emergency fund",
@@ -589,10 +588,15 @@ class RecommendationService:
 
     # ===== TAX EFFICIENCY RECOMMENDATIONS =====
 
-    async def _generate_tax_efficiency_recommendations(
+    @RECOMMENDATION_RULES.rule(
+        RuleInput.TAX_STATUS,
+        RuleInput.INVESTMENTS,
+        RuleInput.ISA_ALLOWANCE,
+        RuleInput.UK_TAX_YEAR
+    )
+    def _generate_tax_efficiency_recommendations(
         self,
-        user_id: UUID,
-        base_currency: str
+        snapshot: UserFinancialSnapshot
     ) -> List[Recommendation]:
         """
         Generate tax efficiency recommendations.
@@ -604,50 +608,13 @@ class RecommendationService:
         recommendations = []
 
         # Check if UK tax resident
-        tax_status = await self._get_current_tax_status(user_id)
-        if not tax_status or not tax_status.uk_tax_resident:
+        if not snapshot.uk_tax_resident:
             return recommendations
 
-        # Get GIA holdings
-        stmt = (
-            select(InvestmentAccount)
-            .where(
-                InvestmentAccount.user_id == user_id,
-                InvestmentAccount.account_type == InvAccountType.GIA,
-                InvestmentAccount.status == 'ACTIVE',
-                InvestmentAccount.deleted == False
-            )
-            .options(selectinload(InvestmentAccount.holdings))
-        )
-        result = await self.db.execute(stmt)
-        gia_accounts = result.scalars().all()
-
-        # Calculate total GIA value
-        total_gia_value = Decimal('0.00')
-        for account in gia_accounts:
-            for holding in account.holdings:
-                if not holding.deleted:
-                    total_gia_value += holding.current_value
-
-        # Check ISA allowance remaining (from ISA recommendation logic)
-        today = date.today()
-        if today.month < 4 or (today.month == 4 and today.day < 6):
-            tax_year = f"{today.year - 1}/{str(today.year)[-2:]}"
-        else:
-            tax_year = f"{today.year}/{str(today.year + 1)[-2:]}"
-
-        stmt = (
-            select(func.sum(ISAContribution.contribution_amount))
-            .where(
-                ISAContribution.user_id == user_id,
-                ISAContribution.tax_year == tax_year
-            )
-        )
-        result = await self.db.execute(stmt)
-        total_contributed = result.scalar() or Decimal('0.00')
-        total_contributed = Decimal(str(total_contributed))
+        # Total value of active GIA holdings
+        total_gia_value = snapshot.gia_value
 
-        isa_remaining = self.ISA_ANNUAL_ALLOWANCE - total_contributed
+        isa_remaining = self.ISA_ANNUAL_ALLOWANCE - snapshot.isa_used
 
         # Recommend if GIA > £5,000 and ISA allowance available
         if total_gia_value > Decimal('5000.00') and isa_remaining > Decimal('5000.00'):
@@ -656,7 +623,7 @@ class RecommendationService:
             tax_saving = annual_return * Decimal('0.20')
 
             recommendation = Recommendation(
-                user_id=user_id,
+                user_id=snapshot.user_id,
                 recommendation_type=RecommendationType.TAX_EFFICIENCY,
                 priority=RecommendationPriority.MEDIUM,
                 title="Transfer investments from GIA to ISA",
@@ -681,10 +648,11 @@ class RecommendationService:
 
     # ===== PENSION RECOMMENDATIONS =====
 
-    async def _generate_pension_recommendations(
+    # Pension data isn't a tracked input yet, so this only runs in full evaluations
+    @RECOMMENDATION_RULES.rule()
+    def _generate_pension_recommendations(
         self,
-        user_id: UUID,
-        base_currency: str
+        snapshot: UserFinancialSnapshot
     ) -> List[Recommendation]:
         """
         Generate pension recommendations.
@@ -0,0 +1,221 @@
+"""
+Recommendation Snapshot - Point-in-time view of a user's finances
+
+Recommendation rules used to fetch their own inputs: the user, tax status,
+incomes and accounts were re-queried by each generator, and GIA holdings
+were loaded row by row just to be summed. The snapshot loads everything the
+rules read up front, in a fixed number of queries, so every rule evaluates
+against the same immutable data.
+
+Queries (independent of how many accounts, holdings or incomes exist):
+1. User, current tax status and all scalar aggregates (income total,
+   GIA value, ISA/TFSA ledger usage) in one SELECT of scalar subqueries
+2. Current coverage needs analysis
+3. Emergency fund balances grouped by currency
+Plus one exchange rate lookup per foreign emergency fund currency.
+
+Business Rules:
+- GIA value uses the security master price when priced, else (or when
+  the user entered a price manually) the holding's own current_price
+  (as InvestmentHolding.market_price)
+- ISA/TFSA usage comes from the allowance ledgers (current tax years)
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select, and_, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.user import User
+from models.life_assurance import CoverageNeedsAnalysis
+from models.savings_account import (
+    SavingsAccount, AccountPurpose, ISAAllowanceLedger, TFSAAllowanceLedger
+)
+from models.income import UserIncome
+from models.investment import (
+    InvestmentAccount, InvestmentHolding, Security, AccountType as InvAccountType,
+    market_price_expression
+)
+from models.tax_status import UserTaxStatus
+from services.currency_conversion import CurrencyConversionService
+from services.isa_tfsa_tracking import get_current_uk_tax_year, get_current_sa_tax_year
+
+
+@dataclass(frozen=True)
+class CoverageSnapshot:
+    """Current life assurance coverage needs (GBP)."""
+    coverage_gap: Decimal
+    current_total_cover: Decimal
+    recommended_cover: Decimal
+
+
+@dataclass(frozen=True)
+class UserFinancialSnapshot:
+    """Everything the recommendation rules read, loaded once."""
+    user_id: UUID
+    base_currency: str
+    as_of: date
+
+    uk_tax_resident: bool
+    sa_tax_resident: bool
+
+    coverage: Optional[CoverageSnapshot]
+
+    income_total: Decimal
+    emergency_fund_total: Decimal
+    gia_value: Decimal
+
+    uk_tax_year: str
+    isa_used: Decimal
+    sa_tax_year: str
+    tfsa_annual_used: Decimal
+    tfsa_lifetime_used: Decimal
+
+
+def _decimal(value) -> Decimal:
+    """Aggregate result as Decimal (NULL -> 0)."""
+    return Decimal(str(value)) if value is not None else Decimal('0.00')
+
+
+async def load_user_snapshot(
+    db: AsyncSession,
+    user_id: UUID,
+    base_currency: str = "GBP",
+    as_of: Optional[date] = None
+) -> Optional[UserFinancialSnapshot]:
+    """
+    Load a user's financial snapshot.
+
+    Args:
+        db: Database session
+        user_id: User UUID
+        base_currency: Currency for the emergency fund total
+        as_of: Date determining the current tax years (default: today)
+
+    Returns:
+        UserFinancialSnapshot, or None if the user doesn't exist
+    """
+    as_of = as_of or date.today()
+    uk_tax_year = get_current_uk_tax_year(as_of)
+    sa_tax_year = get_current_sa_tax_year(as_of)
+
+    income_total = select(func.sum(UserIncome.amount)).where(
+        UserIncome.user_id == user_id,
+        UserIncome.deleted_at.is_(None)
+    ).scalar_subquery()
+
+    gia_value = (
+        select(func.sum(
+            market_price_expression() * InvestmentHolding.quantity
+        ))
+        .select_from(InvestmentHolding)
+        .join(InvestmentAccount, InvestmentAccount.id == InvestmentHolding.account_id)
+        .outerjoin(Security, Security.id == InvestmentHolding.security_id)
+        .where(
+            InvestmentAccount.user_id == user_id,
+            InvestmentAccount.account_type == InvAccountType.GIA,
+            InvestmentAccount.status == 'ACTIVE',
+            InvestmentAccount.deleted == False,
+            InvestmentHolding.deleted == False
+        )
+        .scalar_subquery()
+    )
+
+    isa_used = select(ISAAllowanceLedger.used).where(
+        ISAAllowanceLedger.user_id == user_id,
+        ISAAllowanceLedger.tax_year == uk_tax_year
+    ).scalar_subquery()
+
+    tfsa_annual_used = select(TFSAAllowanceLedger.annual_used).where(
+        TFSAAllowanceLedger.user_id == user_id,
+        TFSAAllowanceLedger.tax_year == sa_tax_year
+    ).scalar_subquery()
+
+    # Every ledger row carries the same lifetime total
+    tfsa_lifetime_used = select(func.max(TFSAAllowanceLedger.lifetime_used)).where(
+        TFSAAllowanceLedger.user_id == user_id
+    ).scalar_subquery()
+
+    result = await db.execute(
+        select(
+            User.id,
+            UserTaxStatus.uk_tax_resident,
+            UserTaxStatus.sa_tax_resident,
+            income_total.label('income_total'),
+            gia_value.label('gia_value'),
+            isa_used.label('isa_used'),
+            tfsa_annual_used.label('tfsa_annual_used'),
+            tfsa_lifetime_used.label('tfsa_lifetime_used')
+        )
+        .outerjoin(UserTaxStatus, and_(
+            UserTaxStatus.user_id == User.id,
+            UserTaxStatus.effective_to.is_(None)
+        ))
+        .where(User.id == user_id)
+        .limit(1)
+    )
+    row = result.first()
+    if row is None:
+        return None
+
+    result = await db.execute(
+        select(
+            CoverageNeedsAnalysis.coverage_gap,
+            CoverageNeedsAnalysis.current_total_cover,
+            CoverageNeedsAnalysis.recommended_cover
+        ).where(
+            CoverageNeedsAnalysis.user_id == user_id,
+            CoverageNeedsAnalysis.effective_to.is_(None)
+        )
+    )
+    coverage_row = result.first()
+    coverage = CoverageSnapshot(
+        coverage_gap=_decimal(coverage_row.coverage_gap),
+        current_total_cover=_decimal(coverage_row.current_total_cover),
+        recommended_cover=_decimal(coverage_row.recommended_cover)
+    ) if coverage_row else None
+
+    result = await db.execute(
+        select(SavingsAccount.currency, func.sum(SavingsAccount.current_balance))
+        .where(
+            SavingsAccount.user_id == user_id,
+            SavingsAccount.purpose == AccountPurpose.EMERGENCY_FUND,
+            SavingsAccount.is_active == True,
+            SavingsAccount.deleted_at.is_(None)
+        )
+        .group_by(SavingsAccount.currency)
+    )
+    emergency_fund_total = Decimal('0.00')
+    currency_service = CurrencyConversionService(db)
+    for currency, balance in result.all():
+        balance = _decimal(balance)
+        if currency.value == base_currency:
+            emergency_fund_total += balance
+        else:
+            converted, _, _ = await currency_service.convert_amount(
+                amount=balance,
+                from_currency=currency.value,
+                to_currency=base_currency
+            )
+            emergency_fund_total += converted
+
+    return UserFinancialSnapshot(
+        user_id=user_id,
+        base_currency=base_currency,
+        as_of=as_of,
+        uk_tax_resident=bool(row.uk_tax_resident),
+        sa_tax_resident=bool(row.sa_tax_resident),
+        coverage=coverage,
+        income_total=_decimal(row.income_total),
+        emergency_fund_total=emergency_fund_total,
+        gia_value=_decimal(row.gia_value),
+        uk_tax_year=uk_tax_year,
+        isa_used=_decimal(row.isa_used),
+        sa_tax_year=sa_tax_year,
+        tfsa_annual_used=_decimal(row.tfsa_annual_used),
+        tfsa_lifetime_used=_decimal(row.tfsa_lifetime_used)
+    )
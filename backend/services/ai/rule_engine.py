@@ -0,0 +1,253 @@
+"""
+Rule Engine - Declarative rules with change-driven evaluation
+
+Recommendation and proactive alert rules declare the inputs they read
+(RuleInput). Each registry indexes its rules by input, so when a user's
+income changes only the rules reading income are re-run, instead of every
+rule for every user.
+
+Change detection:
+- Data inputs: writes to tracked models record a per-user change time
+  (see models/rule_evaluation.py)
+- Calendar inputs: tax years, allowance deadline windows and the month are
+  derived from the date; a rule reading them re-runs when they move on
+- Each batch evaluator stores, per user, when it last ran and the calendar
+  state at the time; users it has never run for get every rule
+
+Performance:
+- Finding the users due for evaluation is three indexed queries,
+  regardless of how many users are unchanged
+- Nightly cost scales with the number of changed (user, input) pairs
+"""
+
+import json
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set
+from uuid import UUID
+
+from sqlalchemy import select, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.user import User, UserStatus
+from models.rule_evaluation import RuleInput, RuleInputChange, RuleEvaluationState
+from services.isa_tfsa_tracking import (
+    get_current_uk_tax_year,
+    get_current_sa_tax_year,
+    get_uk_tax_year_dates,
+    get_sa_tax_year_dates
+)
+
+logger = logging.getLogger(__name__)
+
+# Days before tax year end at which allowance rules change urgency
+DEADLINE_WINDOWS = (30, 60, 90)
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A rule and the inputs it reads."""
+    name: str
+    inputs: FrozenSet[RuleInput]
+    evaluate: Callable
+
+
+class RuleRegistry:
+    """Ordered set of rules, indexed by the inputs they read."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._rules: List[Rule] = []
+        self._by_input: Dict[RuleInput, List[Rule]] = defaultdict(list)
+
+    def rule(self, *inputs: RuleInput) -> Callable[[Callable], Callable]:
+        """
+        Decorator registering a function as a rule.
+
+        Args:
+            inputs: Inputs the rule reads
+
+        Returns:
+            Decorator returning the function unchanged
+        """
+        def register(evaluate: Callable) -> Callable:
+            rule = Rule(name=evaluate.__name__, inputs=frozenset(inputs), evaluate=evaluate)
+            self._rules.append(rule)
+            for rule_input in rule.inputs:
+                self._by_input[rule_input].append(rule)
+            return evaluate
+        return register
+
+    @property
+    def rules(self) -> List[Rule]:
+        """All rules, in registration order."""
+        return list(self._rules)
+
+    @property
+    def inputs(self) -> FrozenSet[RuleInput]:
+        """Every input read by at least one rule."""
+        return frozenset(self._by_input)
+
+    def affected_by(self, changed: Optional[Iterable[RuleInput]] = None) -> List[Rule]:
+        """
+        Rules reading any of the changed inputs, in registration order.
+
+        Args:
+            changed: Changed inputs (None: every rule)
+
+        Returns:
+            List of rules to re-run
+        """
+        if changed is None:
+            return self.rules
+        affected = {id(rule) for rule_input in changed for rule in self._by_input.get(rule_input, ())}
+        return [rule for rule in self._rules if id(rule) in affected]
+
+
+def _deadline_window(days_remaining: int) -> str:
+    """Bucket days to a deadline by DEADLINE_WINDOWS."""
+    for limit in DEADLINE_WINDOWS:
+        if days_remaining < limit:
+            return f"<{limit}"
+    return f">={DEADLINE_WINDOWS[-1]}"
+
+
+def clock_state(today: Optional[date] = None) -> Dict[str, str]:
+    """
+    Calendar inputs as of a date.
+
+    Args:
+        today: Date (default: today)
+
+    Returns:
+        Dict of calendar RuleInput value -> current state
+    """
+    today = today or date.today()
+    uk_tax_year = get_current_uk_tax_year(today)
+    sa_tax_year = get_current_sa_tax_year(today)
+    _, uk_year_end = get_uk_tax_year_dates(uk_tax_year)
+    _, sa_year_end = get_sa_tax_year_dates(sa_tax_year)
+
+    return {
+        RuleInput.UK_TAX_YEAR.value: uk_tax_year,
+        RuleInput.SA_TAX_YEAR.value: sa_tax_year,
+        RuleInput.UK_ALLOWANCE_DEADLINE.value: _deadline_window((uk_year_end - today).days),
+        RuleInput.SA_ALLOWANCE_DEADLINE.value: _deadline_window((sa_year_end - today).days),
+        RuleInput.MONTH.value: today.strftime('%Y-%m'),
+    }
+
+
+class ChangeDrivenEvaluator:
+    """
+    Finds the users whose rule inputs changed since a batch job last ran.
+
+    Usage:
+        evaluator = ChangeDrivenEvaluator(db, "proactive_alerts", registry.inputs)
+        for user_id, changed in (await evaluator.pending_users()).items():
+            ...run registry.affected_by(changed)...
+            await evaluator.mark_evaluated(user_id)
+    """
+
+    def __init__(self, db: AsyncSession, evaluator: str, inputs: Iterable[RuleInput]):
+        """
+        Initialize evaluator.
+
+        Args:
+            db: Database session
+            evaluator: Batch job name (evaluation state is kept per job)
+            inputs: Inputs read by the job's rules; changes to others are ignored
+        """
+        self.db = db
+        self.evaluator = evaluator
+        self.inputs = frozenset(inputs)
+        self.started_at: Optional[datetime] = None
+        self.clock: Dict[str, str] = {}
+
+    async def pending_users(self, today: Optional[date] = None) -> Dict[UUID, Optional[Set[RuleInput]]]:
+        """
+        Active users due for evaluation.
+
+        Args:
+            today: Date for calendar inputs (default: today)
+
+        Returns:
+            Dict of user ID -> inputs changed since the user's last evaluation
+            (None if the job has never run for the user: evaluate every rule)
+        """
+        # Changes from here on are picked up by the next run
+        self.started_at = datetime.utcnow()
+        self.clock = clock_state(today)
+        clock_json = json.dumps(self.clock, sort_keys=True)
+
+        state_join = and_(
+            RuleEvaluationState.user_id == User.id,
+            RuleEvaluationState.evaluator == self.evaluator
+        )
+        pending: Dict[UUID, Optional[Set[RuleInput]]] = {}
+
+        # 1. Never evaluated
+        result = await self.db.execute(
+            select(User.id)
+            .outerjoin(RuleEvaluationState, state_join)
+            .where(
+                User.status == UserStatus.ACTIVE,
+                RuleEvaluationState.user_id.is_(None)
+            )
+        )
+        for user_id in result.scalars().all():
+            pending[user_id] = None
+
+        # 2. Data inputs written since the last evaluation
+        data_inputs = [rule_input.value for rule_input in self.inputs if not rule_input.value.startswith('clock:')]
+        result = await self.db.execute(
+            select(RuleInputChange.user_id, RuleInputChange.input_name)
+            .join(User, User.id == RuleInputChange.user_id)
+            .join(RuleEvaluationState, state_join)
+            .where(
+                User.status == UserStatus.ACTIVE,
+                RuleInputChange.input_name.in_(data_inputs),
+                RuleInputChange.changed_at > RuleEvaluationState.evaluated_at
+            )
+        )
+        for user_id, input_name in result.all():
+            pending.setdefault(user_id, set()).add(RuleInput(input_name))
+
+        # 3. Calendar moved on since the last evaluation
+        result = await self.db.execute(
+            select(RuleEvaluationState.user_id, RuleEvaluationState.clock)
+            .join(User, User.id == RuleEvaluationState.user_id)
+            .where(
+                User.status == UserStatus.ACTIVE,
+                RuleEvaluationState.evaluator == self.evaluator,
+                RuleEvaluationState.clock != clock_json
+            )
+        )
+        for user_id, previous_json in result.all():
+            previous = json.loads(previous_json)
+            changed = {
+                RuleInput(name) for name, value in self.clock.items()
+                if previous.get(name) != value and RuleInput(name) in self.inputs
+            }
+            # Even with no relevant change the stored clock is refreshed
+            inputs = pending.setdefault(user_id, set())
+            if inputs is not None:
+                inputs.update(changed)
+
+        logger.info(f"{len(pending)} users due for {self.evaluator} rule evaluation")
+        return pending
+
+    async def mark_evaluated(self, user_id: UUID) -> None:
+        """
+        Record that the user's rules were evaluated in this run (caller commits).
+
+        Args:
+            user_id: User UUID
+        """
+        await self.db.merge(RuleEvaluationState(
+            user_id=user_id,
+            evaluator=self.evaluator,
+            evaluated_at=self.started_at,
+            clock=json.dumps(self.clock, sort_keys=True)
+        ))
@@ -452,6 +452,22 @@ class DashboardAggregationService:
             logger.error(f"Redis cache write error: {e}")
             # Don't raise - caching failure shouldn't break aggregation
 
+    @classmethod
+    def cache_keys(cls, user_id: UUID) -> List[str]:
+        """
+        Get all dashboard cache keys for a user (one per base currency).
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            List of Redis keys
+        """
+        return [
+            f"dashboard:net_worth:{user_id}:{currency}"
+            for currency in cls.SUPPORTED_BASE_CURRENCIES
+        ]
+
     async def invalidate_cache(self, user_id: UUID) -> None:
         """
         Invalidate all cached dashboard data for user.
@@ -463,8 +479,7 @@ class DashboardAggregationService:
         """
         try:
             # Clear cache for all supported currencies
-            for currency in self.SUPPORTED_BASE_CURRENCIES:
-                cache_key = f"dashboard:net_worth:{user_id}:{currency}"
+            for cache_key in self.cache_keys(user_id):
                 await redis_client.delete(cache_key)
 
             logger.info(f"Invalidated dashboard cache for user {user_id}")
@@ -0,0 +1,129 @@
+"""
+Encryption Key Rotation Service
+
+Re-encrypts Fernet-encrypted columns under the current ENCRYPTION_KEY.
+
+Rotation procedure:
+1. Generate a new key and set it as ENCRYPTION_KEY
+2. Move the old key into ENCRYPTION_KEYS_PREVIOUS (both keys now decrypt)
+3. Run EncryptionKeyRotationService.rotate_all()
+4. Remove the old key from ENCRYPTION_KEYS_PREVIOUS once no rows fail
+
+Architecture:
+- Covers every model that declares ENCRYPTED_FIELDS
+- Walks each table by primary key (keyset pagination), so memory stays flat
+  and a rerun after an interruption only repeats already-rotated rows
+- Re-encrypts each chunk in one batch on the compute pool and writes it back
+  with a single bulk UPDATE, committing per chunk
+- Background job support (not called from request handlers)
+"""
+
+import logging
+from typing import Dict, List, Type
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.investment import InvestmentAccount
+from models.life_assurance import LifeAssurancePolicy, PolicyBeneficiary
+from models.retirement import SARetirementFund, UKPension
+from models.savings_account import SavingsAccount
+from models.two_factor import User2FA
+from utils.encryption import rotate_values_async
+
+logger = logging.getLogger(__name__)
+
+# Models with Fernet-encrypted columns (see each model's ENCRYPTED_FIELDS)
+ENCRYPTED_MODELS = [
+    SavingsAccount,
+    InvestmentAccount,
+    LifeAssurancePolicy,
+    PolicyBeneficiary,
+    UKPension,
+    SARetirementFund,
+    User2FA,
+]
+
+
+class EncryptionKeyRotationService:
+    """Service for re-encrypting stored data under the current encryption key."""
+
+    DEFAULT_CHUNK_SIZE = 500
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize key rotation service.
+
+        Args:
+            db: Database session for queries
+        """
+        self.db = db
+
+    async def rotate_model(self, model: Type, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, int]:
+        """
+        Re-encrypt every encrypted column of one model.
+
+        Values that no configured key can decrypt are left unchanged and
+        counted as failed.
+
+        Args:
+            model: Model class declaring ENCRYPTED_FIELDS
+            chunk_size: Rows per batch
+
+        Returns:
+            Dict with 'rows', 'rotated' (values) and 'failed' (values) counts
+        """
+        fields = model.ENCRYPTED_FIELDS
+        counts = {'rows': 0, 'rotated': 0, 'failed': 0}
+        last_id = None
+
+        while True:
+            query = select(model.id, *(getattr(model, field) for field in fields))
+            if last_id is not None:
+                query = query.where(model.id > last_id)
+            rows = (await self.db.execute(query.order_by(model.id).limit(chunk_size))).all()
+            if not rows:
+                break
+
+            updates: List[Dict] = [{'id': row[0]} for row in rows]
+            for position, field in enumerate(fields, start=1):
+                # Skip NULLs (optional fields)
+                present = [i for i, row in enumerate(rows) if row[position] is not None]
+                rotated = await rotate_values_async([rows[i][position] for i in present])
+                for i, token in zip(present, rotated):
+                    if token is None:
+                        counts['failed'] += 1
+                        continue
+                    updates[i][field] = token
+                    counts['rotated'] += 1
+
+            updates = [values for values in updates if len(values) > 1]
+            if updates:
+                await self.db.execute(update(model), updates)
+            await self.db.commit()
+
+            counts['rows'] += len(rows)
+            last_id = rows[-1][0]
+
+        if counts['failed']:
+            logger.warning(
+                f"Key rotation: {counts['failed']} values in {model.__tablename__} "
+                f"could not be decrypted with any configured key"
+            )
+        return counts
+
+    async def rotate_all(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Dict[str, int]]:
+        """
+        Re-encrypt all encrypted columns in the database.
+
+        Args:
+            chunk_size: Rows per batch
+
+        Returns:
+            Dict of table name -> counts (see rotate_model)
+        """
+        results = {}
+        for model in ENCRYPTED_MODELS:
+            results[model.__tablename__] = await self.rotate_model(model, chunk_size)
+            logger.info(f"Key rotation: {model.__tablename__} {results[model.__tablename__]}")
+        return results
@@ -3,7 +3,8 @@ Goal Optimization Service
 
 Provides intelligent goal prioritization and resource allocation including:
 - Goal prioritization based on urgency, importance, and feasibility
-- Savings allocation across multiple goals
+- Savings allocation across multiple goals (linear program, priority weighted)
+- Allocation frontier across many budgets in one call
 - Conflict detection (insufficient funds, competing deadlines)
 - Goal adjustment recommendations
 
@@ -12,7 +13,11 @@ Business Rules:
   - Urgency (time to target date)
   - Importance (goal type and user priority)
   - Feasibility (achievability with available resources)
-- High-priority goals funded first in allocation
+- Allocation maximizes sum(priority_score x allocated) subject to the
+  budget and 0 <= allocated <= required for each goal. With a single budget
+  constraint the LP optimum fills goals in priority-score order (each goal
+  fully before the next), so it is solved exactly by a sort and cumulative
+  sum rather than a general simplex
 - Conflicts detected when total required > available
 - Recommendations provided for infeasible goals
 - Emergency fund and debt repayment prioritized
@@ -20,23 +25,131 @@ Business Rules:
 Performance:
 - Target: <500ms for prioritization and allocation
 - Target: <300ms for conflict detection
+- Active goals are loaded in one query; required monthly savings for all
+  goals are computed in one numpy pass (no per-goal query)
+- Allocations are computed in integer pence for every budget at once
 - Async database operations throughout
 """
 
 import logging
 from datetime import date
 from decimal import Decimal
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Sequence, Tuple
 from uuid import UUID
 from dateutil.relativedelta import relativedelta
 
+import numpy as np
+
 from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.goal import FinancialGoal, GoalType, GoalPriority, GoalStatus
+from services.goals import goal_service
 
 logger = logging.getLogger(__name__)
 
+# Default return rate: 2% annual (as GoalService.calculate_monthly_savings_needed)
+DEFAULT_EXPECTED_ANNUAL_RETURN = Decimal('0.02')
+
+
+def _months_between(start: date, end: date) -> int:
+    """Calculate number of months between two dates."""
+    delta = relativedelta(end, start)
+    return delta.years * 12 + delta.months
+
+
+def calculate_required_monthly_savings(
+    goals: Sequence[FinancialGoal],
+    expected_annual_return: Decimal = DEFAULT_EXPECTED_ANNUAL_RETURN,
+    as_of: Optional[date] = None
+) -> List[Decimal]:
+    """
+    Required monthly savings for many goals in one vectorized pass.
+
+    Same formula as GoalService.calculate_monthly_savings_needed:
+    PMT = (target - current x (1 + r)^n) x r / ((1 + r)^n - 1), where
+    r = monthly rate and n = months remaining (straight-line if r == 0).
+
+    Args:
+        goals: Goals to evaluate
+        expected_annual_return: Expected annual return rate
+        as_of: Date months are counted from (default: today)
+
+    Returns:
+        Monthly savings needed per goal (same order), rounded to pence
+
+    Raises:
+        goal_service.ValidationError: If a goal's target date is in the past
+    """
+    if not goals:
+        return []
+    as_of = as_of or date.today()
+
+    months = np.array([_months_between(as_of, g.target_date) for g in goals], dtype=np.float64)
+    if (months <= 0).any():
+        raise goal_service.ValidationError("Goal target date is in the past")
+
+    target = np.array([float(g.target_amount) for g in goals])
+    current = np.array([float(g.current_amount) for g in goals])
+    monthly_rate = float(expected_annual_return) / 12
+
+    growth = (1 + monthly_rate) ** months
+    additional_needed = target - current * growth
+    if monthly_rate > 0:
+        payment = additional_needed * monthly_rate / (growth - 1)
+    else:
+        payment = additional_needed / months
+    payment = np.where(additional_needed > 0, payment, 0.0)
+
+    return [Decimal(f"{value:.2f}") for value in payment]
+
+
+def solve_savings_allocation(
+    required_pence: np.ndarray,
+    weights: np.ndarray,
+    budgets_pence: np.ndarray
+) -> np.ndarray:
+    """
+    Solve the weighted allocation LP for every budget at once.
+
+    maximize    sum(weights x allocation)
+    subject to  sum(allocation) <= budget, 0 <= allocation <= required
+
+    A single budget constraint with per-goal bounds is a continuous
+    knapsack: the optimum funds goals in descending weight order, each up
+    to its bound. Ties keep input order.
+
+    Args:
+        required_pence: (n,) required monthly savings per goal, in pence
+        weights: (n,) priority weight per goal
+        budgets_pence: (m,) budgets, in pence
+
+    Returns:
+        (m, n) allocation in pence for each budget and goal
+    """
+    order = np.argsort(-weights, kind='stable')
+    required_sorted = required_pence[order]
+    funded_before = np.concatenate(([0], np.cumsum(required_sorted)[:-1]))
+
+    allocation_sorted = np.clip(
+        budgets_pence[:, None] - funded_before[None, :],
+        0,
+        required_sorted[None, :]
+    )
+    allocation = np.empty_like(allocation_sorted)
+    allocation[:, order] = allocation_sorted
+    return allocation
+
+
+def _to_pence(amounts: Sequence[Decimal]) -> np.ndarray:
+    """Decimal amounts as int64 pence (truncated)."""
+    return np.array([int(amount * 100) for amount in amounts], dtype=np.int64)
+
+
+def _from_pence(pence) -> Decimal:
+    """Pence as a Decimal amount."""
+    return (Decimal(int(pence)) / 100).quantize(Decimal('0.01'))
+
 
 class ValidationError(Exception):
     """Raised when optimization data validation fails."""
@@ -106,7 +219,14 @@ class GoalOptimizationService:
         """
         logger.info(f"Prioritizing goals for user {user_id}")
 
-        # Query all active goals
+        prioritized = self._prioritize(await self._get_active_goals(user_id))
+
+        logger.info(f"Goals prioritized: {len(prioritized)} goals ranked")
+
+        return prioritized
+
+    async def _get_active_goals(self, user_id: UUID) -> List[FinancialGoal]:
+        """Load all of a user's active goals in one query."""
         result = await self.db.execute(
             select(FinancialGoal).where(
                 and_(
@@ -121,8 +241,10 @@ class GoalOptimizationService:
                 )
             )
         )
-        goals = result.scalars().all()
+        return list(result.scalars().all())
 
+    def _prioritize(self, goals: Sequence[FinancialGoal]) -> List[Dict[str, Any]]:
+        """Score, sort and rank goals (see prioritize_goals)."""
         prioritized = []
 
         for goal in goals:
@@ -158,8 +280,21 @@ class GoalOptimizationService:
         for idx, item in enumerate(prioritized, start=1):
             item["rank"] = idx
 
-        logger.info(f"Goals prioritized: {len(prioritized)} goals ranked")
+        return prioritized
 
+    async def _get_goal_requirements(self, user_id: UUID) -> List[Dict[str, Any]]:
+        """
+        Prioritized active goals with their required monthly savings.
+
+        One goal query plus one vectorized savings calculation, shared by
+        allocation, the frontier and conflict detection.
+        """
+        goals = await self._get_active_goals(user_id)
+        required = dict(zip((g.id for g in goals), calculate_required_monthly_savings(goals)))
+
+        prioritized = self._prioritize(goals)
+        for goal_data in prioritized:
+            goal_data["required_monthly"] = required[goal_data["goal_id"]]
         return prioritized
 
     async def allocate_available_savings(
@@ -201,41 +336,30 @@ class GoalOptimizationService:
         if total_available_monthly_savings < 0:
             raise ValidationError("Available savings cannot be negative")
 
-        # Get prioritized goals
-        prioritized = await self.prioritize_goals(user_id)
+        goals = await self._get_goal_requirements(user_id)
+        required = _to_pence([g["required_monthly"] for g in goals])
+        weights = np.array([float(g["priority_score"]) for g in goals])
+        budget = _to_pence([total_available_monthly_savings])
 
-        # Calculate required monthly savings for each goal
-        from services.goals.goal_service import get_goal_service
-        goal_service = get_goal_service(self.db)
+        allocated_pence = solve_savings_allocation(required, weights, budget)[0]
 
         allocations = []
-        remaining_budget = total_available_monthly_savings
-        total_required = Decimal('0.00')
         fully_funded = []
         partially_funded = []
         unfunded = []
 
-        for goal_data in prioritized:
+        for goal_data, allocated, goal_required in zip(goals, allocated_pence, required):
             goal_id = goal_data["goal_id"]
+            allocated = _from_pence(allocated)
 
-            # Calculate required monthly savings
-            calc = await goal_service.calculate_monthly_savings_needed(goal_id)
-            required = calc["monthly_savings_needed"]
-            total_required += required
-
-            if remaining_budget >= required:
-                # Fully fund this goal
-                allocated = required
+            if allocated >= _from_pence(goal_required):
+                funding_status = "FULLY_FUNDED"
                 fully_funded.append(goal_id)
-                remaining_budget -= required
-            elif remaining_budget > 0:
-                # Partially fund this goal
-                allocated = remaining_budget
+            elif allocated > 0:
+                funding_status = "PARTIALLY_FUNDED"
                 partially_funded.append(goal_id)
-                remaining_budget = Decimal('0.00')
             else:
-                # Cannot fund this goal
-                allocated = Decimal('0.00')
+                funding_status = "UNFUNDED"
                 unfunded.append(goal_id)
 
             if total_available_monthly_savings > 0:
@@ -246,21 +370,19 @@ class GoalOptimizationService:
             allocations.append({
                 "goal_id": str(goal_id),
                 "goal_name": goal_data["goal_name"],
-                "required_monthly": required.quantize(Decimal('0.01')),
-                "allocated_monthly": allocated.quantize(Decimal('0.01')),
+                "required_monthly": goal_data["required_monthly"],
+                "allocated_monthly": allocated,
                 "allocation_percentage": percentage.quantize(Decimal('0.01')),
-                "funding_status": (
-                    "FULLY_FUNDED" if goal_id in fully_funded
-                    else "PARTIALLY_FUNDED" if goal_id in partially_funded
-                    else "UNFUNDED"
-                )
+                "funding_status": funding_status
             })
 
-        total_allocated = total_available_monthly_savings - remaining_budget
+        total_allocated = _from_pence(allocated_pence.sum())
+        total_required = sum((g["required_monthly"] for g in goals), Decimal('0.00'))
+        remaining_budget = total_available_monthly_savings - total_allocated
 
         result = {
             "total_available": total_available_monthly_savings.quantize(Decimal('0.01')),
-            "total_allocated": total_allocated.quantize(Decimal('0.01')),
+            "total_allocated": total_allocated,
             "total_required": total_required.quantize(Decimal('0.01')),
             "unallocated": remaining_budget.quantize(Decimal('0.01')),
             "allocations": allocations,
@@ -277,6 +399,82 @@ class GoalOptimizationService:
 
         return result
 
+    async def allocation_frontier(
+        self,
+        user_id: UUID,
+        budgets: Optional[Sequence[Decimal]] = None
+    ) -> Dict[str, Any]:
+        """
+        Optimal allocations across a range of monthly budgets.
+
+        Args:
+            user_id: User UUID
+            budgets: Monthly budgets to solve for (default: the frontier's
+                     breakpoints - zero and each budget at which another goal
+                     becomes fully funded; allocations are linear in between)
+
+        Returns:
+            Dict with:
+                - goals: List[Dict] with goal_id, goal_name, priority_score,
+                  required_monthly (in funding order)
+                - total_required: Decimal
+                - points: List[Dict], one per budget (ascending), with budget,
+                  total_allocated, unallocated, fully_funded_count and
+                  allocations (allocated_monthly per goal, same order as goals)
+
+        Raises:
+            ValidationError: If a budget is negative
+        """
+        logger.info(f"Computing allocation frontier for user {user_id}")
+
+        if budgets is not None and any(b < 0 for b in budgets):
+            raise ValidationError("Available savings cannot be negative")
+
+        goals = await self._get_goal_requirements(user_id)
+        required = _to_pence([g["required_monthly"] for g in goals])
+        weights = np.array([float(g["priority_score"]) for g in goals])
+
+        order = np.argsort(-weights, kind='stable')
+        if budgets is None:
+            budgets_pence = np.unique(np.concatenate(([0], np.cumsum(required[order]))))
+            budgets = [_from_pence(b) for b in budgets_pence]
+        else:
+            budgets = sorted(budgets)
+            budgets_pence = _to_pence(budgets)
+
+        allocation = solve_savings_allocation(required, weights, budgets_pence)
+        fully_funded = (allocation >= required[None, :]).sum(axis=1)
+
+        points = []
+        for budget, row, funded_count in zip(budgets, allocation, fully_funded):
+            total_allocated = _from_pence(row.sum())
+            points.append({
+                "budget": budget.quantize(Decimal('0.01')),
+                "total_allocated": total_allocated,
+                "unallocated": (budget - total_allocated).quantize(Decimal('0.01')),
+                "fully_funded_count": int(funded_count),
+                "allocations": [
+                    {"goal_id": str(goals[i]["goal_id"]), "allocated_monthly": _from_pence(row[i])}
+                    for i in order
+                ]
+            })
+
+        logger.info(f"Allocation frontier computed: {len(goals)} goals, {len(points)} budgets")
+
+        return {
+            "goals": [
+                {
+                    "goal_id": str(goals[i]["goal_id"]),
+                    "goal_name": goals[i]["goal_name"],
+                    "priority_score": goals[i]["priority_score"],
+                    "required_monthly": goals[i]["required_monthly"]
+                }
+                for i in order
+            ],
+            "total_required": sum((g["required_monthly"] for g in goals), Decimal('0.00')),
+            "points": points
+        }
+
     async def identify_conflicting_goals(
         self,
         user_id: UUID,
@@ -308,22 +506,17 @@ class GoalOptimizationService:
 
         conflicts = []
 
-        # Get prioritized goals
-        prioritized = await self.prioritize_goals(user_id)
+        # Prioritized goals with required monthly savings
+        prioritized = await self._get_goal_requirements(user_id)
 
         if not prioritized:
             return conflicts
 
-        # Calculate total required monthly savings
-        from services.goals.goal_service import get_goal_service
-        goal_service = get_goal_service(self.db)
-
         total_required = Decimal('0.00')
         goal_requirements = []
 
         for goal_data in prioritized:
-            calc = await goal_service.calculate_monthly_savings_needed(goal_data["goal_id"])
-            required = calc["monthly_savings_needed"]
+            required = goal_data["required_monthly"]
             total_required += required
 
             goal_requirements.append({
@@ -488,10 +681,7 @@ class GoalOptimizationService:
             raise ValidationError(f"Goal not found: {goal_id}")
 
         # Calculate current required monthly savings
-        from services.goals.goal_service import get_goal_service
-        goal_service = get_goal_service(self.db)
-
-        calc = await goal_service.calculate_monthly_savings_needed(goal_id)
+        calc = await goal_service.get_goal_service(self.db).calculate_monthly_savings_needed(goal_id)
         required_monthly = calc["monthly_savings_needed"]
         months_remaining = calc["months_remaining"]
 
@@ -648,8 +838,7 @@ class GoalOptimizationService:
 
     def _calculate_months_between(self, start: date, end: date) -> int:
         """Calculate number of months between two dates."""
-        delta = relativedelta(end, start)
-        return delta.years * 12 + delta.months
+        return _months_between(start, end)
 
 
 # Factory function
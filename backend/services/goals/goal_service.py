@@ -3,10 +3,11 @@ Goal Management Service
 
 Provides comprehensive financial goal management including:
 - Goal creation with SMART criteria validation
-- Progress tracking with linked accounts
+- Progress tracking with linked accounts (per goal, or bulk for all goals)
 - Monthly savings calculations
 - Milestone management
-- Achievement detection and notifications
+- Achievement and milestone detection and notifications (per user or
+  all users in a nightly job)
 
 Business Rules:
 - Goals must be at least 6 months in the future (max 50 years)
@@ -20,6 +21,9 @@ Business Rules:
 Performance:
 - Target: <500ms for goal creation and updates
 - Target: <200ms for progress queries
+- Achievement, milestone and linked-account checks are set-based: joined
+  queries, one UPDATE per chunk of rows and bulk snapshot INSERTs, so the
+  query count doesn't grow with the number of goals
 - Async database operations throughout
 """
 
@@ -27,11 +31,11 @@ import logging
 import uuid
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List, Sequence, Set, Tuple
 from uuid import UUID
 from dateutil.relativedelta import relativedelta
 
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, update, insert, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.goal import (
@@ -39,11 +43,21 @@ from models.goal import (
     GoalRecommendation, GoalType, GoalPriority, GoalStatus,
     MilestoneStatus, ContributionFrequency
 )
+from models.investment import InvestmentAccount, InvestmentHolding, Security, market_price_expression
+from models.rule_evaluation import RuleInput, upsert_input_changes
+from models.savings_account import SavingsAccount
 from schemas.goal import CreateGoalRequest, UpdateGoalRequest
+from services.currency_conversion import CurrencyConversionService
 
 logger = logging.getLogger(__name__)
 
 
+def _chunks(items: List[Any], size: int) -> Iterator[List[Any]]:
+    """Split a list into consecutive chunks of at most size items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
 class ValidationError(Exception):
     """Raised when goal data validation fails."""
     pass
@@ -67,6 +81,9 @@ class GoalService:
     MAX_GOAL_YEARS = 50
     ON_TRACK_THRESHOLD = Decimal('10.00')  # 10% variance allowed
 
+    # Goals/milestones/accounts per IN (...) list in batch checks
+    BATCH_SIZE = 1000
+
     def __init__(self, db: AsyncSession):
         """
         Initialize goal service.
@@ -177,7 +194,8 @@ class GoalService:
             NotFoundError: If goal not found
 
         Business Logic:
-            - Calculate current_amount from linked accounts (placeholder)
+            - Calculate current_amount from linked savings/investment account
+              balances (manual current_amount kept if no linked account resolves)
             - Calculate progress_percentage = (current / target) * 100
             - Determine on_track based on time elapsed vs progress
             - Update status:
@@ -192,60 +210,18 @@ class GoalService:
 
         goal = await self._get_goal_by_id(goal_id)
 
-        # Calculate current amount from linked accounts
-        # For now, keep existing current_amount (actual account linking TBD)
-        current_amount = goal.current_amount
+        # Calculate current amount from linked accounts (manual amount if none resolve)
+        linked_amounts = await self._calculate_linked_amounts([goal])
+        current_amount = linked_amounts.get(goal.id, goal.current_amount)
 
-        # If linked accounts exist, you would query them here:
-        # current_amount = await self._calculate_from_linked_accounts(goal.linked_accounts)
+        assessment = self._assess_progress(goal, current_amount)
+        progress_percentage = assessment["progress_percentage"]
+        on_track = assessment["on_track"]
+        projected_completion = assessment["projected_completion_date"]
 
-        # Calculate progress percentage
-        progress_percentage = goal.calculate_progress_percentage()
-
-        # Check if achieved
-        if current_amount >= goal.target_amount:
-            goal.status = GoalStatus.ACHIEVED
+        goal.status = assessment["status"]
+        if goal.status == GoalStatus.ACHIEVED:
             goal.achieved_at = datetime.utcnow()
-            on_track = True
-            projected_completion = date.today()
-        else:
-            # Calculate expected progress
-            days_total = (goal.target_date - goal.start_date).days
-            days_elapsed = (date.today() - goal.start_date).days
-
-            if days_total > 0:
-                expected_progress_pct = Decimal(str((days_elapsed / days_total) * 100))
-            else:
-                expected_progress_pct = Decimal('0.00')
-
-            # Calculate variance
-            variance = float(progress_percentage) - float(expected_progress_pct)
-
-            # Determine on_track status
-            on_track = variance >= -float(self.ON_TRACK_THRESHOLD)
-
-            # Update status
-            if on_track:
-                goal.status = GoalStatus.ON_TRACK
-            else:
-                goal.status = GoalStatus.AT_RISK
-
-            # Project completion date
-            if days_elapsed > 0 and current_amount > 0:
-                # Linear projection: days_per_unit * units_remaining
-                rate = float(current_amount) / days_elapsed  # Amount per day
-                remaining = float(goal.target_amount - current_amount)
-
-                if rate > 0:
-                    days_to_complete = int(remaining / rate)
-                    projected_completion = date.today() + relativedelta(days=days_to_complete)
-                else:
-                    projected_completion = None
-            else:
-                projected_completion = None
-
-            if goal.status == GoalStatus.NOT_STARTED and current_amount > 0:
-                goal.status = GoalStatus.IN_PROGRESS
 
         # Update goal
         goal.current_amount = current_amount
@@ -490,13 +466,13 @@ class GoalService:
 
     async def check_goal_achievements(
         self,
-        user_id: UUID
+        user_id: Optional[UUID] = None
     ) -> List[Dict[str, Any]]:
         """
-        Check all user goals for achievements.
+        Check goals and milestones for achievements, set-based.
 
         Args:
-            user_id: User UUID
+            user_id: User UUID (None: every user, for the nightly job)
 
         Returns:
             List of achieved goals with details:
@@ -507,45 +483,224 @@ class GoalService:
                 - newly_achieved: bool (achieved in this check)
 
         Business Logic:
-            - Query all active goals for user
-            - Check if current_amount >= target_amount
-            - Mark goal as ACHIEVED if met
-            - Set achieved_at timestamp
-            - Return list of achievements
+            - Select active goals with current_amount >= target_amount
+            - Mark them ACHIEVED with achieved_at and 100% progress, in one UPDATE
+              per chunk, and store their progress snapshots in one bulk INSERT
+            - Mark pending milestones whose goal has reached the milestone
+              amount as ACHIEVED (one joined query and one UPDATE per chunk)
             - Trigger celebration notifications (placeholder)
+
+        Performance:
+            - Query count is independent of the number of goals and milestones
         """
-        logger.info(f"Checking goal achievements for user {user_id}")
+        achievements, _ = await self._check_achievements(user_id)
+        return achievements
 
-        # Query all non-achieved goals
-        result = await self.db.execute(
-            select(FinancialGoal).where(
-                and_(
-                    FinancialGoal.user_id == user_id,
-                    FinancialGoal.status != GoalStatus.ACHIEVED,
-                    FinancialGoal.status != GoalStatus.ABANDONED,
-                    FinancialGoal.deleted_at.is_(None)
-                )
+    async def sync_linked_account_progress(
+        self,
+        user_id: Optional[UUID] = None
+    ) -> Dict[str, int]:
+        """
+        Recalculate progress of goals with linked accounts from account balances.
+
+        Args:
+            user_id: User UUID (None: every user, for the nightly job)
+
+        Returns:
+            Summary:
+                - goals_checked: Active goals with linked accounts
+                - goals_updated: Goals whose current amount changed
+                - goals_achieved: Goals that reached their target
+                - milestones_achieved: Milestones reached by updated goals
+
+        Business Logic:
+            - current_amount = sum of linked savings balances and investment
+              account values, converted to the goal currency
+            - Accounts must belong to the goal's owner; unknown or deleted
+              accounts are ignored, and goals with no resolvable account keep
+              their manual current_amount
+            - Status, on-track and projection as in update_goal_progress
+            - Changed goals get a progress snapshot and a milestone check
+
+        Performance:
+            - One goal query, one balance query per account type and chunk,
+              one rate lookup per currency pair, then one bulk UPDATE and one
+              bulk INSERT for all changed goals
+        """
+        logger.info(f"Syncing linked account progress for {f'user {user_id}' if user_id else 'all users'}")
+
+        query = select(
+            FinancialGoal.id,
+            FinancialGoal.user_id,
+            FinancialGoal.currency,
+            FinancialGoal.target_amount,
+            FinancialGoal.current_amount,
+            FinancialGoal.start_date,
+            FinancialGoal.target_date,
+            FinancialGoal.status,
+            FinancialGoal.linked_accounts
+        ).where(
+            and_(
+                FinancialGoal.status.notin_([GoalStatus.ACHIEVED, GoalStatus.ABANDONED]),
+                FinancialGoal.deleted_at.is_(None),
+                FinancialGoal.linked_accounts.isnot(None)
             )
         )
-        goals = result.scalars().all()
+        if user_id is not None:
+            query = query.where(FinancialGoal.user_id == user_id)
+        goals = [goal for goal in (await self.db.execute(query)).all() if goal.linked_accounts]
 
-        achievements = []
+        linked_amounts = await self._calculate_linked_amounts(goals)
+
+        now = datetime.utcnow()
+        goal_updates = []
+        snapshots = []
+        changed_users = set()
 
         for goal in goals:
-            if goal.current_amount >= goal.target_amount:
-                # Mark as achieved
-                newly_achieved = goal.status != GoalStatus.ACHIEVED
+            current_amount = linked_amounts.get(goal.id)
+            if current_amount is None or current_amount == goal.current_amount:
+                continue
+
+            assessment = self._assess_progress(goal, current_amount)
+            achieved = assessment["status"] == GoalStatus.ACHIEVED
+
+            goal_updates.append({
+                "id": goal.id,
+                "current_amount": current_amount,
+                "progress_percentage": assessment["progress_percentage"],
+                "status": assessment["status"],
+                "achieved_at": now if achieved else None,
+                "updated_at": now
+            })
+            snapshots.append({
+                "goal_id": goal.id,
+                "amount_at_snapshot": current_amount,
+                "target_amount_at_snapshot": goal.target_amount,
+                "progress_percentage": assessment["progress_percentage"],
+                "on_track": assessment["on_track"],
+                "projected_completion_date": assessment["projected_completion_date"]
+            })
+            changed_users.add(goal.user_id)
+
+        milestones_achieved = 0
+        if goal_updates:
+            # ORM bulk UPDATE by primary key (executemany)
+            await self.db.execute(update(FinancialGoal), goal_updates)
+            await self._insert_progress_snapshots(snapshots)
+            milestones_achieved = await self._mark_milestones(
+                goal_ids=[row["id"] for row in goal_updates]
+            )
+            await self._mark_goals_changed(changed_users)
+            await self.db.commit()
+
+        result = {
+            "goals_checked": len(goals),
+            "goals_updated": len(goal_updates),
+            "goals_achieved": sum(1 for row in goal_updates if row["status"] == GoalStatus.ACHIEVED),
+            "milestones_achieved": milestones_achieved
+        }
+
+        logger.info(
+            f"Linked account progress synced: checked={result['goals_checked']}, "
+            f"updated={result['goals_updated']}, achieved={result['goals_achieved']}"
+        )
+
+        return result
+
+    async def run_nightly_goal_checks(self) -> Dict[str, int]:
+        """
+        Nightly background job: sync linked-account progress, then check
+        achievements for every user.
+
+        Returns:
+            Summary:
+                - goals_updated: Goals whose progress changed from linked accounts
+                - goals_achieved: Goals achieved (by sync or manual progress)
+                - milestones_achieved: Milestones achieved
+        """
+        logger.info("Starting nightly goal checks")
+
+        sync = await self.sync_linked_account_progress()
+        achievements, milestones_achieved = await self._check_achievements()
+
+        summary = {
+            "goals_updated": sync["goals_updated"],
+            "goals_achieved": sync["goals_achieved"] + len(achievements),
+            "milestones_achieved": sync["milestones_achieved"] + milestones_achieved
+        }
+
+        logger.info(f"Nightly goal checks complete: {summary}")
 
-                goal.status = GoalStatus.ACHIEVED
-                goal.achieved_at = datetime.utcnow()
-                goal.progress_percentage = Decimal('100.00')
+        return summary
 
+    # ============================================================================
+    # PRIVATE HELPER METHODS
+    # ============================================================================
+
+    async def _check_achievements(
+        self,
+        user_id: Optional[UUID] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Mark achieved goals and milestones; returns (achievements, milestones achieved)."""
+        logger.info(f"Checking goal achievements for {f'user {user_id}' if user_id else 'all users'}")
+
+        # Only goals that have reached their target are loaded
+        query = select(
+            FinancialGoal.id,
+            FinancialGoal.user_id,
+            FinancialGoal.goal_name,
+            FinancialGoal.target_amount,
+            FinancialGoal.current_amount,
+            FinancialGoal.currency
+        ).where(
+            and_(
+                FinancialGoal.status.notin_([GoalStatus.ACHIEVED, GoalStatus.ABANDONED]),
+                FinancialGoal.deleted_at.is_(None),
+                FinancialGoal.current_amount >= FinancialGoal.target_amount
+            )
+        )
+        if user_id is not None:
+            query = query.where(FinancialGoal.user_id == user_id)
+        achieved = (await self.db.execute(query)).all()
+
+        achievements = []
+        if achieved:
+            now = datetime.utcnow()
+            today = date.today()
+            goal_ids = [goal.id for goal in achieved]
+
+            for chunk in _chunks(goal_ids, self.BATCH_SIZE):
+                await self.db.execute(
+                    update(FinancialGoal)
+                    .where(FinancialGoal.id.in_(chunk))
+                    .values(
+                        status=GoalStatus.ACHIEVED,
+                        achieved_at=now,
+                        progress_percentage=Decimal('100.00'),
+                        updated_at=now
+                    )
+                )
+
+            await self._insert_progress_snapshots([
+                {
+                    "goal_id": goal.id,
+                    "amount_at_snapshot": goal.current_amount,
+                    "target_amount_at_snapshot": goal.target_amount,
+                    "progress_percentage": Decimal('100.00'),
+                    "on_track": True,
+                    "projected_completion_date": today
+                }
+                for goal in achieved
+            ])
+
+            for goal in achieved:
                 achievements.append({
                     "goal_id": goal.id,
                     "goal_name": goal.goal_name,
                     "target_amount": goal.target_amount,
-                    "achieved_date": date.today(),
-                    "newly_achieved": newly_achieved
+                    "achieved_date": today,
+                    "newly_achieved": True
                 })
 
                 # Trigger celebration notification (placeholder)
@@ -554,16 +709,253 @@ class GoalService:
                     f"Target: {goal.target_amount} {goal.currency}"
                 )
 
-        if goals:
-            await self.db.commit()
+            await self._mark_goals_changed({goal.user_id for goal in achieved})
 
-        logger.info(f"Goal achievements checked: {len(achievements)} achievements found")
+        milestones_achieved = await self._mark_milestones(user_id=user_id)
 
-        return achievements
+        await self.db.commit()
 
-    # ============================================================================
-    # PRIVATE HELPER METHODS
-    # ============================================================================
+        logger.info(
+            f"Goal achievements checked: {len(achievements)} achievements, "
+            f"{milestones_achieved} milestones found"
+        )
+
+        return achievements, milestones_achieved
+
+    def _assess_progress(
+        self,
+        goal: Any,
+        current_amount: Decimal,
+        today: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """
+        Progress, status, on-track and projected completion for an amount.
+
+        Works on a FinancialGoal or a selected row with target_amount,
+        start_date, target_date and status.
+        """
+        today = today or date.today()
+
+        if goal.target_amount > 0:
+            progress_percentage = min(
+                (current_amount / goal.target_amount * 100).quantize(Decimal('0.01')),
+                Decimal('100.00')
+            )
+        else:
+            progress_percentage = Decimal('0.00')
+
+        if current_amount >= goal.target_amount:
+            return {
+                "progress_percentage": progress_percentage,
+                "status": GoalStatus.ACHIEVED,
+                "on_track": True,
+                "projected_completion_date": today
+            }
+
+        # Expected progress by elapsed time
+        days_total = (goal.target_date - goal.start_date).days
+        days_elapsed = (today - goal.start_date).days
+
+        if days_total > 0:
+            expected_progress_pct = Decimal(str((days_elapsed / days_total) * 100))
+        else:
+            expected_progress_pct = Decimal('0.00')
+
+        variance = float(progress_percentage) - float(expected_progress_pct)
+        on_track = variance >= -float(self.ON_TRACK_THRESHOLD)
+        status = GoalStatus.ON_TRACK if on_track else GoalStatus.AT_RISK
+
+        # Linear projection: days_per_unit * units_remaining
+        projected_completion = None
+        if days_elapsed > 0 and current_amount > 0:
+            rate = float(current_amount) / days_elapsed  # Amount per day
+            remaining = float(goal.target_amount - current_amount)
+            if rate > 0:
+                projected_completion = today + relativedelta(days=int(remaining / rate))
+
+        return {
+            "progress_percentage": progress_percentage,
+            "status": status,
+            "on_track": on_track,
+            "projected_completion_date": projected_completion
+        }
+
+    async def _calculate_linked_amounts(self, goals: Sequence[Any]) -> Dict[UUID, Decimal]:
+        """
+        Sum each goal's linked account balances in the goal currency.
+
+        Savings accounts count their current balance, investment accounts
+        their holdings at current prices. Accounts are looked up in bulk;
+        goals with no resolvable account (or a missing exchange rate) are
+        omitted from the result.
+        """
+        linked: Dict[UUID, List[UUID]] = {}
+        for goal in goals:
+            account_ids = []
+            for account_id in goal.linked_accounts or []:
+                try:
+                    account_ids.append(UUID(str(account_id)))
+                except ValueError:
+                    logger.warning(f"Ignoring invalid linked account {account_id!r} on goal {goal.id}")
+            if account_ids:
+                linked[goal.id] = account_ids
+
+        if not linked:
+            return {}
+
+        # Account ID -> (owner, currency, balance)
+        balances: Dict[UUID, Tuple[UUID, str, Decimal]] = {}
+        holding_value = func.coalesce(
+            func.sum(
+                market_price_expression() * InvestmentHolding.quantity
+            ),
+            0
+        )
+        account_ids = list({account_id for ids in linked.values() for account_id in ids})
+
+        for chunk in _chunks(account_ids, self.BATCH_SIZE):
+            savings = await self.db.execute(
+                select(
+                    SavingsAccount.id,
+                    SavingsAccount.user_id,
+                    SavingsAccount.currency,
+                    SavingsAccount.current_balance
+                ).where(
+                    and_(
+                        SavingsAccount.id.in_(chunk),
+                        SavingsAccount.deleted_at.is_(None)
+                    )
+                )
+            )
+            investments = await self.db.execute(
+                select(
+                    InvestmentAccount.id,
+                    InvestmentAccount.user_id,
+                    InvestmentAccount.base_currency,
+                    holding_value
+                )
+                .outerjoin(
+                    InvestmentHolding,
+                    and_(
+                        InvestmentHolding.account_id == InvestmentAccount.id,
+                        InvestmentHolding.deleted == False
+                    )
+                )
+                .outerjoin(Security, Security.id == InvestmentHolding.security_id)
+                .where(
+                    and_(
+                        InvestmentAccount.id.in_(chunk),
+                        InvestmentAccount.deleted == False
+                    )
+                )
+                .group_by(InvestmentAccount.id, InvestmentAccount.user_id, InvestmentAccount.base_currency)
+            )
+            for account_id, owner, currency, balance in (*savings.all(), *investments.all()):
+                balances[account_id] = (owner, getattr(currency, 'value', currency), Decimal(str(balance)))
+
+        # One rate lookup per currency pair
+        currency_service = CurrencyConversionService(self.db)
+        rates: Dict[Tuple[str, str], Optional[Decimal]] = {}
+        amounts: Dict[UUID, Decimal] = {}
+
+        for goal in goals:
+            accounts = [
+                balances[account_id] for account_id in linked.get(goal.id, [])
+                if account_id in balances and balances[account_id][0] == goal.user_id
+            ]
+            if not accounts:
+                continue
+
+            total = Decimal('0.00')
+            for _, currency, balance in accounts:
+                if currency != goal.currency:
+                    pair = (currency, goal.currency)
+                    if pair not in rates:
+                        try:
+                            rates[pair] = await currency_service.get_exchange_rate(*pair)
+                        except Exception as e:
+                            logger.warning(f"No {currency}/{goal.currency} rate for linked accounts: {e}")
+                            rates[pair] = None
+                    if rates[pair] is None:
+                        break
+                    balance = balance * rates[pair]
+                total += balance
+            else:
+                amounts[goal.id] = total.quantize(Decimal('0.01'))
+
+        return amounts
+
+    async def _mark_milestones(
+        self,
+        user_id: Optional[UUID] = None,
+        goal_ids: Optional[Sequence[UUID]] = None
+    ) -> int:
+        """
+        Mark pending milestones reached by their goal's current amount
+        ACHIEVED (caller commits).
+
+        Args:
+            user_id: Only this user's goals (None: every user)
+            goal_ids: Only these goals (None: every goal in scope)
+
+        Returns:
+            Number of milestones achieved
+        """
+        query = (
+            select(GoalMilestone.id, GoalMilestone.milestone_name, FinancialGoal.goal_name)
+            .join(FinancialGoal, FinancialGoal.id == GoalMilestone.goal_id)
+            .where(
+                and_(
+                    GoalMilestone.status == MilestoneStatus.PENDING,
+                    FinancialGoal.deleted_at.is_(None),
+                    FinancialGoal.current_amount >= GoalMilestone.milestone_target_amount
+                )
+            )
+        )
+        if user_id is not None:
+            query = query.where(FinancialGoal.user_id == user_id)
+
+        if goal_ids is None:
+            reached = (await self.db.execute(query)).all()
+        else:
+            reached = []
+            for chunk in _chunks(list(goal_ids), self.BATCH_SIZE):
+                reached.extend((await self.db.execute(query.where(GoalMilestone.goal_id.in_(chunk)))).all())
+
+        today = date.today()
+        for chunk in _chunks([milestone.id for milestone in reached], self.BATCH_SIZE):
+            await self.db.execute(
+                update(GoalMilestone)
+                .where(GoalMilestone.id.in_(chunk))
+                .values(status=MilestoneStatus.ACHIEVED, achieved_date=today)
+            )
+
+        for milestone in reached:
+            logger.info(
+                f"MILESTONE ACHIEVED: '{milestone.milestone_name}' "
+                f"for goal '{milestone.goal_name}'"
+            )
+
+        return len(reached)
+
+    async def _insert_progress_snapshots(self, snapshots: List[Dict[str, Any]]) -> None:
+        """Insert progress history snapshots in one bulk INSERT (caller commits)."""
+        if not snapshots:
+            return
+        today = date.today()
+        await self.db.execute(
+            insert(GoalProgressHistory),
+            [
+                {"snapshot_date": today, "effective_from": today, "effective_to": None, **snapshot}
+                for snapshot in snapshots
+            ]
+        )
+
+    async def _mark_goals_changed(self, user_ids: Set[UUID]) -> None:
+        """Record a goals change for rule evaluation (bulk writes bypass the flush)."""
+        if user_ids:
+            connection = await self.db.connection()
+            await connection.run_sync(upsert_input_changes, user_ids, RuleInput.GOALS)
 
     async def _get_goal_by_id(self, goal_id: UUID) -> FinancialGoal:
         """Get goal by ID, raise NotFoundError if not found."""
@@ -630,27 +1022,7 @@ class GoalService:
 
     async def _check_milestones(self, goal: FinancialGoal) -> None:
         """Check and update milestone achievements."""
-        result = await self.db.execute(
-            select(GoalMilestone).where(
-                and_(
-                    GoalMilestone.goal_id == goal.id,
-                    GoalMilestone.status == MilestoneStatus.PENDING
-                )
-            )
-        )
-        milestones = result.scalars().all()
-
-        for milestone in milestones:
-            if goal.current_amount >= milestone.milestone_target_amount:
-                milestone.status = MilestoneStatus.ACHIEVED
-                milestone.achieved_date = date.today()
-
-                logger.info(
-                    f"MILESTONE ACHIEVED: '{milestone.milestone_name}' "
-                    f"for goal '{goal.goal_name}'"
-                )
-
-        if milestones:
+        if await self._mark_milestones(goal_ids=[goal.id]):
             await self.db.commit()
 
     def _calculate_months_between(self, start: date, end: date) -> int:
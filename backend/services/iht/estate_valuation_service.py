@@ -7,6 +7,7 @@ Provides comprehensive estate valuation and UK IHT calculation including:
 - Residence Nil Rate Band (RNRB) calculation with tapering
 - UK IHT calculation with NRB, RNRB, and transferable allowances
 - IHT calculation storage for audit trail
+- Point-in-time valuation from an in-memory estate timeline
 
 Business Rules:
 - Standard NRB: £325,000 (2024/25)
@@ -16,30 +17,120 @@ Business Rules:
 - Transferable NRB/RNRB from deceased spouse supported
 - All calculations use Decimal for precision
 - Temporal data filtering (effective_from/effective_to)
+- RNRB-eligible value: UK-included PROPERTY assets (qualifying residence)
 
 Performance:
 - Target: <500ms for estate calculation
 - Target: <200ms for gross/net estate queries
+- A user's asset/liability timeline is loaded once per service instance
+  (two queries) and every as-of lookup is a binary search, so valuation
+  series cost O(log n) per date instead of a query per date
 - Async database operations throughout
 """
 
 import logging
 import uuid
+from bisect import bisect_right
 from datetime import date
 from decimal import Decimal
-from typing import Optional, Dict, Any
+from itertools import accumulate
+from typing import Optional, Dict, Any, List, Iterable, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, and_, func
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.estate_iht import (
-    EstateAsset, EstateLiability, IHTCalculation
+    EstateAsset, EstateLiability, IHTCalculation, AssetType
 )
 
 logger = logging.getLogger(__name__)
 
 
+class _StepSeries:
+    """Piecewise-constant total built from [effective_from, effective_to) intervals."""
+
+    def __init__(self, intervals: Iterable[Tuple[date, Optional[date], Decimal]]):
+        deltas: Dict[date, Decimal] = {}
+        for start, end, amount in intervals:
+            deltas[start] = deltas.get(start, Decimal('0.00')) + amount
+            if end is not None:
+                deltas[end] = deltas.get(end, Decimal('0.00')) - amount
+
+        self.dates = sorted(deltas)
+        self.totals = list(accumulate(deltas[d] for d in self.dates))
+
+    def value_at(self, as_of_date: date) -> Decimal:
+        """Total of intervals with effective_from <= as_of_date < effective_to."""
+        index = bisect_right(self.dates, as_of_date)
+        return self.totals[index - 1] if index else Decimal('0.00')
+
+
+class EstateTimeline:
+    """
+    In-memory as-of index over a user's estate assets and liabilities.
+
+    Built once from the user's non-deleted rows; each lookup is a binary
+    search over the change dates of the timeline.
+    """
+
+    def __init__(
+        self,
+        assets: Iterable[Tuple[date, Optional[date], Decimal, AssetType]],
+        liabilities: Iterable[Tuple[date, Optional[date], Decimal]]
+    ):
+        """
+        Initialize estate timeline.
+
+        Args:
+            assets: (effective_from, effective_to, value, asset_type) for
+                    UK-included assets
+            liabilities: (effective_from, effective_to, amount) for deductible
+                         liabilities
+        """
+        assets = list(assets)
+        self._gross = _StepSeries((start, end, value) for start, end, value, _ in assets)
+        self._residence = _StepSeries(
+            (start, end, value) for start, end, value, asset_type in assets
+            if asset_type == AssetType.PROPERTY
+        )
+        self._liabilities = _StepSeries(liabilities)
+
+    def value_at(self, as_of_date: date) -> Dict[str, Any]:
+        """
+        Estate values on a date.
+
+        Args:
+            as_of_date: Valuation date
+
+        Returns:
+            Dict with as_of_date, gross_estate, total_liabilities, net_estate
+            and residence_value (RNRB-eligible property value)
+        """
+        gross_estate = self._gross.value_at(as_of_date)
+        total_liabilities = self._liabilities.value_at(as_of_date)
+
+        return {
+            'as_of_date': as_of_date,
+            'gross_estate': gross_estate,
+            'total_liabilities': total_liabilities,
+            'net_estate': gross_estate - total_liabilities,
+            'residence_value': self._residence.value_at(as_of_date)
+        }
+
+    def series(self, dates: Iterable[date]) -> List[Dict[str, Any]]:
+        """
+        Estate values for each date, in the order given.
+
+        Args:
+            dates: Valuation dates
+
+        Returns:
+            List of value_at() dicts
+        """
+        return [self.value_at(as_of_date) for as_of_date in dates]
+
+
 class ValidationError(Exception):
     """Raised when estate data validation fails."""
     pass
@@ -69,6 +160,90 @@ class EstateValuationService:
             db: Database session for operations
         """
         self.db = db
+        self._timelines: Dict[UUID, EstateTimeline] = {}
+
+    async def get_estate_timeline(self, user_id: UUID) -> EstateTimeline:
+        """
+        Get the user's estate timeline, loading it on first use.
+
+        The timeline is cached for the lifetime of this service instance
+        (one request); call invalidate_timeline() after changing the user's
+        assets or liabilities through the same instance.
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            EstateTimeline for the user
+        """
+        timeline = self._timelines.get(user_id)
+        if timeline is not None:
+            return timeline
+
+        asset_rows = await self.db.execute(
+            select(
+                EstateAsset.effective_from,
+                EstateAsset.effective_to,
+                EstateAsset.estimated_value,
+                EstateAsset.asset_type
+            ).where(
+                EstateAsset.user_id == user_id,
+                EstateAsset.included_in_uk_estate == True,
+                EstateAsset.is_deleted == False
+            )
+        )
+        liability_rows = await self.db.execute(
+            select(
+                EstateLiability.effective_from,
+                EstateLiability.effective_to,
+                EstateLiability.amount_outstanding
+            ).where(
+                EstateLiability.user_id == user_id,
+                EstateLiability.deductible_from_estate == True,
+                EstateLiability.is_deleted == False
+            )
+        )
+
+        timeline = EstateTimeline(
+            (
+                (start, end, Decimal(str(value)), asset_type)
+                for start, end, value, asset_type in asset_rows.all()
+            ),
+            (
+                (start, end, Decimal(str(amount)))
+                for start, end, amount in liability_rows.all()
+            )
+        )
+        self._timelines[user_id] = timeline
+
+        return timeline
+
+    def invalidate_timeline(self, user_id: UUID) -> None:
+        """
+        Drop the cached estate timeline for a user.
+
+        Args:
+            user_id: User UUID
+        """
+        self._timelines.pop(user_id, None)
+
+    async def get_valuation_series(
+        self,
+        user_id: UUID,
+        dates: List[date]
+    ) -> List[Dict[str, Any]]:
+        """
+        Get gross, net and RNRB-eligible estate values for a series of dates.
+
+        Args:
+            user_id: User UUID
+            dates: Valuation dates
+
+        Returns:
+            List of dicts (see EstateTimeline.value_at), in the order given
+        """
+        timeline = await self.get_estate_timeline(user_id)
+        return timeline.series(dates)
 
     async def calculate_gross_estate(
         self,
@@ -78,8 +253,8 @@ class EstateValuationService:
         """
         Calculate gross estate value (all UK-includable assets).
 
-        Queries all EstateAssets for user where included_in_uk_estate=True,
-        filters by temporal data (effective_from/effective_to), and sums values.
+        Reads the user's estate timeline (UK-included, non-deleted assets)
+        as of the given date.
 
         Args:
             user_id: User UUID
@@ -99,28 +274,8 @@ class EstateValuationService:
 
         logger.info(f"Calculating gross estate for user {user_id} as of {as_of_date}")
 
-        # Query assets with temporal filtering
-        result = await self.db.execute(
-            select(func.sum(EstateAsset.estimated_value)).where(
-                and_(
-                    EstateAsset.user_id == user_id,
-                    EstateAsset.included_in_uk_estate == True,
-                    EstateAsset.is_deleted == False,
-                    EstateAsset.effective_from <= as_of_date,
-                    (
-                        (EstateAsset.effective_to.is_(None)) |
-                        (EstateAsset.effective_to > as_of_date)
-                    )
-                )
-            )
-        )
-
-        gross_estate = result.scalar()
-
-        if gross_estate is None:
-            gross_estate = Decimal('0.00')
-        else:
-            gross_estate = Decimal(str(gross_estate))
+        timeline = await self.get_estate_timeline(user_id)
+        gross_estate = timeline.value_at(as_of_date)['gross_estate']
 
         logger.info(f"Gross estate calculated: £{gross_estate:,.2f}")
         return gross_estate
@@ -150,33 +305,12 @@ class EstateValuationService:
 
         logger.info(f"Calculating net estate for user {user_id} as of {as_of_date}")
 
-        # Calculate gross estate
-        gross_estate = await self.calculate_gross_estate(user_id, as_of_date)
-
-        # Query deductible liabilities with temporal filtering
-        result = await self.db.execute(
-            select(func.sum(EstateLiability.amount_outstanding)).where(
-                and_(
-                    EstateLiability.user_id == user_id,
-                    EstateLiability.deductible_from_estate == True,
-                    EstateLiability.is_deleted == False,
-                    EstateLiability.effective_from <= as_of_date,
-                    (
-                        (EstateLiability.effective_to.is_(None)) |
-                        (EstateLiability.effective_to > as_of_date)
-                    )
-                )
-            )
-        )
-
-        total_liabilities = result.scalar()
-
-        if total_liabilities is None:
-            total_liabilities = Decimal('0.00')
-        else:
-            total_liabilities = Decimal(str(total_liabilities))
+        timeline = await self.get_estate_timeline(user_id)
+        valuation = timeline.value_at(as_of_date)
 
-        net_estate = gross_estate - total_liabilities
+        gross_estate = valuation['gross_estate']
+        total_liabilities = valuation['total_liabilities']
+        net_estate = valuation['net_estate']
 
         logger.info(
             f"Net estate calculated: £{net_estate:,.2f} "
@@ -291,9 +425,11 @@ class EstateValuationService:
             f"charity={charitable_gifts_percent}%"
         )
 
-        # Calculate estate values
-        gross_estate = await self.calculate_gross_estate(user_id, as_of_date)
-        net_estate = await self.calculate_net_estate(user_id, as_of_date)
+        # Calculate estate values (single timeline lookup)
+        timeline = await self.get_estate_timeline(user_id)
+        valuation = timeline.value_at(as_of_date)
+        gross_estate = valuation['gross_estate']
+        net_estate = valuation['net_estate']
 
         # Standard NRB
         standard_nrb = self.STANDARD_NRB
@@ -7,6 +7,7 @@ Provides comprehensive lifetime gift tracking and PET analysis including:
 - 7-year PET period tracking
 - Taper relief calculation
 - Potential IHT calculation on gifts
+- Vectorized IHT exposure sweep across many hypothetical death dates
 
 Business Rules:
 - Annual exemption: £3,000/year (can carry forward 1 year unused)
@@ -16,10 +17,16 @@ Business Rules:
 - Taper relief: 0-3 years (0%), 3-4 (20%), 4-5 (40%), 5-6 (60%), 6-7 (80%), 7+ (100%)
 - Taper relief reduces TAX, not value
 - IHT rate on gifts: 20% (lifetime) becomes 40% (death) with taper relief
+- Nil rate band is allocated to chargeable gifts in chronological order;
+  each gift's NRB is reduced by chargeable transfers in the 7 years before
+  it, so chargeable lifetime transfers up to 14 years before death still
+  count (the "14-year shadow")
 
 Performance:
 - Target: <200ms for gift recording
 - Target: <500ms for PET analysis with calculations
+- Exposure sweeps load gifts once and evaluate every death date with numpy
+  array operations (no per-gift, per-date Python loop)
 - Async database operations throughout
 """
 
@@ -27,10 +34,12 @@ import logging
 import uuid
 from datetime import date
 from decimal import Decimal
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence
 from uuid import UUID
 from dateutil.relativedelta import relativedelta
 
+import numpy as np
+
 from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -41,6 +50,120 @@ from models.estate_iht import (
 logger = logging.getLogger(__name__)
 
 
+# Taper relief by full years survived after the gift (index = years, capped at 7)
+TAPER_RELIEF_BY_YEARS = np.array([0.0, 0.0, 0.0, 0.20, 0.40, 0.60, 0.80, 1.00])
+DEATH_IHT_RATE = 0.40
+PET_PERIOD_YEARS = 7
+
+
+def _to_decimal(value: float) -> Decimal:
+    """Round a float amount to pence as Decimal."""
+    return Decimal(f"{value:.2f}")
+
+
+def calculate_gift_iht_exposure(
+    gifts: Sequence[Dict[str, Any]],
+    death_dates: Sequence[date],
+    nil_rate_band: Decimal = Decimal('325000.00')
+) -> List[Dict[str, Any]]:
+    """
+    Calculate IHT due on lifetime gifts for each hypothetical death date.
+
+    Pure function (no database access). For every death date:
+    - PETs made in the 7 years before death become chargeable (failed PETs)
+    - CHARGEABLE gifts (CLTs) are always chargeable transfers
+    - Gifts are charged in chronological order; each gift's available NRB is
+      the NRB less chargeable transfers made in the 7 years before it
+    - Tax = 40% of the excess over available NRB, reduced by taper relief
+      for gifts made more than 3 years before death
+    - Lifetime tax already paid on CLTs is not credited (not recorded)
+
+    Args:
+        gifts: Dicts with gift_date, gift_value and gift_type (PET or
+               CHARGEABLE; other types are ignored)
+        death_dates: Hypothetical death dates
+        nil_rate_band: Nil rate band available at death
+
+    Returns:
+        List (same order as death_dates) of dicts with:
+        - death_date: date
+        - chargeable_gifts: Number of gifts charged on death
+        - chargeable_value: Total value of gifts within 7 years of death
+        - gift_iht: Total IHT due on gifts
+        - nrb_used_by_gifts: NRB absorbed by gifts within 7 years of death
+        - nrb_remaining: NRB left for the estate
+    """
+    gifts = sorted(
+        (g for g in gifts if g['gift_type'] in (GiftType.PET, GiftType.CHARGEABLE)),
+        key=lambda g: g['gift_date']
+    )
+    deaths = np.array([d.toordinal() for d in death_dates], dtype=np.int64)
+    nrb = float(nil_rate_band)
+
+    if not gifts:
+        return [
+            {
+                'death_date': death_date,
+                'chargeable_gifts': 0,
+                'chargeable_value': Decimal('0.00'),
+                'gift_iht': Decimal('0.00'),
+                'nrb_used_by_gifts': Decimal('0.00'),
+                'nrb_remaining': _to_decimal(nrb)
+            }
+            for death_date in death_dates
+        ]
+
+    values = np.array([float(g['gift_value']) for g in gifts])
+    made = np.array([g['gift_date'].toordinal() for g in gifts], dtype=np.int64)
+    is_clt = np.array([g['gift_type'] == GiftType.CHARGEABLE for g in gifts])
+
+    # Anniversaries 1..7 years after each gift (n x 7); relativedelta
+    # handles 29 February
+    anniversaries = np.array([
+        [(g['gift_date'] + relativedelta(years=y)).toordinal() for y in range(1, PET_PERIOD_YEARS + 1)]
+        for g in gifts
+    ], dtype=np.int64)
+    seventh = anniversaries[:, -1]
+
+    # (m x n) masks: gift made on/before death, and within 7 years of death
+    made_before_death = made[None, :] <= deaths[:, None]
+    within_seven_years = made_before_death & (deaths[:, None] < seventh[None, :])
+
+    # Chargeable transfers for cumulation: CLTs always, PETs only if failed
+    chargeable = made_before_death & (is_clt[None, :] | within_seven_years)
+    chargeable_values = np.where(chargeable, values[None, :], 0.0)
+
+    # (n x n) prior[k, i]: gift k precedes gift i and is within 7 years of it
+    index = np.arange(len(gifts))
+    prior = (index[:, None] < index[None, :]) & (seventh[:, None] > made[None, :])
+
+    # Cumulative chargeable transfers before each gift, for every death date
+    cumulative = chargeable_values @ prior
+    available_nrb = np.maximum(nrb - cumulative, 0.0)
+    taxable = np.where(within_seven_years, np.maximum(values[None, :] - available_nrb, 0.0), 0.0)
+
+    # Full years survived (0..7) -> taper relief
+    years_survived = (anniversaries[None, :, :] <= deaths[:, None, None]).sum(axis=2)
+    relief = TAPER_RELIEF_BY_YEARS[years_survived]
+    gift_tax = taxable * DEATH_IHT_RATE * (1.0 - relief)
+
+    # Estate NRB is reduced by chargeable transfers in the 7 years before death
+    recent_chargeable = np.where(within_seven_years, values[None, :], 0.0).sum(axis=1)
+    nrb_used = np.minimum(recent_chargeable, nrb)
+
+    return [
+        {
+            'death_date': death_date,
+            'chargeable_gifts': int(within_seven_years[j].sum()),
+            'chargeable_value': _to_decimal(recent_chargeable[j]),
+            'gift_iht': _to_decimal(gift_tax[j].sum()),
+            'nrb_used_by_gifts': _to_decimal(nrb_used[j]),
+            'nrb_remaining': _to_decimal(nrb - nrb_used[j])
+        }
+        for j, death_date in enumerate(death_dates)
+    ]
+
+
 class ValidationError(Exception):
     """Raised when gift data validation fails."""
     pass
@@ -60,6 +183,7 @@ class GiftAnalysisService:
     WEDDING_GIFT_CHILD = Decimal('5000.00')
     WEDDING_GIFT_GRANDCHILD = Decimal('2500.00')
     WEDDING_GIFT_OTHER = Decimal('1000.00')
+    STANDARD_NRB = Decimal('325000.00')
 
     def __init__(self, db: AsyncSession):
         """
@@ -332,6 +456,61 @@ class GiftAnalysisService:
         logger.info(f"Calculated potential IHT for {len(pet_calculations)} PETs")
         return pet_calculations
 
+    async def calculate_iht_exposure_sweep(
+        self,
+        user_id: UUID,
+        death_dates: List[date],
+        nil_rate_band: Optional[Decimal] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Calculate IHT on lifetime gifts for a series of hypothetical death dates.
+
+        Loads every gift that can affect any of the dates in one query
+        (gifts up to 14 years before the earliest date, for NRB cumulation)
+        and evaluates all dates in a single vectorized pass.
+
+        Args:
+            user_id: User UUID
+            death_dates: Hypothetical death dates (e.g. each of the next 10 years)
+            nil_rate_band: NRB at death (default: standard NRB)
+
+        Returns:
+            List of per-date exposure dicts (see calculate_gift_iht_exposure)
+
+        Raises:
+            ValidationError: If no death dates are given
+        """
+        if not death_dates:
+            raise ValidationError("At least one death date is required")
+
+        if nil_rate_band is None:
+            nil_rate_band = self.STANDARD_NRB
+
+        earliest_relevant = min(death_dates) - relativedelta(years=2 * PET_PERIOD_YEARS)
+
+        logger.info(
+            f"Calculating gift IHT exposure for user {user_id} "
+            f"across {len(death_dates)} death dates"
+        )
+
+        result = await self.db.execute(
+            select(Gift.gift_date, Gift.gift_value, Gift.gift_type).where(
+                and_(
+                    Gift.user_id == user_id,
+                    Gift.gift_type.in_([GiftType.PET, GiftType.CHARGEABLE]),
+                    Gift.is_deleted == False,
+                    Gift.gift_date > earliest_relevant,
+                    Gift.gift_date <= max(death_dates)
+                )
+            )
+        )
+        gifts = [row._asdict() for row in result.all()]
+
+        exposure = calculate_gift_iht_exposure(gifts, death_dates, nil_rate_band)
+
+        logger.info(f"Calculated gift IHT exposure from {len(gifts)} gifts")
+        return exposure
+
     async def apply_exemptions(
         self,
         user_id: UUID,
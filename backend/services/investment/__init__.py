@@ -3,9 +3,15 @@
 from services.investment.portfolio_service import PortfolioService
 from services.investment.asset_allocation_service import AssetAllocationService
 from services.investment.investment_tax_service import InvestmentTaxService
+from services.investment.share_matching_service import ShareMatchingService
+from services.investment.price_update_service import PriceUpdateService
+from services.investment.security_master_service import SecurityMasterService
 
 __all__ = [
     'PortfolioService',
     'AssetAllocationService',
     'InvestmentTaxService',
+    'ShareMatchingService',
+    'PriceUpdateService',
+    'SecurityMasterService',
 ]
@@ -8,6 +8,7 @@ Provides comprehensive portfolio allocation analysis including:
 - Portfolio summary with aggregated metrics
 - Top holdings analysis
 - Currency exposure breakdown
+- Single-pass portfolio analytics shared by all of the above, cached per user
 
 Business Rules:
 - Only include active accounts (status=ACTIVE, deleted=False)
@@ -20,31 +21,69 @@ Business Rules:
 Performance:
 - Target: <500ms for allocation calculations
 - Target: <1s for complete portfolio summary
+- Holdings are loaded once per analytics pass; every breakdown, currency
+  exposure and top-N are computed in the same loop
+- Analytics cached in Redis per user (5-minute TTL), invalidated on
+  holding, account and price changes
 - Use async database operations throughout
 """
 
+import json
 import logging
 from collections import defaultdict
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterable, Optional
 from uuid import UUID
 
 from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from models.investment import (
     InvestmentAccount, InvestmentHolding, AssetClass, Region,
     AccountStatus
 )
+from redis_client import redis_client
 
 logger = logging.getLogger(__name__)
 
+# Numeric fields restored to Decimal when reading cached analytics
+_DECIMAL_FIELDS = frozenset({
+    'value', 'percentage', 'total_value', 'total_cost_basis',
+    'total_unrealized_gain', 'unrealized_gain_percentage', 'quantity',
+    'current_price', 'current_value', 'unrealized_gain',
+    'percentage_of_portfolio',
+})
+
+
+def _restore_decimals(data: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON object hook converting cached numeric strings back to Decimal."""
+    for key in _DECIMAL_FIELDS.intersection(data):
+        if isinstance(data[key], str):
+            data[key] = Decimal(data[key])
+    return data
+
+
+def _with_percentages(
+    totals: Dict[str, Decimal],
+    total_value: Decimal
+) -> Dict[str, Dict[str, Decimal]]:
+    """Convert category -> value totals to {value, percentage} (2 d.p.)."""
+    return {
+        category: {
+            'value': value,
+            'percentage': (value / total_value * 100).quantize(Decimal('0.01'))
+        }
+        for category, value in totals.items()
+    }
+
 
 class AssetAllocationService:
     """Service for portfolio asset allocation analysis."""
 
+    CACHE_TTL = 300  # 5 minutes
+    TOP_HOLDINGS_LIMIT = 10
+
     def __init__(self, db: AsyncSession):
         """
         Initialize asset allocation service.
@@ -67,7 +106,6 @@ class AssetAllocationService:
         Notes:
             - Only includes holdings from active accounts
             - Filters out soft-deleted holdings
-            - Eagerly loads account relationship
         """
         result = await self.db.execute(
             select(InvestmentHolding)
@@ -80,10 +118,152 @@ class AssetAllocationService:
                     InvestmentHolding.deleted == False
                 )
             )
-            .options(selectinload(InvestmentHolding.account))
         )
         return result.scalars().all()
 
+    async def get_portfolio_analytics(
+        self,
+        user_id: UUID,
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Get all portfolio analytics for a user from a single pass over holdings.
+
+        Args:
+            user_id: User UUID
+            use_cache: Use cached analytics if available
+
+        Returns:
+            Dict with the get_portfolio_summary fields plus:
+            - region_allocation: {region: {value, percentage}}
+            - sector_allocation: {sector: {value, percentage}}
+        """
+        if use_cache:
+            cached = await self._get_from_cache(user_id)
+            if cached:
+                logger.info(f"Returning cached portfolio analytics for user {user_id}")
+                return cached
+
+        analytics = await self._calculate_analytics(user_id)
+
+        await self._save_to_cache(user_id, analytics)
+
+        return analytics
+
+    async def _calculate_analytics(self, user_id: UUID) -> Dict[str, Any]:
+        """
+        Compute totals, breakdowns, currency exposure and top holdings.
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            Analytics dict (see get_portfolio_analytics)
+        """
+        logger.info(f"Calculating portfolio analytics for user {user_id}")
+
+        holdings = await self._get_active_holdings(user_id)
+
+        # Get active account count
+        account_result = await self.db.execute(
+            select(func.count(InvestmentAccount.id))
+            .where(
+                and_(
+                    InvestmentAccount.user_id == user_id,
+                    InvestmentAccount.status == AccountStatus.ACTIVE,
+                    InvestmentAccount.deleted == False
+                )
+            )
+        )
+        num_accounts = account_result.scalar_one()
+
+        total_value = Decimal('0.00')
+        total_cost_basis = Decimal('0.00')
+        total_unrealized_gain = Decimal('0.00')
+        by_asset_class: Dict[str, Decimal] = defaultdict(Decimal)
+        by_region: Dict[str, Decimal] = defaultdict(Decimal)
+        by_sector: Dict[str, Decimal] = defaultdict(Decimal)
+        by_currency: Dict[str, Decimal] = defaultdict(Decimal)
+        valued_holdings = []
+
+        # Single pass: each holding is valued once
+        for holding in holdings:
+            current_value = holding.current_value
+            total_value += current_value
+            total_cost_basis += holding.purchase_price * holding.quantity
+            total_unrealized_gain += holding.unrealized_gain
+
+            by_asset_class[holding.asset_class.value] += current_value
+            by_region[holding.region.value] += current_value
+            by_sector[holding.sector if holding.sector else 'UNCLASSIFIED'] += current_value
+            by_currency[holding.purchase_currency] += current_value
+
+            valued_holdings.append((current_value, holding))
+
+        # Calculate unrealized gain percentage
+        if total_cost_basis > 0:
+            unrealized_gain_percentage = (
+                total_unrealized_gain / total_cost_basis * 100
+            ).quantize(Decimal('0.01'))
+        else:
+            unrealized_gain_percentage = Decimal('0.00')
+
+        # Breakdowns are empty when there is nothing to apportion
+        if total_value > 0:
+            asset_allocation = _with_percentages(by_asset_class, total_value)
+            region_allocation = _with_percentages(by_region, total_value)
+            sector_allocation = _with_percentages(by_sector, total_value)
+            currency_exposure = _with_percentages(by_currency, total_value)
+        else:
+            if holdings:
+                logger.warning(f"Total portfolio value is zero for user {user_id}")
+            asset_allocation = region_allocation = sector_allocation = currency_exposure = {}
+
+        # Top holdings by value
+        valued_holdings.sort(key=lambda item: item[0], reverse=True)
+
+        top_holdings = []
+        for current_value, holding in valued_holdings[:self.TOP_HOLDINGS_LIMIT]:
+            percentage_of_portfolio = Decimal('0.00')
+            if total_value > 0:
+                percentage_of_portfolio = (
+                    current_value / total_value * 100
+                ).quantize(Decimal('0.01'))
+
+            top_holdings.append({
+                'id': str(holding.id),
+                'security_name': holding.security_name,
+                'ticker': holding.ticker,
+                'quantity': holding.quantity,
+                'current_price': holding.market_price,
+                'current_value': current_value,
+                'unrealized_gain': holding.unrealized_gain,
+                'unrealized_gain_percentage': holding.unrealized_gain_percentage,
+                'asset_class': holding.asset_class.value,
+                'region': holding.region.value,
+                'percentage_of_portfolio': percentage_of_portfolio
+            })
+
+        logger.info(
+            f"Portfolio analytics calculated for user {user_id}: "
+            f"total_value={total_value}, num_holdings={len(holdings)}, "
+            f"num_accounts={num_accounts}"
+        )
+
+        return {
+            'total_value': total_value,
+            'total_cost_basis': total_cost_basis,
+            'total_unrealized_gain': total_unrealized_gain,
+            'unrealized_gain_percentage': unrealized_gain_percentage,
+            'num_holdings': len(holdings),
+            'num_accounts': num_accounts,
+            'currency_exposure': currency_exposure,
+            'asset_allocation': asset_allocation,
+            'region_allocation': region_allocation,
+            'sector_allocation': sector_allocation,
+            'top_holdings': top_holdings
+        }
+
     async def calculate_allocation_by_asset_class(
         self,
         user_id: UUID
@@ -112,41 +292,8 @@ class AssetAllocationService:
             - Percentages rounded to 2 decimal places
             - Total value calculated from current_value property
         """
-        logger.info(f"Calculating asset class allocation for user {user_id}")
-
-        holdings = await self._get_active_holdings(user_id)
-
-        if not holdings:
-            logger.info(f"No active holdings found for user {user_id}")
-            return {}
-
-        # Calculate total portfolio value
-        total_value = sum(holding.current_value for holding in holdings)
-
-        if total_value == 0:
-            logger.warning(f"Total portfolio value is zero for user {user_id}")
-            return {}
-
-        # Group by asset class
-        allocation: Dict[str, Decimal] = defaultdict(Decimal)
-        for holding in holdings:
-            allocation[holding.asset_class.value] += holding.current_value
-
-        # Calculate percentages
-        result = {}
-        for asset_class, value in allocation.items():
-            percentage = (value / total_value * 100).quantize(Decimal('0.01'))
-            result[asset_class] = {
-                'value': value,
-                'percentage': percentage
-            }
-
-        logger.info(
-            f"Asset class allocation calculated for user {user_id}: "
-            f"{len(result)} classes, total_value={total_value}"
-        )
-
-        return result
+        analytics = await self.get_portfolio_analytics(user_id)
+        return analytics['asset_allocation']
 
     async def calculate_allocation_by_region(
         self,
@@ -175,41 +322,8 @@ class AssetAllocationService:
             - Returns empty dict if no holdings
             - Percentages rounded to 2 decimal places
         """
-        logger.info(f"Calculating region allocation for user {user_id}")
-
-        holdings = await self._get_active_holdings(user_id)
-
-        if not holdings:
-            logger.info(f"No active holdings found for user {user_id}")
-            return {}
-
-        # Calculate total portfolio value
-        total_value = sum(holding.current_value for holding in holdings)
-
-        if total_value == 0:
-            logger.warning(f"Total portfolio value is zero for user {user_id}")
-            return {}
-
-        # Group by region
-        allocation: Dict[str, Decimal] = defaultdict(Decimal)
-        for holding in holdings:
-            allocation[holding.region.value] += holding.current_value
-
-        # Calculate percentages
-        result = {}
-        for region, value in allocation.items():
-            percentage = (value / total_value * 100).quantize(Decimal('0.01'))
-            result[region] = {
-                'value': value,
-                'percentage': percentage
-            }
-
-        logger.info(
-            f"Region allocation calculated for user {user_id}: "
-            f"{len(result)} regions, total_value={total_value}"
-        )
-
-        return result
+        analytics = await self.get_portfolio_analytics(user_id)
+        return analytics['region_allocation']
 
     async def calculate_allocation_by_sector(
         self,
@@ -239,42 +353,8 @@ class AssetAllocationService:
             - Percentages rounded to 2 decimal places
             - Holdings with null sector are grouped under 'UNCLASSIFIED'
         """
-        logger.info(f"Calculating sector allocation for user {user_id}")
-
-        holdings = await self._get_active_holdings(user_id)
-
-        if not holdings:
-            logger.info(f"No active holdings found for user {user_id}")
-            return {}
-
-        # Calculate total portfolio value
-        total_value = sum(holding.current_value for holding in holdings)
-
-        if total_value == 0:
-            logger.warning(f"Total portfolio value is zero for user {user_id}")
-            return {}
-
-        # Group by sector
-        allocation: Dict[str, Decimal] = defaultdict(Decimal)
-        for holding in holdings:
-            sector = holding.sector if holding.sector else 'UNCLASSIFIED'
-            allocation[sector] += holding.current_value
-
-        # Calculate percentages
-        result = {}
-        for sector, value in allocation.items():
-            percentage = (value / total_value * 100).quantize(Decimal('0.01'))
-            result[sector] = {
-                'value': value,
-                'percentage': percentage
-            }
-
-        logger.info(
-            f"Sector allocation calculated for user {user_id}: "
-            f"{len(result)} sectors, total_value={total_value}"
-        )
-
-        return result
+        analytics = await self.get_portfolio_analytics(user_id)
+        return analytics['sector_allocation']
 
     async def get_portfolio_summary(
         self,
@@ -337,131 +417,95 @@ class AssetAllocationService:
             - All monetary values are Decimal
             - Percentages calculated to 2 decimal places
         """
-        logger.info(f"Generating portfolio summary for user {user_id}")
+        analytics = await self.get_portfolio_analytics(user_id)
+        return {
+            key: value for key, value in analytics.items()
+            if key not in ('region_allocation', 'sector_allocation')
+        }
 
-        holdings = await self._get_active_holdings(user_id)
+    async def _get_from_cache(self, user_id: UUID) -> Optional[Dict[str, Any]]:
+        """
+        Get cached portfolio analytics.
 
-        # Get unique account count
-        account_result = await self.db.execute(
-            select(InvestmentAccount)
-            .where(
-                and_(
-                    InvestmentAccount.user_id == user_id,
-                    InvestmentAccount.status == AccountStatus.ACTIVE,
-                    InvestmentAccount.deleted == False
-                )
-            )
-        )
-        accounts = account_result.scalars().all()
-        num_accounts = len(accounts)
-
-        if not holdings:
-            logger.info(f"No active holdings found for user {user_id}")
-            return {
-                'total_value': Decimal('0.00'),
-                'total_cost_basis': Decimal('0.00'),
-                'total_unrealized_gain': Decimal('0.00'),
-                'unrealized_gain_percentage': Decimal('0.00'),
-                'num_holdings': 0,
-                'num_accounts': num_accounts,
-                'currency_exposure': {},
-                'asset_allocation': {},
-                'top_holdings': []
-            }
+        Args:
+            user_id: User UUID
 
-        # Calculate aggregated metrics
-        total_value = Decimal('0.00')
-        total_cost_basis = Decimal('0.00')
-        total_unrealized_gain = Decimal('0.00')
+        Returns:
+            Cached analytics dict or None
+        """
+        cache_key = self.cache_key(user_id)
 
-        for holding in holdings:
-            current_value = holding.current_value
-            total_value += current_value
+        try:
+            cached_data = await redis_client.get(cache_key)
 
-            # Calculate cost basis
-            cost_basis = holding.purchase_price * holding.quantity
-            total_cost_basis += cost_basis
+            if cached_data:
+                logger.debug(f"Cache hit for {cache_key}")
+                return json.loads(cached_data, object_hook=_restore_decimals)
 
-            # Calculate unrealized gain
-            unrealized_gain = holding.unrealized_gain
-            total_unrealized_gain += unrealized_gain
+            logger.debug(f"Cache miss for {cache_key}")
+            return None
 
-        # Calculate unrealized gain percentage
-        if total_cost_basis > 0:
-            unrealized_gain_percentage = (
-                total_unrealized_gain / total_cost_basis * 100
-            ).quantize(Decimal('0.01'))
-        else:
-            unrealized_gain_percentage = Decimal('0.00')
+        except Exception as e:
+            logger.error(f"Redis cache read error: {e}")
+            return None
 
-        # Currency exposure
-        currency_exposure: Dict[str, Decimal] = defaultdict(Decimal)
-        for holding in holdings:
-            currency = holding.purchase_currency
-            currency_exposure[currency] += holding.current_value
+    async def _save_to_cache(self, user_id: UUID, data: Dict[str, Any]) -> None:
+        """
+        Save portfolio analytics to cache.
 
-        # Calculate currency percentages
-        currency_breakdown = {}
-        if total_value > 0:
-            for currency, value in currency_exposure.items():
-                percentage = (value / total_value * 100).quantize(Decimal('0.01'))
-                currency_breakdown[currency] = {
-                    'value': value,
-                    'percentage': percentage
-                }
-
-        # Get asset allocation (reuse existing method)
-        asset_allocation = await self.calculate_allocation_by_asset_class(user_id)
-
-        # Top 10 holdings
-        sorted_holdings = sorted(
-            holdings,
-            key=lambda h: h.current_value,
-            reverse=True
-        )[:10]
+        Args:
+            user_id: User UUID
+            data: Analytics data to cache
+        """
+        cache_key = self.cache_key(user_id)
 
-        top_holdings = []
-        for holding in sorted_holdings:
-            percentage_of_portfolio = Decimal('0.00')
-            if total_value > 0:
-                percentage_of_portfolio = (
-                    holding.current_value / total_value * 100
-                ).quantize(Decimal('0.01'))
+        try:
+            await redis_client.set(
+                cache_key,
+                json.dumps(data, default=str),
+                expire=self.CACHE_TTL
+            )
 
-            top_holdings.append({
-                'id': str(holding.id),
-                'security_name': holding.security_name,
-                'ticker': holding.ticker,
-                'quantity': holding.quantity,
-                'current_price': holding.current_price,
-                'current_value': holding.current_value,
-                'unrealized_gain': holding.unrealized_gain,
-                'unrealized_gain_percentage': holding.unrealized_gain_percentage,
-                'asset_class': holding.asset_class.value,
-                'region': holding.region.value,
-                'percentage_of_portfolio': percentage_of_portfolio
-            })
+            logger.debug(f"Cached data for {cache_key} (TTL: {self.CACHE_TTL}s)")
 
-        summary = {
-            'total_value': total_value,
-            'total_cost_basis': total_cost_basis,
-            'total_unrealized_gain': total_unrealized_gain,
-            'unrealized_gain_percentage': unrealized_gain_percentage,
-            'num_holdings': len(holdings),
-            'num_accounts': num_accounts,
-            'currency_exposure': currency_breakdown,
-            'asset_allocation': asset_allocation,
-            'top_holdings': top_holdings
-        }
+        except Exception as e:
+            logger.error(f"Redis cache write error: {e}")
+            # Don't raise - caching failure shouldn't break analytics
 
-        logger.info(
-            f"Portfolio summary generated for user {user_id}: "
-            f"total_value={total_value}, num_holdings={len(holdings)}, "
-            f"num_accounts={num_accounts}"
-        )
+    @classmethod
+    def cache_key(cls, user_id: UUID) -> str:
+        """
+        Get the portfolio analytics cache key for a user.
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            Redis key
+        """
+        return f"portfolio:analytics:{user_id}"
+
+    @classmethod
+    async def invalidate_cache(cls, user_ids: Iterable[UUID]) -> None:
+        """
+        Invalidate cached portfolio analytics for users.
+
+        Call this after committing holding, account or price changes.
+
+        Args:
+            user_ids: Users whose portfolios changed
+        """
+        keys = [cls.cache_key(user_id) for user_id in set(user_ids)]
+        if not keys:
+            return
 
-        return summary
+        try:
+            await redis_client.delete(*keys)
+            logger.info(f"Invalidated portfolio analytics cache for {len(keys)} users")
 
+        except Exception as e:
+            logger.error(f"Redis cache invalidation error: {e}")
+            # Don't raise - cache invalidation failure is non-critical
 
 # Factory function
 def get_asset_allocation_service(db: AsyncSession) -> AssetAllocationService:
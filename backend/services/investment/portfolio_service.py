@@ -4,9 +4,12 @@ Portfolio Management Service
 Provides comprehensive investment portfolio management including:
 - Investment account creation with encrypted account numbers
 - Holding management (add, update, sell)
-- Tax lot tracking for FIFO CGT calculations
+- Listed holdings linked to the shared security master for pricing
+- Tax lot tracking for FIFO CGT calculations (open-lot queue per holding)
+- Bulk disposals in a single transaction
 - Dividend income recording
 - Realized capital gains tracking
+- UK holdings re-matched (share identification rules) after back-dated trades
 
 Business Rules:
 - Account numbers are encrypted using Fernet symmetric encryption
@@ -19,6 +22,8 @@ Business Rules:
 Performance:
 - Target: <200ms for account/holding operations
 - Target: <500ms for sell operations (due to FIFO calculation)
+- Sales read only the open lots they consume (partial index on open lots)
+- Portfolio analytics caches are invalidated after each committed change
 - Async database operations throughout
 """
 
@@ -26,7 +31,7 @@ import logging
 import uuid
 from datetime import datetime, date
 from decimal import Decimal
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set
 from uuid import UUID
 
 from sqlalchemy import select, and_, or_
@@ -38,7 +43,10 @@ from models.investment import (
     SecurityType, AssetClass, Region, DisposalMethod, SourceCountry
 )
 from utils.encryption import encrypt_value
-from services.currency_conversion import CurrencyConversionService
+from services.currency_conversion import CurrencyConversionService, get_uk_tax_year
+from services.investment.asset_allocation_service import AssetAllocationService
+from services.investment.security_master_service import SecurityMasterService
+from services.investment.share_matching_service import ShareMatchingService
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +54,9 @@ logger = logging.getLogger(__name__)
 class PortfolioService:
     """Service for portfolio management operations."""
 
+    # Open tax lots fetched per round-trip when matching a disposal
+    OPEN_LOT_BATCH_SIZE = 25
+
     def __init__(self, db: AsyncSession):
         """
         Initialize portfolio service.
@@ -55,6 +66,13 @@ class PortfolioService:
         """
         self.db = db
         self.currency_service = CurrencyConversionService(db)
+        self.security_master = SecurityMasterService(db)
+        self.share_matching = ShareMatchingService(db)
+        # Users whose portfolio analytics cache is stale once the pending
+        # transaction commits
+        self._stale_portfolios: Set[UUID] = set()
+        # Earliest disposal date per UK holding in the pending transaction
+        self._uk_disposals: Dict[UUID, date] = {}
 
     async def create_account(
         self,
@@ -121,6 +139,7 @@ class PortfolioService:
         self.db.add(account)
         await self.db.commit()
         await self.db.refresh(account)
+        await AssetAllocationService.invalidate_cache([user_id])
 
         logger.info(
             f"Investment account created successfully: id={account.id}, "
@@ -142,7 +161,8 @@ class PortfolioService:
         asset_class: AssetClass,
         region: Region,
         sector: Optional[str] = None,
-        isin: Optional[str] = None
+        isin: Optional[str] = None,
+        exchange: Optional[str] = None
     ) -> InvestmentHolding:
         """
         Add a new holding to an investment account.
@@ -162,6 +182,7 @@ class PortfolioService:
             region: Geographic region
             sector: Sector (optional)
             isin: ISIN code (optional)
+            exchange: Listing exchange code (optional)
 
         Returns:
             Created InvestmentHolding
@@ -196,6 +217,15 @@ class PortfolioService:
             f"ticker={ticker}, quantity={quantity}, price={purchase_price}"
         )
 
+        # Link to the shared security master row for pricing
+        security = await self.security_master.get_or_create_security(
+            ticker,
+            exchange=exchange,
+            security_name=name,
+            isin=isin,
+            price_currency=purchase_currency
+        )
+
         # Create holding
         holding = InvestmentHolding(
             id=uuid.uuid4(),
@@ -204,6 +234,7 @@ class PortfolioService:
             ticker=ticker,
             isin=isin,
             security_name=name,
+            security=security,
             quantity=quantity,
             purchase_date=purchase_date,
             purchase_price=purchase_price,
@@ -272,6 +303,7 @@ class PortfolioService:
             cost_basis_gbp=cost_basis_gbp,
             cost_basis_zar=cost_basis_zar,
             exchange_rate=exchange_rate,
+            remaining_quantity=quantity,
             disposal_date=None,
             disposal_quantity=None,
             disposal_proceeds=None,
@@ -282,8 +314,12 @@ class PortfolioService:
         )
 
         self.db.add(tax_lot)
+        await self.db.flush()
+        if account.country == AccountCountry.UK:
+            await self.share_matching.rematch_if_back_dated(holding.id, purchase_date)
         await self.db.commit()
         await self.db.refresh(holding)
+        await AssetAllocationService.invalidate_cache([account.user_id])
 
         logger.info(
             f"Holding added successfully: id={holding.id}, ticker={ticker}, "
@@ -300,6 +336,10 @@ class PortfolioService:
         """
         Update the current price of a holding and recalculate gains.
 
+        The price is a manual override for this holding only: it is used
+        instead of the security master price, which only the market price
+        feed writes.
+
         Args:
             holding_id: Holding UUID
             new_current_price: New current price per share/unit
@@ -329,11 +369,13 @@ class PortfolioService:
 
         logger.info(
             f"Updating price for holding {holding_id}: "
-            f"old_price={holding.current_price}, new_price={new_current_price}"
+            f"old_price={holding.market_price}, new_price={new_current_price}"
         )
 
-        # Update price
+        # Manual prices apply to this holding only: the shared security
+        # price is written by the market price feed alone
         holding.current_price = new_current_price
+        holding.price_overridden = True
         holding.last_price_update = datetime.utcnow()
         holding.updated_at = datetime.utcnow()
 
@@ -342,6 +384,9 @@ class PortfolioService:
 
         await self.db.commit()
         await self.db.refresh(holding)
+        await AssetAllocationService.invalidate_cache(
+            [await self._get_owner_user_id(holding)]
+        )
 
         logger.info(
             f"Holding price updated: id={holding_id}, "
@@ -361,6 +406,10 @@ class PortfolioService:
         """
         Sell a holding (partial or full) using FIFO method for CGT.
 
+        Only the open tax lots consumed by the sale are loaded (see
+        _consume_open_lots), so sale cost does not grow with the number of
+        historical, fully disposed lots.
+
         Args:
             holding_id: Holding UUID
             quantity_to_sell: Quantity to sell
@@ -378,6 +427,98 @@ class PortfolioService:
             - tax_year: str
             - remaining_quantity: Decimal
 
+        Raises:
+            ValueError: If holding not found, quantity exceeds available,
+                       or sale parameters are invalid
+        """
+        try:
+            sale_details = await self._dispose_holding(
+                holding_id, quantity_to_sell, sale_price, sale_date
+            )
+            await self._rematch_back_dated_disposals([sale_details])
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            self._stale_portfolios.clear()
+            self._uk_disposals.clear()
+            raise
+        await self._invalidate_stale_portfolios()
+
+        return sale_details
+
+    async def sell_holdings_bulk(
+        self,
+        disposals: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Apply several disposals atomically in a single transaction.
+
+        Disposals are applied in the order given, so multiple sales of the
+        same holding consume its FIFO queue sequentially. If any disposal
+        fails validation, the whole batch is rolled back.
+
+        Args:
+            disposals: List of dicts with keys holding_id, quantity_to_sell,
+                       sale_price and sale_date
+
+        Returns:
+            List of sale detail dicts (same shape as sell_holding), in input order
+
+        Raises:
+            ValueError: If the batch is empty or any disposal is invalid
+        """
+        if not disposals:
+            raise ValueError("At least one disposal is required")
+
+        logger.info(f"Processing bulk disposal of {len(disposals)} sales")
+
+        results = []
+        try:
+            for disposal in disposals:
+                results.append(
+                    await self._dispose_holding(
+                        holding_id=disposal["holding_id"],
+                        quantity_to_sell=disposal["quantity_to_sell"],
+                        sale_price=disposal["sale_price"],
+                        sale_date=disposal["sale_date"]
+                    )
+                )
+            await self._rematch_back_dated_disposals(results)
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            self._stale_portfolios.clear()
+            self._uk_disposals.clear()
+            raise
+
+        await self._invalidate_stale_portfolios()
+
+        logger.info(
+            f"Bulk disposal committed: {len(results)} sales, "
+            f"total_realized_gain={sum(r['realized_gain'] for r in results)}"
+        )
+
+        return results
+
+    async def _dispose_holding(
+        self,
+        holding_id: UUID,
+        quantity_to_sell: Decimal,
+        sale_price: Decimal,
+        sale_date: date
+    ) -> Dict[str, Any]:
+        """
+        Record a disposal against a holding without committing.
+
+        Args:
+            holding_id: Holding UUID
+            quantity_to_sell: Quantity to sell
+            sale_price: Sale price per share/unit
+            sale_date: Date of sale
+
+        Returns:
+            Dict with sale details (see sell_holding)
+
         Raises:
             ValueError: If holding not found, quantity exceeds available,
                        or sale parameters are invalid
@@ -389,20 +530,27 @@ class PortfolioService:
         if sale_price < 0:
             raise ValueError("Sale price cannot be negative")
 
-        # Get holding
+        # Get holding with its account (for country and owner) in one round-trip
         result = await self.db.execute(
-            select(InvestmentHolding).where(
+            select(InvestmentHolding, InvestmentAccount.country, InvestmentAccount.user_id)
+            .join(InvestmentAccount, InvestmentHolding.account_id == InvestmentAccount.id)
+            .where(
                 and_(
                     InvestmentHolding.id == holding_id,
                     InvestmentHolding.deleted == False
                 )
             )
         )
-        holding = result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        if not holding:
+        if not row:
             raise ValueError(f"Holding not found: {holding_id}")
 
+        holding, country, user_id = row
+        self._stale_portfolios.add(user_id)
+        if country == AccountCountry.UK:
+            self._uk_disposals[holding_id] = min(sale_date, self._uk_disposals.get(holding_id, sale_date))
+
         # Check quantity available
         if quantity_to_sell > holding.quantity:
             raise ValueError(
@@ -415,81 +563,15 @@ class PortfolioService:
             f"price={sale_price}, date={sale_date}"
         )
 
-        # Get account for country
-        account_result = await self.db.execute(
-            select(InvestmentAccount).where(
-                InvestmentAccount.id == holding.account_id
-            )
-        )
-        account = account_result.scalar_one()
-
-        # Get tax lots using FIFO (oldest first, not yet disposed or partially disposed)
-        # A tax lot is available if disposal_date is None (not sold at all)
-        tax_lots_result = await self.db.execute(
-            select(TaxLot)
-            .where(
-                and_(
-                    TaxLot.holding_id == holding_id,
-                    TaxLot.disposal_date.is_(None)  # Only lots that haven't been sold
-                )
-            )
-            .order_by(TaxLot.purchase_date.asc())
-        )
-        tax_lots = tax_lots_result.scalars().all()
-
-        if not tax_lots:
-            raise ValueError(f"No tax lots found for holding {holding_id}")
-
-        # Calculate total cost basis and process FIFO sales
-        total_cost_basis = Decimal('0.00')
+        tax_year = get_uk_tax_year(sale_date)
         total_proceeds = sale_price * quantity_to_sell
-        remaining_to_sell = quantity_to_sell
-
-        for tax_lot in tax_lots:
-            if remaining_to_sell <= 0:
-                break
-
-            # Determine quantity from this lot
-            lot_quantity_to_sell = min(remaining_to_sell, tax_lot.quantity)
-
-            # Calculate cost basis from this lot (proportional)
-            lot_cost_basis = (tax_lot.cost_basis_gbp / tax_lot.quantity) * lot_quantity_to_sell
-            total_cost_basis += lot_cost_basis
-
-            # Calculate tax year (UK: April 6 - April 5)
-            if sale_date.month >= 4 and sale_date.day >= 6:
-                tax_year = f"{sale_date.year}/{str(sale_date.year + 1)[-2:]}"
-            else:
-                tax_year = f"{sale_date.year - 1}/{str(sale_date.year)[-2:]}"
-
-            # Update tax lot for disposal
-            tax_lot.disposal_date = sale_date
-            tax_lot.disposal_quantity = lot_quantity_to_sell
-            tax_lot.disposal_proceeds = sale_price * lot_quantity_to_sell
-            tax_lot.realized_gain = (sale_price * lot_quantity_to_sell) - lot_cost_basis
-            tax_lot.disposal_method = DisposalMethod.FIFO
-            tax_lot.cgt_tax_year = tax_year
-
-            # Note: We keep the original quantity in tax_lot.quantity for record keeping
-            # The disposal_date and disposal_quantity indicate it's been sold
-
-            # Update remaining quantity to sell
-            remaining_to_sell -= lot_quantity_to_sell
-
-            logger.debug(
-                f"Sold {lot_quantity_to_sell} from tax lot {tax_lot.id}, "
-                f"cost_basis={lot_cost_basis}, gain={tax_lot.realized_gain}"
-            )
+        total_cost_basis = await self._consume_open_lots(
+            holding_id, quantity_to_sell, sale_price, sale_date, tax_year
+        )
 
         # Calculate realized gain
         realized_gain = total_proceeds - total_cost_basis
 
-        # Determine tax year for capital gain record
-        if sale_date.month >= 4 and sale_date.day >= 6:
-            cg_tax_year = f"{sale_date.year}/{str(sale_date.year + 1)[-2:]}"
-        else:
-            cg_tax_year = f"{sale_date.year - 1}/{str(sale_date.year)[-2:]}"
-
         # Create capital gain record
         capital_gain = CapitalGainRealized(
             id=uuid.uuid4(),
@@ -500,8 +582,8 @@ class PortfolioService:
             sale_value=total_proceeds,
             cost_basis=total_cost_basis,
             gain_loss=realized_gain,
-            tax_year=cg_tax_year,
-            country=account.country,
+            tax_year=tax_year,
+            country=country,
             created_at=datetime.utcnow()
         )
 
@@ -518,30 +600,164 @@ class PortfolioService:
         holding.quantity = new_quantity if new_quantity > 0 else Decimal('0.0001')  # Min quantity to satisfy constraint
         holding.updated_at = datetime.utcnow()
 
-        # If fully sold, optionally mark as deleted or keep for historical tracking
-        # For now, we keep it with quantity = 0
+        # Flush so later disposals in the same transaction see the updated
+        # holding quantity and lot cursors
+        await self.db.flush()
 
-        await self.db.commit()
+        logger.info(
+            f"Holding sold: id={holding_id}, "
+            f"quantity_sold={quantity_to_sell}, realized_gain={realized_gain}, "
+            f"remaining={new_quantity}"
+        )
 
-        sale_details = {
+        return {
             "holding_id": str(holding_id),
             "quantity_sold": float(quantity_to_sell),
             "sale_price": float(sale_price),
             "sale_value": float(total_proceeds),
             "cost_basis": float(total_cost_basis),
             "realized_gain": float(realized_gain),
-            "tax_year": cg_tax_year,
+            "tax_year": tax_year,
             "remaining_quantity": float(new_quantity),
             "capital_gain_id": str(capital_gain.id)
         }
 
-        logger.info(
-            f"Holding sold successfully: id={holding_id}, "
-            f"quantity_sold={quantity_to_sell}, realized_gain={realized_gain}, "
-            f"remaining={new_quantity}"
+    async def _rematch_back_dated_disposals(self, sales: List[Dict[str, Any]]) -> None:
+        """
+        Re-match UK holdings whose disposals in this transaction are back-dated.
+
+        A sale dated on or before a holding's stored share matches changes
+        them, so the holding is re-matched from that date (see
+        ShareMatchingService.rematch_if_back_dated) and the affected sale
+        details report the re-matched cost basis instead of FIFO.
+
+        Args:
+            sales: Sale detail dicts from _dispose_holding, updated in place
+        """
+        uk_disposals, self._uk_disposals = self._uk_disposals, {}
+        rematched = set()
+        for holding_id, trade_date in uk_disposals.items():
+            if await self.share_matching.rematch_if_back_dated(holding_id, trade_date):
+                rematched.add(str(holding_id))
+
+        sales = [sale for sale in sales if sale["holding_id"] in rematched]
+        if not sales:
+            return
+
+        result = await self.db.execute(
+            select(CapitalGainRealized.id, CapitalGainRealized.cost_basis, CapitalGainRealized.gain_loss)
+            .where(CapitalGainRealized.id.in_([UUID(sale["capital_gain_id"]) for sale in sales]))
         )
+        gains = {str(gain_id): (cost_basis, gain_loss) for gain_id, cost_basis, gain_loss in result.all()}
+        for sale in sales:
+            cost_basis, gain_loss = gains[sale["capital_gain_id"]]
+            sale["cost_basis"] = float(cost_basis)
+            sale["realized_gain"] = float(gain_loss)
 
-        return sale_details
+    async def _consume_open_lots(
+        self,
+        holding_id: UUID,
+        quantity_to_sell: Decimal,
+        sale_price: Decimal,
+        sale_date: date,
+        tax_year: str
+    ) -> Decimal:
+        """
+        Consume open tax lots oldest-first and return the GBP cost basis used.
+
+        Lots are read from the open-lot index (remaining_quantity > 0) in small
+        batches, so a sale touches only the lots it actually consumes. Each lot's
+        remaining_quantity cursor is decremented; partially consumed lots stay
+        open for the next sale. Disposal fields accumulate across partial sales.
+
+        Args:
+            holding_id: Holding UUID
+            quantity_to_sell: Quantity to match against open lots
+            sale_price: Sale price per share/unit
+            sale_date: Date of sale
+            tax_year: UK tax year of the sale
+
+        Returns:
+            Decimal: Total cost basis (GBP) of the quantity sold
+
+        Raises:
+            ValueError: If open lots cannot cover the quantity sold
+        """
+        total_cost_basis = Decimal('0.00')
+        remaining_to_sell = quantity_to_sell
+
+        while remaining_to_sell > 0:
+            tax_lots_result = await self.db.execute(
+                select(TaxLot)
+                .where(
+                    and_(
+                        TaxLot.holding_id == holding_id,
+                        TaxLot.remaining_quantity > 0
+                    )
+                )
+                .order_by(
+                    TaxLot.purchase_date.asc(),
+                    TaxLot.created_at.asc(),
+                    TaxLot.id.asc()
+                )
+                .limit(self.OPEN_LOT_BATCH_SIZE)
+                .with_for_update()
+            )
+            tax_lots = tax_lots_result.scalars().all()
+
+            if not tax_lots:
+                raise ValueError(
+                    f"Insufficient open tax lots for holding {holding_id}: "
+                    f"{remaining_to_sell} shares unmatched"
+                )
+
+            for tax_lot in tax_lots:
+                if remaining_to_sell <= 0:
+                    break
+
+                # Determine quantity from this lot
+                lot_quantity_to_sell = min(remaining_to_sell, tax_lot.remaining_quantity)
+
+                # Calculate cost basis from this lot (proportional to original lot size)
+                lot_cost_basis = (tax_lot.cost_basis_gbp / tax_lot.quantity) * lot_quantity_to_sell
+                total_cost_basis += lot_cost_basis
+
+                lot_proceeds = sale_price * lot_quantity_to_sell
+
+                # Advance the open-lot cursor and accumulate disposal details
+                tax_lot.remaining_quantity = tax_lot.remaining_quantity - lot_quantity_to_sell
+                tax_lot.disposal_date = sale_date
+                tax_lot.disposal_quantity = (tax_lot.disposal_quantity or Decimal('0')) + lot_quantity_to_sell
+                tax_lot.disposal_proceeds = (tax_lot.disposal_proceeds or Decimal('0')) + lot_proceeds
+                tax_lot.realized_gain = (
+                    (tax_lot.realized_gain or Decimal('0')) + lot_proceeds - lot_cost_basis
+                )
+                tax_lot.disposal_method = DisposalMethod.FIFO
+                tax_lot.cgt_tax_year = tax_year
+
+                remaining_to_sell -= lot_quantity_to_sell
+
+                logger.debug(
+                    f"Sold {lot_quantity_to_sell} from tax lot {tax_lot.id}, "
+                    f"cost_basis={lot_cost_basis}, lot_remaining={tax_lot.remaining_quantity}"
+                )
+
+            # Flush cursors so the next batch (if any) skips exhausted lots
+            await self.db.flush()
+
+        return total_cost_basis
+
+    async def _get_owner_user_id(self, holding: InvestmentHolding) -> UUID:
+        """Get the user owning a holding's account."""
+        result = await self.db.execute(
+            select(InvestmentAccount.user_id).where(InvestmentAccount.id == holding.account_id)
+        )
+        return result.scalar_one()
+
+    async def _invalidate_stale_portfolios(self) -> None:
+        """Invalidate analytics caches for users touched by the committed transaction."""
+        stale, self._stale_portfolios = self._stale_portfolios, set()
+        await AssetAllocationService.invalidate_cache(stale)
 
     async def record_dividend(
         self,
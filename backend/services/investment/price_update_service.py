@@ -0,0 +1,276 @@
+"""
+Bulk Price Update Service
+
+Reprices investment holdings from a price feed (e.g. market close):
+- Parses CSV price files ("ticker,price[,exchange]" per line, optional header)
+- Updates the shared security master (one row per security) with set-based
+  UPDATE statements in chunks
+- Invalidates cached data only for users who hold a repriced security
+- Marks those users' investments as changed for rule evaluation
+  (the bulk UPDATE bypasses the ORM flush that normally records it)
+
+Business Rules:
+- Prices must be non-negative
+- Tickers and exchanges are matched upper-case; no exchange means the
+  unspecified listing ('')
+- Feed entries for securities not in the security master are ignored
+- Soft-deleted holdings do not count towards affected users
+- If a security appears more than once in a feed, the last price wins
+- Holdings are valued from their security's price at read time
+  (InvestmentHolding.market_price), so no holding rows are written
+
+Performance:
+- One UPDATE per chunk of securities, not one write per holding
+- PostgreSQL: UPDATE ... FROM (VALUES ...) joined on ticker and exchange
+- Other dialects (SQLite in tests): UPDATE ... SET current_price = CASE ...
+- Each chunk commits separately to keep transactions short
+"""
+
+import logging
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, update, and_, case, tuple_, values, column, String, Numeric
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.investment import InvestmentAccount, InvestmentHolding, Security
+from models.rule_evaluation import RuleInput, upsert_input_changes
+from redis_client import redis_client
+from services.dashboard_aggregation import DashboardAggregationService
+from services.investment.asset_allocation_service import AssetAllocationService
+from services.investment.security_master_service import normalize_listing
+
+logger = logging.getLogger(__name__)
+
+
+def parse_price_csv(lines: Iterable[str]) -> Iterator[Tuple[str, str, Decimal]]:
+    """
+    Parse a ticker,price[,exchange] feed line by line.
+
+    Blank lines and a leading "ticker,..." header are skipped.
+
+    Args:
+        lines: Iterable of CSV lines (file object, list, or generator)
+
+    Yields:
+        Tuple of (ticker, exchange, price), normalized to the security master key
+
+    Raises:
+        ValueError: If a line is malformed or a price is negative
+    """
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+
+        parts = [part.strip() for part in line.split(",")]
+        if line_number == 1 and parts[0].lower() == "ticker":
+            continue
+
+        if len(parts) not in (2, 3) or not parts[0]:
+            raise ValueError(f"Line {line_number}: expected 'ticker,price[,exchange]'")
+
+        try:
+            price = Decimal(parts[1])
+        except InvalidOperation:
+            raise ValueError(f"Line {line_number}: invalid price '{parts[1]}'")
+
+        if price < 0:
+            raise ValueError(f"Line {line_number}: price cannot be negative")
+
+        ticker, exchange = normalize_listing(parts[0], parts[2] if len(parts) == 3 else None)
+        yield ticker, exchange, price
+
+
+class PriceUpdateService:
+    """Service for bulk repricing of the security master."""
+
+    # Securities per UPDATE statement
+    CHUNK_SIZE = 1000
+
+    # Redis keys per DELETE when invalidating caches
+    INVALIDATION_BATCH_SIZE = 500
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize price update service.
+
+        Args:
+            db: Database session for operations
+        """
+        self.db = db
+
+    async def bulk_update_prices(
+        self,
+        prices: Iterable[Tuple[str, str, Decimal]],
+        chunk_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Reprice all securities in a price feed.
+
+        Args:
+            prices: Iterable of (ticker, exchange, price), e.g. from parse_price_csv
+            chunk_size: Securities per UPDATE (default CHUNK_SIZE)
+
+        Returns:
+            Dict with:
+            - securities_received: Distinct securities in the feed
+            - securities_updated: Security master rows repriced
+            - users_affected: Users whose caches were invalidated
+            - chunks: Number of UPDATE statements issued
+
+        Raises:
+            ValueError: If a price is negative
+        """
+        chunk_size = chunk_size or self.CHUNK_SIZE
+        affected_users: Set[UUID] = set()
+        securities_received = 0
+        securities_updated = 0
+        chunks = 0
+
+        chunk: Dict[Tuple[str, str], Decimal] = {}
+        for ticker, exchange, price in prices:
+            if price < 0:
+                raise ValueError(f"Price for {ticker} cannot be negative")
+
+            listing = normalize_listing(ticker, exchange)
+            if listing not in chunk:
+                securities_received += 1
+            chunk[listing] = price
+
+            if len(chunk) >= chunk_size:
+                securities_updated += await self._apply_chunk(chunk, affected_users)
+                chunks += 1
+                chunk = {}
+
+        if chunk:
+            securities_updated += await self._apply_chunk(chunk, affected_users)
+            chunks += 1
+
+        await self._invalidate_user_caches(affected_users)
+
+        logger.info(
+            f"Bulk price update complete: securities={securities_received}, "
+            f"securities_updated={securities_updated}, users_affected={len(affected_users)}, "
+            f"chunks={chunks}"
+        )
+
+        return {
+            "securities_received": securities_received,
+            "securities_updated": securities_updated,
+            "users_affected": len(affected_users),
+            "chunks": chunks,
+        }
+
+    async def _apply_chunk(
+        self,
+        chunk: Dict[Tuple[str, str], Decimal],
+        affected_users: Set[UUID]
+    ) -> int:
+        """
+        Reprice one chunk of securities and commit.
+
+        Args:
+            chunk: (ticker, exchange) -> price mapping
+            affected_users: Set updated in place with holders of repriced securities
+
+        Returns:
+            int: Number of securities updated
+        """
+        listings = list(chunk)
+        in_chunk = tuple_(Security.ticker, Security.exchange).in_(listings)
+
+        users_result = await self.db.execute(
+            select(InvestmentAccount.user_id)
+            .join(InvestmentHolding, InvestmentHolding.account_id == InvestmentAccount.id)
+            .join(Security, Security.id == InvestmentHolding.security_id)
+            .where(and_(in_chunk, InvestmentHolding.deleted == False))
+            .distinct()
+        )
+        chunk_users = users_result.scalars().all()
+        affected_users.update(chunk_users)
+
+        now = datetime.utcnow()
+
+        if self.db.get_bind().dialect.name == "postgresql":
+            price_feed = values(
+                column("ticker", String(20)),
+                column("exchange", String(20)),
+                column("price", Numeric(15, 4)),
+                name="price_feed"
+            ).data([(ticker, exchange, price) for (ticker, exchange), price in chunk.items()])
+
+            stmt = (
+                update(Security)
+                .where(
+                    and_(
+                        Security.ticker == price_feed.c.ticker,
+                        Security.exchange == price_feed.c.exchange
+                    )
+                )
+                .values(
+                    current_price=price_feed.c.price,
+                    last_price_update=now,
+                    updated_at=now
+                )
+            )
+        else:
+            stmt = (
+                update(Security)
+                .where(in_chunk)
+                .values(
+                    current_price=case(
+                        *[
+                            (and_(Security.ticker == ticker, Security.exchange == exchange), price)
+                            for (ticker, exchange), price in chunk.items()
+                        ]
+                    ),
+                    last_price_update=now,
+                    updated_at=now
+                )
+            )
+
+        result = await self.db.execute(stmt.execution_options(synchronize_session=False))
+        connection = await self.db.connection()
+        await connection.run_sync(upsert_input_changes, chunk_users, RuleInput.INVESTMENTS)
+        await self.db.commit()
+
+        logger.debug(f"Repriced {result.rowcount} securities for {len(listings)} feed entries")
+
+        return result.rowcount
+
+    async def _invalidate_user_caches(self, user_ids: Set[UUID]) -> None:
+        """
+        Invalidate cached dashboard and portfolio analytics for the given users only.
+
+        Keys are deleted in batches to avoid one Redis round-trip per key.
+
+        Args:
+            user_ids: Users holding a repriced security
+        """
+        keys: List[str] = []
+        for user_id in user_ids:
+            keys.extend(DashboardAggregationService.cache_keys(user_id))
+            keys.append(AssetAllocationService.cache_key(user_id))
+
+        try:
+            for i in range(0, len(keys), self.INVALIDATION_BATCH_SIZE):
+                await redis_client.delete(*keys[i:i + self.INVALIDATION_BATCH_SIZE])
+        except Exception as e:
+            logger.error(f"Redis cache invalidation error: {e}")
+            # Don't raise - cache invalidation failure is non-critical
+
+
+def get_price_update_service(db: AsyncSession) -> PriceUpdateService:
+    """
+    Get price update service instance.
+
+    Args:
+        db: Database session
+
+    Returns:
+        PriceUpdateService instance
+    """
+    return PriceUpdateService(db)
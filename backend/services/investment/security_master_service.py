@@ -0,0 +1,146 @@
+"""
+Security Master Service
+
+Maintains the shared securities table that holdings are priced from:
+- Get-or-create a security by (ticker, exchange) when a holding is added
+- Prices are written by the market price feed (PriceUpdateService), once
+  per security for every holding that references it
+
+Business Rules:
+- Tickers are stored upper-case; an empty exchange means an unspecified listing
+- A security's price overrides the current_price of every linked holding,
+  except holdings whose price the user entered manually
+  (see InvestmentHolding.market_price)
+- Security prices come from the market price feed only; manual edits
+  never write the shared row
+
+Performance:
+- Concurrent get-or-create is safe: the insert runs in a savepoint and a
+  unique violation falls back to reading the row the other writer created
+"""
+
+import logging
+from typing import Optional
+
+from sqlalchemy import select, and_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.investment import Security
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_listing(ticker: str, exchange: Optional[str] = None) -> tuple:
+    """
+    Normalize a ticker/exchange pair to the security master key.
+
+    Args:
+        ticker: Ticker symbol
+        exchange: Exchange code (optional)
+
+    Returns:
+        Tuple of (ticker, exchange), upper-cased, exchange '' if not given
+    """
+    return ticker.strip().upper(), (exchange or '').strip().upper()
+
+
+class SecurityMasterService:
+    """Service for security master lookups and price updates."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize security master service.
+
+        Args:
+            db: Database session for operations
+        """
+        self.db = db
+
+    async def get_security(
+        self,
+        ticker: str,
+        exchange: Optional[str] = None
+    ) -> Optional[Security]:
+        """
+        Look up a security by ticker and exchange.
+
+        Args:
+            ticker: Ticker symbol
+            exchange: Exchange code (optional)
+
+        Returns:
+            Security or None if not found
+        """
+        ticker, exchange = normalize_listing(ticker, exchange)
+        result = await self.db.execute(
+            select(Security).where(
+                and_(
+                    Security.ticker == ticker,
+                    Security.exchange == exchange
+                )
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def get_or_create_security(
+        self,
+        ticker: str,
+        exchange: Optional[str] = None,
+        security_name: Optional[str] = None,
+        isin: Optional[str] = None,
+        price_currency: Optional[str] = None
+    ) -> Security:
+        """
+        Get a security by ticker and exchange, creating it if missing.
+
+        New securities start unpriced, so linked holdings keep using their own
+        current_price until the first price update. Does not commit.
+
+        Args:
+            ticker: Ticker symbol
+            exchange: Exchange code (optional)
+            security_name: Security name (used when creating)
+            isin: ISIN code (used when creating)
+            price_currency: Quote currency (used when creating)
+
+        Returns:
+            Security
+        """
+        security = await self.get_security(ticker, exchange)
+        if security:
+            return security
+
+        ticker, exchange = normalize_listing(ticker, exchange)
+        security = Security(
+            ticker=ticker,
+            exchange=exchange,
+            security_name=security_name,
+            isin=isin,
+            price_currency=price_currency
+        )
+
+        try:
+            async with self.db.begin_nested():
+                self.db.add(security)
+        except IntegrityError:
+            # Created concurrently by another request
+            logger.debug(f"Security {ticker}/{exchange} created concurrently")
+            return await self.get_security(ticker, exchange)
+
+        logger.info(f"Created security master entry: ticker={ticker}, exchange={exchange}")
+
+        return security
+
+
+def get_security_master_service(db: AsyncSession) -> SecurityMasterService:
+    """
+    Get security master service instance.
+
+    Args:
+        db: Database session
+
+    Returns:
+        SecurityMasterService instance
+    """
+    return SecurityMasterService(db)
@@ -0,0 +1,558 @@
+"""
+UK Share Matching Service
+
+Applies the UK CGT share identification rules to a holding's transaction log:
+1. Same-day rule: disposals match acquisitions made on the same day
+2. Bed-and-breakfast rule: then acquisitions in the 30 days after the disposal
+3. Section 104 pool: any remainder comes from the pooled average cost
+
+Business Rules:
+- All acquisitions (and all disposals) on one day are treated as a single
+  transaction, as required by TCGA 1992 s105
+- 30-day matches are taken earliest acquisition first
+- Acquisitions not matched under rules 1-2 join the Section 104 pool on their date
+- Applies to UK accounts only; SA holdings keep FIFO (PortfolioService)
+
+Performance:
+- The Section 104 pool is a running total: O(1) per transaction
+- The 30-day look-forward uses a single forward pointer over the
+  date-sorted acquisitions, so each acquisition day is visited a bounded
+  number of times
+- Pool snapshots and stored matches let a back-dated trade be re-matched
+  from 30 days before the trade date, instead of replaying the full log
+"""
+
+import logging
+import uuid
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Optional, List, Dict, Any, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, and_, delete, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.investment import (
+    InvestmentAccount, InvestmentHolding, TaxLot, CapitalGainRealized,
+    ShareMatch, Section104PoolSnapshot, MatchingRule, AccountCountry
+)
+
+logger = logging.getLogger(__name__)
+
+# Look-forward window for the bed-and-breakfast rule (TCGA 1992 s106A)
+BED_AND_BREAKFAST_DAYS = 30
+
+
+class Section104Pool:
+    """Running Section 104 holding: pooled quantity and allowable cost."""
+
+    __slots__ = ('quantity', 'cost')
+
+    def __init__(self, quantity: Decimal = Decimal('0'), cost: Decimal = Decimal('0')):
+        self.quantity = quantity
+        self.cost = cost
+
+    def add(self, quantity: Decimal, cost: Decimal) -> None:
+        """Add an acquisition to the pool."""
+        self.quantity += quantity
+        self.cost += cost
+
+    def remove(self, quantity: Decimal) -> Decimal:
+        """
+        Remove shares from the pool at average cost.
+
+        Args:
+            quantity: Number of shares disposed from the pool
+
+        Returns:
+            Decimal: Allowable cost of the shares removed
+
+        Raises:
+            ValueError: If the pool holds fewer shares than requested
+        """
+        if quantity > self.quantity:
+            raise ValueError(
+                f"Cannot dispose of {quantity} shares from Section 104 pool "
+                f"holding {self.quantity}"
+            )
+
+        if quantity == self.quantity:
+            cost = self.cost
+            self.quantity = Decimal('0')
+            self.cost = Decimal('0')
+            return cost
+
+        cost = self.cost * quantity / self.quantity
+        self.quantity -= quantity
+        self.cost -= cost
+        return cost
+
+
+def match_disposals(
+    acquisitions: Dict[date, Tuple[Decimal, Decimal]],
+    disposals: List[Dict[str, Any]],
+    opening_pool: Optional[Section104Pool] = None
+) -> Dict[str, Any]:
+    """
+    Match disposals against acquisitions using the UK share identification rules.
+
+    Args:
+        acquisitions: Unmatched acquisitions per day as {date: (quantity, cost)}
+        disposals: Disposals as dicts with id, disposal_date and quantity
+        opening_pool: Section 104 pool before the first transaction given
+
+    Returns:
+        Dict with:
+        - matches: {disposal id: [match dicts with rule, acquisition_date, quantity, cost]}
+        - snapshots: [(date, pool quantity, pool cost)] after each transaction day
+        - pool: closing Section104Pool
+
+    Raises:
+        ValueError: If a disposal exceeds the shares available to match
+    """
+    pool = opening_pool or Section104Pool()
+
+    # Remaining unmatched quantity/cost per acquisition day
+    acq_remaining = {d: [q, c] for d, (q, c) in acquisitions.items() if q > 0}
+    acq_days = sorted(acq_remaining)
+
+    # Same-day disposals form a single disposal
+    disposal_days: Dict[date, List[Dict[str, Any]]] = defaultdict(list)
+    for disposal in disposals:
+        disposal_days[disposal["disposal_date"]].append(disposal)
+    disp_days = sorted(disposal_days)
+    disp_remaining = {d: sum(row["quantity"] for row in disposal_days[d]) for d in disp_days}
+    day_matches: Dict[date, List[Dict[str, Any]]] = {d: [] for d in disp_days}
+
+    def take(acq_day: date, quantity: Decimal) -> Decimal:
+        remaining = acq_remaining[acq_day]
+        if quantity == remaining[0]:
+            cost = remaining[1]
+        else:
+            cost = remaining[1] * quantity / remaining[0]
+        remaining[0] -= quantity
+        remaining[1] -= cost
+        return cost
+
+    # Rule 1: same day
+    for d in disp_days:
+        if d in acq_remaining and acq_remaining[d][0] > 0:
+            quantity = min(disp_remaining[d], acq_remaining[d][0])
+            cost = take(d, quantity)
+            disp_remaining[d] -= quantity
+            day_matches[d].append({
+                "rule": MatchingRule.SAME_DAY,
+                "acquisition_date": d,
+                "quantity": quantity,
+                "cost": cost,
+            })
+
+    # Rule 2: acquisitions in the following 30 days, earliest first.
+    # Disposals are processed in date order, so `start` only moves forward and
+    # skips acquisition days that are past or fully matched.
+    start = 0
+    for d in disp_days:
+        if disp_remaining[d] <= 0:
+            continue
+
+        window_end = d + timedelta(days=BED_AND_BREAKFAST_DAYS)
+        while start < len(acq_days) and (
+            acq_days[start] <= d or acq_remaining[acq_days[start]][0] <= 0
+        ):
+            start += 1
+
+        k = start
+        while disp_remaining[d] > 0 and k < len(acq_days) and acq_days[k] <= window_end:
+            acq_day = acq_days[k]
+            available = acq_remaining[acq_day][0]
+            if available > 0:
+                quantity = min(disp_remaining[d], available)
+                cost = take(acq_day, quantity)
+                disp_remaining[d] -= quantity
+                day_matches[d].append({
+                    "rule": MatchingRule.BED_AND_BREAKFAST,
+                    "acquisition_date": acq_day,
+                    "quantity": quantity,
+                    "cost": cost,
+                })
+            k += 1
+
+    # Rule 3: Section 104 pool, walked once in date order
+    snapshots = []
+    for d in sorted(set(acq_days) | set(disp_days)):
+        if d in acq_remaining and acq_remaining[d][0] > 0:
+            pool.add(acq_remaining[d][0], acq_remaining[d][1])
+
+        if d in disp_remaining and disp_remaining[d] > 0:
+            quantity = disp_remaining[d]
+            cost = pool.remove(quantity)
+            disp_remaining[d] = Decimal('0')
+            day_matches[d].append({
+                "rule": MatchingRule.SECTION_104,
+                "acquisition_date": None,
+                "quantity": quantity,
+                "cost": cost,
+            })
+
+        snapshots.append((d, pool.quantity, pool.cost))
+
+    # Allocate each day's matches to its disposals pro rata by quantity
+    matches: Dict[Any, List[Dict[str, Any]]] = {}
+    for d in disp_days:
+        rows = disposal_days[d]
+        day_quantity = sum(row["quantity"] for row in rows)
+        for row in rows:
+            share = row["quantity"] / day_quantity
+            matches[row["id"]] = [
+                {**match, "quantity": match["quantity"] * share, "cost": match["cost"] * share}
+                for match in day_matches[d]
+            ]
+
+    return {"matches": matches, "snapshots": snapshots, "pool": pool}
+
+
+class ShareMatchingService:
+    """Service for UK CGT share matching on investment holdings."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize share matching service.
+
+        Args:
+            db: Database session for operations
+        """
+        self.db = db
+
+    async def recalculate_holding(
+        self,
+        holding_id: UUID,
+        changed_from: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """
+        Re-match a holding's disposals and update realized gains.
+
+        When changed_from is given (e.g. the date of a back-dated trade), only
+        disposals from 30 days before that date onward are re-matched, starting
+        from the stored Section 104 pool snapshot. Otherwise, or when no
+        snapshot covers the trades before that point, the full log is
+        replayed.
+
+        Args:
+            holding_id: Holding UUID
+            changed_from: Earliest date of an inserted or changed trade
+
+        Returns:
+            Dict with rebuilt_from, disposals_rematched, gains_updated,
+            pool_quantity and pool_cost
+
+        Raises:
+            ValueError: If holding not found, not a UK holding, or disposals
+                        exceed the shares acquired
+        """
+        summary = await self._rematch(holding_id, changed_from)
+        await self.db.commit()
+        return summary
+
+    async def _rematch(
+        self,
+        holding_id: UUID,
+        changed_from: Optional[date]
+    ) -> Dict[str, Any]:
+        """Re-match a holding (see recalculate_holding) without committing."""
+        result = await self.db.execute(
+            select(InvestmentHolding, InvestmentAccount.country)
+            .join(InvestmentAccount, InvestmentHolding.account_id == InvestmentAccount.id)
+            .where(InvestmentHolding.id == holding_id)
+        )
+        row = result.one_or_none()
+
+        if not row:
+            raise ValueError(f"Holding not found: {holding_id}")
+
+        _, country = row
+        if country != AccountCountry.UK:
+            raise ValueError("UK share matching rules apply to UK holdings only")
+
+        rebuild_from = (
+            changed_from - timedelta(days=BED_AND_BREAKFAST_DAYS) if changed_from else None
+        )
+
+        logger.info(
+            f"Re-matching disposals for holding {holding_id} from {rebuild_from or 'start'}"
+        )
+
+        opening_pool = await self._get_opening_pool(holding_id, rebuild_from)
+        if opening_pool is None:
+            # No snapshot covers the trades before the window: replay everything
+            logger.info(f"No usable pool snapshot for holding {holding_id}; replaying all trades")
+            rebuild_from = None
+            opening_pool = Section104Pool()
+
+        acquisitions = await self._get_unmatched_acquisitions(holding_id, rebuild_from)
+        disposals = await self._get_disposals(holding_id, rebuild_from)
+
+        matched = match_disposals(
+            acquisitions,
+            [
+                {"id": cg.id, "disposal_date": cg.disposal_date, "quantity": cg.quantity_sold}
+                for cg in disposals
+            ],
+            opening_pool
+        )
+
+        # Replace stored matches and snapshots from the rebuild point onward
+        match_filter = [ShareMatch.holding_id == holding_id]
+        snapshot_filter = [Section104PoolSnapshot.holding_id == holding_id]
+        if rebuild_from:
+            match_filter.append(ShareMatch.disposal_date >= rebuild_from)
+            snapshot_filter.append(Section104PoolSnapshot.snapshot_date >= rebuild_from)
+        await self.db.execute(delete(ShareMatch).where(and_(*match_filter)))
+        await self.db.execute(delete(Section104PoolSnapshot).where(and_(*snapshot_filter)))
+
+        gains_updated = 0
+        now = datetime.utcnow()
+        for cg in disposals:
+            cost_basis = Decimal('0.00')
+            for match in matched["matches"][cg.id]:
+                allowable_cost = match["cost"].quantize(Decimal('0.01'))
+                cost_basis += allowable_cost
+                self.db.add(ShareMatch(
+                    id=uuid.uuid4(),
+                    holding_id=holding_id,
+                    capital_gain_id=cg.id,
+                    disposal_date=cg.disposal_date,
+                    matching_rule=match["rule"],
+                    acquisition_date=match["acquisition_date"],
+                    quantity=match["quantity"].quantize(Decimal('0.0001')),
+                    allowable_cost=allowable_cost,
+                    created_at=now
+                ))
+
+            if cg.cost_basis != cost_basis:
+                cg.cost_basis = cost_basis
+                cg.gain_loss = cg.sale_value - cost_basis
+                gains_updated += 1
+
+        for snapshot_date, pool_quantity, pool_cost in matched["snapshots"]:
+            self.db.add(Section104PoolSnapshot(
+                id=uuid.uuid4(),
+                holding_id=holding_id,
+                snapshot_date=snapshot_date,
+                pool_quantity=pool_quantity.quantize(Decimal('0.0001')),
+                pool_cost=pool_cost.quantize(Decimal('0.01')),
+                created_at=now
+            ))
+
+        await self.db.flush()
+
+        pool = matched["pool"]
+        logger.info(
+            f"Share matching complete for holding {holding_id}: "
+            f"disposals_rematched={len(disposals)}, gains_updated={gains_updated}, "
+            f"pool_quantity={pool.quantity}"
+        )
+
+        return {
+            "holding_id": str(holding_id),
+            "rebuilt_from": rebuild_from,
+            "disposals_rematched": len(disposals),
+            "gains_updated": gains_updated,
+            "pool_quantity": pool.quantity.quantize(Decimal('0.0001')),
+            "pool_cost": pool.cost.quantize(Decimal('0.01')),
+        }
+
+    async def rematch_if_back_dated(
+        self,
+        holding_id: UUID,
+        trade_date: date
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Re-match a UK holding after a trade dated on or before its stored matches.
+
+        Trades after the latest stored match and pool snapshot don't change
+        earlier results, so nothing is re-matched for them. Does not commit,
+        so the re-match is part of the trade's transaction.
+
+        Args:
+            holding_id: Holding UUID
+            trade_date: Date of the inserted trade
+
+        Returns:
+            recalculate_holding summary, or None if the trade isn't back-dated
+        """
+        result = await self.db.execute(
+            select(
+                select(func.max(ShareMatch.disposal_date))
+                .where(ShareMatch.holding_id == holding_id)
+                .scalar_subquery(),
+                select(func.max(Section104PoolSnapshot.snapshot_date))
+                .where(Section104PoolSnapshot.holding_id == holding_id)
+                .scalar_subquery()
+            )
+        )
+        latest = [d for d in result.one() if d is not None]
+
+        if not latest or trade_date > max(latest):
+            return None
+
+        logger.info(f"Back-dated trade on {trade_date} for holding {holding_id}; re-matching")
+        return await self._rematch(holding_id, trade_date)
+
+    async def get_disposal_matches(self, capital_gain_id: UUID) -> List[ShareMatch]:
+        """
+        Get the stored matches for a realized disposal.
+
+        Args:
+            capital_gain_id: CapitalGainRealized UUID
+
+        Returns:
+            List of ShareMatch rows in rule priority order
+        """
+        result = await self.db.execute(
+            select(ShareMatch).where(ShareMatch.capital_gain_id == capital_gain_id)
+        )
+        rule_order = list(MatchingRule)
+        return sorted(
+            result.scalars().all(),
+            key=lambda m: (rule_order.index(m.matching_rule), m.acquisition_date or date.max)
+        )
+
+    async def _get_opening_pool(
+        self,
+        holding_id: UUID,
+        rebuild_from: Optional[date]
+    ) -> Optional[Section104Pool]:
+        """
+        Load the latest pool snapshot strictly before the rebuild point.
+
+        Every transaction day of a replay gets a snapshot, so a trade between
+        the latest snapshot and the rebuild point (or any earlier trade when
+        there is no snapshot) means the pool was never built that far.
+
+        Returns:
+            Opening pool, or None if no snapshot covers the earlier trades
+        """
+        if rebuild_from is None:
+            return Section104Pool()
+
+        result = await self.db.execute(
+            select(Section104PoolSnapshot)
+            .where(
+                and_(
+                    Section104PoolSnapshot.holding_id == holding_id,
+                    Section104PoolSnapshot.snapshot_date < rebuild_from
+                )
+            )
+            .order_by(Section104PoolSnapshot.snapshot_date.desc())
+            .limit(1)
+        )
+        snapshot = result.scalar_one_or_none()
+
+        lot_conditions = [TaxLot.holding_id == holding_id, TaxLot.purchase_date < rebuild_from]
+        disposal_conditions = [
+            CapitalGainRealized.holding_id == holding_id,
+            CapitalGainRealized.disposal_date < rebuild_from
+        ]
+        if snapshot:
+            lot_conditions.append(TaxLot.purchase_date > snapshot.snapshot_date)
+            disposal_conditions.append(CapitalGainRealized.disposal_date > snapshot.snapshot_date)
+
+        uncovered = await self.db.execute(
+            select(
+                select(TaxLot.id).where(and_(*lot_conditions)).exists()
+                | select(CapitalGainRealized.id).where(and_(*disposal_conditions)).exists()
+            )
+        )
+        if uncovered.scalar():
+            return None
+
+        if not snapshot:
+            return Section104Pool()
+
+        return Section104Pool(
+            Decimal(str(snapshot.pool_quantity)),
+            Decimal(str(snapshot.pool_cost))
+        )
+
+    async def _get_unmatched_acquisitions(
+        self,
+        holding_id: UUID,
+        rebuild_from: Optional[date]
+    ) -> Dict[date, Tuple[Decimal, Decimal]]:
+        """
+        Load acquisitions per day from the rebuild point, net of any quantity
+        already matched (30-day rule) to disposals before the rebuild point.
+        """
+        conditions = [TaxLot.holding_id == holding_id]
+        if rebuild_from:
+            conditions.append(TaxLot.purchase_date >= rebuild_from)
+
+        result = await self.db.execute(
+            select(
+                TaxLot.purchase_date,
+                func.sum(TaxLot.quantity),
+                func.sum(TaxLot.cost_basis_gbp)
+            )
+            .where(and_(*conditions))
+            .group_by(TaxLot.purchase_date)
+        )
+        acquisitions = {
+            acq_date: (Decimal(str(quantity)), Decimal(str(cost)))
+            for acq_date, quantity, cost in result.all()
+        }
+
+        if rebuild_from and acquisitions:
+            consumed_result = await self.db.execute(
+                select(ShareMatch.acquisition_date, func.sum(ShareMatch.quantity))
+                .where(
+                    and_(
+                        ShareMatch.holding_id == holding_id,
+                        ShareMatch.disposal_date < rebuild_from,
+                        ShareMatch.acquisition_date >= rebuild_from
+                    )
+                )
+                .group_by(ShareMatch.acquisition_date)
+            )
+            for acq_date, consumed in consumed_result.all():
+                if acq_date not in acquisitions:
+                    continue
+                quantity, cost = acquisitions[acq_date]
+                consumed = min(Decimal(str(consumed)), quantity)
+                remaining = quantity - consumed
+                acquisitions[acq_date] = (
+                    remaining,
+                    cost * remaining / quantity if quantity > 0 else Decimal('0')
+                )
+
+        return acquisitions
+
+    async def _get_disposals(
+        self,
+        holding_id: UUID,
+        rebuild_from: Optional[date]
+    ) -> List[CapitalGainRealized]:
+        """Load disposals from the rebuild point in date order."""
+        conditions = [CapitalGainRealized.holding_id == holding_id]
+        if rebuild_from:
+            conditions.append(CapitalGainRealized.disposal_date >= rebuild_from)
+
+        result = await self.db.execute(
+            select(CapitalGainRealized)
+            .where(and_(*conditions))
+            .order_by(CapitalGainRealized.disposal_date.asc(), CapitalGainRealized.created_at.asc())
+        )
+        return list(result.scalars().all())
+
+
+def get_share_matching_service(db: AsyncSession) -> ShareMatchingService:
+    """
+    Get share matching service instance.
+
+    Args:
+        db: Database session
+
+    Returns:
+        ShareMatchingService instance
+    """
+    return ShareMatchingService(db)
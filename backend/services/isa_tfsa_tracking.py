@@ -18,6 +18,14 @@ Business Rules:
 - SA tax year: March 1 - February 28/29
 - TFSA growth counts toward annual limit
 - Unused allowance does NOT carry forward
+
+Performance:
+- Used allowance is read from per-user, per-tax-year ledger rows
+  (ISAAllowanceLedger, TFSAAllowanceLedger) maintained as contributions are
+  written, so allowance checks are a primary-key lookup rather than a sum
+  over contribution rows
+- Recording a contribution locks the ledger row(s) before validating, so
+  concurrent contributions can't both pass the check and overshoot
 """
 
 import uuid
@@ -26,10 +34,13 @@ from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 from calendar import isleap
 
-from sqlalchemy import select, func
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from models.savings_account import ISAContribution, TFSAContribution, TFSAContributionType
+from models.savings_account import (
+    ISAContribution, TFSAContribution, TFSAContributionType,
+    ISAAllowanceLedger, TFSAAllowanceLedger, ensure_allowance_ledger
+)
 
 
 # ===== CONFIGURATION =====
@@ -212,10 +223,40 @@ class ISATrackingService:
         """
         self.db = db
 
+    async def get_isa_used(
+        self,
+        user_id: uuid.UUID,
+        tax_year: str,
+        for_update: bool = False
+    ) -> Decimal:
+        """
+        Get ISA allowance used in a tax year from the ledger.
+
+        Args:
+            user_id: User's UUID
+            tax_year: Tax year string
+            for_update: Lock the ledger row until the transaction ends
+                (created empty first if missing, so there is a row to lock)
+
+        Returns:
+            Decimal: Total contributed in the tax year
+        """
+        stmt = select(ISAAllowanceLedger.used).where(
+            ISAAllowanceLedger.user_id == user_id,
+            ISAAllowanceLedger.tax_year == tax_year
+        )
+        if for_update:
+            connection = await self.db.connection()
+            await connection.run_sync(ensure_allowance_ledger, ISAAllowanceLedger, user_id, tax_year)
+            stmt = stmt.with_for_update()
+        result = await self.db.execute(stmt)
+        return Decimal(str(result.scalar() or Decimal('0.00')))
+
     async def get_isa_allowance(
         self,
         user_id: uuid.UUID,
-        tax_year: Optional[str] = None
+        tax_year: Optional[str] = None,
+        include_contributions: bool = True
     ) -> Dict:
         """
         Get ISA allowance for a tax year.
@@ -223,6 +264,8 @@ class ISATrackingService:
         Args:
             user_id: User's UUID
             tax_year: Tax year string (defaults to current UK tax year)
+            include_contributions: Also list the year's contributions (one
+                extra query); totals come from the ledger either way
 
         Returns:
             Dict containing:
@@ -247,17 +290,16 @@ class ISATrackingService:
         if tax_year is None:
             tax_year = get_current_uk_tax_year()
 
-        # Get all contributions for this tax year
-        stmt = select(ISAContribution).where(
-            ISAContribution.user_id == user_id,
-            ISAContribution.tax_year == tax_year
-        ).order_by(ISAContribution.contribution_date.desc())
-        result = await self.db.execute(stmt)
-        contributions = result.scalars().all()
+        used = await self.get_isa_used(user_id, tax_year)
 
-        # Calculate used allowance
-        used = sum(c.contribution_amount for c in contributions)
-        used = Decimal(str(used))
+        contributions = []
+        if include_contributions:
+            stmt = select(ISAContribution).where(
+                ISAContribution.user_id == user_id,
+                ISAContribution.tax_year == tax_year
+            ).order_by(ISAContribution.contribution_date.desc())
+            result = await self.db.execute(stmt)
+            contributions = result.scalars().all()
 
         # Calculate remaining
         remaining = ISA_ANNUAL_ALLOWANCE - used
@@ -313,15 +355,16 @@ class ISATrackingService:
         # Determine tax year from contribution date
         tax_year = get_current_uk_tax_year(contribution_date)
 
-        # Check current allowance
-        allowance = await self.get_isa_allowance(user_id, tax_year)
+        # Check current allowance (ledger row stays locked until commit)
+        used = await self.get_isa_used(user_id, tax_year, for_update=True)
+        remaining = max(ISA_ANNUAL_ALLOWANCE - used, Decimal('0'))
 
         # Validate against remaining allowance
-        if amount > allowance['remaining']:
-            excess = amount - allowance['remaining']
+        if amount > remaining:
+            excess = amount - remaining
             raise ValueError(
                 f"Contribution of £{amount} would exceed ISA allowance by £{excess}. "
-                f"Remaining allowance for {tax_year}: £{allowance['remaining']}"
+                f"Remaining allowance for {tax_year}: £{remaining}"
             )
 
         # Create contribution record
@@ -335,6 +378,7 @@ class ISATrackingService:
             notes=notes
         )
 
+        # The ledger is updated in the same flush (see models.savings_account)
         self.db.add(contribution)
         await self.db.commit()
         await self.db.refresh(contribution)
@@ -357,10 +401,65 @@ class TFSATrackingService:
         """
         self.db = db
 
+    async def get_tfsa_used(
+        self,
+        user_id: uuid.UUID,
+        tax_year: str,
+        for_update: bool = False
+    ) -> Tuple[Decimal, Decimal]:
+        """
+        Get TFSA annual and lifetime allowance used from the ledger.
+
+        The tax year's row carries both totals. Before the first
+        contribution of a year there is no row, and the lifetime total is
+        read from any of the user's other rows.
+
+        Args:
+            user_id: User's UUID
+            tax_year: Tax year string
+            for_update: Lock the user's ledger rows until the transaction ends
+                (the tax year's row is created first if missing, so there is
+                a row to lock)
+
+        Returns:
+            Tuple[Decimal, Decimal]: (annual_used, lifetime_used)
+        """
+        if for_update:
+            connection = await self.db.connection()
+            await connection.run_sync(ensure_allowance_ledger, TFSAAllowanceLedger, user_id, tax_year)
+
+            # Lifetime totals span all of the user's rows, so lock them all
+            result = await self.db.execute(
+                select(TFSAAllowanceLedger.tax_year, TFSAAllowanceLedger.annual_used, TFSAAllowanceLedger.lifetime_used)
+                .where(TFSAAllowanceLedger.user_id == user_id)
+                .with_for_update()
+            )
+            row = {row.tax_year: row for row in result.all()}[tax_year]
+        else:
+            result = await self.db.execute(
+                select(TFSAAllowanceLedger.annual_used, TFSAAllowanceLedger.lifetime_used).where(
+                    TFSAAllowanceLedger.user_id == user_id,
+                    TFSAAllowanceLedger.tax_year == tax_year
+                )
+            )
+            row = result.first()
+            if row is None:
+                result = await self.db.execute(
+                    select(TFSAAllowanceLedger.lifetime_used)
+                    .where(TFSAAllowanceLedger.user_id == user_id)
+                    .limit(1)
+                )
+                return Decimal('0.00'), Decimal(str(result.scalar() or Decimal('0.00')))
+
+        if row is None:
+            return Decimal('0.00'), Decimal('0.00')
+        return Decimal(str(row.annual_used)), Decimal(str(row.lifetime_used))
+
     async def get_tfsa_allowance(
         self,
         user_id: uuid.UUID,
-        tax_year: Optional[str] = None
+        tax_year: Optional[str] = None,
+        include_contributions: bool = True
     ) -> Dict:
         """
         Get TFSA allowance for a tax year.
@@ -370,6 +469,8 @@ class TFSATrackingService:
         Args:
             user_id: User's UUID
             tax_year: Tax year string (defaults to current SA tax year)
+            include_contributions: Also list the year's contributions (one
+                extra query); totals come from the ledger either way
 
         Returns:
             Dict containing:
@@ -402,17 +503,16 @@ class TFSATrackingService:
         if tax_year is None:
             tax_year = get_current_sa_tax_year()
 
-        # Get contributions for this tax year
-        stmt_annual = select(TFSAContribution).where(
-            TFSAContribution.user_id == user_id,
-            TFSAContribution.tax_year == tax_year
-        ).order_by(TFSAContribution.contribution_date.desc())
-        result_annual = await self.db.execute(stmt_annual)
-        annual_contributions = result_annual.scalars().all()
+        annual_used, lifetime_used = await self.get_tfsa_used(user_id, tax_year)
 
-        # Calculate annual used
-        annual_used = sum(c.contribution_amount for c in annual_contributions)
-        annual_used = Decimal(str(annual_used))
+        annual_contributions = []
+        if include_contributions:
+            stmt_annual = select(TFSAContribution).where(
+                TFSAContribution.user_id == user_id,
+                TFSAContribution.tax_year == tax_year
+            ).order_by(TFSAContribution.contribution_date.desc())
+            result_annual = await self.db.execute(stmt_annual)
+            annual_contributions = result_annual.scalars().all()
 
         # Calculate annual remaining
         annual_remaining = TFSA_ANNUAL_ALLOWANCE - annual_used
@@ -421,17 +521,6 @@ class TFSATrackingService:
         # Calculate annual percentage used
         annual_percentage_used = float((annual_used / TFSA_ANNUAL_ALLOWANCE) * 100) if TFSA_ANNUAL_ALLOWANCE > 0 else 0.0
 
-        # Get lifetime contributions (all time)
-        stmt_lifetime = select(TFSAContribution).where(
-            TFSAContribution.user_id == user_id
-        )
-        result_lifetime = await self.db.execute(stmt_lifetime)
-        lifetime_contributions = result_lifetime.scalars().all()
-
-        # Calculate lifetime used
-        lifetime_used = sum(c.contribution_amount for c in lifetime_contributions)
-        lifetime_used = Decimal(str(lifetime_used))
-
         # Calculate lifetime remaining
         lifetime_remaining = TFSA_LIFETIME_ALLOWANCE - lifetime_used
         lifetime_remaining = max(lifetime_remaining, Decimal('0'))
@@ -498,23 +587,25 @@ class TFSATrackingService:
         # Determine tax year from contribution date
         tax_year = get_current_sa_tax_year(contribution_date)
 
-        # Check current allowances
-        allowance = await self.get_tfsa_allowance(user_id, tax_year)
+        # Check current allowances (ledger rows stay locked until commit)
+        annual_used, lifetime_used = await self.get_tfsa_used(user_id, tax_year, for_update=True)
+        annual_remaining = max(TFSA_ANNUAL_ALLOWANCE - annual_used, Decimal('0'))
+        lifetime_remaining = max(TFSA_LIFETIME_ALLOWANCE - lifetime_used, Decimal('0'))
 
         # Validate against annual allowance
-        if amount > allowance['annual_remaining']:
-            excess = amount - allowance['annual_remaining']
+        if amount > annual_remaining:
+            excess = amount - annual_remaining
             raise ValueError(
                 f"Contribution of R{amount} would exceed TFSA annual allowance by R{excess}. "
-                f"Remaining annual allowance for {tax_year}: R{allowance['annual_remaining']}"
+                f"Remaining annual allowance for {tax_year}: R{annual_remaining}"
             )
 
         # Validate against lifetime allowance
-        if amount > allowance['lifetime_remaining']:
-            excess = amount - allowance['lifetime_remaining']
+        if amount > lifetime_remaining:
+            excess = amount - lifetime_remaining
             raise ValueError(
                 f"Contribution of R{amount} would exceed TFSA lifetime allowance by R{excess}. "
-                f"Remaining lifetime allowance: R{allowance['lifetime_remaining']}"
+                f"Remaining lifetime allowance: R{lifetime_remaining}"
             )
 
         # Create contribution record
@@ -529,6 +620,7 @@ class TFSATrackingService:
             notes=notes
         )
 
+        # The ledger is updated in the same flush (see models.savings_account)
         self.db.add(contribution)
         await self.db.commit()
         await self.db.refresh(contribution)
@@ -591,11 +683,11 @@ class AllowanceTrackingService:
             }
         """
         if account_type == "ISA":
-            allowance = await self.isa_service.get_isa_allowance(user_id, tax_year)
+            allowance = await self.isa_service.get_isa_allowance(user_id, tax_year, include_contributions=False)
             percentage = Decimal(str(allowance['percentage_used'])) / Decimal('100')
             limit_type = "annual"
         elif account_type == "TFSA":
-            allowance = await self.tfsa_service.get_tfsa_allowance(user_id, tax_year)
+            allowance = await self.tfsa_service.get_tfsa_allowance(user_id, tax_year, include_contributions=False)
             # Use the higher of annual or lifetime percentage
             annual_pct = Decimal(str(allowance['annual_percentage_used'])) / Decimal('100')
             lifetime_pct = Decimal(str(allowance['lifetime_percentage_used'])) / Decimal('100')
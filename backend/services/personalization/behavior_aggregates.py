@@ -0,0 +1,184 @@
+"""
+Behavior Aggregates
+
+Maintains per-user daily behavior counters (UserBehaviorDaily) as behavior
+events are written, and reads them back for analysis.
+
+Behavior analysis used to load every raw event in the window and parse each
+action_context. Counters are now folded in once, when events are written,
+so analysis reads one row per day.
+
+Business Rules:
+- Days are UTC calendar days (event timestamp date)
+- Page views count the 'page' of PAGE_VIEW actions; feature uses count the
+  'feature' of FEATURE_USAGE actions
+- Actions with unparseable context still count towards totals and hours
+- All writes go through write_behavior_events() so raw rows and counters
+  stay in step
+
+Performance:
+- Write: one SELECT ... FOR UPDATE over the touched (user, day) rows per batch
+- Read: O(days) rows instead of O(events)
+"""
+
+import json
+import logging
+from collections import Counter
+from datetime import date, datetime
+from typing import Any, Dict, List, Tuple
+from uuid import UUID
+
+from sqlalchemy import insert, select, and_, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.personalization import ActionType, UserBehavior, UserBehaviorDaily
+
+logger = logging.getLogger(__name__)
+
+HOURS_PER_DAY = 24
+
+
+def _empty_summary() -> Dict[str, Any]:
+    """Zeroed counters."""
+    return {
+        'total_actions': 0,
+        'page_views': Counter(),
+        'feature_uses': Counter(),
+        'hourly_actions': [0] * HOURS_PER_DAY
+    }
+
+
+def summarize_events(events: List[Dict[str, Any]]) -> Dict[Tuple[UUID, date], Dict[str, Any]]:
+    """
+    Fold behavior events into per-user daily counters.
+
+    Args:
+        events: UserBehavior column values (user_id, action_type,
+            action_context JSON string, timestamp)
+
+    Returns:
+        Dict of (user_id, day) -> counters (see _empty_summary)
+    """
+    summaries: Dict[Tuple[UUID, date], Dict[str, Any]] = {}
+
+    for event in events:
+        timestamp: datetime = event['timestamp']
+        summary = summaries.setdefault((event['user_id'], timestamp.date()), _empty_summary())
+        summary['total_actions'] += 1
+        summary['hourly_actions'][timestamp.hour] += 1
+
+        action_type = ActionType(event['action_type'])
+        if action_type not in (ActionType.PAGE_VIEW, ActionType.FEATURE_USAGE):
+            continue
+
+        try:
+            context = json.loads(event['action_context'])
+        except (TypeError, json.JSONDecodeError):
+            logger.warning(f"Failed to parse action_context for behavior {event.get('id')}")
+            continue
+        if not isinstance(context, dict):
+            continue
+
+        if action_type == ActionType.PAGE_VIEW and 'page' in context:
+            summary['page_views'][str(context['page'])] += 1
+        elif action_type == ActionType.FEATURE_USAGE and 'feature' in context:
+            summary['feature_uses'][str(context['feature'])] += 1
+
+    return summaries
+
+
+async def apply_behavior_events(db: AsyncSession, events: List[Dict[str, Any]]) -> None:
+    """
+    Add events to the daily counters (caller commits).
+
+    Locks existing (user, day) rows so concurrent writers don't lose counts.
+
+    Args:
+        db: Database session
+        events: UserBehavior column values
+    """
+    summaries = summarize_events(events)
+    if not summaries:
+        return
+
+    user_ids = {user_id for user_id, _ in summaries}
+    days = {day for _, day in summaries}
+    result = await db.execute(
+        select(UserBehaviorDaily).where(
+            and_(
+                UserBehaviorDaily.user_id.in_(user_ids),
+                UserBehaviorDaily.activity_date.in_(days)
+            )
+        ).with_for_update()
+    )
+    existing = {(row.user_id, row.activity_date): row for row in result.scalars()}
+
+    for (user_id, day), summary in summaries.items():
+        row = existing.get((user_id, day))
+        if row is None:
+            db.add(UserBehaviorDaily(
+                user_id=user_id,
+                activity_date=day,
+                total_actions=summary['total_actions'],
+                page_views=dict(summary['page_views']),
+                feature_uses=dict(summary['feature_uses']),
+                hourly_actions=summary['hourly_actions']
+            ))
+            continue
+
+        # Assign new objects so the JSON columns are detected as changed
+        row.total_actions += summary['total_actions']
+        row.page_views = dict(Counter(row.page_views) + summary['page_views'])
+        row.feature_uses = dict(Counter(row.feature_uses) + summary['feature_uses'])
+        row.hourly_actions = [a + b for a, b in zip(row.hourly_actions, summary['hourly_actions'])]
+
+
+async def write_behavior_events(db: AsyncSession, events: List[Dict[str, Any]]) -> None:
+    """
+    Insert raw behavior events and update the daily counters (caller commits).
+
+    Args:
+        db: Database session
+        events: UserBehavior column values
+    """
+    if not events:
+        return
+    await db.execute(insert(UserBehavior), events)
+    await apply_behavior_events(db, events)
+
+
+async def load_behavior_summary(db: AsyncSession, user_id: UUID, since: date) -> Dict[str, Any]:
+    """
+    Sum a user's daily counters from a day onwards.
+
+    Args:
+        db: Database session
+        user_id: User UUID
+        since: First UTC day included
+
+    Returns:
+        Dict with total_actions, page_views (Counter), feature_uses (Counter)
+        and hourly_actions (24 counts). Counters list the most recent days'
+        entries first, so ties in most_common() favour recent activity.
+    """
+    result = await db.execute(
+        select(
+            UserBehaviorDaily.total_actions,
+            UserBehaviorDaily.page_views,
+            UserBehaviorDaily.feature_uses,
+            UserBehaviorDaily.hourly_actions
+        ).where(
+            and_(
+                UserBehaviorDaily.user_id == user_id,
+                UserBehaviorDaily.activity_date >= since
+            )
+        ).order_by(desc(UserBehaviorDaily.activity_date))
+    )
+
+    summary = _empty_summary()
+    for total_actions, page_views, feature_uses, hourly_actions in result.all():
+        summary['total_actions'] += total_actions
+        summary['page_views'].update(page_views or {})
+        summary['feature_uses'].update(feature_uses or {})
+        summary['hourly_actions'] = [a + b for a, b in zip(summary['hourly_actions'], hourly_actions)]
+    return summary
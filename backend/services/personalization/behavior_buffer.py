@@ -0,0 +1,249 @@
+"""
+Behavior Buffer
+
+Write-behind buffer for behavior tracking events.
+
+Tracking a click or page view used to cost a full transaction (insert,
+commit, refresh) on the request path. Events are now appended to an
+in-process buffer and bulk-inserted in the background.
+
+Flushes happen:
+- When the buffer reaches BEHAVIOR_BUFFER_FLUSH_SIZE events
+- Every BEHAVIOR_BUFFER_FLUSH_INTERVAL seconds
+- Before behavior is read back (see PreferenceService.analyze_behavior)
+- On application shutdown (close())
+
+Business Rules:
+- The buffer is bounded (BEHAVIOR_BUFFER_MAX_SIZE); when full, new events
+  are dropped and counted rather than slowing requests down
+- A flush that fails on a connection error puts events back in the buffer
+  (up to capacity) so a brief database outage loses nothing; a batch the
+  database rejects is dropped and counted
+- Event timestamps are taken when the event is recorded, not when flushed
+
+Performance:
+- record() is synchronous and O(1); it never touches the database
+- One multi-row INSERT (executemany) per flush instead of one transaction
+  per event; daily aggregates are updated in the same transaction
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy.exc import IntegrityError, InterfaceError, OperationalError, SQLAlchemyError
+
+from config import settings
+from database import AsyncSessionLocal
+from models.personalization import ActionType
+from services.personalization.behavior_aggregates import write_behavior_events
+
+logger = logging.getLogger(__name__)
+
+
+class BehaviorBuffer:
+    """
+    Bounded in-process buffer of behavior events with background flushing.
+
+    The flush loop starts lazily on the first recorded event.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        flush_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        session_factory=AsyncSessionLocal
+    ):
+        """
+        Initialize behavior buffer.
+
+        Args:
+            max_size: Events held before new events are dropped
+            flush_size: Events that trigger an immediate flush
+            flush_interval: Seconds between background flushes
+            session_factory: Session factory used for flushes
+        """
+        self.max_size = max_size or settings.BEHAVIOR_BUFFER_MAX_SIZE
+        self.flush_size = flush_size or settings.BEHAVIOR_BUFFER_FLUSH_SIZE
+        self.flush_interval = flush_interval or settings.BEHAVIOR_BUFFER_FLUSH_INTERVAL
+        self.session_factory = session_factory
+
+        self._events: Deque[Dict[str, Any]] = deque()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._size_flush: Optional[asyncio.Task] = None
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Reset counters."""
+        self._recorded = 0
+        self._flushed = 0
+        self._dropped = 0
+        self._flushes = 0
+        self._failed_flushes = 0
+        self._last_flush_at: Optional[datetime] = None
+
+    def record(
+        self,
+        user_id: UUID,
+        action_type: ActionType,
+        action_context: Dict
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Buffer one behavior event.
+
+        Args:
+            user_id: User UUID
+            action_type: Type of action
+            action_context: Action context metadata (dict)
+
+        Returns:
+            The buffered event (UserBehavior column values), or None if the
+            buffer is full and the event was dropped
+        """
+        if len(self._events) >= self.max_size:
+            self._dropped += 1
+            if self._dropped == 1 or self._dropped % 1000 == 0:
+                logger.warning(f"Behavior buffer full ({self.max_size}); {self._dropped} events dropped")
+            return None
+
+        event = {
+            'id': uuid.uuid4(),
+            'user_id': user_id,
+            'action_type': action_type,
+            'action_context': json.dumps(action_context),
+            'timestamp': datetime.utcnow()
+        }
+        self._events.append(event)
+        self._recorded += 1
+
+        self._start()
+        if len(self._events) >= self.flush_size and (self._size_flush is None or self._size_flush.done()):
+            self._size_flush = asyncio.get_running_loop().create_task(self.flush())
+        return event
+
+    def _bind_loop(self) -> None:
+        """Bind to the running event loop (locks and tasks don't carry across loops)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._flush_task = None
+            self._size_flush = None
+
+    def _start(self) -> None:
+        """Start the flush loop on the running event loop if it isn't running."""
+        self._bind_loop()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = self._loop.create_task(self._flush_periodically())
+
+    async def _flush_periodically(self) -> None:
+        """Flush every flush_interval seconds until cancelled."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Bulk-insert all buffered events.
+
+        Returns:
+            Number of events written
+        """
+        if not self._events:
+            return 0
+        self._bind_loop()
+
+        async with self._lock:
+            events: List[Dict[str, Any]] = list(self._events)
+            self._events.clear()
+            if not events:
+                return 0
+
+            try:
+                await self._write(events)
+            except SQLAlchemyError as e:
+                self._failed_flushes += 1
+                if isinstance(e, (OperationalError, InterfaceError)):
+                    # Connection problem: put events back ahead of newer ones, within capacity
+                    room = max(self.max_size - len(self._events), 0)
+                    self._dropped += max(len(events) - room, 0)
+                    self._events.extendleft(reversed(events[:room]))
+                else:
+                    # Retrying a rejected batch would fail forever
+                    self._dropped += len(events)
+                logger.error(f"Behavior buffer flush of {len(events)} events failed: {e}")
+                return 0
+
+            self._flushes += 1
+            self._flushed += len(events)
+            self._last_flush_at = datetime.utcnow()
+            logger.debug(f"Behavior buffer flushed {len(events)} events")
+            return len(events)
+
+    async def _write(self, events: List[Dict[str, Any]]) -> None:
+        """Write events and their aggregates in one transaction."""
+        for attempt in range(2):
+            try:
+                async with self.session_factory() as session:
+                    await write_behavior_events(session, events)
+                    await session.commit()
+                return
+            except IntegrityError:
+                # Another writer created the same daily aggregate row first; retry
+                # once, which updates that row instead
+                if attempt:
+                    raise
+
+    async def close(self) -> None:
+        """
+        Stop the flush loop and write remaining events.
+
+        Should be called during application shutdown.
+        """
+        self._bind_loop()
+
+        # Cancel the loop while holding the lock so it can't be mid-write
+        if self._flush_task is not None:
+            async with self._lock:
+                self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        if self._size_flush is not None:
+            await self._size_flush
+            self._size_flush = None
+        await self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Buffer metrics for this process.
+
+        Returns:
+            Dict with buffered, max_size, recorded, flushed, dropped,
+            flushes, failed_flushes and last_flush_at
+        """
+        return {
+            'buffered': len(self._events),
+            'max_size': self.max_size,
+            'recorded': self._recorded,
+            'flushed': self._flushed,
+            'dropped': self._dropped,
+            'flushes': self._flushes,
+            'failed_flushes': self._failed_flushes,
+            'last_flush_at': self._last_flush_at
+        }
+
+
+# Global behavior buffer instance
+behavior_buffer = BehaviorBuffer()
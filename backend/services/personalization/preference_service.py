@@ -9,7 +9,7 @@ Provides comprehensive personalization functionality including:
 
 Business Rules:
 - Preferences stored as key-value pairs
-- Behavior tracked asynchronously
+- Behavior tracked asynchronously (write-behind buffer, see behavior_buffer.py)
 - Dashboard personalized based on usage patterns
 - Insights generated based on user profile and financial data
 - Default preferences provided for new users
@@ -18,6 +18,7 @@ Performance:
 - Target: <200ms for preference queries
 - Target: <100ms for behavior tracking
 - Target: <500ms for dashboard personalization
+- Behavior analysis reads per-day aggregates, not raw events
 - Target: <1s for insight generation
 """
 
@@ -30,13 +31,15 @@ from typing import Dict, List, Optional, Any
 from uuid import UUID
 from collections import Counter
 
-from sqlalchemy import select, and_, func, desc
+from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.personalization import (
     UserPreference, UserBehavior, PersonalizedInsight,
     PreferenceType, ActionType, InsightType
 )
+from services.personalization.behavior_aggregates import load_behavior_summary
+from services.personalization.behavior_buffer import BehaviorBuffer, behavior_buffer
 
 logger = logging.getLogger(__name__)
 
@@ -63,14 +66,16 @@ class PreferenceService:
         'retirement', 'protection', 'tax', 'iht'
     ]
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, buffer: Optional[BehaviorBuffer] = None):
         """
         Initialize preference service.
 
         Args:
             db: Database session for operations
+            buffer: Behavior buffer (default: the shared process buffer)
         """
         self.db = db
+        self.behavior_buffer = buffer or behavior_buffer
 
     async def save_preference(
         self,
@@ -179,7 +184,7 @@ class PreferenceService:
         user_id: UUID,
         action_type: ActionType,
         action_context: Dict
-    ) -> UserBehavior:
+    ) -> Optional[UserBehavior]:
         """
         Log user action.
 
@@ -189,31 +194,22 @@ class PreferenceService:
             action_context: Action context metadata (dict)
 
         Returns:
-            Created UserBehavior record
+            UserBehavior record (not yet written), or None if the behavior
+            buffer was full and the action was dropped
 
         Business Logic:
             - Store timestamp (UTC now)
             - Store context as JSON string
-            - Async/fire-and-forget for performance
+            - Fire-and-forget: buffered and bulk-inserted in the background,
+              so no database round trip on the request path
         """
         logger.debug(f"Tracking behavior for user {user_id}: {action_type}")
 
-        # Create behavior record
-        behavior = UserBehavior(
-            id=uuid.uuid4(),
-            user_id=user_id,
-            action_type=action_type,
-            action_context=json.dumps(action_context),
-            timestamp=datetime.utcnow()
-        )
+        event = self.behavior_buffer.record(user_id, action_type, action_context)
+        if event is None:
+            return None
 
-        self.db.add(behavior)
-        await self.db.commit()
-        await self.db.refresh(behavior)
-
-        logger.debug(f"Behavior tracked: {action_type} for user {user_id}")
-
-        return behavior
+        return UserBehavior(**event)
 
     async def analyze_behavior(
         self,
@@ -233,10 +229,11 @@ class PreferenceService:
                 - most_used_features: List[str]
                 - engagement_score: int (0-100)
                 - total_actions: int
+                - hourly_activity: List[int] (actions per UTC hour, 24 values)
 
         Business Logic:
-            - Query behaviors from last N days
-            - Parse action_context JSON
+            - Read daily aggregates from the last N days (whole UTC days,
+              including the day N days ago)
             - Count page views by page
             - Count feature usage by feature
             - Calculate engagement score based on:
@@ -246,45 +243,29 @@ class PreferenceService:
         """
         logger.info(f"Analyzing behavior for user {user_id} (last {days} days)")
 
-        # Calculate date range
-        start_date = datetime.utcnow() - timedelta(days=days)
+        summary = await self._get_behavior_summary(user_id, days)
+        result_dict = self._analyze_summary(summary)
 
-        # Query behaviors
-        result = await self.db.execute(
-            select(UserBehavior).where(
-                and_(
-                    UserBehavior.user_id == user_id,
-                    UserBehavior.timestamp >= start_date
-                )
-            ).order_by(desc(UserBehavior.timestamp))
+        logger.info(
+            f"Behavior analysis complete for user {user_id}: "
+            f"{result_dict['total_actions']} actions, engagement score {result_dict['engagement_score']}"
         )
-        behaviors = result.scalars().all()
-
-        total_actions = len(behaviors)
-
-        # Parse behaviors
-        page_views = []
-        feature_usage = []
 
-        for behavior in behaviors:
-            try:
-                context = json.loads(behavior.action_context)
-
-                if behavior.action_type == ActionType.PAGE_VIEW:
-                    if 'page' in context:
-                        page_views.append(context['page'])
+        return result_dict
 
-                elif behavior.action_type == ActionType.FEATURE_USAGE:
-                    if 'feature' in context:
-                        feature_usage.append(context['feature'])
+    async def _get_behavior_summary(self, user_id: UUID, days: int) -> Dict:
+        """Daily aggregate counters for the last N days (see load_behavior_summary)."""
+        # Write buffered actions first so recent activity is counted
+        await self.behavior_buffer.flush()
 
-            except json.JSONDecodeError:
-                logger.warning(f"Failed to parse action_context for behavior {behavior.id}")
-                continue
+        start_date = (datetime.utcnow() - timedelta(days=days)).date()
+        return await load_behavior_summary(self.db, user_id, start_date)
 
-        # Count occurrences
-        page_counter = Counter(page_views)
-        feature_counter = Counter(feature_usage)
+    def _analyze_summary(self, summary: Dict) -> Dict:
+        """Build behavior analysis (see analyze_behavior) from aggregate counters."""
+        total_actions = summary['total_actions']
+        page_counter = summary['page_views']
+        feature_counter = summary['feature_uses']
 
         # Get top 5 most viewed pages
         most_viewed_pages = [page for page, count in page_counter.most_common(5)]
@@ -310,20 +291,14 @@ class PreferenceService:
             (feature_score * 0.30)
         )
 
-        result_dict = {
+        return {
             "most_viewed_pages": most_viewed_pages,
             "most_used_features": most_used_features,
             "engagement_score": engagement_score,
-            "total_actions": total_actions
+            "total_actions": total_actions,
+            "hourly_activity": summary['hourly_actions']
         }
 
-        logger.info(
-            f"Behavior analysis complete for user {user_id}: "
-            f"{total_actions} actions, engagement score {engagement_score}"
-        )
-
-        return result_dict
-
     async def personalize_dashboard(
         self,
         user_id: UUID
@@ -341,7 +316,7 @@ class PreferenceService:
                 - hidden_widgets: List[str] (widgets to hide/collapse)
 
         Business Logic:
-            - Analyze behavior to identify frequently accessed sections
+            - Analyze behavior (daily aggregates) to identify frequently accessed sections
             - Get user preferences for layout
             - Order widgets by usage frequency
             - Hide widgets with <5% usage rate
@@ -350,7 +325,8 @@ class PreferenceService:
         logger.info(f"Personalizing dashboard for user {user_id}")
 
         # Get behavior analysis
-        behavior_analysis = await self.analyze_behavior(user_id, days=30)
+        summary = await self._get_behavior_summary(user_id, days=30)
+        behavior_analysis = self._analyze_summary(summary)
 
         # If no behavior data, return default layout
         if behavior_analysis['total_actions'] == 0:
@@ -378,18 +354,7 @@ class PreferenceService:
         total_page_views = 0
 
         for page in behavior_analysis['most_viewed_pages']:
-            # Get actual count from behaviors
-            result = await self.db.execute(
-                select(func.count(UserBehavior.id)).where(
-                    and_(
-                        UserBehavior.user_id == user_id,
-                        UserBehavior.action_type == ActionType.PAGE_VIEW,
-                        UserBehavior.action_context.like(f'%"page": "{page}"%'),
-                        UserBehavior.timestamp >= datetime.utcnow() - timedelta(days=30)
-                    )
-                )
-            )
-            page_count = result.scalar() or 0
+            page_count = summary['page_views'][page]
             total_page_views += page_count
 
             if page in page_to_widget:
@@ -19,6 +19,7 @@ Business Rules:
 
 Performance:
 - Eager loads relationships to avoid N+1 queries
+- Encrypts all beneficiary PII for a policy in one batch
 - Uses async/await for database operations
 - Validates data before database operations
 """
@@ -43,7 +44,7 @@ from models.life_assurance import (
     ProviderCountry,
     BeneficiaryRelationship
 )
-from utils.encryption import encrypt_value, decrypt_value
+from utils.encryption import encrypt_values_async
 from services.protection.exceptions import (
     PolicyValidationError,
     PolicyNotFoundError,
@@ -146,17 +147,24 @@ class PolicyService:
         self.db.add(policy)
         await self.db.flush()  # Get policy ID
 
+        # Encrypt all beneficiary PII in one batch
+        encrypted_pii = await encrypt_values_async([
+            value
+            for ben_data in beneficiaries_data
+            for value in (ben_data['name'], ben_data['date_of_birth'].isoformat(), ben_data['address'])
+        ])
+
         # Create beneficiaries
-        for ben_data in beneficiaries_data:
+        for i, ben_data in enumerate(beneficiaries_data):
+            name_encrypted, date_of_birth_encrypted, address_encrypted = encrypted_pii[3 * i:3 * i + 3]
             beneficiary = PolicyBeneficiary(
                 policy_id=policy.id,
                 beneficiary_relationship=ben_data['relationship'],
-                percentage=ben_data['percentage']
+                percentage=ben_data['percentage'],
+                name_encrypted=name_encrypted,
+                date_of_birth_encrypted=date_of_birth_encrypted,
+                address_encrypted=address_encrypted
             )
-            # Encrypt PII
-            beneficiary.set_name(ben_data['name'])
-            beneficiary.set_date_of_birth(ben_data['date_of_birth'])
-            beneficiary.set_address(ben_data['address'])
 
             self.db.add(beneficiary)
 
@@ -16,6 +16,7 @@ Business Rules:
 - Minimum tapered allowance: £10,000
 - Carry forward: Look back 3 previous tax years
 - Carry forward: Use oldest first (FIFO)
+- MPAA applies from the tax year of the earliest flexible access (mpaa_date)
 - Excess contributions subject to tax charge at marginal rate
 
 Tax Years:
@@ -25,25 +26,67 @@ Tax Years:
 Performance:
 - Target: <100ms for calculations
 - Target: <200ms for carry forward lookback
+- The allowance ledger for every tax year of a user is built from three
+  queries (tracking, contributions per year, MPAA dates) in one pass and
+  cached in Redis until the user's pensions or contributions change
 - Async database operations throughout
 """
 
+import json
 import logging
 from datetime import date
 from decimal import Decimal
 from typing import Optional, Dict, Any, List
 from uuid import UUID
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.retirement import (
     UKPension, UKPensionContribution, AnnualAllowanceTracking
 )
+from redis_client import redis_client
 
 logger = logging.getLogger(__name__)
 
 
+# Ledger entry fields cached as strings and restored to Decimal
+_DECIMAL_FIELDS = frozenset({
+    'adjusted_income', 'annual_allowance', 'total_contributions',
+    'total_carry_forward', 'total_available', 'allowance_used',
+    'allowance_remaining', 'excess', 'carry_forward_used'
+})
+
+
+def _restore_decimals(data: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON object hook converting cached ledger amounts back to Decimal."""
+    for key in _DECIMAL_FIELDS.intersection(data):
+        data[key] = Decimal(data[key])
+    if isinstance(data.get('carry_forward'), dict):
+        data['carry_forward'] = {
+            year: Decimal(amount) for year, amount in data['carry_forward'].items()
+        }
+    return data
+
+
+def _tax_year_label(start_year: int) -> str:
+    """Format a tax year start (e.g. 2024) as YYYY/YY (e.g. 2024/25)."""
+    return f"{start_year}/{str(start_year + 1)[-2:]}"
+
+
+def _tax_year_start(tax_year: str) -> Optional[int]:
+    """Parse YYYY/YY to its start year, or None if invalid."""
+    year_parts = tax_year.split('/')
+    if len(year_parts) != 2 or not year_parts[0].isdigit():
+        return None
+    return int(year_parts[0])
+
+
+def _tax_year_of(day: date) -> int:
+    """Start year of the UK tax year (6 April - 5 April) containing a date."""
+    return day.year if (day.month, day.day) >= (4, 6) else day.year - 1
+
+
 class AnnualAllowanceService:
     """Service for UK pension Annual Allowance calculations."""
 
@@ -54,6 +97,10 @@ class AnnualAllowanceService:
     TAPER_RATE = Decimal('0.50')  # £1 reduction per £2 over threshold
     MINIMUM_TAPERED_ALLOWANCE = Decimal('10000.00')
 
+    # Carry forward look-back (tax years)
+    CARRY_FORWARD_YEARS = 3
+    CACHE_TTL = 3600  # 1 hour (invalidated on pension/contribution changes)
+
     def __init__(self, db: AsyncSession):
         """
         Initialize Annual Allowance service.
@@ -121,6 +168,199 @@ class AnnualAllowanceService:
         logger.info(f"Standard allowance: {self.STANDARD_ANNUAL_ALLOWANCE}")
         return self.STANDARD_ANNUAL_ALLOWANCE
 
+    async def get_allowance_ledger(
+        self,
+        user_id: UUID,
+        tax_year: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the user's annual allowance ledger covering a tax year.
+
+        The ledger runs from the user's earliest recorded tax year (or the
+        carry forward look-back of the requested year, if earlier) to the
+        requested year, and is memoized in Redis until a pension or
+        contribution changes.
+
+        Args:
+            user_id: User UUID
+            tax_year: Latest tax year needed (format: YYYY/YY)
+
+        Returns:
+            Dict mapping tax year to ledger entry (see _build_ledger)
+
+        Raises:
+            ValueError: If tax year format is invalid
+        """
+        target_year = _tax_year_start(tax_year)
+        if target_year is None:
+            raise ValueError(f"Invalid tax year format: {tax_year}")
+
+        cache_key = self.cache_key(user_id)
+        cached = await self._get_cached_ledger(cache_key)
+        if cached is not None and tax_year in cached:
+            return cached
+
+        last_year = target_year
+        if cached:
+            last_year = max(last_year, max(_tax_year_start(year) for year in cached))
+
+        ledger = await self._build_ledger(user_id, last_year)
+        await self._cache_ledger(cache_key, ledger)
+
+        return ledger
+
+    async def _build_ledger(
+        self,
+        user_id: UUID,
+        last_year: int
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Compute allowance, carry forward and usage for every tax year in one pass.
+
+        Per year (oldest first):
+        - Contributions: live contribution rows, else the tracking record's
+          total_contributions, else zero
+        - Allowance: MPAA if in effect, else standard/tapered on the tracking
+          record's adjusted_income
+        - Contributions use the year's own allowance first, then unused
+          allowance from the previous 3 years oldest first (FIFO); what a
+          year draws is no longer available to later years
+
+        Args:
+            user_id: User UUID
+            last_year: Start year of the last tax year to include
+
+        Returns:
+            Dict mapping tax year (YYYY/YY) to entry with tax_year,
+            total_contributions, adjusted_income, annual_allowance, tapered,
+            mpaa_applies, carry_forward, total_carry_forward, total_available,
+            allowance_used, allowance_remaining, excess, carry_forward_used
+        """
+        tracking_result = await self.db.execute(
+            select(
+                AnnualAllowanceTracking.tax_year,
+                AnnualAllowanceTracking.total_contributions,
+                AnnualAllowanceTracking.adjusted_income
+            ).where(AnnualAllowanceTracking.user_id == user_id)
+        )
+        tracking = {
+            _tax_year_start(year): (Decimal(str(total or 0)), adjusted_income)
+            for year, total, adjusted_income in tracking_result.all()
+        }
+
+        contributions_result = await self.db.execute(
+            select(
+                UKPensionContribution.tax_year,
+                func.sum(
+                    func.coalesce(UKPensionContribution.employee_contribution, 0) +
+                    func.coalesce(UKPensionContribution.employer_contribution, 0) +
+                    func.coalesce(UKPensionContribution.personal_contribution, 0)
+                )
+            )
+            .join(UKPension)
+            .where(
+                and_(
+                    UKPension.user_id == user_id,
+                    UKPension.is_deleted == False
+                )
+            )
+            .group_by(UKPensionContribution.tax_year)
+        )
+        contributions = {
+            _tax_year_start(year): Decimal(str(total or 0))
+            for year, total in contributions_result.all()
+        }
+
+        mpaa_result = await self.db.execute(
+            select(UKPension.mpaa_date).where(
+                and_(
+                    UKPension.user_id == user_id,
+                    UKPension.mpaa_triggered == True,
+                    UKPension.is_deleted == False
+                )
+            )
+        )
+        mpaa_dates = mpaa_result.scalars().all()
+
+        # MPAA with no recorded date applies to every year
+        mpaa_from = None
+        if mpaa_dates:
+            mpaa_from = min(
+                _tax_year_of(mpaa_date) if mpaa_date else float('-inf')
+                for mpaa_date in mpaa_dates
+            )
+
+        first_year = min(
+            [last_year - self.CARRY_FORWARD_YEARS, *tracking, *contributions]
+        )
+
+        ledger = {}
+        unused_by_year: Dict[int, Decimal] = {}
+
+        for year in range(first_year, last_year + 1):
+            # Unused allowance expires after the look-back period
+            for expired in [y for y in unused_by_year if y < year - self.CARRY_FORWARD_YEARS]:
+                del unused_by_year[expired]
+
+            carry_forward = {
+                _tax_year_label(y): amount
+                for y, amount in sorted(unused_by_year.items()) if amount > 0
+            }
+            total_carry_forward = sum(carry_forward.values(), Decimal('0.00'))
+
+            if year in contributions:
+                total_contributions = contributions[year]
+            elif year in tracking:
+                total_contributions = tracking[year][0]
+            else:
+                total_contributions = Decimal('0.00')
+
+            adjusted_income = tracking.get(year, (None, None))[1]
+            adjusted_income = Decimal(str(adjusted_income)) if adjusted_income is not None else Decimal('0.00')
+            mpaa_applies = mpaa_from is not None and year >= mpaa_from
+
+            annual_allowance = self.calculate_annual_allowance(
+                user_id,
+                _tax_year_label(year),
+                adjusted_income,
+                mpaa_applies
+            )
+
+            total_available = annual_allowance + total_carry_forward
+
+            # Draw carry forward oldest first for contributions over the allowance
+            needed = max(Decimal('0.00'), total_contributions - annual_allowance)
+            carry_forward_used = Decimal('0.00')
+            for y in sorted(unused_by_year):
+                drawn = min(unused_by_year[y], needed)
+                unused_by_year[y] -= drawn
+                needed -= drawn
+                carry_forward_used += drawn
+            unused_by_year[year] = max(Decimal('0.00'), annual_allowance - total_contributions)
+
+            ledger[_tax_year_label(year)] = {
+                'tax_year': _tax_year_label(year),
+                'total_contributions': total_contributions,
+                'adjusted_income': adjusted_income,
+                'annual_allowance': annual_allowance,
+                'tapered': not mpaa_applies and annual_allowance < self.STANDARD_ANNUAL_ALLOWANCE,
+                'mpaa_applies': mpaa_applies,
+                'carry_forward': carry_forward,
+                'total_carry_forward': total_carry_forward,
+                'total_available': total_available,
+                'allowance_used': min(total_contributions, total_available),
+                'allowance_remaining': max(Decimal('0.00'), total_available - total_contributions),
+                'excess': max(Decimal('0.00'), total_contributions - total_available),
+                'carry_forward_used': carry_forward_used
+            }
+
+        logger.info(
+            f"Built annual allowance ledger for user {user_id}: "
+            f"{_tax_year_label(first_year)} to {_tax_year_label(last_year)}"
+        )
+
+        return ledger
+
     async def calculate_carry_forward(
         self,
         user_id: UUID,
@@ -137,7 +377,7 @@ class AnnualAllowanceService:
             tax_year: Current tax year (format: YYYY/YY)
 
         Returns:
-            Dict mapping tax year to unused allowance:
+            Dict mapping tax year to unused allowance, oldest first:
             {
                 "2021/22": Decimal("10000.00"),
                 "2022/23": Decimal("5000.00"),
@@ -146,63 +386,21 @@ class AnnualAllowanceService:
 
         Business Logic:
             - Look back 3 previous tax years
-            - For each year: unused = annual_allowance - contributions
+            - For each year: unused = annual_allowance - contributions,
+              less carry forward drawn by later years (FIFO)
             - Only carry forward if positive unused amount
-            - Use FIFO: oldest unused allowance first
+            - Years with no contributions have their full allowance unused
         """
         logger.info(f"Calculating carry forward for user {user_id}, tax year {tax_year}")
 
-        # Parse current tax year to get previous years
-        # Format: YYYY/YY -> e.g., "2024/25"
-        year_parts = tax_year.split('/')
-        if len(year_parts) != 2:
+        if _tax_year_start(tax_year) is None:
             logger.error(f"Invalid tax year format: {tax_year}")
             return {}
 
-        current_year_start = int(year_parts[0])
-
-        # Calculate previous 3 tax years
-        previous_years = []
-        for i in range(1, 4):
-            prev_year_start = current_year_start - i
-            prev_year_end = str(prev_year_start + 1)[-2:]
-            prev_tax_year = f"{prev_year_start}/{prev_year_end}"
-            previous_years.append(prev_tax_year)
-
-        # Reverse to get oldest first (FIFO)
-        previous_years.reverse()
-
-        logger.info(f"Looking back at tax years: {previous_years}")
+        ledger = await self.get_allowance_ledger(user_id, tax_year)
+        carry_forward = ledger[tax_year]['carry_forward']
 
-        carry_forward = {}
-
-        for prev_year in previous_years:
-            # Get AA tracking for this year
-            result = await self.db.execute(
-                select(AnnualAllowanceTracking).where(
-                    and_(
-                        AnnualAllowanceTracking.user_id == user_id,
-                        AnnualAllowanceTracking.tax_year == prev_year
-                    )
-                )
-            )
-            aa_tracking = result.scalar_one_or_none()
-
-            if aa_tracking:
-                # Calculate unused allowance
-                unused = aa_tracking.annual_allowance_limit - aa_tracking.allowance_used
-
-                if unused > 0:
-                    carry_forward[prev_year] = unused
-                    logger.debug(f"Carry forward from {prev_year}: {unused}")
-            else:
-                # No tracking record - assume full allowance available
-                # (user may not have contributed in that year)
-                carry_forward[prev_year] = self.STANDARD_ANNUAL_ALLOWANCE
-                logger.debug(f"No tracking for {prev_year} - assuming full allowance available")
-
-        total_carry_forward = sum(carry_forward.values())
-        logger.info(f"Total carry forward available: {total_carry_forward}")
+        logger.info(f"Total carry forward available: {ledger[tax_year]['total_carry_forward']}")
 
         return carry_forward
 
@@ -225,90 +423,38 @@ class AnnualAllowanceService:
             tax_year: Tax year (format: YYYY/YY)
 
         Returns:
-            Dict with:
+            Dict with the ledger entry for the year:
                 - tax_year: str
                 - total_contributions: Decimal
                 - annual_allowance: Decimal
                 - carry_forward: Dict[str, Decimal]
                 - total_carry_forward: Decimal
+                - total_available: Decimal
                 - allowance_used: Decimal
                 - allowance_remaining: Decimal
                 - excess: Decimal (0 if no excess)
                 - mpaa_applies: bool
                 - tapered: bool
+            plus the AnnualAllowanceResponse field names
+            (annual_allowance_limit, carry_forward_available,
+            excess_contributions, tapered_allowance)
         """
         logger.info(f"Calculating allowance usage for user {user_id}, tax year {tax_year}")
 
-        # Get all contributions for this tax year
-        contributions_result = await self.db.execute(
-            select(UKPensionContribution)
-            .join(UKPension)
-            .where(
-                and_(
-                    UKPension.user_id == user_id,
-                    UKPensionContribution.tax_year == tax_year,
-                    UKPension.is_deleted == False
-                )
-            )
-        )
-        contributions = contributions_result.scalars().all()
-
-        # Calculate total contributions
-        total_contributions = Decimal('0.00')
-        for contribution in contributions:
-            total_contributions += contribution.total_contribution
+        ledger = await self.get_allowance_ledger(user_id, tax_year)
+        usage = dict(ledger[tax_year])
 
-        # Check if MPAA applies (any pension has mpaa_triggered)
-        mpaa_result = await self.db.execute(
-            select(UKPension).where(
-                and_(
-                    UKPension.user_id == user_id,
-                    UKPension.mpaa_triggered == True,
-                    UKPension.is_deleted == False
-                )
-            )
-        )
-        mpaa_triggered = mpaa_result.scalar_one_or_none() is not None
-
-        # For now, assume no tapering (would require user income data)
-        # In production, this would fetch from user income records
-        adjusted_income = Decimal('0.00')
-        tapered = False
-
-        # Calculate annual allowance
-        annual_allowance = self.calculate_annual_allowance(
-            user_id,
-            tax_year,
-            adjusted_income,
-            mpaa_triggered
-        )
-
-        # Calculate carry forward
-        carry_forward = await self.calculate_carry_forward(user_id, tax_year)
-        total_carry_forward = sum(carry_forward.values())
-
-        # Calculate usage
-        total_available = annual_allowance + total_carry_forward
-        allowance_used = min(total_contributions, total_available)
-        allowance_remaining = max(Decimal('0.00'), total_available - total_contributions)
-        excess = max(Decimal('0.00'), total_contributions - total_available)
-
-        usage = {
-            "tax_year": tax_year,
-            "total_contributions": total_contributions,
-            "annual_allowance_limit": annual_allowance,
-            "carry_forward_available": carry_forward,
-            "allowance_used": allowance_used,
-            "allowance_remaining": allowance_remaining,
-            "excess_contributions": excess,
-            "mpaa_applies": mpaa_triggered,
-            "tapered_allowance": tapered
-        }
+        usage.update({
+            "annual_allowance_limit": usage['annual_allowance'],
+            "carry_forward_available": usage['carry_forward'],
+            "excess_contributions": usage['excess'],
+            "tapered_allowance": usage['tapered']
+        })
 
         logger.info(
-            f"Allowance usage calculated: contributions={total_contributions}, "
-            f"allowance={annual_allowance}, used={allowance_used}, "
-            f"remaining={allowance_remaining}, excess={excess}"
+            f"Allowance usage calculated: contributions={usage['total_contributions']}, "
+            f"allowance={usage['annual_allowance']}, used={usage['allowance_used']}, "
+            f"remaining={usage['allowance_remaining']}, excess={usage['excess']}"
         )
 
         return usage
@@ -399,6 +545,9 @@ class AnnualAllowanceService:
         # Calculate current usage
         usage = await self.calculate_allowance_usage(user_id, tax_year)
 
+        # JSON column: store amounts as strings to keep Decimal precision
+        carry_forward = {year: str(amount) for year, amount in usage['carry_forward'].items()}
+
         # Check if tracking record exists
         result = await self.db.execute(
             select(AnnualAllowanceTracking).where(
@@ -414,7 +563,7 @@ class AnnualAllowanceService:
             # Update existing record
             tracking.total_contributions = usage['total_contributions']
             tracking.annual_allowance_limit = usage['annual_allowance']
-            tracking.carry_forward_available = usage['carry_forward']
+            tracking.carry_forward_available = carry_forward
             tracking.tapered_allowance = usage['tapered']
             tracking.allowance_used = usage['allowance_used']
             tracking.allowance_remaining = usage['allowance_remaining']
@@ -431,7 +580,7 @@ class AnnualAllowanceService:
                 tax_year=tax_year,
                 total_contributions=usage['total_contributions'],
                 annual_allowance_limit=usage['annual_allowance'],
-                carry_forward_available=usage['carry_forward'],
+                carry_forward_available=carry_forward,
                 tapered_allowance=usage['tapered'],
                 adjusted_income=None,
                 allowance_used=usage['allowance_used'],
@@ -446,8 +595,83 @@ class AnnualAllowanceService:
         await self.db.commit()
         await self.db.refresh(tracking)
 
+        # Tracking rows are ledger inputs for years without contributions
+        await self.invalidate_cache(user_id)
+
         return tracking
 
+    async def _get_cached_ledger(self, cache_key: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Get cached allowance ledger from Redis.
+
+        Args:
+            cache_key: Cache key
+
+        Returns:
+            Cached ledger or None
+        """
+        try:
+            cached_data = await redis_client.get(cache_key)
+
+            if cached_data:
+                logger.debug(f"Cache hit for {cache_key}")
+                return json.loads(cached_data, object_hook=_restore_decimals)
+
+            logger.debug(f"Cache miss for {cache_key}")
+            return None
+
+        except Exception as e:
+            logger.warning(f"Failed to get cached ledger: {e}")
+            return None
+
+    async def _cache_ledger(self, cache_key: str, ledger: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Cache allowance ledger in Redis.
+
+        Args:
+            cache_key: Cache key
+            ledger: Ledger to cache
+        """
+        try:
+            await redis_client.set(
+                cache_key,
+                json.dumps(ledger, default=str),
+                expire=self.CACHE_TTL
+            )
+
+        except Exception as e:
+            logger.warning(f"Failed to cache ledger: {e}")
+
+    @classmethod
+    def cache_key(cls, user_id: UUID) -> str:
+        """
+        Get the annual allowance ledger cache key for a user.
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            Redis key
+        """
+        return f"pension:allowance:{user_id}"
+
+    @classmethod
+    async def invalidate_cache(cls, user_id: UUID) -> None:
+        """
+        Invalidate the cached annual allowance ledger for a user.
+
+        Call after a user's pensions, contributions or tracking records change.
+
+        Args:
+            user_id: User UUID
+        """
+        try:
+            await redis_client.delete(cls.cache_key(user_id))
+            logger.info(f"Invalidated annual allowance ledger cache for user {user_id}")
+
+        except Exception as e:
+            logger.warning(f"Failed to invalidate annual allowance ledger cache: {e}")
+
 
 # Factory function
 def get_annual_allowance_service(db: AsyncSession) -> AnnualAllowanceService:
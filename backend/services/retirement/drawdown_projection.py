@@ -0,0 +1,235 @@
+"""
+Drawdown Projection Kernel
+
+Closed-form, vectorized pension pot calculations shared by retirement income
+projections and retirement age scenarios:
+- Pot value at retirement with annual contributions (future value of annuity)
+- Pot value paths over a horizon, sharing compounding factors across years
+- Years until a drawdown pot is depleted (growing annuity algebra)
+- Drawdown grids over start age x drawdown rate x growth rate
+
+All functions take NumPy-broadcastable inputs with rates as decimal
+fractions (0.05 for 5%) and return float arrays. Callers convert final
+display figures to Decimal and round.
+
+Depletion model:
+    With withdrawal W growing at rate i and the pot growing at rate g, the
+    pot is exhausted in year k (k = 0, 1, ...) when the present value of
+    withdrawals 0..k reaches the pot:
+
+        W * sum_{j=0..k} q^j >= P * c,   q = (1 + i) / (1 + g)
+
+    where c = 1 if withdrawals are taken at the start of the year (before
+    growth) and c = 1 + g if taken at the end (after growth). The geometric
+    sum is inverted with logarithms, so no year-by-year simulation is needed.
+
+Performance:
+- O(1) per scenario; a full grid is a handful of NumPy array operations
+"""
+
+import numpy as np
+
+# Tolerance for treating q as 1 and for integer boundaries in ceil()
+_EPSILON = 1e-12
+_BOUNDARY_TOLERANCE = 1e-9
+
+
+def project_pot(
+    pot,
+    annual_contribution,
+    growth_rate,
+    years
+) -> np.ndarray:
+    """
+    Project pot value after a number of years of growth and contributions.
+
+    Each year the pot grows, then the annual contribution is added.
+
+    Args:
+        pot: Current pot value
+        annual_contribution: Contribution added at the end of each year
+        growth_rate: Annual growth rate (decimal fraction)
+        years: Number of years (non-negative integers)
+
+    Returns:
+        Projected pot value(s)
+    """
+    pot, annual_contribution, growth_rate, years = np.broadcast_arrays(
+        *(np.asarray(value, dtype=float) for value in (pot, annual_contribution, growth_rate, years))
+    )
+
+    growth_factor = (1.0 + growth_rate) ** years
+    no_growth = np.abs(growth_rate) < _EPSILON
+    annuity_factor = np.where(
+        no_growth,
+        years,
+        (growth_factor - 1.0) / np.where(no_growth, 1.0, growth_rate)
+    )
+
+    return pot * growth_factor + annual_contribution * annuity_factor
+
+
+def project_pot_path(
+    pot,
+    annual_contribution,
+    growth_rates,
+    max_years: int
+) -> np.ndarray:
+    """
+    Project pot value at every year from 0 to max_years for each growth rate.
+
+    Compounding factors are built once by cumulative product and reused for
+    every year, so projecting to many retirement ages costs one pass over
+    the horizon rather than one power per age.
+
+    Args:
+        pot: Current pot value
+        annual_contribution: Contribution added at the end of each year
+        growth_rates: Sequence of annual growth rates (decimal fractions)
+        max_years: Last year to project to
+
+    Returns:
+        Array shaped (growth rates, max_years + 1); column n is the pot after
+        n years, matching project_pot
+    """
+    growth = np.asarray(growth_rates, dtype=float).reshape(-1, 1)
+
+    # growth_factors[:, n] = (1 + g)^n
+    growth_factors = np.ones((growth.shape[0], max_years + 1))
+    growth_factors[:, 1:] = np.cumprod(np.broadcast_to(1.0 + growth, (growth.shape[0], max_years)), axis=1)
+
+    # annuity_factors[:, n] = sum_{j<n} (1 + g)^j
+    annuity_factors = np.zeros_like(growth_factors)
+    annuity_factors[:, 1:] = np.cumsum(growth_factors[:, :-1], axis=1)
+
+    return pot * growth_factors + annual_contribution * annuity_factors
+
+
+def depletion_years(
+    pot,
+    withdrawal,
+    growth_rate,
+    withdrawal_growth_rate=0.0,
+    withdraw_in_advance: bool = True
+) -> np.ndarray:
+    """
+    Year index (0-based) in which a drawdown pot is exhausted.
+
+    Args:
+        pot: Pot value at the start of drawdown
+        withdrawal: First year's withdrawal
+        growth_rate: Annual investment growth rate (decimal fraction)
+        withdrawal_growth_rate: Annual increase in withdrawals, e.g. inflation
+        withdraw_in_advance: True to withdraw at the start of each year
+                             (before growth), False at the end (after growth)
+
+    Returns:
+        Float array of year indices; inf where the pot is never exhausted
+    """
+    pot, withdrawal, growth_rate, withdrawal_growth_rate = np.broadcast_arrays(
+        *(np.asarray(value, dtype=float) for value in (pot, withdrawal, growth_rate, withdrawal_growth_rate))
+    )
+
+    has_withdrawal = withdrawal > 0
+    safe_withdrawal = np.where(has_withdrawal, withdrawal, 1.0)
+
+    timing = 1.0 if withdraw_in_advance else 1.0 + growth_rate
+    # Withdrawals (in first-year units, discounted) needed to exhaust the pot
+    ratio = pot * timing / safe_withdrawal
+
+    q = (1.0 + withdrawal_growth_rate) / (1.0 + growth_rate)
+    log_q = np.log(np.where(np.abs(q - 1.0) < _EPSILON, 2.0, q))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Smallest n = k + 1 with (q^n - 1) / (q - 1) >= ratio
+        growing = np.log1p(ratio * (q - 1.0)) / log_q
+        shrinking_target = 1.0 - ratio * (1.0 - q)
+        shrinking = np.where(
+            shrinking_target > 0,
+            np.log(np.where(shrinking_target > 0, shrinking_target, 1.0)) / log_q,
+            np.inf
+        )
+
+    terms = np.where(
+        np.abs(q - 1.0) < _EPSILON,
+        ratio,
+        np.where(q > 1.0, growing, shrinking)
+    )
+    years = np.maximum(np.ceil(terms - _BOUNDARY_TOLERANCE) - 1.0, 0.0)
+
+    # First withdrawal alone exhausts the pot
+    years = np.where(ratio <= 1.0, 0.0, years)
+
+    # Without withdrawals only an empty pot counts as exhausted
+    return np.where(has_withdrawal, years, np.where(pot <= 0, 0.0, np.inf))
+
+
+def depletion_ages(
+    start_age,
+    pot,
+    withdrawal,
+    growth_rate,
+    life_expectancy,
+    withdrawal_growth_rate=0.0,
+    withdraw_in_advance: bool = True
+) -> np.ndarray:
+    """
+    Age at which a drawdown pot is exhausted, if before life expectancy.
+
+    Args:
+        start_age: Age when drawdown starts
+        pot: Pot value at the start of drawdown
+        withdrawal: First year's withdrawal
+        growth_rate: Annual investment growth rate (decimal fraction)
+        life_expectancy: Age drawdown is modelled to
+        withdrawal_growth_rate: Annual increase in withdrawals
+        withdraw_in_advance: Withdrawal timing (see depletion_years)
+
+    Returns:
+        Float array of ages; nan where the pot lasts to life expectancy
+    """
+    ages = np.asarray(start_age, dtype=float) + depletion_years(
+        pot, withdrawal, growth_rate, withdrawal_growth_rate, withdraw_in_advance
+    )
+    return np.where(ages < np.asarray(life_expectancy, dtype=float), ages, np.nan)
+
+
+def drawdown_grid(
+    pot: float,
+    start_ages,
+    drawdown_rates,
+    growth_rates,
+    inflation_rate: float,
+    life_expectancy: int
+) -> dict:
+    """
+    Evaluate drawdown for every start age x drawdown rate x growth rate.
+
+    Withdrawals are taken at the start of each year and rise with inflation.
+
+    Args:
+        pot: Pot value at the start of drawdown
+        start_ages: Sequence of start ages
+        drawdown_rates: Sequence of initial drawdown rates (decimal fractions)
+        growth_rates: Sequence of growth rates (decimal fractions)
+        inflation_rate: Annual withdrawal increase (decimal fraction)
+        life_expectancy: Age drawdown is modelled to
+
+    Returns:
+        Dict of arrays shaped (ages, rates, growth rates):
+            - annual_income: First year's income
+            - depletion_age: Age pot is exhausted (nan if it lasts)
+    """
+    ages = np.asarray(start_ages, dtype=float)[:, None, None]
+    rates = np.asarray(drawdown_rates, dtype=float)[None, :, None]
+    growth = np.asarray(growth_rates, dtype=float)[None, None, :]
+
+    annual_income = np.broadcast_to(pot * rates, np.broadcast_shapes(ages.shape, rates.shape, growth.shape))
+
+    return {
+        'annual_income': annual_income,
+        'depletion_age': depletion_ages(
+            ages, pot, annual_income, growth, life_expectancy,
+            withdrawal_growth_rate=inflation_rate
+        )
+    }
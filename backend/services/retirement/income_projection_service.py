@@ -22,23 +22,31 @@ Business Rules:
 Performance:
 - Target: <300ms for simple projections
 - Target: <1s for complex scenarios with year-by-year modeling
+- Retirement inputs (pensions with DB details, state pension forecast) are
+  loaded with a fixed number of queries and reused within a service instance
+- Pot depletion is solved in closed form (see drawdown_projection), and
+  drawdown grids are evaluated in a single NumPy pass
 - Async database operations throughout
 """
 
 import logging
 import uuid
 from datetime import date, datetime
-from decimal import Decimal
-from typing import Optional, Dict, Any, List
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Optional, Dict, Any, List, Sequence
 from uuid import UUID
 
+import numpy as np
+
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from models.retirement import (
-    UKPension, UKPensionDBDetails, StatePensionForecast,
+    UKPension, StatePensionForecast,
     RetirementProjection, PensionType
 )
+from services.retirement.drawdown_projection import depletion_ages, drawdown_grid
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +68,62 @@ class IncomeProjectionService:
             db: Database session for operations
         """
         self.db = db
+        self._inputs: Dict[UUID, Dict[str, Any]] = {}
+
+    async def get_retirement_inputs(self, user_id: UUID) -> Dict[str, Any]:
+        """
+        Get the user's retirement inputs, loading them on first use.
+
+        Loads every active pension with its DB details eagerly and the state
+        pension forecast (three queries regardless of the number of
+        pensions). The bundle is reused for the lifetime of this service
+        instance, so gap analysis and projection creation share one load.
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            Dict with:
+                - pensions: List[UKPension] (db_details loaded)
+                - state_pension: Optional[StatePensionForecast]
+        """
+        inputs = self._inputs.get(user_id)
+        if inputs is not None:
+            return inputs
+
+        pensions_result = await self.db.execute(
+            select(UKPension)
+            .options(selectinload(UKPension.db_details))
+            .where(
+                and_(
+                    UKPension.user_id == user_id,
+                    UKPension.is_deleted == False
+                )
+            )
+        )
+
+        sp_result = await self.db.execute(
+            select(StatePensionForecast).where(
+                StatePensionForecast.user_id == user_id
+            )
+        )
+
+        inputs = {
+            "pensions": pensions_result.scalars().all(),
+            "state_pension": sp_result.scalar_one_or_none()
+        }
+        self._inputs[user_id] = inputs
+
+        return inputs
+
+    def invalidate_retirement_inputs(self, user_id: UUID) -> None:
+        """
+        Drop the cached retirement inputs for a user.
+
+        Args:
+            user_id: User UUID
+        """
+        self._inputs.pop(user_id, None)
 
     def project_dc_pension_value(
         self,
@@ -135,7 +199,9 @@ class IncomeProjectionService:
         """
         Calculate drawdown income and model pot depletion.
 
-        Simulates year-by-year drawdown with investment growth and inflation.
+        Withdrawals are taken at the start of each year and rise with
+        inflation; the remaining pot grows. The depletion age is solved in
+        closed form rather than simulated year by year.
 
         Args:
             pot_value: Initial pension pot value
@@ -167,36 +233,25 @@ class IncomeProjectionService:
         annual_income = pot_value * (drawdown_rate / Decimal('100'))
         monthly_income = annual_income / Decimal('12')
 
-        # Model pot depletion year by year
-        remaining_pot = pot_value
-        current_withdrawal = annual_income
-        current_age = start_age
-
-        growth_decimal = growth_rate / Decimal('100')
-        inflation_decimal = inflation_rate / Decimal('100')
-
-        while current_age < life_expectancy:
-            # Take withdrawal at start of year
-            remaining_pot -= current_withdrawal
-
-            # Check if depleted
-            if remaining_pot <= Decimal('0'):
-                logger.info(f"Pot depleted at age {current_age}")
-                return {
-                    "annual_income": annual_income,
-                    "monthly_income": monthly_income,
-                    "depletion_age": current_age,
-                    "pot_lasts": False,
-                    "years_lasting": current_age - start_age
-                }
-
-            # Apply investment growth
-            remaining_pot *= (Decimal('1') + growth_decimal)
-
-            # Increase withdrawal with inflation
-            current_withdrawal *= (Decimal('1') + inflation_decimal)
+        depletion_age = depletion_ages(
+            start_age,
+            float(pot_value),
+            float(annual_income),
+            float(growth_rate / Decimal('100')),
+            life_expectancy,
+            withdrawal_growth_rate=float(inflation_rate / Decimal('100'))
+        )
 
-            current_age += 1
+        if not np.isnan(depletion_age):
+            depletion_age = int(depletion_age)
+            logger.info(f"Pot depleted at age {depletion_age}")
+            return {
+                "annual_income": annual_income,
+                "monthly_income": monthly_income,
+                "depletion_age": depletion_age,
+                "pot_lasts": False,
+                "years_lasting": depletion_age - start_age
+            }
 
         # Pot lasts until life expectancy
         logger.info(f"Pot lasts until life expectancy ({life_expectancy})")
@@ -208,6 +263,82 @@ class IncomeProjectionService:
             "years_lasting": life_expectancy - start_age
         }
 
+    def calculate_drawdown_grid(
+        self,
+        pot_value: Decimal,
+        start_ages: Sequence[int],
+        drawdown_rates: Sequence[Decimal],
+        growth_rates: Optional[Sequence[Decimal]] = None,
+        inflation_rate: Optional[Decimal] = None,
+        life_expectancy: int = DEFAULT_LIFE_EXPECTANCY
+    ) -> List[Dict[str, Any]]:
+        """
+        Calculate drawdown outcomes for every start age x drawdown rate x growth rate.
+
+        Same model as calculate_drawdown_income, evaluated for the whole grid
+        in one vectorized pass.
+
+        Args:
+            pot_value: Initial pension pot value
+            start_ages: Ages when drawdown starts
+            drawdown_rates: Annual drawdown rates (percentages)
+            growth_rates: Annual growth rates (percentages, default: [5%])
+            inflation_rate: Annual inflation rate (default: 2.5%)
+            life_expectancy: Maximum age to model to (default: 95)
+
+        Returns:
+            List of dicts (start age, then drawdown rate, then growth rate order):
+                - start_age: int
+                - drawdown_rate: Decimal
+                - growth_rate: Decimal
+                - annual_income: Decimal (rounded to pence)
+                - monthly_income: Decimal (rounded to pence)
+                - depletion_age: Optional[int]
+                - pot_lasts: bool
+                - years_lasting: int
+        """
+        if growth_rates is None:
+            growth_rates = [self.DEFAULT_GROWTH_RATE]
+        if inflation_rate is None:
+            inflation_rate = self.DEFAULT_INFLATION_RATE
+
+        logger.info(
+            f"Calculating drawdown grid: pot={pot_value}, {len(start_ages)} ages x "
+            f"{len(drawdown_rates)} rates x {len(growth_rates)} growth rates"
+        )
+
+        grid = drawdown_grid(
+            float(pot_value),
+            start_ages,
+            [float(rate / Decimal('100')) for rate in drawdown_rates],
+            [float(rate / Decimal('100')) for rate in growth_rates],
+            float(inflation_rate / Decimal('100')),
+            life_expectancy
+        )
+
+        pence = Decimal('0.01')
+        results = []
+        for a, start_age in enumerate(start_ages):
+            for r, drawdown_rate in enumerate(drawdown_rates):
+                annual_income = pot_value * (drawdown_rate / Decimal('100'))
+                for g, growth_rate in enumerate(growth_rates):
+                    depletion_age = grid['depletion_age'][a, r, g]
+                    pot_lasts = bool(np.isnan(depletion_age))
+                    depletion_age = None if pot_lasts else int(depletion_age)
+
+                    results.append({
+                        "start_age": start_age,
+                        "drawdown_rate": drawdown_rate,
+                        "growth_rate": growth_rate,
+                        "annual_income": annual_income.quantize(pence, rounding=ROUND_HALF_UP),
+                        "monthly_income": (annual_income / Decimal('12')).quantize(pence, rounding=ROUND_HALF_UP),
+                        "depletion_age": depletion_age,
+                        "pot_lasts": pot_lasts,
+                        "years_lasting": (life_expectancy if pot_lasts else depletion_age) - start_age
+                    })
+
+        return results
+
     def calculate_annuity_income(
         self,
         pot_value: Decimal,
@@ -280,28 +411,15 @@ class IncomeProjectionService:
             f"target_age={target_retirement_age}"
         )
 
-        # Get state pension forecast
-        sp_result = await self.db.execute(
-            select(StatePensionForecast).where(
-                StatePensionForecast.user_id == user_id
-            )
-        )
-        state_pension = sp_result.scalar_one_or_none()
+        inputs = await self.get_retirement_inputs(user_id)
+
+        state_pension = inputs['state_pension']
 
         state_pension_income = Decimal('0.00')
         if state_pension:
             state_pension_income = state_pension.estimated_annual_amount
 
-        # Get all pensions
-        pensions_result = await self.db.execute(
-            select(UKPension).where(
-                and_(
-                    UKPension.user_id == user_id,
-                    UKPension.is_deleted == False
-                )
-            )
-        )
-        pensions = pensions_result.scalars().all()
+        pensions = inputs['pensions']
 
         db_pension_income = Decimal('0.00')
         dc_drawdown_income = Decimal('0.00')
@@ -313,13 +431,8 @@ class IncomeProjectionService:
                 continue
 
             if pension.pension_type == PensionType.OCCUPATIONAL_DB:
-                # Get DB details
-                db_details_result = await self.db.execute(
-                    select(UKPensionDBDetails).where(
-                        UKPensionDBDetails.pension_id == pension.id
-                    )
-                )
-                db_details = db_details_result.scalar_one_or_none()
+                # DB details eagerly loaded with the pension
+                db_details = pension.db_details
 
                 if db_details and db_details.guaranteed_pension_amount:
                     db_pension_income += db_details.guaranteed_pension_amount
@@ -469,7 +582,7 @@ class IncomeProjectionService:
             f"age={target_retirement_age}, needed={annual_income_needed}"
         )
 
-        # Calculate income and gap
+        # Calculate income and gap (both read the same retirement inputs)
         income = await self.calculate_total_retirement_income(user_id, target_retirement_age)
         gap_analysis = await self.calculate_retirement_income_gap(
             user_id,
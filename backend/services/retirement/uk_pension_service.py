@@ -42,6 +42,7 @@ from models.retirement import (
     TaxReliefMethod, DBSchemeType, IndexationType,
     InvestmentStrategy
 )
+from services.retirement.annual_allowance_service import AnnualAllowanceService
 from utils.encryption import encrypt_value
 
 logger = logging.getLogger(__name__)
@@ -195,6 +196,9 @@ class UKPensionService:
         await self.db.commit()
         await self.db.refresh(pension)
 
+        # MPAA status feeds the annual allowance ledger
+        await AnnualAllowanceService.invalidate_cache(pension.user_id)
+
         logger.info(f"UK pension created successfully: id={pension.id}")
         return pension
 
@@ -252,6 +256,8 @@ class UKPensionService:
         await self.db.commit()
         await self.db.refresh(pension)
 
+        await AnnualAllowanceService.invalidate_cache(user_id)
+
         logger.info(f"Pension updated successfully: id={pension_id}")
         return pension
 
@@ -301,6 +307,8 @@ class UKPensionService:
 
         await self.db.commit()
 
+        await AnnualAllowanceService.invalidate_cache(user_id)
+
         logger.info(f"Pension soft deleted successfully: id={pension_id}")
         return {"success": True, "message": "Pension deleted successfully"}
 
@@ -387,6 +395,8 @@ class UKPensionService:
         await self.db.commit()
         await self.db.refresh(contribution)
 
+        await AnnualAllowanceService.invalidate_cache(user_id)
+
         logger.info(f"Contribution added successfully: id={contribution.id}")
 
         # TODO: Update Annual Allowance tracking automatically
@@ -8,9 +8,24 @@ Runs probabilistic retirement planning simulations to:
 - Model uncertainty in returns and inflation
 
 Uses numpy for efficient simulation.
+
+Caching:
+- Simulations use a fixed seed, so identical inputs always give identical
+  results. Results are cached by a hash of the inputs (quantized to pennies
+  and hundredths of a percent) and the simulation version.
+- An in-process LRU is checked first, then Redis; misses are simulated on
+  the compute pool.
+- Entries record how long the simulation took; hit rates and compute time
+  saved are available from monte_carlo_cache.stats().
 """
 
+import copy
+import hashlib
+import json
 import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
 import numpy as np
 from decimal import Decimal
 from typing import Dict, Any, Optional
@@ -18,8 +33,164 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from compute_pool import compute_pool
+from redis_client import redis_client
+
 logger = logging.getLogger(__name__)
 
+# Bump when simulation logic changes so cached results are not reused
+SIMULATION_VERSION = "1"
+SIMULATION_SEED = 42
+
+MONEY_QUANTUM = Decimal('0.01')
+PERCENT_QUANTUM = Decimal('0.01')
+
+
+class MonteCarloCache:
+    """
+    Two-tier cache for Monte Carlo results: in-process LRU, then Redis.
+
+    Keys are content hashes, so entries never go stale; Redis entries
+    expire to bound memory and the LRU evicts the least recently used.
+
+    Attributes:
+        memory_hits: Lookups served from the in-process LRU
+        redis_hits: Lookups served from Redis
+        misses: Lookups that required a simulation
+        compute_seconds_saved: Simulation time avoided by hits
+    """
+
+    KEY_PREFIX = "scenario:monte_carlo"
+    CACHE_TTL = 86400  # 24 hours
+    MAX_ENTRIES = 256
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        """Initialize an empty cache."""
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss counters."""
+        self.memory_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.compute_seconds = 0.0
+        self.compute_seconds_saved = 0.0
+
+    def clear(self) -> None:
+        """Drop in-process entries and counters (Redis entries are kept)."""
+        self._entries.clear()
+        self.reset_stats()
+
+    @classmethod
+    def cache_key(cls, inputs: Dict[str, Any]) -> str:
+        """
+        Get the cache key for normalized simulation inputs.
+
+        Returns:
+            Redis key
+        """
+        payload = json.dumps(
+            {'version': SIMULATION_VERSION, 'seed': SIMULATION_SEED, **inputs},
+            sort_keys=True,
+            default=str
+        )
+        digest = hashlib.sha256(payload.encode()).hexdigest()
+        return f"{cls.KEY_PREFIX}:{digest}"
+
+    async def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached entry (result, compute_seconds, computed_at).
+
+        Returns:
+            Entry dict or None on a miss
+        """
+        entry = self._entries.get(cache_key)
+        if entry is not None:
+            self._entries.move_to_end(cache_key)
+            self.memory_hits += 1
+            self.compute_seconds_saved += entry['compute_seconds']
+            return entry
+
+        try:
+            cached_data = await redis_client.get(cache_key)
+            if cached_data:
+                entry = json.loads(cached_data)
+                self._remember(cache_key, entry)
+                self.redis_hits += 1
+                self.compute_seconds_saved += entry['compute_seconds']
+                logger.debug(f"Cache hit for {cache_key}")
+                return entry
+        except Exception as e:
+            logger.error(f"Redis cache read error: {e}")
+
+        self.misses += 1
+        logger.debug(f"Cache miss for {cache_key}")
+        return None
+
+    async def set(self, cache_key: str, result: Dict[str, Any], compute_seconds: float) -> Dict[str, Any]:
+        """
+        Cache a simulation result.
+
+        Args:
+            cache_key: Key from cache_key()
+            result: Simulation result (JSON-serializable)
+            compute_seconds: Time the simulation took
+
+        Returns:
+            Stored entry
+        """
+        entry = {
+            'result': result,
+            'compute_seconds': compute_seconds,
+            'computed_at': datetime.utcnow().isoformat()
+        }
+        self.compute_seconds += compute_seconds
+        self._remember(cache_key, entry)
+
+        try:
+            await redis_client.set(cache_key, json.dumps(entry), expire=self.CACHE_TTL)
+            logger.debug(f"Cached data for {cache_key} (TTL: {self.CACHE_TTL}s)")
+        except Exception as e:
+            logger.error(f"Redis cache write error: {e}")
+            # Don't raise - caching failure shouldn't break the simulation
+
+        return entry
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache metrics.
+
+        Returns:
+            Dict with hit/miss counts, hit_rate (%), entries held in
+            process, total simulation time and simulation time saved (seconds)
+        """
+        hits = self.memory_hits + self.redis_hits
+        lookups = hits + self.misses
+        return {
+            'lookups': lookups,
+            'memory_hits': self.memory_hits,
+            'redis_hits': self.redis_hits,
+            'misses': self.misses,
+            'hit_rate': round(hits / lookups * 100, 2) if lookups else 0.0,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'compute_seconds': round(self.compute_seconds, 4),
+            'compute_seconds_saved': round(self.compute_seconds_saved, 4)
+        }
+
+    def _remember(self, cache_key: str, entry: Dict[str, Any]) -> None:
+        """Store an entry in the LRU, evicting the least recently used."""
+        self._entries[cache_key] = entry
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+# Global Monte Carlo cache instance (shared by all requests in the process)
+monte_carlo_cache = MonteCarloCache()
+
 
 class MonteCarloService:
     """Service for Monte Carlo retirement simulations."""
@@ -44,6 +215,8 @@ class MonteCarloService:
         """
         Run Monte Carlo simulation for retirement planning.
 
+        Results are cached per quantized inputs (see MonteCarloCache).
+
         Args:
             user_id: User UUID
             starting_pot: Starting pension pot value
@@ -65,8 +238,6 @@ class MonteCarloService:
             - confidence_intervals
             - worst_case, best_case, expected_value
         """
-        logger.info(f"Running {simulations} Monte Carlo simulations for user {user_id}")
-
         if simulations < 1000 or simulations > 50000:
             raise ValueError("Simulations must be between 1000 and 50000")
 
@@ -74,19 +245,68 @@ class MonteCarloService:
         if years_in_retirement <= 0:
             raise ValueError("Life expectancy must be after retirement age")
 
-        # Convert Decimal to float for numpy
-        starting_pot_float = float(starting_pot)
-        target_income_float = float(target_annual_income)
-        mean_return_float = float(mean_return) / 100.0
-        return_vol_float = float(return_volatility) / 100.0
-        mean_inflation_float = float(mean_inflation) / 100.0
-        inflation_vol_float = float(inflation_volatility) / 100.0
+        # Quantize so equivalent inputs share a cache entry; the simulation
+        # runs on the same quantized values so results depend only on the key
+        inputs = {
+            'starting_pot': Decimal(starting_pot).quantize(MONEY_QUANTUM),
+            'retirement_age': retirement_age,
+            'life_expectancy': life_expectancy,
+            'target_annual_income': Decimal(target_annual_income).quantize(MONEY_QUANTUM),
+            'mean_return': Decimal(mean_return).quantize(PERCENT_QUANTUM),
+            'return_volatility': Decimal(return_volatility).quantize(PERCENT_QUANTUM),
+            'mean_inflation': Decimal(mean_inflation).quantize(PERCENT_QUANTUM),
+            'inflation_volatility': Decimal(inflation_volatility).quantize(PERCENT_QUANTUM),
+            'simulations': simulations
+        }
+        cache_key = MonteCarloCache.cache_key(inputs)
+
+        entry = await monte_carlo_cache.get(cache_key)
+        if entry is None:
+            logger.info(f"Running {simulations} Monte Carlo simulations for user {user_id}")
+            started = time.perf_counter()
+            result = await compute_pool.run(
+                self._simulate_retirement,
+                float(inputs['starting_pot']),
+                retirement_age,
+                life_expectancy,
+                float(inputs['target_annual_income']),
+                float(inputs['mean_return']) / 100.0,
+                float(inputs['return_volatility']) / 100.0,
+                float(inputs['mean_inflation']) / 100.0,
+                float(inputs['inflation_volatility']) / 100.0,
+                simulations
+            )
+            entry = await monte_carlo_cache.set(cache_key, result, time.perf_counter() - started)
+
+        # Callers may modify the result; keep the cached copy intact
+        return copy.deepcopy(entry['result'])
+
+    def _simulate_retirement(
+        self,
+        starting_pot_float: float,
+        retirement_age: int,
+        life_expectancy: int,
+        target_income_float: float,
+        mean_return_float: float,
+        return_vol_float: float,
+        mean_inflation_float: float,
+        inflation_vol_float: float,
+        simulations: int
+    ) -> Dict[str, Any]:
+        """
+        Run the retirement simulations (CPU-bound; runs on the compute pool).
+
+        Rates are decimal fractions. Returns the run_monte_carlo_retirement
+        result dict.
+        """
+        years_in_retirement = life_expectancy - retirement_age
 
         # Run simulations
         final_pot_values = []
         success_count = 0
 
-        np.random.seed(42)  # For reproducibility in tests
+        # Own generator (not the global one) so concurrent runs stay reproducible
+        rng = np.random.RandomState(SIMULATION_SEED)
 
         for _ in range(simulations):
             pot = starting_pot_float
@@ -94,8 +314,8 @@ class MonteCarloService:
 
             for year in range(years_in_retirement):
                 # Generate random return and inflation
-                annual_return = np.random.normal(mean_return_float, return_vol_float)
-                annual_inflation = np.random.normal(mean_inflation_float, inflation_vol_float)
+                annual_return = rng.normal(mean_return_float, return_vol_float)
+                annual_inflation = rng.normal(mean_inflation_float, inflation_vol_float)
 
                 # Apply return
                 pot = pot * (1 + annual_return)
@@ -122,7 +342,7 @@ class MonteCarloService:
         percentiles = np.percentile(final_pot_values, [10, 25, 50, 75, 90])
 
         # Calculate safe withdrawal rate (rate that gives 90% success probability)
-        safe_withdrawal_rate = await self._calculate_safe_withdrawal_rate(
+        safe_withdrawal_rate = self._calculate_safe_withdrawal_rate(
             starting_pot_float,
             retirement_age,
             life_expectancy,
@@ -197,7 +417,8 @@ class MonteCarloService:
         mean_inflation_float = float(mean_inflation) / 100.0
         inflation_vol_float = float(inflation_volatility) / 100.0
 
-        safe_rate = await self._calculate_safe_withdrawal_rate(
+        safe_rate = await compute_pool.run(
+            self._calculate_safe_withdrawal_rate,
             starting_pot_float,
             retirement_age,
             life_expectancy,
@@ -211,7 +432,7 @@ class MonteCarloService:
 
         return Decimal(str(safe_rate))
 
-    async def _calculate_safe_withdrawal_rate(
+    def _calculate_safe_withdrawal_rate(
         self,
         starting_pot: float,
         retirement_age: int,
@@ -242,15 +463,15 @@ class MonteCarloService:
 
             # Run simulations with this rate
             success_count = 0
-            np.random.seed(42)
+            rng = np.random.RandomState(SIMULATION_SEED)
 
             for _ in range(simulations):
                 pot = starting_pot
                 withdrawal = annual_withdrawal
 
                 for year in range(years_in_retirement):
-                    annual_return = np.random.normal(mean_return, return_volatility)
-                    annual_inflation = np.random.normal(mean_inflation, inflation_volatility)
+                    annual_return = rng.normal(mean_return, return_volatility)
+                    annual_inflation = rng.normal(mean_inflation, inflation_volatility)
 
                     pot = pot * (1 + annual_return)
                     withdrawal = withdrawal * (1 + annual_inflation)
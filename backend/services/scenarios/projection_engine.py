@@ -0,0 +1,397 @@
+"""
+Scenario Projection Engine
+
+Vectorized multi-year projection of a user's finances, used by scenario
+execution. Each asset or debt is a bucket projected as an array over the
+horizon:
+- Cash savings (interest taxable), ISA/TFSA (tax-free), GIA (dividends taxable)
+- DC pensions (contributions until retirement, drawdown afterwards)
+- Property (grows with inflation) and debts (interest accrues, repayments reduce)
+
+Each year applies contributions, growth, inflation-linked salary and
+contribution increases, and the UK and SA tax schedules from UKTaxService and
+SATaxService (income tax, National Insurance, dividend tax) to salary, pension
+drawdown and investment income. Tax bands are held at 2024/25 levels, as in
+the tax services.
+
+All years are computed with NumPy array operations; there is no per-year
+Python loop. Taxes on investment income are computed from the pre-tax
+trajectory and their compounded cost is deducted from net worth.
+
+Bucket dicts:
+    name: Display name
+    kind: One of BUCKET_KINDS
+    country: 'UK' or 'SA' (tax schedule for its income)
+    balance: Current value (amount owed for debts)
+    annual_contribution: First-year contribution, increased with inflation
+                         each year; for debts a level annual repayment
+    growth_rate: Annual growth or interest rate (decimal fraction)
+    contribution_years: Optional number of years contributions last
+
+Performance:
+- 30 years x 10 buckets is a few dozen array operations (well under 1ms)
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from services.tax.uk_tax_service import UKTaxService
+from services.tax.sa_tax_service import SATaxService
+
+BUCKET_KINDS = ('cash', 'isa', 'tfsa', 'gia', 'pension', 'property', 'debt')
+
+# Share of a GIA's value paid out as (taxable) dividends each year
+DEFAULT_DIVIDEND_YIELD = 0.02
+
+# Share of UK pension drawdown that is taxable (25% is tax-free)
+UK_PENSION_TAXABLE_SHARE = 0.75
+
+DEFAULT_DRAWDOWN_RATE = 0.04
+
+_UK = UKTaxService
+_SA = SATaxService
+
+
+def _f(value) -> float:
+    """Decimal tax constant as float."""
+    return float(value)
+
+
+def uk_income_tax(income) -> np.ndarray:
+    """
+    UK income tax (England/Wales/NI, 2024/25) for an array of incomes.
+
+    Mirrors UKTaxService.calculate_income_tax, including the personal
+    allowance taper above £100,000.
+    """
+    income = np.maximum(np.asarray(income, dtype=float), 0.0)
+
+    taper = np.maximum(income - _f(_UK.PERSONAL_ALLOWANCE_TAPER_THRESHOLD), 0.0) / 2
+    personal_allowance = np.maximum(_f(_UK.PERSONAL_ALLOWANCE) - taper, 0.0)
+    taxable = np.maximum(income - personal_allowance, 0.0)
+
+    basic_band = _f(_UK.BASIC_RATE_UPPER - _UK.PERSONAL_ALLOWANCE)
+    additional_start = _f(_UK.HIGHER_RATE_UPPER - _UK.PERSONAL_ALLOWANCE)
+
+    at_basic = np.minimum(taxable, basic_band)
+    at_higher = np.clip(taxable - basic_band, 0.0, additional_start - basic_band)
+    at_additional = np.maximum(taxable - additional_start, 0.0)
+
+    return (
+        at_basic * _f(_UK.BASIC_RATE)
+        + at_higher * _f(_UK.HIGHER_RATE)
+        + at_additional * _f(_UK.ADDITIONAL_RATE)
+    )
+
+
+def uk_national_insurance(employment_income) -> np.ndarray:
+    """UK Class 1 employee National Insurance for an array of incomes."""
+    income = np.maximum(np.asarray(employment_income, dtype=float), 0.0)
+
+    threshold = _f(_UK.NI_PRIMARY_THRESHOLD)
+    upper = _f(_UK.NI_UPPER_EARNINGS_LIMIT)
+
+    main = np.clip(income - threshold, 0.0, upper - threshold)
+    additional = np.maximum(income - upper, 0.0)
+
+    return main * _f(_UK.NI_CLASS_1_RATE) + additional * _f(_UK.NI_CLASS_1_ADDITIONAL_RATE)
+
+
+def uk_dividend_tax(dividend_income, other_income) -> np.ndarray:
+    """
+    UK dividend tax for arrays of dividends and other income.
+
+    Mirrors UKTaxService.calculate_dividend_tax: dividends sit on top of
+    other taxable income after the dividend allowance.
+    """
+    dividends = np.maximum(np.asarray(dividend_income, dtype=float), 0.0)
+    other_income = np.maximum(np.asarray(other_income, dtype=float), 0.0)
+
+    taxable_dividends = np.maximum(dividends - _f(_UK.DIVIDEND_ALLOWANCE), 0.0)
+
+    taper = np.maximum(other_income - _f(_UK.PERSONAL_ALLOWANCE_TAPER_THRESHOLD), 0.0) / 2
+    personal_allowance = np.maximum(_f(_UK.PERSONAL_ALLOWANCE) - taper, 0.0)
+    start = np.maximum(other_income - personal_allowance, 0.0)
+    end = start + taxable_dividends
+
+    higher_threshold = _f(_UK.BASIC_RATE_UPPER - _UK.PERSONAL_ALLOWANCE)
+    additional_threshold = _f(_UK.HIGHER_RATE_UPPER - _UK.PERSONAL_ALLOWANCE)
+
+    at_basic = np.clip(np.minimum(end, higher_threshold) - start, 0.0, None)
+    at_higher = np.clip(
+        np.minimum(end, additional_threshold) - np.maximum(start, higher_threshold), 0.0, None
+    )
+    at_additional = np.clip(end - np.maximum(start, additional_threshold), 0.0, None)
+
+    return (
+        at_basic * _f(_UK.DIVIDEND_BASIC_RATE)
+        + at_higher * _f(_UK.DIVIDEND_HIGHER_RATE)
+        + at_additional * _f(_UK.DIVIDEND_ADDITIONAL_RATE)
+    )
+
+
+def sa_income_tax(income, ages=None) -> np.ndarray:
+    """
+    SA income tax (2024/25) after age rebates for an array of incomes.
+
+    Mirrors SATaxService.calculate_income_tax.
+
+    Args:
+        income: Gross taxable income
+        ages: Taxpayer ages for rebates (None: under 65)
+    """
+    income = np.maximum(np.asarray(income, dtype=float), 0.0)
+
+    tax = np.zeros_like(income)
+    for band in _SA.INCOME_TAX_BANDS:
+        lower = _f(band['lower'])
+        upper = np.inf if band['upper'] is None else _f(band['upper'])
+        tax += np.clip(np.minimum(income, upper) - lower, 0.0, None) * _f(band['rate'])
+
+    if ages is None:
+        rebate = _f(_SA.REBATE_UNDER_65)
+    else:
+        ages = np.asarray(ages, dtype=float)
+        rebate = np.select(
+            [ages < 65, ages < 75],
+            [_f(_SA.REBATE_UNDER_65), _f(_SA.REBATE_65_TO_74)],
+            _f(_SA.REBATE_75_PLUS)
+        )
+
+    return np.maximum(tax - rebate, 0.0)
+
+
+def sa_dividend_tax(dividend_income) -> np.ndarray:
+    """SA dividend withholding tax above the annual exemption."""
+    dividends = np.maximum(np.asarray(dividend_income, dtype=float), 0.0)
+    return np.maximum(dividends - _f(_SA.DIVIDEND_EXEMPTION), 0.0) * _f(_SA.DIVIDEND_TAX_RATE)
+
+
+def _grow_with_flows(opening: np.ndarray, growth: np.ndarray, flows: np.ndarray) -> np.ndarray:
+    """
+    Balances after each year of growth followed by a cash flow.
+
+    V_t = V_{t-1} * (1 + g) + flow_t, solved for all t at once as
+    V_t = G_t * (V_0 + sum_{k<=t} flow_k / G_k) with G_t = (1 + g)^t.
+
+    Args:
+        opening: Opening balances, shape (buckets,)
+        growth: Growth rates, shape (buckets,)
+        flows: End-of-year flows, shape (buckets, years)
+
+    Returns:
+        Balances, shape (buckets, years + 1), column 0 the opening balance
+    """
+    years = flows.shape[1]
+    factors = (1.0 + growth[:, None]) ** np.arange(years + 1)[None, :]
+    discounted = np.cumsum(flows / factors[:, 1:], axis=1)
+
+    balances = np.empty((opening.shape[0], years + 1))
+    balances[:, 0] = opening
+    balances[:, 1:] = factors[:, 1:] * (opening[:, None] + discounted)
+    return balances
+
+
+def _household_tax(
+    country: str,
+    earned: np.ndarray,
+    pension_income: np.ndarray,
+    interest: np.ndarray,
+    dividends: np.ndarray,
+    ages: Optional[np.ndarray]
+) -> Dict[str, np.ndarray]:
+    """Yearly tax by type for one country's income arrays."""
+    if country == 'SA':
+        return {
+            'income_tax': sa_income_tax(earned + pension_income + interest, ages),
+            'national_insurance': np.zeros_like(earned),
+            'dividend_tax': sa_dividend_tax(dividends)
+        }
+
+    other_income = earned + pension_income * UK_PENSION_TAXABLE_SHARE + interest
+    return {
+        'income_tax': uk_income_tax(other_income),
+        'national_insurance': uk_national_insurance(earned),
+        'dividend_tax': uk_dividend_tax(dividends, other_income)
+    }
+
+
+def project_buckets(
+    buckets: Sequence[Dict[str, Any]],
+    years: int,
+    inflation_rate: float,
+    salary: float = 0.0,
+    salary_country: str = 'UK',
+    start_age: Optional[int] = None,
+    retirement_age: int = 67,
+    drawdown_rate: float = DEFAULT_DRAWDOWN_RATE
+) -> Dict[str, Any]:
+    """
+    Project buckets, income and tax over a horizon.
+
+    Pension buckets receive contributions until retirement and then pay an
+    inflation-linked drawdown income of drawdown_rate x the pot at
+    retirement. Salary rises with inflation and stops at retirement.
+
+    The horizon is extended internally to reach retirement so that
+    pension_pot_at_retirement is always available; returned arrays cover
+    `years` years.
+
+    Args:
+        buckets: Bucket dicts (see module docstring)
+        years: Projection horizon in years
+        inflation_rate: Annual inflation (decimal fraction)
+        salary: Current annual earned income
+        salary_country: 'UK' or 'SA' tax schedule for the salary
+        start_age: Current age (None treated as 0, as in scenario baselines)
+        retirement_age: Age salary and pension contributions stop
+        drawdown_rate: Initial pension drawdown rate (decimal fraction)
+
+    Returns:
+        Dict with:
+            - balances: (buckets, years + 1) year-end values (debts positive)
+            - net_worth: (years + 1,) assets - debts - compounded investment tax
+            - real_net_worth: (years + 1,) net worth in today's money
+            - salary, pension_income: (years,) yearly income
+            - taxes: Dict of (years,) arrays - income_tax, national_insurance,
+              dividend_tax, investment_tax (part caused by investment income)
+              and total
+            - pension_pot_at_retirement, retirement_income: floats
+    """
+    age = start_age or 0
+    years_to_retirement = max(0, retirement_age - age)
+    horizon = max(years, years_to_retirement)
+
+    kinds = np.array([bucket['kind'] for bucket in buckets], dtype=object)
+    countries = np.array([bucket.get('country', 'UK') for bucket in buckets], dtype=object)
+    opening = np.array([float(bucket['balance']) for bucket in buckets], dtype=float)
+    growth = np.array([float(bucket.get('growth_rate', 0.0)) for bucket in buckets], dtype=float)
+    base_contribution = np.array([float(bucket.get('annual_contribution', 0.0)) for bucket in buckets], dtype=float)
+    contribution_years = np.array(
+        [bucket.get('contribution_years') or horizon for bucket in buckets], dtype=float
+    )
+
+    year_index = np.arange(1, horizon + 1, dtype=float)
+    inflation_factors = (1.0 + inflation_rate) ** (year_index - 1)
+    working = year_index <= years_to_retirement
+    is_pension = kinds == 'pension'
+    is_debt = kinds == 'debt'
+
+    # Contributions rise with inflation and debt repayments are level; both
+    # stop after their term, and pension contributions stop at retirement
+    active = year_index[None, :] <= contribution_years[:, None]
+    active = np.where(is_pension[:, None], active & working[None, :], active)
+    flows = np.where(
+        is_debt[:, None],
+        -base_contribution[:, None],
+        base_contribution[:, None] * inflation_factors[None, :]
+    ) * active
+
+    # First pass: pension pots at retirement, then drawdown flows from the
+    # following year
+    balances = _grow_with_flows(opening, growth, flows)
+    pots_at_retirement = balances[:, years_to_retirement]
+    drawing = ~working
+    drawdown_factors = (1.0 + inflation_rate) ** np.maximum(year_index - years_to_retirement - 1, 0)
+    planned_drawdown = np.where(
+        is_pension[:, None],
+        pots_at_retirement[:, None] * drawdown_rate * drawdown_factors[None, :] * drawing[None, :],
+        0.0
+    )
+    balances = _grow_with_flows(opening, growth, flows - planned_drawdown)
+
+    # Pots and debts cannot go below zero; drawdown is limited to what is left
+    floored = is_pension | is_debt
+    grown = np.maximum(balances[:, :-1], 0.0) * (1.0 + growth[:, None])
+    drawdown = np.minimum(planned_drawdown, grown)
+    balances = np.where(floored[:, None], np.maximum(balances, 0.0), balances)
+
+    # Yearly income by country
+    salary_path = float(salary) * inflation_factors * working
+    start_balances = np.maximum(balances[:, :-1], 0.0)
+    interest = np.where((kinds == 'cash')[:, None], start_balances * growth[:, None], 0.0)
+    dividends = np.where((kinds == 'gia')[:, None], start_balances * DEFAULT_DIVIDEND_YIELD, 0.0)
+    ages = age + year_index if start_age is not None else None
+
+    taxes = {key: np.zeros(horizon) for key in ('income_tax', 'national_insurance', 'dividend_tax', 'investment_tax')}
+    for country in ('UK', 'SA'):
+        in_country = countries == country
+        earned = salary_path if salary_country == country else np.zeros(horizon)
+        pension_income = drawdown[in_country].sum(axis=0)
+        country_interest = interest[in_country].sum(axis=0)
+        country_dividends = dividends[in_country].sum(axis=0)
+
+        if not (earned.any() or pension_income.any() or country_interest.any() or country_dividends.any()):
+            continue
+
+        with_investments = _household_tax(country, earned, pension_income, country_interest, country_dividends, ages)
+        without_investments = _household_tax(
+            country, earned, pension_income, np.zeros(horizon), np.zeros(horizon), ages
+        )
+        for key, values in with_investments.items():
+            taxes[key] += values
+        taxes['investment_tax'] += sum(with_investments.values()) - sum(without_investments.values())
+
+    taxes['total'] = taxes['income_tax'] + taxes['national_insurance'] + taxes['dividend_tax']
+
+    # Investment tax is paid from savings; its cost compounds at the average
+    # growth of the invested buckets
+    invested = np.isin(kinds, ('cash', 'isa', 'tfsa', 'gia'))
+    drag_growth = float(growth[invested].mean()) if invested.any() else 0.0
+    tax_drag = _grow_with_flows(np.zeros(1), np.array([drag_growth]), -taxes['investment_tax'][None, :])[0]
+
+    signed = np.where(is_debt[:, None], -balances, balances)
+    net_worth = signed.sum(axis=0) + tax_drag
+    real_net_worth = net_worth / (1.0 + inflation_rate) ** np.arange(horizon + 1)
+
+    pension_pot = float(pots_at_retirement[is_pension].sum())
+
+    return {
+        'balances': balances[:, :years + 1],
+        'net_worth': net_worth[:years + 1],
+        'real_net_worth': real_net_worth[:years + 1],
+        'salary': salary_path[:years],
+        'pension_income': drawdown.sum(axis=0)[:years],
+        'taxes': {key: values[:years] for key, values in taxes.items()},
+        'pension_pot_at_retirement': pension_pot,
+        'retirement_income': pension_pot * drawdown_rate
+    }
+
+
+def project_goals(
+    goals: Sequence[Dict[str, Any]],
+    years_to_target: Sequence[float],
+    growth_rate: float
+) -> List[Dict[str, Any]]:
+    """
+    Project each goal's own savings to its target date.
+
+    Args:
+        goals: Dicts with current_amount, target_amount, annual_contribution
+        years_to_target: Years until each goal's target date
+        growth_rate: Growth on goal savings (decimal fraction)
+
+    Returns:
+        One dict per goal with projected_amount, shortfall and achieved
+    """
+    if not goals:
+        return []
+
+    current = np.array([float(goal['current_amount']) for goal in goals])
+    target = np.array([float(goal['target_amount']) for goal in goals])
+    contribution = np.array([float(goal.get('annual_contribution', 0.0)) for goal in goals])
+    years = np.maximum(np.asarray(years_to_target, dtype=float), 0.0)
+
+    factor = (1.0 + growth_rate) ** years
+    annuity = years if abs(growth_rate) < 1e-12 else (factor - 1.0) / growth_rate
+    projected = current * factor + contribution * annuity
+
+    return [
+        {
+            'projected_amount': float(projected[i]),
+            'shortfall': float(max(target[i] - projected[i], 0.0)),
+            'achieved': bool(projected[i] >= target[i])
+        }
+        for i in range(len(goals))
+    ]
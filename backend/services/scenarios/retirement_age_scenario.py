@@ -7,22 +7,39 @@ Models different retirement ages (55-70) and their impact on:
 - Pot depletion age
 - Replacement ratio
 
-Uses time-value-of-money calculations with compound interest.
+Uses time-value-of-money calculations with compound interest. A range of
+retirement ages is modelled in one vectorized pass (see drawdown_projection).
+
+Sweeps (every retirement age x several growth rates) share compounding
+factors across ages and are cached in Redis per input hash; results depend
+only on the inputs, so entries simply expire.
 """
 
+import hashlib
+import json
 import logging
 from decimal import Decimal
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Sequence
 from uuid import UUID
 
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from redis_client import redis_client
+from services.retirement.drawdown_projection import project_pot_path, depletion_ages
+
 logger = logging.getLogger(__name__)
 
+MIN_RETIREMENT_AGE = 55
+MAX_RETIREMENT_AGE = 70
+DEFAULT_SWEEP_GROWTH_RATES = (Decimal('4.00'), Decimal('6.00'), Decimal('8.00'))
+
 
 class RetirementAgeScenarioService:
     """Service for retirement age scenario modeling."""
 
+    CACHE_TTL = 3600  # 1 hour
+
     def __init__(self, db: AsyncSession):
         """Initialize retirement age scenario service."""
         self.db = db
@@ -57,61 +74,212 @@ class RetirementAgeScenarioService:
             - pot_depletion_age
             - replacement_ratio
         """
-        logger.info(f"Modeling retirement age {retirement_age} for user {user_id}")
+        results = await self.model_retirement_ages(
+            user_id,
+            [retirement_age],
+            current_age,
+            current_pension_pot,
+            annual_contributions,
+            growth_rate,
+            life_expectancy
+        )
+        return results[0]
 
-        # Validate inputs
-        if retirement_age < 55 or retirement_age > 70:
-            raise ValueError("Retirement age must be between 55 and 70")
+    async def model_retirement_ages(
+        self,
+        user_id: UUID,
+        retirement_ages: Sequence[int],
+        current_age: int,
+        current_pension_pot: Decimal,
+        annual_contributions: Decimal,
+        growth_rate: Decimal = Decimal('6.00'),
+        life_expectancy: int = 90
+    ) -> List[Dict[str, Any]]:
+        """
+        Model several retirement ages in a single vectorized pass.
+
+        Args:
+            user_id: User UUID
+            retirement_ages: Target retirement ages (each 55-70)
+            current_age: Current age
+            current_pension_pot: Current pension pot value
+            annual_contributions: Annual pension contributions
+            growth_rate: Expected annual growth rate (%)
+            life_expectancy: Expected life expectancy
+
+        Returns:
+            List of scenario dicts (same keys as model_retirement_age),
+            in the order of retirement_ages
+        """
+        logger.info(f"Modeling retirement ages {list(retirement_ages)} for user {user_id}")
+
+        return self._model_grid(
+            retirement_ages,
+            [growth_rate],
+            current_age,
+            current_pension_pot,
+            annual_contributions,
+            life_expectancy
+        )[0]
+
+    async def sweep_retirement_ages(
+        self,
+        user_id: UUID,
+        current_age: int,
+        current_pension_pot: Decimal,
+        annual_contributions: Decimal,
+        growth_rates: Optional[Sequence[Decimal]] = None,
+        retirement_ages: Optional[Sequence[int]] = None,
+        life_expectancy: int = 90
+    ) -> Dict[str, Any]:
+        """
+        Model every retirement age against several growth assumptions.
+
+        Results are cached per input hash.
+
+        Args:
+            user_id: User UUID
+            current_age: Current age
+            current_pension_pot: Current pension pot value
+            annual_contributions: Annual pension contributions
+            growth_rates: Growth rates to compare (%, default: 4%, 6%, 8%)
+            retirement_ages: Ages to model (default: every age from
+                             max(55, current_age) to 70)
+            life_expectancy: Expected life expectancy
 
-        years_to_retirement = retirement_age - current_age
-        if years_to_retirement < 0:
+        Returns:
+            Dict with:
+            - current_age
+            - retirement_ages
+            - growth_rates
+            - scenarios: one dict per growth rate x retirement age (growth
+              rate order, then age order), with the model_retirement_age keys
+              plus growth_rate
+        """
+        if growth_rates is None:
+            growth_rates = DEFAULT_SWEEP_GROWTH_RATES
+        if retirement_ages is None:
+            retirement_ages = range(max(MIN_RETIREMENT_AGE, current_age), MAX_RETIREMENT_AGE + 1)
+        retirement_ages = sorted(set(retirement_ages))
+        growth_rates = list(growth_rates)
+
+        if not retirement_ages:
             raise ValueError("Retirement age must be in the future")
+        if not growth_rates:
+            raise ValueError("At least one growth rate is required")
 
-        # Project pension pot to retirement using compound interest
-        pension_pot = current_pension_pot
-        growth_factor = Decimal('1') + (growth_rate / Decimal('100'))
+        cache_key = self.cache_key(
+            current_age, current_pension_pot, annual_contributions,
+            growth_rates, retirement_ages, life_expectancy
+        )
+        cached = await self._get_from_cache(cache_key)
+        if cached is not None:
+            return cached
+
+        logger.info(
+            f"Sweeping {len(retirement_ages)} retirement ages x {len(growth_rates)} "
+            f"growth rates for user {user_id}"
+        )
 
-        for year in range(years_to_retirement):
-            # Apply growth
-            pension_pot *= growth_factor
-            # Add contribution
-            pension_pot += annual_contributions
+        grid = self._model_grid(
+            retirement_ages,
+            growth_rates,
+            current_age,
+            current_pension_pot,
+            annual_contributions,
+            life_expectancy
+        )
+
+        scenarios = []
+        for growth_rate, results in zip(growth_rates, grid):
+            for result in results:
+                scenarios.append({'growth_rate': float(growth_rate), **result})
+
+        sweep = {
+            'current_age': current_age,
+            'retirement_ages': retirement_ages,
+            'growth_rates': [float(rate) for rate in growth_rates],
+            'scenarios': scenarios
+        }
+
+        await self._save_to_cache(cache_key, sweep)
+        return sweep
+
+    def _model_grid(
+        self,
+        retirement_ages: Sequence[int],
+        growth_rates: Sequence[Decimal],
+        current_age: int,
+        current_pension_pot: Decimal,
+        annual_contributions: Decimal,
+        life_expectancy: int
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Model retirement ages x growth rates.
+
+        The pot is projected once per growth rate over the whole horizon and
+        read off at each retirement age.
+
+        Returns:
+            One list of scenario dicts per growth rate, in retirement_ages order
+        """
+        # Validate inputs
+        for retirement_age in retirement_ages:
+            if retirement_age < MIN_RETIREMENT_AGE or retirement_age > MAX_RETIREMENT_AGE:
+                raise ValueError("Retirement age must be between 55 and 70")
+            if retirement_age < current_age:
+                raise ValueError("Retirement age must be in the future")
+
+        ages = np.asarray(retirement_ages, dtype=int)
+        growth = np.asarray([float(rate / Decimal('100')) for rate in growth_rates])[:, None]
+        contributions = float(annual_contributions)
+
+        # Project pension pot to retirement using compound interest
+        pot_paths = project_pot_path(
+            float(current_pension_pot), contributions, growth[:, 0], int(ages.max()) - current_age
+        )
+        pension_pots = pot_paths[:, ages - current_age]
 
         # Calculate tax-free lump sum (25%)
-        tax_free_lump_sum = pension_pot * Decimal('0.25')
-        remaining_pot = pension_pot - tax_free_lump_sum
+        tax_free_lump_sums = pension_pots * 0.25
+        remaining_pots = pension_pots - tax_free_lump_sums
 
         # Calculate sustainable withdrawal rate (4% rule)
-        annual_income = remaining_pot * Decimal('0.04')
-        monthly_income = annual_income / Decimal('12')
-
-        # Calculate pot depletion age
-        # Using 4% withdrawal with assumed growth continuing
-        years_in_retirement = life_expectancy - retirement_age
-        pot_depletion_age = self._calculate_depletion_age(
-            remaining_pot,
-            annual_income,
-            growth_rate,
-            retirement_age,
-            life_expectancy
+        annual_incomes = remaining_pots * 0.04
+
+        # Pot depletion with 4% withdrawal (taken after growth) and growth continuing
+        pot_depletion_ages = depletion_ages(
+            ages, remaining_pots, annual_incomes, growth, life_expectancy,
+            withdraw_in_advance=False
         )
 
         # Calculate replacement ratio (assume current salary = contributions * 10)
-        estimated_salary = annual_contributions * Decimal('10')
-        replacement_ratio = (annual_income / estimated_salary * Decimal('100')) if estimated_salary > 0 else Decimal('0')
+        estimated_salary = contributions * 10
+        replacement_ratios = (
+            annual_incomes / estimated_salary * 100 if estimated_salary > 0
+            else np.zeros_like(annual_incomes)
+        )
 
-        return {
-            'retirement_age': retirement_age,
-            'years_to_retirement': years_to_retirement,
-            'pension_pot_at_retirement': float(pension_pot),
-            'tax_free_lump_sum': float(tax_free_lump_sum),
-            'remaining_for_income': float(remaining_pot),
-            'annual_retirement_income': float(annual_income),
-            'monthly_retirement_income': float(monthly_income),
-            'pot_depletion_age': pot_depletion_age,
-            'replacement_ratio': float(replacement_ratio),
-            'adequate': replacement_ratio >= Decimal('70.00')  # 70% is typical target
-        }
+        grid = []
+        for g in range(len(growth_rates)):
+            results = []
+            for a, retirement_age in enumerate(retirement_ages):
+                depletion_age = pot_depletion_ages[g, a]
+                results.append({
+                    'retirement_age': retirement_age,
+                    'years_to_retirement': retirement_age - current_age,
+                    'pension_pot_at_retirement': float(pension_pots[g, a]),
+                    'tax_free_lump_sum': float(tax_free_lump_sums[g, a]),
+                    'remaining_for_income': float(remaining_pots[g, a]),
+                    'annual_retirement_income': float(annual_incomes[g, a]),
+                    'monthly_retirement_income': float(annual_incomes[g, a] / 12),
+                    'pot_depletion_age': None if np.isnan(depletion_age) else int(depletion_age),
+                    'replacement_ratio': float(replacement_ratios[g, a]),
+                    'adequate': bool(replacement_ratios[g, a] >= 70.0)  # 70% is typical target
+                })
+            grid.append(results)
+
+        return grid
 
     async def optimize_retirement_age(
         self,
@@ -141,32 +309,32 @@ class RetirementAgeScenarioService:
         """
         logger.info(f"Optimizing retirement age for user {user_id} with target income {target_income}")
 
-        # Try ages from 55 to 70
+        # Model ages 55 to 70 in one pass
+        scenarios = await self.model_retirement_ages(
+            user_id,
+            list(range(max(MIN_RETIREMENT_AGE, current_age + 1), MAX_RETIREMENT_AGE + 1)),
+            current_age,
+            current_pension_pot,
+            annual_contributions,
+            growth_rate
+        )
+
         best_age = None
         closest_income = Decimal('0')
         closest_diff = Decimal('999999999')
 
-        for age in range(max(55, current_age + 1), 71):
-            result = await self.model_retirement_age(
-                user_id,
-                age,
-                current_age,
-                current_pension_pot,
-                annual_contributions,
-                growth_rate
-            )
-
+        for result in scenarios:
             income = Decimal(str(result['annual_retirement_income']))
             diff = abs(income - target_income)
 
             if diff < closest_diff:
                 closest_diff = diff
                 closest_income = income
-                best_age = age
+                best_age = result['retirement_age']
 
             # If we've achieved or exceeded target, that's the optimal age
             if income >= target_income:
-                best_age = age
+                best_age = result['retirement_age']
                 break
 
         pension_pot_needed = target_income / Decimal('0.04')  # 4% rule reversed
@@ -189,33 +357,72 @@ class RetirementAgeScenarioService:
             'reasoning': reasoning
         }
 
-    def _calculate_depletion_age(
-        self,
-        starting_pot: Decimal,
-        annual_withdrawal: Decimal,
-        growth_rate: Decimal,
-        retirement_age: int,
-        life_expectancy: int
-    ) -> Optional[int]:
+    async def _get_from_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """
-        Calculate age when pension pot depletes.
+        Get a cached retirement age sweep.
+
+        Args:
+            cache_key: Redis key
 
         Returns:
-            Age when pot depletes, or None if pot lasts until life expectancy
+            Cached sweep dict or None
+        """
+        try:
+            cached_data = await redis_client.get(cache_key)
+
+            if cached_data:
+                logger.debug(f"Cache hit for {cache_key}")
+                return json.loads(cached_data)
+
+            logger.debug(f"Cache miss for {cache_key}")
+            return None
+
+        except Exception as e:
+            logger.error(f"Redis cache read error: {e}")
+            return None
+
+    async def _save_to_cache(self, cache_key: str, data: Dict[str, Any]) -> None:
         """
-        pot = starting_pot
-        growth_factor = Decimal('1') + (growth_rate / Decimal('100'))
-        current_age = retirement_age
+        Save a retirement age sweep to cache.
 
-        while current_age < life_expectancy:
-            # Apply growth
-            pot *= growth_factor
-            # Withdraw
-            pot -= annual_withdrawal
+        Args:
+            cache_key: Redis key
+            data: Sweep data to cache
+        """
+        try:
+            await redis_client.set(cache_key, json.dumps(data), expire=self.CACHE_TTL)
+            logger.debug(f"Cached data for {cache_key} (TTL: {self.CACHE_TTL}s)")
 
-            if pot <= 0:
-                return current_age
+        except Exception as e:
+            logger.error(f"Redis cache write error: {e}")
+            # Don't raise - caching failure shouldn't break the sweep
 
-            current_age += 1
+    @classmethod
+    def cache_key(
+        cls,
+        current_age: int,
+        current_pension_pot: Decimal,
+        annual_contributions: Decimal,
+        growth_rates: Sequence[Decimal],
+        retirement_ages: Sequence[int],
+        life_expectancy: int
+    ) -> str:
+        """
+        Get the sweep cache key for a set of inputs.
+
+        Decimal inputs are normalized so equal amounts (e.g. 6 and 6.00) share
+        an entry.
 
-        return None  # Pot lasts until life expectancy
+        Returns:
+            Redis key
+        """
+        inputs = json.dumps([
+            current_age,
+            str(Decimal(current_pension_pot).normalize()),
+            str(Decimal(annual_contributions).normalize()),
+            [str(Decimal(rate).normalize()) for rate in growth_rates],
+            list(retirement_ages),
+            life_expectancy
+        ])
+        digest = hashlib.sha256(inputs.encode()).hexdigest()
+        return f"scenario:retirement_sweep:{digest}"
@@ -5,6 +5,7 @@ Provides core scenario management and execution:
 - Create, read, update, delete scenarios
 - Execute scenario calculations with projections
 - Compare multiple scenarios
+- Run and compare several scenarios against one shared baseline
 - Baseline snapshot creation
 - Scenario expiration management
 
@@ -19,18 +20,23 @@ Performance:
 - Async database operations throughout
 - Optimized queries with proper indexing
 - Cached baseline snapshots
+- Projections are vectorized over years and asset buckets (see
+  projection_engine) and run on the compute pool, concurrently when
+  several scenarios are run together
 """
 
+import asyncio
 import logging
 import uuid
 from datetime import datetime, timedelta
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 
+import numpy as np
 from sqlalchemy import select, and_, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import defer, selectinload
 
 from models.scenario import (
     Scenario, ScenarioAssumption, ScenarioResult,
@@ -38,11 +44,46 @@ from models.scenario import (
 )
 from models.user import User
 from models.savings_account import SavingsAccount
-from models.investment import InvestmentAccount
-from models.retirement import UKPension, SARetirementFund
+from models.investment import InvestmentAccount, AccountType as InvestmentAccountType
+from models.retirement import (
+    UKPension, SARetirementFund, PensionType,
+    ContributionFrequency as PensionContributionFrequency
+)
+from models.income import UserIncome, IncomeType, IncomeFrequency
+from models.estate_iht import EstateAsset, EstateLiability, AssetType
+from models.goal import FinancialGoal, GoalStatus, ContributionFrequency as GoalContributionFrequency
+from services.scenarios.projection_engine import project_buckets, project_goals
+from compute_pool import compute_pool
+from utils.projection_series import ProjectionSeries
 
 logger = logging.getLogger(__name__)
 
+# Periods per year for annualizing recurring amounts
+INCOME_PERIODS_PER_YEAR = {
+    IncomeFrequency.ANNUAL: 1,
+    IncomeFrequency.MONTHLY: 12,
+    IncomeFrequency.WEEKLY: 52,
+    IncomeFrequency.ONE_TIME: 0,
+}
+PENSION_CONTRIBUTION_PERIODS_PER_YEAR = {
+    PensionContributionFrequency.MONTHLY: 12,
+    PensionContributionFrequency.ANNUAL: 1,
+    PensionContributionFrequency.ONE_OFF: 0,
+}
+GOAL_CONTRIBUTION_PERIODS_PER_YEAR = {
+    GoalContributionFrequency.WEEKLY: 52,
+    GoalContributionFrequency.MONTHLY: 12,
+    GoalContributionFrequency.QUARTERLY: 4,
+    GoalContributionFrequency.ANNUALLY: 1,
+    GoalContributionFrequency.ONE_OFF: 0,
+}
+
+# Year-by-year result series readable through get_result_series
+RESULT_SERIES = {
+    'net_worth': 'net_worth_series',
+    'tax_liability': 'tax_liability_series',
+}
+
 
 class ValidationError(Exception):
     """Raised when scenario data validation fails."""
@@ -358,49 +399,17 @@ class ScenarioService:
         scenario_state = await self._apply_scenario_modifications(baseline, scenario)
 
         # Run projections
-        projection_years = execution_params.get('projection_years', 30)
-        growth_rate = execution_params.get('growth_rate', Decimal('6.00'))
-        inflation_rate = execution_params.get('inflation_rate', Decimal('2.50'))
+        projection_years, growth_rate, inflation_rate = self._execution_settings(execution_params)
 
-        projections = await self._calculate_projections(
+        projections = await compute_pool.run(
+            self._calculate_projections,
             scenario_state,
             projection_years,
             growth_rate,
             inflation_rate
         )
 
-        # Create or update results
-        existing_result = await self.db.execute(
-            select(ScenarioResult).where(ScenarioResult.scenario_id == scenario_id)
-        )
-        result = existing_result.scalar_one_or_none()
-
-        if not result:
-            result = ScenarioResult(
-                id=uuid.uuid4(),
-                scenario_id=scenario_id
-            )
-            self.db.add(result)
-
-        # Update result fields
-        result.calculation_date = datetime.utcnow()
-        result.calculation_version = "1.0.0"
-        result.projection_years = projection_years
-        result.net_worth_projection = projections['net_worth_projection']
-        result.retirement_income_projection = projections['retirement_income_projection']
-        result.tax_liability_projection = projections['tax_liability_projection']
-        result.goal_achievement_projection = projections.get('goal_achievement_projection')
-        result.detailed_breakdown = projections.get('detailed_breakdown')
-        result.total_lifetime_tax = projections.get('total_lifetime_tax')
-        result.final_net_worth = projections.get('final_net_worth')
-        result.retirement_adequacy_ratio = projections.get('retirement_adequacy_ratio')
-        result.goals_achieved_count = projections.get('goals_achieved_count', 0)
-        result.goals_achieved_percentage = projections.get('goals_achieved_percentage')
-        result.probability_of_success = projections.get('probability_of_success')
-
-        # Update scenario status
-        scenario.status = ScenarioStatus.CALCULATED
-        scenario.updated_at = datetime.utcnow()
+        result = self._store_result(scenario, projections, projection_years)
 
         await self.db.commit()
         await self.db.refresh(result)
@@ -408,6 +417,70 @@ class ScenarioService:
         logger.info(f"Completed scenario {scenario_id} calculation")
         return result
 
+    async def run_and_compare_scenarios(
+        self,
+        scenario_ids: List[UUID],
+        user_id: UUID,
+        execution_params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Run several scenarios and compare them side-by-side.
+
+        The user's baseline is built once and each scenario's assumptions are
+        applied to it as an overlay. Projections run concurrently on the
+        compute pool and all results are saved in one commit.
+
+        Args:
+            scenario_ids: List of Scenario UUIDs (2-5)
+            user_id: User UUID (for ownership verification)
+            execution_params: Execution parameters (see run_scenario),
+                              shared by all scenarios
+
+        Returns:
+            Dict containing comparison data (see compare_scenarios)
+
+        Raises:
+            ValidationError: If < 2 or > 5 scenarios
+            NotFoundError: If any scenario not found
+            PermissionError: If user doesn't own all scenarios
+        """
+        if len(scenario_ids) < 2:
+            raise ValidationError("Need at least 2 scenarios to compare")
+        if len(scenario_ids) > 5:
+            raise ValidationError("Cannot compare more than 5 scenarios")
+
+        logger.info(f"Running {len(scenario_ids)} scenarios for comparison")
+
+        scenarios = await self._get_scenarios(scenario_ids, user_id)
+
+        # One baseline shared by every scenario
+        baseline = await self._build_user_baseline(user_id)
+        scenario_states = [
+            await self._apply_scenario_modifications(baseline, scenario)
+            for scenario in scenarios
+        ]
+
+        projection_years, growth_rate, inflation_rate = self._execution_settings(execution_params)
+
+        all_projections = await asyncio.gather(*(
+            compute_pool.run(
+                self._calculate_projections,
+                scenario_state,
+                projection_years,
+                growth_rate,
+                inflation_rate
+            )
+            for scenario_state in scenario_states
+        ))
+
+        for scenario, projections in zip(scenarios, all_projections):
+            self._store_result(scenario, projections, projection_years)
+
+        await self.db.commit()
+
+        logger.info(f"Completed {len(scenarios)} scenario calculations")
+        return self._build_comparison(scenarios)
+
     async def compare_scenarios(
         self,
         scenario_ids: List[UUID],
@@ -434,14 +507,166 @@ class ScenarioService:
             raise ValidationError("Cannot compare more than 5 scenarios")
 
         # Load all scenarios with results
+        scenarios = await self._get_scenarios(scenario_ids, user_id)
+        await self.db.commit()
+
+        for scenario in scenarios:
+            if scenario.status != ScenarioStatus.CALCULATED:
+                raise ValidationError(f"Scenario {scenario.id} has not been calculated yet")
+
+        return self._build_comparison(scenarios)
+
+    async def get_result_series(
+        self,
+        scenario_id: UUID,
+        user_id: UUID,
+        series: str,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+        max_points: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get part of a result series without materializing the whole series.
+
+        Args:
+            scenario_id: Scenario UUID
+            user_id: User UUID (for ownership verification)
+            series: Series name ('net_worth' or 'tax_liability')
+            start_year: First projection year (default: first)
+            end_year: Last projection year (default: last)
+            max_points: Downsample to at most this many points
+
+        Returns:
+            Dict with series, total_points and columns (name -> values)
+
+        Raises:
+            ValidationError: If series unknown
+            NotFoundError: If scenario not found or not calculated
+            PermissionError: If user doesn't own scenario
+        """
+        if series not in RESULT_SERIES:
+            raise ValidationError(
+                f"Unknown series '{series}'. Available: {', '.join(RESULT_SERIES)}"
+            )
+
+        scenario = await self.get_scenario(scenario_id, user_id)
+        projection = getattr(scenario.results, RESULT_SERIES[series], None) if scenario.results else None
+        if projection is None:
+            raise NotFoundError(f"Scenario {scenario_id} has no calculated results")
+
+        start, stop = projection.index_range(start_year, end_year)
+
+        return {
+            'scenario_id': scenario.id,
+            'series': series,
+            'total_points': len(projection),
+            'columns': projection.window(start, stop, max_points=max_points)
+        }
+
+    # Private helper methods
+
+    async def _get_scenarios(
+        self,
+        scenario_ids: List[UUID],
+        user_id: UUID
+    ) -> List[Scenario]:
+        """
+        Load several scenarios in one query with ownership checks.
+
+        Marks them accessed; the caller commits.
+
+        Returns:
+            Scenarios in scenario_ids order
+
+        Raises:
+            NotFoundError: If any scenario not found
+            PermissionError: If user doesn't own all scenarios
+        """
+        query = (
+            select(Scenario)
+            .where(Scenario.id.in_(scenario_ids))
+            .options(
+                selectinload(Scenario.assumptions),
+                # Comparisons use summary metrics only; skip decoding projections
+                selectinload(Scenario.results).options(
+                    defer(ScenarioResult.net_worth_projection),
+                    defer(ScenarioResult.tax_liability_projection),
+                    defer(ScenarioResult.detailed_breakdown)
+                )
+            )
+        )
+        result = await self.db.execute(query)
+        scenarios_by_id = {scenario.id: scenario for scenario in result.scalars().all()}
+
         scenarios = []
+        now = datetime.utcnow()
         for scenario_id in scenario_ids:
-            scenario = await self.get_scenario(scenario_id, user_id)
-            if scenario.status != ScenarioStatus.CALCULATED:
-                raise ValidationError(f"Scenario {scenario_id} has not been calculated yet")
+            scenario = scenarios_by_id.get(scenario_id)
+            if not scenario:
+                raise NotFoundError(f"Scenario {scenario_id} not found")
+            if scenario.user_id != user_id:
+                raise PermissionError(f"User {user_id} does not have access to scenario {scenario_id}")
+
+            # Update last accessed time
+            scenario.last_accessed_at = now
+            scenario.expires_at = now + timedelta(days=self.SCENARIO_EXPIRY_DAYS)
             scenarios.append(scenario)
 
-        # Build comparison
+        return scenarios
+
+    @staticmethod
+    def _execution_settings(execution_params: Dict[str, Any]):
+        """Projection years, growth rate and inflation rate with defaults."""
+        return (
+            execution_params.get('projection_years', 30),
+            execution_params.get('growth_rate', Decimal('6.00')),
+            execution_params.get('inflation_rate', Decimal('2.50'))
+        )
+
+    def _store_result(
+        self,
+        scenario: Scenario,
+        projections: Dict[str, Any],
+        projection_years: int
+    ) -> ScenarioResult:
+        """
+        Create or update a scenario's result from projections.
+
+        Marks the scenario calculated; the caller commits.
+        """
+        result = scenario.results
+        if not result:
+            result = ScenarioResult(
+                id=uuid.uuid4(),
+                scenario_id=scenario.id
+            )
+            self.db.add(result)
+            scenario.results = result
+
+        # Update result fields
+        result.calculation_date = datetime.utcnow()
+        result.calculation_version = "1.0.0"
+        result.projection_years = projection_years
+        result.net_worth_projection = projections['net_worth_projection'].to_json()
+        result.retirement_income_projection = projections['retirement_income_projection']
+        result.tax_liability_projection = projections['tax_liability_projection'].to_json()
+        result.goal_achievement_projection = projections.get('goal_achievement_projection')
+        result.detailed_breakdown = projections.get('detailed_breakdown')
+        result.total_lifetime_tax = projections.get('total_lifetime_tax')
+        result.final_net_worth = projections.get('final_net_worth')
+        result.retirement_adequacy_ratio = projections.get('retirement_adequacy_ratio')
+        result.goals_achieved_count = projections.get('goals_achieved_count', 0)
+        result.goals_achieved_percentage = projections.get('goals_achieved_percentage')
+        result.probability_of_success = projections.get('probability_of_success')
+
+        # Update scenario status
+        scenario.status = ScenarioStatus.CALCULATED
+        scenario.updated_at = datetime.utcnow()
+
+        return result
+
+    def _build_comparison(self, scenarios: List[Scenario]) -> Dict[str, Any]:
+        """Build the side-by-side comparison of calculated scenarios."""
         comparison = {
             'scenarios': [],
             'metric_comparisons': {},
@@ -452,9 +677,31 @@ class ScenarioService:
         for scenario in scenarios:
             comparison['scenarios'].append({
                 'id': str(scenario.id),
+                'user_id': str(scenario.user_id),
                 'name': scenario.scenario_name,
+                'scenario_name': scenario.scenario_name,
                 'type': scenario.scenario_type.value,
-                'description': scenario.description
+                'scenario_type': scenario.scenario_type,
+                'description': scenario.description,
+                'base_case': scenario.base_case,
+                'status': scenario.status,
+                'created_at': scenario.created_at,
+                'updated_at': scenario.updated_at,
+                'last_accessed_at': scenario.last_accessed_at,
+                'expires_at': scenario.expires_at,
+                'assumptions': [
+                    {
+                        'id': assumption.id,
+                        'scenario_id': assumption.scenario_id,
+                        'assumption_type': assumption.assumption_type,
+                        'assumption_key': assumption.assumption_key,
+                        'assumption_value': assumption.assumption_value,
+                        'unit': assumption.unit,
+                        'created_at': assumption.created_at
+                    }
+                    for assumption in scenario.assumptions
+                ],
+                'has_results': scenario.results is not None
             })
 
         # Compare key metrics
@@ -493,8 +740,6 @@ class ScenarioService:
 
         return comparison
 
-    # Private helper methods
-
     async def _count_active_scenarios(self, user_id: UUID) -> int:
         """Count active (non-archived) scenarios for user."""
         query = select(func.count(Scenario.id)).where(
@@ -528,11 +773,12 @@ class ScenarioService:
 
         Returns dict with:
         - user demographics
-        - tax status
-        - income
+        - income (annual salary and its tax country)
         - net worth
-        - assets (savings, investments, pensions)
+        - assets (savings, investments, pensions, property)
         - liabilities
+        - buckets: projection buckets (see projection_engine)
+        - goals: active goals with their own savings
         """
         # Get user
         user_query = select(User).where(User.id == user_id)
@@ -550,47 +796,223 @@ class ScenarioService:
                 age -= 1
 
         # Get savings accounts
-        savings_query = select(SavingsAccount).where(SavingsAccount.user_id == user_id)
+        savings_query = select(SavingsAccount).where(
+            and_(
+                SavingsAccount.user_id == user_id,
+                SavingsAccount.is_active == True,
+                SavingsAccount.deleted_at.is_(None)
+            )
+        )
         savings_result = await self.db.execute(savings_query)
         savings_accounts = savings_result.scalars().all()
-        total_savings = sum(account.current_balance for account in savings_accounts)
-
-        # Get investments
-        investments_query = select(InvestmentAccount).where(InvestmentAccount.user_id == user_id)
+        total_savings = sum((account.current_balance for account in savings_accounts), Decimal('0'))
+
+        # Get investments (valued from holdings)
+        investments_query = (
+            select(InvestmentAccount)
+            .where(
+                and_(
+                    InvestmentAccount.user_id == user_id,
+                    InvestmentAccount.deleted == False
+                )
+            )
+            .options(selectinload(InvestmentAccount.holdings))
+        )
         investments_result = await self.db.execute(investments_query)
         investment_accounts = investments_result.scalars().all()
-        total_investments = sum(account.current_value for account in investment_accounts)
+        investment_values = {
+            account.id: sum(
+                (holding.current_value for holding in account.holdings if not holding.deleted),
+                Decimal('0')
+            )
+            for account in investment_accounts
+        }
+        total_investments = sum(investment_values.values(), Decimal('0'))
 
         # Get UK pensions
-        uk_pensions_query = select(UKPension).where(UKPension.user_id == user_id)
+        uk_pensions_query = (
+            select(UKPension)
+            .where(
+                and_(
+                    UKPension.user_id == user_id,
+                    UKPension.is_deleted == False
+                )
+            )
+            .options(selectinload(UKPension.contributions))
+        )
         uk_pensions_result = await self.db.execute(uk_pensions_query)
         uk_pensions = uk_pensions_result.scalars().all()
-        total_uk_pension = sum(pension.current_value or Decimal('0') for pension in uk_pensions)
+        total_uk_pension = sum((pension.current_value or Decimal('0') for pension in uk_pensions), Decimal('0'))
 
         # Get SA retirement funds
-        sa_funds_query = select(SARetirementFund).where(SARetirementFund.user_id == user_id)
+        sa_funds_query = select(SARetirementFund).where(
+            and_(
+                SARetirementFund.user_id == user_id,
+                SARetirementFund.is_deleted == False
+            )
+        )
         sa_funds_result = await self.db.execute(sa_funds_query)
         sa_funds = sa_funds_result.scalars().all()
-        total_sa_pension = sum(fund.current_value for fund in sa_funds)
+        total_sa_pension = sum((fund.current_value for fund in sa_funds), Decimal('0'))
+
+        # Get earned income
+        income_query = select(UserIncome).where(
+            and_(
+                UserIncome.user_id == user_id,
+                UserIncome.deleted_at.is_(None),
+                UserIncome.income_type.in_([IncomeType.EMPLOYMENT, IncomeType.SELF_EMPLOYMENT])
+            )
+        )
+        income_result = await self.db.execute(income_query)
+        incomes = income_result.scalars().all()
+        income_by_country = {'UK': Decimal('0'), 'SA': Decimal('0')}
+        for income in incomes:
+            country = 'SA' if income.source_country in ('ZA', 'SA') else 'UK'
+            income_by_country[country] += income.amount * INCOME_PERIODS_PER_YEAR[income.frequency]
+        salary_country = max(income_by_country, key=income_by_country.get)
+
+        # Get property and liabilities
+        today = datetime.utcnow().date()
+        property_query = select(EstateAsset).where(
+            and_(
+                EstateAsset.user_id == user_id,
+                EstateAsset.asset_type == AssetType.PROPERTY,
+                EstateAsset.is_deleted == False,
+                or_(EstateAsset.effective_to.is_(None), EstateAsset.effective_to >= today)
+            )
+        )
+        property_result = await self.db.execute(property_query)
+        properties = property_result.scalars().all()
+        total_property = sum((asset.estimated_value for asset in properties), Decimal('0'))
+
+        liabilities_query = select(EstateLiability).where(
+            and_(
+                EstateLiability.user_id == user_id,
+                EstateLiability.is_deleted == False,
+                or_(EstateLiability.effective_to.is_(None), EstateLiability.effective_to >= today)
+            )
+        )
+        liabilities_result = await self.db.execute(liabilities_query)
+        liabilities = liabilities_result.scalars().all()
+        total_liabilities = sum((liability.amount_outstanding for liability in liabilities), Decimal('0'))
+
+        # Get active goals
+        goals_query = select(FinancialGoal).where(
+            and_(
+                FinancialGoal.user_id == user_id,
+                FinancialGoal.deleted_at.is_(None),
+                FinancialGoal.status.notin_([GoalStatus.ACHIEVED, GoalStatus.ABANDONED])
+            )
+        )
+        goals_result = await self.db.execute(goals_query)
+        goals = goals_result.scalars().all()
+
+        buckets = []
+        for acc in savings_accounts:
+            buckets.append({
+                'name': acc.account_name,
+                'kind': 'isa' if acc.is_isa else 'tfsa' if acc.is_tfsa else 'cash',
+                'country': 'SA' if acc.country and acc.country.value == 'SA' else 'UK',
+                'balance': acc.current_balance,
+                'interest_rate': acc.interest_rate or Decimal('0')
+            })
+        for acc in investment_accounts:
+            buckets.append({
+                'name': acc.provider,
+                'kind': 'isa' if acc.account_type == InvestmentAccountType.STOCKS_ISA else 'gia',
+                'country': 'SA' if acc.country and acc.country.value == 'SA' else 'UK',
+                'balance': investment_values[acc.id]
+            })
+        for pension in uk_pensions:
+            if pension.pension_type in (PensionType.OCCUPATIONAL_DB, PensionType.STATE_PENSION):
+                continue
+            buckets.append({
+                'name': pension.provider,
+                'kind': 'pension',
+                'country': 'UK',
+                'balance': pension.current_value or Decimal('0'),
+                'annual_contribution': self._annual_pension_contributions(pension)
+            })
+        for fund in sa_funds:
+            buckets.append({
+                'name': fund.fund_name,
+                'kind': 'pension',
+                'country': 'SA',
+                'balance': fund.current_value
+            })
+        for asset in properties:
+            buckets.append({
+                'name': asset.description,
+                'kind': 'property',
+                'country': 'SA' if asset.included_in_sa_estate and not asset.included_in_uk_estate else 'UK',
+                'balance': asset.estimated_value
+            })
+        for liability in liabilities:
+            buckets.append({
+                'name': liability.description,
+                'kind': 'debt',
+                'country': 'UK',
+                'balance': liability.amount_outstanding
+            })
 
         baseline = {
             'user_id': user_id,
             'snapshot_date': datetime.utcnow(),
             'age': age,
             'date_of_birth': user.date_of_birth,
+            'annual_salary': income_by_country[salary_country],
+            'salary_country': salary_country,
             'savings': total_savings,
             'investments': total_investments,
             'uk_pensions': total_uk_pension,
             'sa_pensions': total_sa_pension,
-            'total_net_worth': total_savings + total_investments + total_uk_pension + total_sa_pension,
+            'property': total_property,
+            'liabilities': total_liabilities,
+            'total_net_worth': (
+                total_savings + total_investments + total_uk_pension + total_sa_pension
+                + total_property - total_liabilities
+            ),
             'savings_accounts': [{'id': str(acc.id), 'balance': acc.current_balance} for acc in savings_accounts],
-            'investment_accounts': [{'id': str(acc.id), 'value': acc.current_value} for acc in investment_accounts],
+            'investment_accounts': [
+                {'id': str(acc.id), 'value': investment_values[acc.id]} for acc in investment_accounts
+            ],
             'uk_pensions_list': [{'id': str(p.id), 'value': p.current_value} for p in uk_pensions],
             'sa_funds_list': [{'id': str(f.id), 'value': f.current_value} for f in sa_funds],
+            'buckets': buckets,
+            'goals': [
+                {
+                    'id': str(goal.id),
+                    'name': goal.goal_name,
+                    'target_amount': goal.target_amount,
+                    'current_amount': goal.current_amount or Decimal('0'),
+                    'target_date': goal.target_date,
+                    'annual_contribution': (
+                        (goal.contribution_amount or Decimal('0'))
+                        * GOAL_CONTRIBUTION_PERIODS_PER_YEAR.get(goal.contribution_frequency, 0)
+                        if goal.auto_contribution else Decimal('0')
+                    )
+                }
+                for goal in goals
+            ],
         }
 
         return baseline
 
+    @staticmethod
+    def _annual_pension_contributions(pension: UKPension) -> Decimal:
+        """Annualized ongoing contributions to a pension (all payers)."""
+        total = Decimal('0')
+        for contribution in pension.contributions:
+            if contribution.effective_to is not None:
+                continue
+            amount = (
+                (contribution.employee_contribution or Decimal('0'))
+                + (contribution.employer_contribution or Decimal('0'))
+                + (contribution.personal_contribution or Decimal('0'))
+            )
+            total += amount * PENSION_CONTRIBUTION_PERIODS_PER_YEAR.get(contribution.frequency, 0)
+        return total
+
     async def _apply_scenario_modifications(
         self,
         baseline: Dict[str, Any],
@@ -601,7 +1023,8 @@ class ScenarioService:
 
         Returns modified state with scenario assumptions applied.
         """
-        # Deep copy baseline
+        # Overlay on a shallow copy: assumptions only replace top-level keys,
+        # so one baseline can be shared by several scenarios
         scenario_state = baseline.copy()
 
         # Apply assumptions based on scenario type
@@ -621,7 +1044,52 @@ class ScenarioService:
 
         return scenario_state
 
-    async def _calculate_projections(
+    def _projection_buckets(
+        self,
+        scenario_state: Dict[str, Any],
+        growth: float
+    ) -> List[Dict[str, Any]]:
+        """
+        Projection buckets for a scenario state.
+
+        Invested buckets grow at the scenario growth rate, cash at its
+        interest rate and property with inflation (set by the caller). A
+        property purchase adds the property, its repayment mortgage and the
+        deposit paid out of savings.
+        """
+        buckets = []
+        for bucket in scenario_state.get('buckets', []):
+            if bucket['kind'] in ('cash', 'isa', 'tfsa') and 'interest_rate' in bucket:
+                growth_rate = float(bucket['interest_rate']) / 100
+            elif bucket['kind'] in ('property', 'debt'):
+                growth_rate = None
+            else:
+                growth_rate = growth
+            buckets.append({**bucket, 'growth_rate': growth_rate})
+
+        property_value = scenario_state.get('property_value')
+        if property_value:
+            deposit = scenario_state.get('property_deposit', Decimal('0'))
+            mortgage_rate = float(scenario_state.get('mortgage_rate', Decimal('0'))) / 100
+            term = scenario_state.get('mortgage_term_years', 25)
+            principal = float(property_value - deposit)
+            repayment = (
+                principal / term if mortgage_rate == 0
+                else principal * mortgage_rate / (1 - (1 + mortgage_rate) ** -term)
+            )
+            buckets.extend([
+                {'name': 'Property purchase', 'kind': 'property', 'country': 'UK',
+                 'balance': property_value, 'growth_rate': None},
+                {'name': 'Mortgage', 'kind': 'debt', 'country': 'UK', 'balance': principal,
+                 'annual_contribution': repayment, 'growth_rate': mortgage_rate,
+                 'contribution_years': term},
+                {'name': 'Property deposit', 'kind': 'cash', 'country': 'UK',
+                 'balance': -deposit, 'growth_rate': 0.0},
+            ])
+
+        return buckets
+
+    def _calculate_projections(
         self,
         scenario_state: Dict[str, Any],
         projection_years: int,
@@ -632,66 +1100,131 @@ class ScenarioService:
         Calculate financial projections for scenario state.
 
         Returns dict with:
-        - net_worth_projection: List[Dict] (year-by-year)
+        - net_worth_projection: ProjectionSeries (year-by-year)
         - retirement_income_projection: Dict
-        - tax_liability_projection: List[Dict]
+        - tax_liability_projection: ProjectionSeries
+        - goal_achievement_projection: Dict
+        - detailed_breakdown: Dict (year-end value of each bucket)
         - summary metrics
         """
-        net_worth_projections = []
-        tax_projections = []
-        current_net_worth = scenario_state['total_net_worth']
-        total_tax = Decimal('0')
-
-        # Simple projection model (will be enhanced)
-        for year in range(1, projection_years + 1):
-            # Calculate growth
-            investment_growth = current_net_worth * (growth_rate / Decimal('100'))
-            current_net_worth += investment_growth
-
-            # Estimate tax (simplified)
-            estimated_tax = investment_growth * Decimal('0.20')  # 20% tax rate estimate
-            total_tax += estimated_tax
-
-            net_worth_projections.append({
-                'year': year,
-                'age': scenario_state.get('age', 0) + year,
-                'net_worth': float(current_net_worth),
-                'growth': float(investment_growth)
-            })
+        growth = float(growth_rate / Decimal('100'))
+        inflation = float(inflation_rate / Decimal('100'))
+        age = scenario_state.get('age')
+        retirement_age = scenario_state.get('target_retirement_age', 67)
 
-            tax_projections.append({
-                'year': year,
-                'tax': float(estimated_tax)
-            })
+        buckets = self._projection_buckets(scenario_state, growth)
+        for bucket in buckets:
+            if bucket['growth_rate'] is None:
+                bucket['growth_rate'] = 0.0 if bucket['kind'] == 'debt' else inflation
 
-        # Retirement income projection (simplified)
-        retirement_age = scenario_state.get('target_retirement_age', 67)
-        pension_pot = scenario_state.get('uk_pensions', Decimal('0')) + scenario_state.get('sa_pensions', Decimal('0'))
+        projection = project_buckets(
+            buckets,
+            projection_years,
+            inflation,
+            salary=float(scenario_state.get('annual_salary', Decimal('0'))),
+            salary_country=scenario_state.get('salary_country', 'UK'),
+            start_age=age,
+            retirement_age=retirement_age
+        )
 
-        # Project pension pot to retirement
-        years_to_retirement = max(0, retirement_age - scenario_state.get('age', 0))
-        for _ in range(years_to_retirement):
-            pension_pot *= (Decimal('1') + growth_rate / Decimal('100'))
+        net_worth = projection['net_worth']
+        taxes = projection['taxes']
+
+        years = np.arange(1, projection_years + 1)
+        net_worth_projections = ProjectionSeries.from_columns(
+            {
+                'year': years,
+                'age': (age or 0) + years,
+                'net_worth': net_worth[1:],
+                'real_net_worth': projection['real_net_worth'][1:],
+                'growth': np.diff(net_worth)
+            },
+            int_columns=('year', 'age')
+        )
 
-        # 4% safe withdrawal rate
-        annual_retirement_income = pension_pot * Decimal('0.04')
+        tax_projections = ProjectionSeries.from_columns(
+            {
+                'year': years,
+                'tax': taxes['total'],
+                'income_tax': taxes['income_tax'],
+                'national_insurance': taxes['national_insurance'],
+                'dividend_tax': taxes['dividend_tax']
+            },
+            int_columns=('year',)
+        )
 
+        # Retirement income from pension drawdown
+        annual_retirement_income = projection['retirement_income']
         retirement_projection = {
             'retirement_age': retirement_age,
-            'pension_pot_at_retirement': float(pension_pot),
-            'annual_income': float(annual_retirement_income),
-            'monthly_income': float(annual_retirement_income / Decimal('12'))
+            'pension_pot_at_retirement': projection['pension_pot_at_retirement'],
+            'annual_income': annual_retirement_income,
+            'monthly_income': annual_retirement_income / 12
+        }
+
+        # Replacement of final salary by retirement income
+        years_to_retirement = max(0, retirement_age - (age or 0))
+        final_salary = float(scenario_state.get('annual_salary', Decimal('0'))) * (1 + inflation) ** max(years_to_retirement - 1, 0)
+        retirement_adequacy_ratio = None
+        if final_salary > 0:
+            retirement_adequacy_ratio = min(
+                Decimal(str(annual_retirement_income / final_salary * 100)),
+                Decimal('999.99')
+            ).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+
+        # Goals funded from their own savings by their target dates
+        goals = scenario_state.get('goals', [])
+        today = datetime.utcnow().date()
+        goal_results = project_goals(
+            goals,
+            [(goal['target_date'] - today).days / 365.25 for goal in goals],
+            growth
+        )
+        goals_achieved = sum(1 for result in goal_results if result['achieved'])
+        goal_projection = {
+            'goals': [
+                {
+                    'goal_id': goal['id'],
+                    'goal_name': goal['name'],
+                    'target_date': goal['target_date'].isoformat(),
+                    'target_amount': float(goal['target_amount']),
+                    **result
+                }
+                for goal, result in zip(goals, goal_results)
+            ],
+            'achieved_count': goals_achieved,
+            'total_goals': len(goals)
+        }
+        goals_percentage = (
+            (Decimal(goals_achieved) / Decimal(len(goals)) * 100).quantize(Decimal('0.01'))
+            if goals else Decimal('0.00')
+        )
+
+        detailed_breakdown = {
+            'buckets': [
+                {
+                    'name': bucket['name'],
+                    'kind': bucket['kind'],
+                    'country': bucket['country'],
+                    'values': [float(value) for value in projection['balances'][i]]
+                }
+                for i, bucket in enumerate(buckets)
+            ],
+            'investment_tax': [float(value) for value in taxes['investment_tax']],
+            'pension_income': [float(value) for value in projection['pension_income']]
         }
 
         return {
             'net_worth_projection': net_worth_projections,
             'retirement_income_projection': retirement_projection,
             'tax_liability_projection': tax_projections,
-            'total_lifetime_tax': float(total_tax),
-            'final_net_worth': float(current_net_worth),
-            'retirement_adequacy_ratio': Decimal('75.00'),  # Placeholder
-            'goals_achieved_count': 0,
-            'goals_achieved_percentage': Decimal('0.00')
+            'goal_achievement_projection': goal_projection,
+            'detailed_breakdown': detailed_breakdown,
+            'total_lifetime_tax': float(taxes['total'].sum()),
+            'final_net_worth': float(net_worth[projection_years]),
+            'retirement_adequacy_ratio': retirement_adequacy_ratio,
+            'goals_achieved_count': goals_achieved,
+            'goals_achieved_percentage': goals_percentage
         }
 
     def _compare_metric(
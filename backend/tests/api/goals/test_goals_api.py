@@ -10,6 +10,7 @@ Tests cover:
 - Account linking
 - Goal overview/statistics
 - Optimization and allocation
+- Nightly goal checks (internal job)
 """
 
 import pytest
@@ -618,6 +619,64 @@ async def test_optimize_allocation_negative_amount(
     assert response.status_code == 422  # Validation error
 
 
+@pytest.mark.asyncio
+async def test_optimize_allocation_frontier(
+    async_client: AsyncClient,
+    test_user_token: str,
+    test_goal_id: str
+):
+    """Test allocation frontier across several budgets."""
+    response = await async_client.post(
+        "/api/v1/goals/optimize/frontier",
+        params=[("budgets", "500.00"), ("budgets", "100.00")],
+        headers={"Authorization": f"Bearer {test_user_token}"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+
+    assert [g["goal_id"] for g in data["goals"]] == [test_goal_id]
+    assert [Decimal(p["budget"]) for p in data["points"]] == [Decimal("100.00"), Decimal("500.00")]
+    for point in data["points"]:
+        assert Decimal(point["total_allocated"]) + Decimal(point["unallocated"]) == Decimal(point["budget"])
+
+
+# ============================================================================
+# INTERNAL JOB TESTS
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_run_goal_checks_requires_service_credential(
+    async_client: AsyncClient,
+    test_user_token: str,
+    test_goal,
+    db_session,
+    monkeypatch
+):
+    """Test nightly goal checks run only with the service credential."""
+    monkeypatch.setattr("middleware.auth.settings.INTERNAL_API_KEY", "job-secret")
+    test_goal.current_amount = test_goal.target_amount
+    await db_session.commit()
+
+    response = await async_client.post(
+        "/api/v1/goals/checks/run",
+        headers={"Authorization": f"Bearer {test_user_token}"}
+    )
+    assert response.status_code == 403
+
+    response = await async_client.post(
+        "/api/v1/goals/checks/run",
+        headers={"X-Internal-API-Key": "job-secret"}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["goals_achieved"] == 1
+    assert data["goals_updated"] == 0
+
+    await db_session.refresh(test_goal)
+    assert test_goal.status == GoalStatus.ACHIEVED
+
+
 # ============================================================================
 # EDGE CASES AND ERROR HANDLING
 # ============================================================================
@@ -19,6 +19,7 @@ from uuid import uuid4
 from models.investment import (
     InvestmentAccount,
     InvestmentHolding,
+    Security,
     TaxLot,
     DividendIncome,
     CapitalGainRealized,
@@ -723,6 +724,63 @@ class TestGetHoldings:
         assert len(data) == 1
         assert data[0]["ticker"] == "VWRL"
 
+    async def test_get_holdings_projection_uses_market_price(
+        self, test_client, authenticated_headers, db_session, test_user
+    ):
+        """Test projected price fields match the full response (security master price)."""
+        account = InvestmentAccount(
+            id=uuid4(),
+            user_id=test_user.id,
+            account_type=AccountType.GIA,
+            provider="Test Provider",
+            country=AccountCountry.UK,
+            base_currency="GBP",
+            status=AccountStatus.ACTIVE,
+            deleted=False
+        )
+        account.set_account_number("12345678")
+        security = Security(
+            ticker="VWRL",
+            exchange="LSE",
+            current_price=Decimal("110.00"),
+            last_price_update=datetime(2025, 10, 1, 16, 30)
+        )
+        db_session.add_all([account, security])
+        await db_session.flush()
+
+        db_session.add(InvestmentHolding(
+            id=uuid4(),
+            account_id=account.id,
+            security_id=security.id,
+            security_type=SecurityType.STOCK,
+            ticker="VWRL",
+            security_name="Vanguard FTSE All-World",
+            quantity=Decimal("100"),
+            purchase_date=date.today(),
+            purchase_price=Decimal("95.00"),
+            purchase_currency="GBP",
+            current_price=Decimal("100.00"),
+            asset_class=AssetClass.EQUITY,
+            region=Region.GLOBAL,
+            deleted=False
+        ))
+        await db_session.commit()
+
+        full = (await test_client.get(
+            "/api/v1/investments/holdings",
+            headers=authenticated_headers
+        )).json()
+        response = await test_client.get(
+            "/api/v1/investments/holdings?fields=current_price,last_price_update",
+            headers=authenticated_headers
+        )
+
+        assert response.status_code == 200
+        projected = response.json()
+        assert Decimal(str(projected[0]["current_price"])) == Decimal("110.00")
+        assert Decimal(str(projected[0]["current_price"])) == Decimal(str(full[0]["current_price"]))
+        assert projected[0]["last_price_update"] == full[0]["last_price_update"]
+
 
 @pytest.mark.asyncio
 class TestUpdateHoldingPrice:
@@ -1157,3 +1215,30 @@ class TestAuthenticationAndAuthorization:
                 response = await test_client.post(url, json={})
 
             assert response.status_code == 401, f"{method} {url} should require auth"
+
+    async def test_bulk_price_update_requires_service_credential(
+        self, test_client, authenticated_headers, monkeypatch
+    ):
+        """Test a user session cannot reprice every user's holdings."""
+        monkeypatch.setattr("middleware.auth.settings.INTERNAL_API_KEY", "feed-secret")
+        files = {"file": ("prices.csv", b"ticker,price\nVOD,0.75\n", "text/csv")}
+
+        response = await test_client.post(
+            "/api/v1/investments/prices/bulk", files=files, headers=authenticated_headers
+        )
+        assert response.status_code == 403
+
+        response = await test_client.post(
+            "/api/v1/investments/prices/bulk",
+            files=files,
+            headers={"X-Internal-API-Key": "wrong"}
+        )
+        assert response.status_code == 403
+
+        response = await test_client.post(
+            "/api/v1/investments/prices/bulk",
+            files=files,
+            headers={"X-Internal-API-Key": "feed-secret"}
+        )
+        assert response.status_code == 200
+        assert response.json()["securities_received"] == 1
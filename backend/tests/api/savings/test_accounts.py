@@ -14,6 +14,7 @@ import pytest
 from decimal import Decimal
 from datetime import date, datetime, timedelta
 from uuid import uuid4
+from unittest.mock import patch
 
 from models.savings_account import (
     SavingsAccount,
@@ -247,6 +248,35 @@ class TestGetSavingsAccounts:
         data = response.json()
         assert len(data) == 2
 
+    async def test_get_all_accounts_masks_without_decrypting(
+        self, test_client, authenticated_headers, test_user, db_session
+    ):
+        """Test listing accounts shows stored suffixes and never decrypts."""
+        account = SavingsAccount(
+            user_id=test_user.id,
+            bank_name="Bank A",
+            account_name="Account 1",
+            account_type=AccountType.SAVINGS,
+            currency=Currency.GBP,
+            current_balance=Decimal("10000"),
+            country=AccountCountry.UK
+        )
+        account.set_account_number("GB29NWBK60161331926819")
+        db_session.add(account)
+        await db_session.commit()
+
+        with patch(
+            'models.savings_account.decrypt_account_number',
+            side_effect=AssertionError("decrypted on list")
+        ):
+            response = await test_client.get(
+                "/api/v1/savings/accounts",
+                headers=authenticated_headers
+            )
+
+        assert response.status_code == 200
+        assert response.json()[0]["account_number"] == "****6819"
+
     async def test_get_accounts_filter_by_type(
         self, test_client, authenticated_headers, test_user, db_session
     ):
@@ -334,6 +364,86 @@ class TestGetSavingsAccounts:
         assert len(data) == 1
         assert data[0]["currency"] == "ZAR"
 
+    async def test_get_accounts_paginates_with_cursor(
+        self, test_client, authenticated_headers, test_user, db_session
+    ):
+        """Test following X-Next-Cursor visits every account exactly once."""
+        for i in range(5):
+            db_session.add(SavingsAccount(
+                user_id=test_user.id,
+                bank_name="Bank A",
+                account_name=f"Account {i}",
+                account_number_encrypted=f"encrypted{i}",
+                account_type=AccountType.SAVINGS,
+                currency=Currency.GBP,
+                current_balance=Decimal("1000"),
+                country=AccountCountry.UK
+            ))
+        await db_session.commit()
+
+        names = []
+        params = {"limit": 2}
+        for _ in range(3):
+            response = await test_client.get(
+                "/api/v1/savings/accounts",
+                params=params,
+                headers=authenticated_headers
+            )
+            assert response.status_code == 200
+            assert response.headers["X-Total-Count"] == "5"
+            names.extend(account["account_name"] for account in response.json())
+            if "X-Next-Cursor" not in response.headers:
+                break
+            params = {"limit": 2, "cursor": response.headers["X-Next-Cursor"]}
+
+        assert len(names) == 5
+        assert sorted(names) == [f"Account {i}" for i in range(5)]
+        assert "X-Next-Cursor" not in response.headers
+
+    async def test_get_accounts_field_projection(
+        self, test_client, authenticated_headers, test_user, db_session
+    ):
+        """Test fields= returns only the requested fields (plus id)."""
+        db_session.add(SavingsAccount(
+            user_id=test_user.id,
+            bank_name="Bank A",
+            account_name="Projected",
+            account_number_encrypted="encrypted1",
+            account_type=AccountType.SAVINGS,
+            currency=Currency.GBP,
+            current_balance=Decimal("1234.50"),
+            country=AccountCountry.UK
+        ))
+        await db_session.commit()
+
+        response = await test_client.get(
+            "/api/v1/savings/accounts?fields=account_name,current_balance",
+            headers=authenticated_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert set(data[0]) == {"id", "account_name", "current_balance"}
+        assert data[0]["account_name"] == "Projected"
+        assert Decimal(str(data[0]["current_balance"])) == Decimal("1234.50")
+
+    async def test_get_accounts_rejects_invalid_paging(
+        self, test_client, authenticated_headers
+    ):
+        """Test unknown fields and malformed cursors return 400."""
+        response = await test_client.get(
+            "/api/v1/savings/accounts?fields=account_number",
+            headers=authenticated_headers
+        )
+        assert response.status_code == 400
+
+        response = await test_client.get(
+            "/api/v1/savings/accounts?cursor=not-a-cursor",
+            headers=authenticated_headers
+        )
+        assert response.status_code == 400
+
 
 @pytest.mark.asyncio
 class TestGetSingleAccount:
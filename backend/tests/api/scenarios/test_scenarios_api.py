@@ -10,14 +10,19 @@ Tests:
 - POST /api/v1/scenarios/{id}/run - Run scenario
 - POST /api/v1/scenarios/compare - Compare scenarios
 - POST /api/v1/scenarios/retirement-age - Retirement age scenario
+- Retirement age sweep uses the profile date of birth
 - POST /api/v1/scenarios/monte-carlo - Monte Carlo simulation
 """
 
 import pytest
+from fastapi import HTTPException
 from httpx import AsyncClient
 from decimal import Decimal
 from datetime import date, timedelta
 
+from api.v1.scenarios.scenarios import _current_age
+from models.user import User
+
 
 @pytest.mark.asyncio
 async def test_create_scenario(async_client: AsyncClient, auth_headers):
@@ -279,3 +284,18 @@ async def test_unauthorized_access(async_client: AsyncClient):
     """Test that endpoints require authentication."""
     response = await async_client.get("/api/v1/scenarios")
     assert response.status_code == 401  # Unauthorized
+
+
+def test_sweep_age_from_date_of_birth():
+    """Test the sweep's current age comes from the profile and is required."""
+    today = date.today()
+    birthday_tomorrow = today + timedelta(days=1)
+
+    assert _current_age(User(date_of_birth=date(today.year - 40, today.month, today.day))) == 40
+    if birthday_tomorrow.year == today.year:
+        born = date(today.year - 40, birthday_tomorrow.month, birthday_tomorrow.day)
+        assert _current_age(User(date_of_birth=born)) == 39
+
+    with pytest.raises(HTTPException) as exc_info:
+        _current_age(User(date_of_birth=None))
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,167 @@
+"""
+Tests for Recommendation Service pipeline.
+
+Test Coverage:
+- Snapshot loads in a fixed number of queries, however many holdings exist
+- Rules evaluate against the snapshot (ISA, tax efficiency)
+- Regenerated recommendations are upserted, not duplicated
+"""
+
+import pytest
+from contextlib import contextmanager
+from decimal import Decimal
+from datetime import date
+from uuid import uuid4
+
+from sqlalchemy import event, select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import engine
+from models.tax_status import UserTaxStatus, UKDomicileStatus
+from models.savings_account import ISAContribution
+from models.investment import (
+    InvestmentAccount,
+    InvestmentHolding,
+    AccountType,
+    AccountCountry,
+    AccountStatus,
+    SecurityType,
+    AssetClass,
+    Region
+)
+from models.recommendation import Recommendation, RecommendationType
+from services.ai.recommendation_service import RecommendationService
+from services.ai.recommendation_snapshot import load_user_snapshot
+from services.isa_tfsa_tracking import get_current_uk_tax_year
+
+
+@contextmanager
+def count_queries():
+    """Count SQL statements executed inside the block."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+async def uk_resident(db_session: AsyncSession, test_user):
+    """Test user with a current UK tax status."""
+    db_session.add(UserTaxStatus(
+        user_id=test_user.id,
+        uk_tax_resident=True,
+        sa_tax_resident=False,
+        uk_domicile=UKDomicileStatus.UK_DOMICILE,
+        effective_from=date(2024, 4, 6),
+        effective_to=None
+    ))
+    await db_session.commit()
+    return test_user
+
+
+async def _add_gia_holdings(db_session: AsyncSession, user, count: int, price: Decimal) -> None:
+    """Add a GIA with `count` holdings of 10 units each."""
+    account = InvestmentAccount(
+        id=uuid4(),
+        user_id=user.id,
+        account_type=AccountType.GIA,
+        provider="Vanguard",
+        account_number_encrypted="****1234",
+        country=AccountCountry.UK,
+        base_currency="GBP",
+        account_open_date=date(2024, 1, 1),
+        status=AccountStatus.ACTIVE,
+        deleted=False
+    )
+    db_session.add(account)
+    for i in range(count):
+        db_session.add(InvestmentHolding(
+            account_id=account.id,
+            security_type=SecurityType.STOCK,
+            ticker=f"T{i}",
+            security_name=f"Holding {i}",
+            quantity=Decimal("10"),
+            purchase_date=date(2024, 1, 15),
+            purchase_price=price,
+            purchase_currency="GBP",
+            current_price=price,
+            asset_class=AssetClass.EQUITY,
+            region=Region.UK,
+            deleted=False
+        ))
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_query_count_is_fixed(db_session: AsyncSession, uk_resident):
+    """Test the snapshot doesn't issue more queries as holdings grow."""
+    await _add_gia_holdings(db_session, uk_resident, 2, Decimal("100"))
+    with count_queries() as few:
+        snapshot = await load_user_snapshot(db_session, uk_resident.id)
+    assert snapshot.gia_value == Decimal("2000")
+
+    await _add_gia_holdings(db_session, uk_resident, 20, Decimal("100"))
+    with count_queries() as many:
+        snapshot = await load_user_snapshot(db_session, uk_resident.id)
+    assert snapshot.gia_value == Decimal("22000")
+
+    assert len(few) == len(many) == 3
+
+
+@pytest.mark.asyncio
+async def test_snapshot_missing_user(db_session: AsyncSession):
+    """Test an unknown user has no snapshot."""
+    assert await load_user_snapshot(db_session, uuid4()) is None
+
+
+@pytest.mark.asyncio
+async def test_rules_use_snapshot_allowance_and_gia(db_session: AsyncSession, uk_resident):
+    """Test ISA and GIA-to-ISA rules read the ledger and GIA totals."""
+    await _add_gia_holdings(db_session, uk_resident, 3, Decimal("500"))
+    db_session.add(ISAContribution(
+        user_id=uk_resident.id,
+        tax_year=get_current_uk_tax_year(),
+        contribution_amount=Decimal("4000.00"),
+        contribution_date=date.today()
+    ))
+    await db_session.commit()
+
+    recommendations = await RecommendationService(db_session).generate_recommendations(uk_resident.id)
+    by_type = {rec.recommendation_type: rec for rec in recommendations}
+
+    assert "£16,000.00 of unused ISA allowance" in by_type[RecommendationType.ISA].description
+    assert "£15,000.00 in a General Investment Account" in by_type[RecommendationType.TAX_EFFICIENCY].description
+    assert RecommendationType.TFSA not in by_type
+
+
+@pytest.mark.asyncio
+async def test_save_recommendations_upserts(db_session: AsyncSession, uk_resident):
+    """Test regenerating updates open recommendations instead of duplicating them."""
+    service = RecommendationService(db_session)
+
+    first = await service.save_recommendations(
+        uk_resident.id, await service.generate_recommendations(uk_resident.id)
+    )
+    assert first
+
+    # Completed recommendations are not reopened; a new one is created
+    first[0].complete()
+    await db_session.commit()
+
+    second = await service.save_recommendations(
+        uk_resident.id, await service.generate_recommendations(uk_resident.id)
+    )
+
+    assert [rec.id for rec in second[1:]] == [rec.id for rec in first[1:]]
+    assert second[0].id != first[0].id
+
+    total = (await db_session.execute(
+        select(func.count(Recommendation.id)).where(Recommendation.user_id == uk_resident.id)
+    )).scalar()
+    assert total == len(first) + 1
@@ -0,0 +1,236 @@
+"""
+Tests for the rule engine.
+
+Test Coverage:
+- Registry indexes rules by the inputs they declare
+- Recommendation rules re-run only for changed inputs
+- Writes to tracked models record input changes (ORM and bulk)
+- Holding owners resolve with one query per flush; security repricing marks holders
+- Change times are stamped at commit, not at flush
+- Change-driven evaluator: first run, no-op run, data and calendar changes
+"""
+
+import pytest
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import delete, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import engine
+from models.tax_status import UserTaxStatus, UKDomicileStatus
+from models.investment import (
+    AccountCountry, AccountType, AssetClass, InvestmentAccount, InvestmentHolding,
+    Region, Security, SecurityType
+)
+from models.savings_account import ISAContribution
+from models.recommendation import RecommendationType
+from models.rule_evaluation import RuleInput, RuleInputChange, upsert_input_changes
+from services.ai.recommendation_service import RecommendationService
+from services.ai.recommendation_snapshot import load_user_snapshot
+from services.ai.rule_engine import RuleRegistry, ChangeDrivenEvaluator, clock_state
+from services.investment.price_update_service import PriceUpdateService
+from services.isa_tfsa_tracking import get_current_uk_tax_year
+
+
+@pytest.fixture
+async def uk_resident(db_session: AsyncSession, test_user):
+    """Test user with a current UK tax status."""
+    db_session.add(UserTaxStatus(
+        user_id=test_user.id,
+        uk_tax_resident=True,
+        sa_tax_resident=False,
+        uk_domicile=UKDomicileStatus.UK_DOMICILE,
+        effective_from=date(2024, 4, 6),
+        effective_to=None
+    ))
+    await db_session.commit()
+    return test_user
+
+
+async def _changed_inputs(db_session: AsyncSession, user_id):
+    """Input names recorded as changed for a user."""
+    result = await db_session.execute(
+        select(RuleInputChange.input_name).where(RuleInputChange.user_id == user_id)
+    )
+    return set(result.scalars().all())
+
+
+def test_registry_indexes_rules_by_input():
+    """Test only rules reading a changed input are affected, in order."""
+    registry = RuleRegistry()
+
+    @registry.rule(RuleInput.INCOME)
+    def first():
+        pass
+
+    @registry.rule(RuleInput.SAVINGS, RuleInput.INCOME)
+    def second():
+        pass
+
+    @registry.rule(RuleInput.GOALS)
+    def third():
+        pass
+
+    assert [rule.name for rule in registry.affected_by([RuleInput.INCOME])] == ["first", "second"]
+    assert [rule.name for rule in registry.affected_by([RuleInput.GOALS, RuleInput.SAVINGS])] == ["second", "third"]
+    assert registry.affected_by([RuleInput.COVERAGE]) == []
+    assert [rule.name for rule in registry.affected_by()] == ["first", "second", "third"]
+    assert registry.inputs == {RuleInput.INCOME, RuleInput.SAVINGS, RuleInput.GOALS}
+
+
+def test_clock_deadline_windows():
+    """Test calendar inputs bucket days to tax year end."""
+    assert clock_state(date(2025, 1, 1))[RuleInput.UK_ALLOWANCE_DEADLINE.value] == ">=90"
+    assert clock_state(date(2025, 2, 10))[RuleInput.UK_ALLOWANCE_DEADLINE.value] == "<60"
+    assert clock_state(date(2025, 3, 20))[RuleInput.UK_ALLOWANCE_DEADLINE.value] == "<30"
+    assert clock_state(date(2025, 3, 20))[RuleInput.UK_TAX_YEAR.value] == "2024/25"
+
+
+@pytest.mark.asyncio
+async def test_recommendation_rules_rerun_for_changed_inputs(db_session: AsyncSession, uk_resident):
+    """Test an allowance change re-runs the ISA rules but not protection/emergency fund."""
+    service = RecommendationService(db_session)
+    snapshot = await load_user_snapshot(db_session, uk_resident.id)
+
+    all_types = {rec.recommendation_type for rec in service.evaluate_rules(snapshot)}
+    isa_types = {rec.recommendation_type for rec in service.evaluate_rules(snapshot, [RuleInput.ISA_ALLOWANCE])}
+
+    assert RecommendationType.EMERGENCY_FUND in all_types
+    assert isa_types == {RecommendationType.ISA}
+    assert service.evaluate_rules(snapshot, [RuleInput.GOALS]) == []
+
+
+@pytest.mark.asyncio
+async def test_writes_record_input_changes(db_session: AsyncSession, uk_resident):
+    """Test ORM writes and bulk marks record the user's changed inputs."""
+    assert await _changed_inputs(db_session, uk_resident.id) == {"tax_status"}
+
+    db_session.add(ISAContribution(
+        user_id=uk_resident.id,
+        tax_year=get_current_uk_tax_year(),
+        contribution_amount=Decimal("1000.00"),
+        contribution_date=date.today()
+    ))
+    await db_session.commit()
+
+    connection = await db_session.connection()
+    await connection.run_sync(upsert_input_changes, [uk_resident.id], RuleInput.INVESTMENTS)
+    await db_session.commit()
+
+    assert await _changed_inputs(db_session, uk_resident.id) == {"tax_status", "isa_allowance", "investments"}
+
+
+@pytest.mark.asyncio
+async def test_input_changes_stamped_at_commit(db_session: AsyncSession, uk_resident):
+    """Test a change flushed before an evaluator run starts is dated after it once committed."""
+    db_session.add(ISAContribution(
+        user_id=uk_resident.id,
+        tax_year=get_current_uk_tax_year(),
+        contribution_amount=Decimal("500.00"),
+        contribution_date=date.today()
+    ))
+    await db_session.flush()
+    evaluator_started = datetime.utcnow()
+    await db_session.commit()
+
+    changed_at = (await db_session.execute(
+        select(RuleInputChange.changed_at).where(
+            RuleInputChange.user_id == uk_resident.id,
+            RuleInputChange.input_name == RuleInput.ISA_ALLOWANCE.value
+        )
+    )).scalar_one()
+    assert changed_at >= evaluator_started
+
+
+@pytest.mark.asyncio
+async def test_holding_and_security_writes_record_investments(db_session: AsyncSession, uk_resident):
+    """Test holdings resolve owners in one query and repricing their security marks holders."""
+    account = InvestmentAccount(
+        user_id=uk_resident.id,
+        account_type=AccountType.GIA,
+        provider="Test Provider",
+        country=AccountCountry.UK,
+        base_currency="GBP"
+    )
+    account.set_account_number("12345678")
+    security = Security(ticker="VWRL", exchange="LSE")
+    db_session.add_all([account, security])
+    await db_session.commit()
+    db_session.info.pop('account_owners', None)
+
+    owner_queries = []
+
+    def count_owner_queries(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "investment_accounts" in statement:
+            owner_queries.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count_owner_queries)
+    try:
+        db_session.add_all([
+            InvestmentHolding(
+                account_id=account.id,
+                security_id=security.id,
+                security_type=SecurityType.ETF,
+                ticker="VWRL",
+                security_name=f"Holding {i}",
+                quantity=Decimal("10"),
+                purchase_date=date(2025, 1, 1),
+                purchase_price=Decimal("90.00"),
+                purchase_currency="GBP",
+                current_price=Decimal("90.00"),
+                asset_class=AssetClass.EQUITY,
+                region=Region.GLOBAL
+            )
+            for i in range(3)
+        ])
+        await db_session.commit()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count_owner_queries)
+
+    assert len(owner_queries) == 1
+    assert "investments" in await _changed_inputs(db_session, uk_resident.id)
+
+    await db_session.execute(delete(RuleInputChange).where(RuleInputChange.user_id == uk_resident.id))
+    await db_session.commit()
+
+    await PriceUpdateService(db_session).bulk_update_prices([("VWRL", "LSE", Decimal("101.50"))])
+
+    assert await _changed_inputs(db_session, uk_resident.id) == {"investments"}
+
+
+@pytest.mark.asyncio
+async def test_evaluator_only_returns_changed_users(db_session: AsyncSession, uk_resident):
+    """Test first run evaluates everything, then only changed inputs."""
+    inputs = [RuleInput.TAX_STATUS, RuleInput.ISA_ALLOWANCE, RuleInput.UK_ALLOWANCE_DEADLINE]
+    today = date(2025, 1, 1)
+
+    evaluator = ChangeDrivenEvaluator(db_session, "test", inputs)
+    assert await evaluator.pending_users(today) == {uk_resident.id: None}
+    await evaluator.mark_evaluated(uk_resident.id)
+    await db_session.commit()
+
+    # Nothing changed
+    evaluator = ChangeDrivenEvaluator(db_session, "test", inputs)
+    assert await evaluator.pending_users(today) == {}
+
+    # A contribution changes the ISA allowance input only
+    db_session.add(ISAContribution(
+        user_id=uk_resident.id,
+        tax_year="2024/25",
+        contribution_amount=Decimal("500.00"),
+        contribution_date=today
+    ))
+    await db_session.commit()
+    evaluator = ChangeDrivenEvaluator(db_session, "test", inputs)
+    assert await evaluator.pending_users(today) == {uk_resident.id: {RuleInput.ISA_ALLOWANCE}}
+    await evaluator.mark_evaluated(uk_resident.id)
+    await db_session.commit()
+
+    # Entering the final 60 days changes the deadline input; the month is not read
+    evaluator = ChangeDrivenEvaluator(db_session, "test", inputs)
+    assert await evaluator.pending_users(date(2025, 2, 10)) == {uk_resident.id: {RuleInput.UK_ALLOWANCE_DEADLINE}}
+
+    # Evaluation state is per job
+    other = ChangeDrivenEvaluator(db_session, "other", inputs)
+    assert await other.pending_users(today) == {uk_resident.id: None}
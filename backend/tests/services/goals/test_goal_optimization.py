@@ -15,14 +15,18 @@ from decimal import Decimal
 from uuid import uuid4
 from dateutil.relativedelta import relativedelta
 
+import numpy as np
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.goal import (
     FinancialGoal, GoalType, GoalPriority, GoalStatus
 )
 from services.goals.goal_optimization_service import (
-    GoalOptimizationService, ValidationError
+    GoalOptimizationService, ValidationError,
+    calculate_required_monthly_savings, solve_savings_allocation
 )
+from services.goals.goal_service import GoalService
 
 
 @pytest.fixture
@@ -402,6 +406,72 @@ async def test_allocate_zero_budget(
     assert allocation["total_allocated"] == Decimal('0.00')
 
 
+def test_solve_savings_allocation_fills_by_weight():
+    """Test the LP funds the highest weight goal fully before the next."""
+    required = np.array([30000, 50000, 20000], dtype=np.int64)
+    weights = np.array([50.0, 90.0, 70.0])
+    budgets = np.array([0, 40000, 70000, 200000], dtype=np.int64)
+
+    allocation = solve_savings_allocation(required, weights, budgets)
+
+    assert allocation.tolist() == [
+        [0, 0, 0],
+        [0, 40000, 0],
+        [0, 50000, 20000],
+        [30000, 50000, 20000],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_required_savings_match_goal_service(
+    db_session: AsyncSession,
+    multiple_goals
+):
+    """Test the vectorized requirement matches the per-goal calculation."""
+    goal_service = GoalService(db_session)
+
+    required = calculate_required_monthly_savings(multiple_goals)
+
+    for goal, amount in zip(multiple_goals, required):
+        calc = await goal_service.calculate_monthly_savings_needed(goal.id)
+        assert amount == calc["monthly_savings_needed"]
+
+
+@pytest.mark.asyncio
+async def test_allocation_frontier(
+    optimization_service: GoalOptimizationService,
+    multiple_goals
+):
+    """Test the frontier's breakpoints fund one more goal each, in priority order."""
+    user_id = multiple_goals[0].user_id
+    prioritized = await optimization_service.prioritize_goals(user_id)
+
+    frontier = await optimization_service.allocation_frontier(user_id)
+
+    assert [g["goal_id"] for g in frontier["goals"]] == [str(g["goal_id"]) for g in prioritized]
+    assert [p["fully_funded_count"] for p in frontier["points"]] == [0, 1, 2, 3, 4]
+    assert frontier["points"][-1]["budget"] == frontier["total_required"]
+    assert frontier["points"][-1]["unallocated"] == Decimal('0.00')
+
+    # Matches a single allocation at any budget
+    frontier = await optimization_service.allocation_frontier(user_id, [Decimal('1234.56')])
+    allocation = await optimization_service.allocate_available_savings(user_id, Decimal('1234.56'))
+    allocated = {a["goal_id"]: a["allocated_monthly"] for a in allocation["allocations"]}
+    point = frontier["points"][0]
+    assert point["total_allocated"] == allocation["total_allocated"]
+    assert {a["goal_id"]: a["allocated_monthly"] for a in point["allocations"]} == allocated
+
+
+@pytest.mark.asyncio
+async def test_allocation_frontier_negative_budget_raises_error(
+    optimization_service: GoalOptimizationService,
+    test_user_id
+):
+    """Test that a negative frontier budget raises ValidationError."""
+    with pytest.raises(ValidationError):
+        await optimization_service.allocation_frontier(test_user_id, [Decimal('-1.00')])
+
+
 # ============================================================================
 # CONFLICT DETECTION TESTS
 # ============================================================================
@@ -7,7 +7,8 @@ Tests cover:
 - Monthly savings calculations
 - Account linking
 - Milestone creation and tracking
-- Goal achievement detection
+- Goal achievement detection (per user and all users)
+- Bulk linked-account progress sync
 - Edge cases (limits, validation, temporal data)
 """
 
@@ -17,12 +18,24 @@ from decimal import Decimal
 from uuid import uuid4
 from dateutil.relativedelta import relativedelta
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.goal import (
     FinancialGoal, GoalMilestone, GoalProgressHistory,
     GoalType, GoalPriority, GoalStatus, MilestoneStatus
 )
+from models.savings_account import SavingsAccount, AccountType, AccountCountry, Currency
+from models.investment import (
+    InvestmentAccount,
+    InvestmentHolding,
+    AccountType as InvestmentAccountType,
+    AccountCountry as InvestmentAccountCountry,
+    AccountStatus,
+    SecurityType,
+    AssetClass,
+    Region
+)
 from schemas.goal import CreateGoalRequest
 from services.goals.goal_service import (
     GoalService, ValidationError, NotFoundError, GoalLimitError
@@ -644,6 +657,187 @@ async def test_check_goal_achievements_updates_status(
     assert goal.progress_percentage == Decimal('100.00')
 
 
+def _goal(user_id, current_amount, target_amount, linked_accounts=None) -> FinancialGoal:
+    """In-progress custom goal, started 6 months ago, due in 18 months."""
+    return FinancialGoal(
+        id=uuid4(),
+        user_id=user_id,
+        goal_name="Goal",
+        goal_type=GoalType.CUSTOM,
+        target_amount=target_amount,
+        currency='GBP',
+        current_amount=current_amount,
+        target_date=date.today() + relativedelta(months=18),
+        start_date=date.today() - relativedelta(months=6),
+        priority=GoalPriority.MEDIUM,
+        status=GoalStatus.IN_PROGRESS,
+        linked_accounts=linked_accounts
+    )
+
+
+def _savings_account(user_id, balance: Decimal) -> SavingsAccount:
+    """Active GBP savings account."""
+    return SavingsAccount(
+        id=uuid4(),
+        user_id=user_id,
+        bank_name="Test Bank",
+        account_name="Savings",
+        account_number_encrypted="encrypted_1234",
+        account_type=AccountType.SAVINGS,
+        currency=Currency.GBP,
+        current_balance=balance,
+        country=AccountCountry.UK,
+        is_active=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_check_goal_achievements_all_users(
+    goal_service: GoalService,
+    db_session: AsyncSession
+):
+    """Test the all-users check marks goals and milestones and stores snapshots."""
+    achieved_ids = []
+    for user_id in (uuid4(), uuid4()):
+        goal = _goal(user_id, current_amount=Decimal('1000.00'), target_amount=Decimal('1000.00'))
+        db_session.add(goal)
+        achieved_ids.append(goal.id)
+
+    in_progress = _goal(uuid4(), current_amount=Decimal('3000.00'), target_amount=Decimal('10000.00'))
+    db_session.add(in_progress)
+    milestone = GoalMilestone(
+        id=uuid4(),
+        goal_id=in_progress.id,
+        milestone_name="First 2k",
+        milestone_target_amount=Decimal('2000.00'),
+        milestone_target_date=date.today() + relativedelta(months=6),
+        status=MilestoneStatus.PENDING
+    )
+    db_session.add(milestone)
+    await db_session.commit()
+
+    achievements = await goal_service.check_goal_achievements()
+
+    assert sorted(a["goal_id"] for a in achievements) == sorted(achieved_ids)
+
+    await db_session.refresh(milestone)
+    assert milestone.status == MilestoneStatus.ACHIEVED
+    assert milestone.achieved_date == date.today()
+
+    snapshots = (await db_session.execute(
+        select(GoalProgressHistory).where(GoalProgressHistory.goal_id.in_(achieved_ids))
+    )).scalars().all()
+    assert len(snapshots) == 2
+    assert all(s.progress_percentage == Decimal('100.00') for s in snapshots)
+
+    # Already achieved goals are not reported again
+    assert await goal_service.check_goal_achievements() == []
+
+
+@pytest.mark.asyncio
+async def test_sync_linked_account_progress(
+    goal_service: GoalService,
+    db_session: AsyncSession,
+    test_user_id
+):
+    """Test progress is recalculated in bulk from the owner's linked balances."""
+    savings = _savings_account(test_user_id, Decimal('3000.00'))
+    others = _savings_account(uuid4(), Decimal('50000.00'))
+    investments = InvestmentAccount(
+        id=uuid4(),
+        user_id=test_user_id,
+        account_type=InvestmentAccountType.GIA,
+        provider="Vanguard",
+        account_number_encrypted="****1234",
+        country=InvestmentAccountCountry.UK,
+        base_currency="GBP",
+        account_open_date=date(2024, 1, 1),
+        status=AccountStatus.ACTIVE,
+        deleted=False
+    )
+    db_session.add_all([savings, others, investments])
+    db_session.add(InvestmentHolding(
+        account_id=investments.id,
+        security_type=SecurityType.STOCK,
+        ticker="VWRL",
+        security_name="Vanguard FTSE All-World",
+        quantity=Decimal('10'),
+        purchase_date=date(2024, 1, 15),
+        purchase_price=Decimal('150.00'),
+        purchase_currency="GBP",
+        current_price=Decimal('200.00'),
+        asset_class=AssetClass.EQUITY,
+        region=Region.GLOBAL,
+        deleted=False
+    ))
+
+    # Another user's account and an invalid ID are ignored
+    goal = _goal(
+        test_user_id,
+        current_amount=Decimal('0.00'),
+        target_amount=Decimal('10000.00'),
+        linked_accounts=[str(savings.id), str(investments.id), str(others.id), "not-a-uuid"]
+    )
+    unlinked = _goal(test_user_id, current_amount=Decimal('100.00'), target_amount=Decimal('10000.00'))
+    db_session.add_all([goal, unlinked])
+    milestone = GoalMilestone(
+        id=uuid4(),
+        goal_id=goal.id,
+        milestone_name="Halfway",
+        milestone_target_amount=Decimal('5000.00'),
+        milestone_target_date=date.today() + relativedelta(months=12),
+        status=MilestoneStatus.PENDING
+    )
+    db_session.add(milestone)
+    await db_session.commit()
+    await db_session.refresh(goal)
+    updated_before = goal.updated_at
+
+    result = await goal_service.sync_linked_account_progress(test_user_id)
+
+    assert result == {
+        "goals_checked": 1,
+        "goals_updated": 1,
+        "goals_achieved": 0,
+        "milestones_achieved": 1
+    }
+
+    await db_session.refresh(goal)
+    await db_session.refresh(milestone)
+    assert goal.current_amount == Decimal('5000.00')
+    assert goal.progress_percentage == Decimal('50.00')
+    assert goal.status == GoalStatus.ON_TRACK
+    assert goal.updated_at > updated_before
+    assert milestone.status == MilestoneStatus.ACHIEVED
+
+    snapshot = (await db_session.execute(
+        select(GoalProgressHistory).where(GoalProgressHistory.goal_id == goal.id)
+    )).scalar_one()
+    assert snapshot.amount_at_snapshot == Decimal('5000.00')
+
+    # Unchanged balances write nothing
+    result = await goal_service.sync_linked_account_progress(test_user_id)
+    assert result["goals_updated"] == 0
+
+
+@pytest.mark.asyncio
+async def test_update_goal_progress_from_linked_account(
+    goal_service: GoalService,
+    db_session: AsyncSession,
+    sample_goal,
+    test_user_id
+):
+    """Test linking a savings account sets progress from its balance."""
+    savings = _savings_account(test_user_id, Decimal('7500.00'))
+    db_session.add(savings)
+    await db_session.commit()
+
+    goal = await goal_service.link_account_to_goal(sample_goal.id, str(savings.id), "SAVINGS_ACCOUNT")
+
+    assert goal.current_amount == Decimal('7500.00')
+    assert goal.progress_percentage == Decimal('50.00')
+
+
 # ============================================================================
 # EDGE CASE TESTS
 # ============================================================================
@@ -9,6 +9,7 @@ Tests cover:
 - Transferable NRB application
 - IHT calculation saving
 - Edge cases (zero estate, negative values handled)
+- As-of estate timeline and valuation series
 """
 
 import pytest
@@ -22,7 +23,7 @@ from models.estate_iht import (
     EstateAsset, EstateLiability, IHTCalculation, AssetType, LiabilityType
 )
 from services.iht.estate_valuation_service import (
-    EstateValuationService, ValidationError
+    EstateValuationService, EstateTimeline, ValidationError
 )
 
 
@@ -670,3 +671,85 @@ class TestEdgeCases:
         result = await estate_service.calculate_iht(test_user_id)
         assert result['taxable_estate'] == Decimal('0.00')
         assert result['iht_owed'] == Decimal('0.00')
+
+
+class TestEstateTimeline:
+    """Tests for the as-of estate timeline."""
+
+    def test_timeline_step_boundaries(self):
+        """Test effective_from is inclusive and effective_to exclusive."""
+        timeline = EstateTimeline(
+            [
+                (date(2020, 1, 1), date(2022, 1, 1), Decimal('400000.00'), AssetType.PROPERTY),
+                (date(2022, 1, 1), None, Decimal('450000.00'), AssetType.PROPERTY),
+                (date(2021, 6, 1), None, Decimal('100000.00'), AssetType.INVESTMENTS),
+            ],
+            [(date(2020, 1, 1), date(2021, 1, 1), Decimal('50000.00'))]
+        )
+
+        assert timeline.value_at(date(2019, 12, 31))['gross_estate'] == Decimal('0.00')
+
+        points = timeline.series([date(2020, 1, 1), date(2021, 6, 1), date(2022, 1, 1)])
+        assert [p['gross_estate'] for p in points] == [
+            Decimal('400000.00'), Decimal('500000.00'), Decimal('550000.00')
+        ]
+        assert [p['net_estate'] for p in points] == [
+            Decimal('350000.00'), Decimal('500000.00'), Decimal('550000.00')
+        ]
+        assert [p['residence_value'] for p in points] == [
+            Decimal('400000.00'), Decimal('400000.00'), Decimal('450000.00')
+        ]
+
+    async def test_valuation_series_matches_point_queries(
+        self,
+        estate_service: EstateValuationService,
+        db_session: AsyncSession,
+        test_user_id,
+        sample_assets,
+        sample_liabilities
+    ):
+        """Test the series uses UK-included, deductible, non-deleted rows."""
+        today = date.today()
+        db_session.add(EstateAsset(
+            id=uuid4(),
+            user_id=test_user_id,
+            asset_type=AssetType.PROPERTY,
+            description="Overseas property",
+            estimated_value=Decimal('900000.00'),
+            currency='GBP',
+            owned_individually=True,
+            included_in_uk_estate=False,
+            included_in_sa_estate=True,
+            effective_from=today - timedelta(days=365),
+            effective_to=None,
+            is_deleted=False
+        ))
+        await db_session.commit()
+
+        series = await estate_service.get_valuation_series(
+            test_user_id, [today - timedelta(days=400), today]
+        )
+
+        assert series[0]['gross_estate'] == Decimal('0.00')
+        assert series[1]['gross_estate'] == Decimal('1000000.00')
+        assert series[1]['net_estate'] == Decimal('800000.00')
+        assert series[1]['residence_value'] == Decimal('500000.00')
+        assert series[1]['net_estate'] == await estate_service.calculate_net_estate(test_user_id)
+
+    async def test_timeline_cached_until_invalidated(
+        self,
+        estate_service: EstateValuationService,
+        db_session: AsyncSession,
+        test_user_id,
+        sample_assets
+    ):
+        """Test the timeline is loaded once per service instance."""
+        assert await estate_service.calculate_gross_estate(test_user_id) == Decimal('1000000.00')
+
+        sample_assets[1].is_deleted = True
+        await db_session.commit()
+
+        assert await estate_service.calculate_gross_estate(test_user_id) == Decimal('1000000.00')
+
+        estate_service.invalidate_timeline(test_user_id)
+        assert await estate_service.calculate_gross_estate(test_user_id) == Decimal('800000.00')
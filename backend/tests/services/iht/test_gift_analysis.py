@@ -20,7 +20,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.estate_iht import Gift, GiftType, ExemptionType, IHTExemption
 from services.iht.gift_analysis_service import (
-    GiftAnalysisService, ValidationError
+    GiftAnalysisService, ValidationError, calculate_gift_iht_exposure
 )
 
 
@@ -622,3 +622,117 @@ class TestEdgeCases:
         calc = calculations[0]
         assert calc['taper_relief_percent'] == Decimal('1.00')
         assert calc['potential_iht'] == Decimal('0.00')
+
+
+def _gift(gift_date, value, gift_type=GiftType.PET):
+    """Build a gift dict for the exposure engine."""
+    return {'gift_date': gift_date, 'gift_value': Decimal(value), 'gift_type': gift_type}
+
+
+class TestGiftIHTExposure:
+    """Tests for the vectorized death-date exposure sweep."""
+
+    def test_single_pet_taper_and_expiry(self):
+        """Test one PET over NRB tapers by year and drops out after 7 years."""
+        gift_date = date(2020, 6, 1)
+        deaths = [gift_date + relativedelta(years=n) for n in (1, 3, 5, 7)]
+
+        exposure = calculate_gift_iht_exposure([_gift(gift_date, '425000.00')], deaths)
+
+        # Excess over NRB is £100,000 -> £40,000 before taper
+        assert [p['gift_iht'] for p in exposure] == [
+            Decimal('40000.00'), Decimal('32000.00'), Decimal('16000.00'), Decimal('0.00')
+        ]
+        assert exposure[0]['nrb_remaining'] == Decimal('0.00')
+        assert exposure[3]['chargeable_gifts'] == 0
+        assert exposure[3]['nrb_remaining'] == Decimal('325000.00')
+
+    def test_nrb_allocated_chronologically(self):
+        """Test earlier gifts use the NRB first."""
+        exposure = calculate_gift_iht_exposure(
+            [_gift(date(2021, 1, 1), '200000.00'), _gift(date(2020, 1, 1), '200000.00')],
+            [date(2022, 1, 1)]
+        )
+
+        # First gift fully covered; second has £125,000 NRB left -> £75,000 taxable
+        assert exposure[0]['gift_iht'] == Decimal('30000.00')
+        assert exposure[0]['chargeable_value'] == Decimal('400000.00')
+        assert exposure[0]['nrb_used_by_gifts'] == Decimal('325000.00')
+
+    def test_clt_shadow_reduces_nrb_for_later_pet(self):
+        """Test a CLT outside the 7-year window still reduces NRB for a later PET."""
+        exposure = calculate_gift_iht_exposure(
+            [
+                _gift(date(2010, 1, 1), '300000.00', GiftType.CHARGEABLE),
+                _gift(date(2016, 1, 1), '100000.00'),
+            ],
+            [date(2018, 1, 1)]
+        )
+
+        # CLT is >7 years before death (not taxed), but within 7 years before
+        # the PET: PET has £25,000 NRB -> £75,000 taxable, no taper (2 years)
+        assert exposure[0]['gift_iht'] == Decimal('30000.00')
+        assert exposure[0]['chargeable_gifts'] == 1
+        assert exposure[0]['nrb_remaining'] == Decimal('225000.00')
+
+    def test_expired_pet_does_not_shadow(self):
+        """Test a PET that survived 7 years does not reduce NRB for later gifts."""
+        exposure = calculate_gift_iht_exposure(
+            [_gift(date(2010, 1, 1), '300000.00'), _gift(date(2016, 1, 1), '100000.00')],
+            [date(2018, 1, 1)]
+        )
+
+        assert exposure[0]['gift_iht'] == Decimal('0.00')
+
+    def test_gifts_after_death_and_exempt_ignored(self):
+        """Test gifts after the death date and exempt gifts are not charged."""
+        exposure = calculate_gift_iht_exposure(
+            [
+                _gift(date(2024, 1, 1), '500000.00', GiftType.EXEMPT),
+                _gift(date(2025, 1, 1), '500000.00'),
+            ],
+            [date(2024, 6, 1)]
+        )
+
+        assert exposure[0]['chargeable_gifts'] == 0
+        assert exposure[0]['gift_iht'] == Decimal('0.00')
+
+    async def test_exposure_sweep_loads_user_gifts(
+        self,
+        gift_service: GiftAnalysisService,
+        db_session: AsyncSession,
+        test_user_id
+    ):
+        """Test the service sweep uses the user's non-deleted gifts."""
+        today = date.today()
+        for value, deleted in (('400000.00', False), ('900000.00', True)):
+            db_session.add(Gift(
+                id=uuid4(),
+                user_id=test_user_id,
+                recipient='Child',
+                gift_date=today - relativedelta(years=1),
+                gift_value=Decimal(value),
+                currency='GBP',
+                gift_type=GiftType.PET,
+                becomes_exempt_date=today + relativedelta(years=6),
+                still_in_pet_period=True,
+                is_deleted=deleted
+            ))
+        await db_session.commit()
+
+        deaths = [today + relativedelta(years=n) for n in range(8)]
+        exposure = await gift_service.calculate_iht_exposure_sweep(test_user_id, deaths)
+
+        assert len(exposure) == 8
+        assert exposure[0]['gift_iht'] == Decimal('30000.00')
+        assert exposure[2]['gift_iht'] == Decimal('24000.00')
+        assert exposure[6]['gift_iht'] == Decimal('0.00')
+
+    async def test_exposure_sweep_requires_dates(
+        self,
+        gift_service: GiftAnalysisService,
+        test_user_id
+    ):
+        """Test an empty death date list is rejected."""
+        with pytest.raises(ValidationError):
+            await gift_service.calculate_iht_exposure_sweep(test_user_id, [])
@@ -12,11 +12,13 @@ Test Coverage:
 - Empty portfolio handling
 - Multiple accounts
 - Currency exposure calculation
+- Single-pass analytics and per-user caching
 """
 
 import pytest
 from decimal import Decimal
 from datetime import date, datetime
+from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
 from sqlalchemy import select
@@ -797,3 +799,89 @@ class TestMultipleAccounts:
 
         # Should only count active account
         assert summary['num_accounts'] == 1
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis_client wrapper."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, expire=None):
+        self.store[key] = value
+        return True
+
+    async def delete(self, *keys):
+        return sum(1 for key in keys if self.store.pop(key, None) is not None)
+
+
+class TestPortfolioAnalytics:
+    """Tests for single-pass analytics and caching."""
+
+    async def test_analytics_includes_all_breakdowns(self, db_session, test_user, multiple_holdings):
+        """Test one analytics pass produces every breakdown consistently."""
+        service = AssetAllocationService(db_session)
+
+        with patch.object(service, '_get_active_holdings', wraps=service._get_active_holdings) as loader:
+            analytics = await service.get_portfolio_analytics(test_user.id, use_cache=False)
+
+        assert loader.call_count == 1
+        assert analytics['total_value'] == Decimal('153200.00')
+        for breakdown in ('asset_allocation', 'region_allocation', 'sector_allocation', 'currency_exposure'):
+            assert sum(item['value'] for item in analytics[breakdown].values()) == Decimal('153200.00')
+        assert analytics['region_allocation']['UK']['value'] == Decimal('101200.00')
+        assert len(analytics['top_holdings']) == 5
+
+    async def test_dashboard_calls_share_cached_analytics(self, db_session, test_user, multiple_holdings):
+        """Test summary and allocations after the first call are served from cache."""
+        service = AssetAllocationService(db_session)
+        fake_redis = FakeRedis()
+
+        with patch('services.investment.asset_allocation_service.redis_client', fake_redis), \
+                patch.object(service, '_calculate_analytics', wraps=service._calculate_analytics) as calculate:
+            summary = await service.get_portfolio_summary(test_user.id)
+            by_class = await service.calculate_allocation_by_asset_class(test_user.id)
+            by_region = await service.calculate_allocation_by_region(test_user.id)
+            by_sector = await service.calculate_allocation_by_sector(test_user.id)
+            cached_summary = await service.get_portfolio_summary(test_user.id)
+
+        assert calculate.call_count == 1
+        assert AssetAllocationService.cache_key(test_user.id) in fake_redis.store
+
+        # Cached values round-trip as Decimals
+        assert cached_summary == summary
+        assert by_class == summary['asset_allocation']
+        assert isinstance(by_region['UK']['percentage'], Decimal)
+        assert by_sector['TECHNOLOGY']['value'] > 0
+        assert 'region_allocation' not in summary
+
+    async def test_invalidate_cache_forces_recalculation(self, db_session, test_user, multiple_holdings):
+        """Test invalidation drops the cached analytics for the user."""
+        service = AssetAllocationService(db_session)
+        fake_redis = FakeRedis()
+
+        with patch('services.investment.asset_allocation_service.redis_client', fake_redis):
+            await service.get_portfolio_summary(test_user.id)
+            await AssetAllocationService.invalidate_cache([test_user.id])
+
+            assert fake_redis.store == {}
+
+            with patch.object(service, '_calculate_analytics', wraps=service._calculate_analytics) as calculate:
+                await service.get_portfolio_summary(test_user.id)
+
+        assert calculate.call_count == 1
+
+    async def test_redis_error_does_not_break_analytics(self, db_session, test_user, multiple_holdings):
+        """Test analytics are still calculated when Redis is unavailable."""
+        service = AssetAllocationService(db_session)
+        broken_redis = AsyncMock()
+        broken_redis.get.side_effect = Exception("Redis down")
+        broken_redis.set.side_effect = Exception("Redis down")
+
+        with patch('services.investment.asset_allocation_service.redis_client', broken_redis):
+            summary = await service.get_portfolio_summary(test_user.id)
+
+        assert summary['total_value'] == Decimal('153200.00')
@@ -6,6 +6,7 @@ Comprehensive test suite for portfolio management service including:
 - Holding creation and initial values
 - Price updates with gain calculations
 - Selling holdings using FIFO (partial and full sales)
+- Open-lot queue and bulk disposals
 - Dividend recording
 - Validation errors (negative prices, overselling, etc.)
 - Account number encryption verification
@@ -605,6 +606,169 @@ class TestSellHolding:
         assert "Quantity to sell must be greater than 0" in str(exc_info.value)
 
 
+class TestOpenLotQueue:
+    """Test the open-lot FIFO queue and bulk disposals."""
+
+    async def _holding_with_two_lots(self, db_session, portfolio_service, test_account):
+        """Create a holding with lots of 30 @ 100 (Jan) and 20 @ 120 (Mar)."""
+        holding = await portfolio_service.add_holding(
+            account_id=test_account.id,
+            security_type=SecurityType.STOCK,
+            ticker="MSFT",
+            name="Microsoft Corp",
+            quantity=Decimal("30.00"),
+            purchase_price=Decimal("100.00"),
+            purchase_date=date(2024, 1, 1),
+            purchase_currency="GBP",
+            asset_class=AssetClass.EQUITY,
+            region=Region.US
+        )
+        db_session.add(TaxLot(
+            id=uuid.uuid4(),
+            holding_id=holding.id,
+            purchase_date=date(2024, 3, 1),
+            quantity=Decimal("20.00"),
+            purchase_price=Decimal("120.00"),
+            purchase_currency="GBP",
+            cost_basis_gbp=Decimal("2400.00"),
+            cost_basis_zar=Decimal("56400.00"),
+            exchange_rate=Decimal("23.50"),
+            created_at=datetime.utcnow()
+        ))
+        holding.quantity = Decimal("50.00")
+        await db_session.commit()
+        return holding
+
+    async def test_new_lot_defaults_remaining_to_quantity(self, db_session, test_account, portfolio_service):
+        """Test lots enter the queue fully open."""
+        holding = await self._holding_with_two_lots(db_session, portfolio_service, test_account)
+
+        result = await db_session.execute(
+            select(TaxLot).where(TaxLot.holding_id == holding.id).order_by(TaxLot.purchase_date)
+        )
+        lots = result.scalars().all()
+        assert [lot.remaining_quantity for lot in lots] == [Decimal("30.00"), Decimal("20.00")]
+        assert all(lot.is_open for lot in lots)
+
+    async def test_partially_sold_lot_stays_open(self, db_session, test_account, portfolio_service):
+        """Test a partial sale leaves the remainder of the lot available to later sales."""
+        holding = await self._holding_with_two_lots(db_session, portfolio_service, test_account)
+
+        await portfolio_service.sell_holding(
+            holding_id=holding.id,
+            quantity_to_sell=Decimal("10.00"),
+            sale_price=Decimal("150.00"),
+            sale_date=date(2024, 5, 1)
+        )
+
+        # Second sale must consume the remaining 20 of lot 1 before lot 2
+        sale = await portfolio_service.sell_holding(
+            holding_id=holding.id,
+            quantity_to_sell=Decimal("25.00"),
+            sale_price=Decimal("150.00"),
+            sale_date=date(2024, 6, 1)
+        )
+
+        # Lot 1: (150 - 100) * 20 = 1000; Lot 2: (150 - 120) * 5 = 150
+        assert sale["realized_gain"] == 1150.00
+        assert sale["remaining_quantity"] == 15.00
+
+        result = await db_session.execute(
+            select(TaxLot).where(TaxLot.holding_id == holding.id).order_by(TaxLot.purchase_date)
+        )
+        lot1, lot2 = result.scalars().all()
+        assert lot1.remaining_quantity == Decimal("0")
+        assert lot1.disposal_quantity == Decimal("30.00")
+        assert lot1.realized_gain == Decimal("1500.00")
+        assert not lot1.is_open
+        assert lot2.remaining_quantity == Decimal("15.00")
+        assert lot2.disposal_quantity == Decimal("5.00")
+
+    async def test_sale_uses_uk_tax_year_boundary(self, db_session, test_account, portfolio_service):
+        """Test sales after April 6 fall in the new tax year regardless of day of month."""
+        holding = await self._holding_with_two_lots(db_session, portfolio_service, test_account)
+
+        sale = await portfolio_service.sell_holding(
+            holding_id=holding.id,
+            quantity_to_sell=Decimal("5.00"),
+            sale_price=Decimal("150.00"),
+            sale_date=date(2024, 7, 1)
+        )
+
+        assert sale["tax_year"] == "2024/25"
+
+    async def test_bulk_sell_single_transaction(self, db_session, test_account, portfolio_service):
+        """Test bulk disposals of the same holding consume the queue in order."""
+        holding = await self._holding_with_two_lots(db_session, portfolio_service, test_account)
+
+        sales = await portfolio_service.sell_holdings_bulk([
+            {
+                "holding_id": holding.id,
+                "quantity_to_sell": Decimal("20.00"),
+                "sale_price": Decimal("150.00"),
+                "sale_date": date(2024, 5, 1)
+            },
+            {
+                "holding_id": holding.id,
+                "quantity_to_sell": Decimal("20.00"),
+                "sale_price": Decimal("150.00"),
+                "sale_date": date(2024, 5, 2)
+            },
+        ])
+
+        assert len(sales) == 2
+        assert sales[0]["realized_gain"] == 1000.00  # 20 from lot 1
+        assert sales[1]["realized_gain"] == 500.00 + 300.00  # 10 from lot 1, 10 from lot 2
+        assert sales[1]["remaining_quantity"] == 10.00
+
+        result = await db_session.execute(
+            select(CapitalGainRealized).where(CapitalGainRealized.holding_id == holding.id)
+        )
+        assert len(result.scalars().all()) == 2
+
+    async def test_bulk_sell_rolls_back_on_error(self, db_session, test_account, portfolio_service):
+        """Test a failing disposal rolls back the whole batch."""
+        holding = await self._holding_with_two_lots(db_session, portfolio_service, test_account)
+        holding_id = holding.id
+
+        with pytest.raises(ValueError) as exc_info:
+            await portfolio_service.sell_holdings_bulk([
+                {
+                    "holding_id": holding_id,
+                    "quantity_to_sell": Decimal("10.00"),
+                    "sale_price": Decimal("150.00"),
+                    "sale_date": date(2024, 5, 1)
+                },
+                {
+                    "holding_id": holding_id,
+                    "quantity_to_sell": Decimal("100.00"),
+                    "sale_price": Decimal("150.00"),
+                    "sale_date": date(2024, 5, 2)
+                },
+            ])
+
+        assert "Cannot sell" in str(exc_info.value)
+
+        result = await db_session.execute(
+            select(CapitalGainRealized).where(CapitalGainRealized.holding_id == holding_id)
+        )
+        assert result.scalars().all() == []
+
+        result = await db_session.execute(
+            select(TaxLot.remaining_quantity)
+            .where(TaxLot.holding_id == holding_id)
+            .order_by(TaxLot.purchase_date)
+        )
+        assert result.scalars().all() == [Decimal("30.00"), Decimal("20.00")]
+
+    async def test_bulk_sell_empty_batch(self, portfolio_service):
+        """Test an empty batch is rejected."""
+        with pytest.raises(ValueError) as exc_info:
+            await portfolio_service.sell_holdings_bulk([])
+
+        assert "At least one disposal" in str(exc_info.value)
+
+
 class TestRecordDividend:
     """Test dividend recording."""
 
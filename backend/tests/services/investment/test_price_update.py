@@ -0,0 +1,286 @@
+"""
+Bulk Price Update Service Tests
+
+Test suite for bulk holding repricing including:
+- CSV price feed parsing and validation
+- Security master repricing shared by every holder of a security
+- Chunked updates
+- Soft-deleted holdings do not count as affected
+- Cache invalidation limited to affected users
+- Security master linking and single-holding price updates
+"""
+
+import pytest
+import uuid
+from decimal import Decimal
+from datetime import date, datetime
+from unittest.mock import AsyncMock, patch
+
+from sqlalchemy import select
+
+from models.investment import (
+    InvestmentAccount, InvestmentHolding, Security, AccountType, AccountCountry,
+    AccountStatus, SecurityType, AssetClass, Region
+)
+from models.user import User, UserStatus, CountryPreference
+from services.investment.asset_allocation_service import AssetAllocationService
+from services.investment.portfolio_service import PortfolioService
+from services.investment.price_update_service import PriceUpdateService, parse_price_csv
+from services.investment.security_master_service import SecurityMasterService
+from utils.password import hash_password
+
+
+async def _create_security(db_session, ticker, exchange="", price=None):
+    """Create a security master row."""
+    security = Security(id=uuid.uuid4(), ticker=ticker, exchange=exchange, current_price=price)
+    db_session.add(security)
+    await db_session.commit()
+    return security
+
+
+async def _create_user_with_holdings(db_session, email, holdings):
+    """Create a user with one GIA account holding the given (security, price, deleted) rows."""
+    user = User(
+        email=email,
+        password_hash=hash_password("PricingPass123!"),
+        first_name="Price",
+        last_name="Tester",
+        country_preference=CountryPreference.UK,
+        status=UserStatus.ACTIVE,
+        email_verified=True,
+        terms_accepted_at=datetime.utcnow(),
+        marketing_consent=False,
+    )
+    db_session.add(user)
+    await db_session.flush()
+
+    account = InvestmentAccount(
+        id=uuid.uuid4(),
+        user_id=user.id,
+        account_type=AccountType.GIA,
+        provider="Test Broker",
+        country=AccountCountry.UK,
+        base_currency="GBP",
+        status=AccountStatus.ACTIVE,
+        deleted=False
+    )
+    account.set_account_number("GIA00001")
+    db_session.add(account)
+    await db_session.flush()
+
+    created = []
+    for security, price, deleted in holdings:
+        holding = InvestmentHolding(
+            id=uuid.uuid4(),
+            account_id=account.id,
+            security_type=SecurityType.STOCK,
+            ticker=security.ticker,
+            security_name=f"{security.ticker} plc",
+            security=security,
+            quantity=Decimal("10"),
+            purchase_date=date(2024, 1, 1),
+            purchase_price=Decimal(price),
+            purchase_currency="GBP",
+            current_price=Decimal(price),
+            asset_class=AssetClass.EQUITY,
+            region=Region.UK,
+            deleted=deleted
+        )
+        db_session.add(holding)
+        created.append(holding)
+
+    await db_session.commit()
+    return user, created
+
+
+async def _security_prices(db_session):
+    """Map (ticker, exchange) to the stored security price."""
+    rows = (await db_session.execute(
+        select(Security.ticker, Security.exchange, Security.current_price)
+    )).all()
+    return {(ticker, exchange): price for ticker, exchange, price in rows}
+
+
+class TestParsePriceCsv:
+    """Test CSV feed parsing."""
+
+    def test_parse_with_header_and_blank_lines(self):
+        """Test header and blank lines are skipped and tickers normalized."""
+        rows = list(parse_price_csv(["ticker,price", "vod, 0.72", "", "BP,4.85,lse"]))
+
+        assert rows == [("VOD", "", Decimal("0.72")), ("BP", "LSE", Decimal("4.85"))]
+
+    def test_parse_malformed_line(self):
+        """Test malformed lines report the line number."""
+        with pytest.raises(ValueError) as exc_info:
+            list(parse_price_csv(["VOD,0.72", "BP"]))
+
+        assert "Line 2" in str(exc_info.value)
+
+    def test_parse_invalid_price(self):
+        """Test non-numeric prices are rejected."""
+        with pytest.raises(ValueError) as exc_info:
+            list(parse_price_csv(["VOD,abc"]))
+
+        assert "invalid price" in str(exc_info.value)
+
+    def test_parse_negative_price(self):
+        """Test negative prices are rejected."""
+        with pytest.raises(ValueError) as exc_info:
+            list(parse_price_csv(["VOD,-1"]))
+
+        assert "cannot be negative" in str(exc_info.value)
+
+
+class TestBulkUpdatePrices:
+    """Test set-based repricing of the security master."""
+
+    async def test_reprices_security_shared_across_users(self, db_session):
+        """Test one security row reprices every holder, others untouched."""
+        vod = await _create_security(db_session, "VOD")
+        bp = await _create_security(db_session, "BP")
+        hsba = await _create_security(db_session, "HSBA", price=Decimal("6.00"))
+
+        user_a, holdings_a = await _create_user_with_holdings(
+            db_session, "a@example.com", [(vod, "0.70", False), (bp, "4.00", False)]
+        )
+        user_b, holdings_b = await _create_user_with_holdings(
+            db_session, "b@example.com", [(vod, "0.80", False)]
+        )
+        user_c, holdings_c = await _create_user_with_holdings(
+            db_session, "c@example.com", [(hsba, "5.00", False)]
+        )
+
+        mock_redis = AsyncMock()
+        with patch('services.investment.price_update_service.redis_client', mock_redis):
+            result = await PriceUpdateService(db_session).bulk_update_prices(
+                [("VOD", "", Decimal("0.75")), ("BP", "", Decimal("4.50")),
+                 ("UNKNOWN", "", Decimal("1"))]
+            )
+
+        assert result["securities_received"] == 3
+        assert result["securities_updated"] == 2
+        assert result["users_affected"] == 2
+        assert result["chunks"] == 1
+
+        # Holdings rows are not written; values come from the security at read time
+        db_session.expunge_all()
+        holdings = {
+            h.id: h for h in (await db_session.execute(select(InvestmentHolding))).scalars().all()
+        }
+        assert holdings[holdings_a[0].id].current_price == Decimal("0.70")
+        assert holdings[holdings_a[0].id].market_price == Decimal("0.75")
+        assert holdings[holdings_a[1].id].current_value == Decimal("45.00")
+        assert holdings[holdings_b[0].id].market_price == Decimal("0.75")
+        assert holdings[holdings_c[0].id].market_price == Decimal("6.00")
+
+        # Only affected users' dashboard caches are invalidated
+        deleted_keys = [key for call in mock_redis.delete.call_args_list for key in call[0]]
+        assert any(str(user_a.id) in key for key in deleted_keys)
+        assert any(str(user_b.id) in key for key in deleted_keys)
+        assert not any(str(user_c.id) in key for key in deleted_keys)
+        assert AssetAllocationService.cache_key(user_a.id) in deleted_keys
+
+    async def test_chunked_updates(self, db_session):
+        """Test the feed is applied in chunks and last price wins for duplicates."""
+        for ticker in ("AAA", "BBB", "CCC"):
+            await _create_security(db_session, ticker)
+        await _create_security(db_session, "AAA", exchange="JSE")
+
+        with patch('services.investment.price_update_service.redis_client', AsyncMock()):
+            result = await PriceUpdateService(db_session).bulk_update_prices(
+                [("AAA", "", Decimal("1.10")), ("AAA", "", Decimal("1.20")),
+                 ("BBB", "", Decimal("2.20")), ("CCC", "", Decimal("3.30")),
+                 ("AAA", "JSE", Decimal("25.00"))],
+                chunk_size=2
+            )
+
+        assert result["chunks"] == 2
+        assert result["securities_updated"] == 4
+
+        assert await _security_prices(db_session) == {
+            ("AAA", ""): Decimal("1.20"),
+            ("BBB", ""): Decimal("2.20"),
+            ("CCC", ""): Decimal("3.30"),
+            ("AAA", "JSE"): Decimal("25.00"),
+        }
+
+    async def test_deleted_holdings_not_affected(self, db_session):
+        """Test users with only soft-deleted holdings are not invalidated."""
+        vod = await _create_security(db_session, "VOD")
+        await _create_user_with_holdings(db_session, "deleted@example.com", [(vod, "0.70", True)])
+
+        mock_redis = AsyncMock()
+        with patch('services.investment.price_update_service.redis_client', mock_redis):
+            result = await PriceUpdateService(db_session).bulk_update_prices(
+                [("VOD", "", Decimal("0.75"))]
+            )
+
+        assert result["securities_updated"] == 1
+        assert result["users_affected"] == 0
+        mock_redis.delete.assert_not_called()
+
+    async def test_negative_price_rejected(self, db_session):
+        """Test a negative price in the feed raises an error."""
+        with pytest.raises(ValueError) as exc_info:
+            await PriceUpdateService(db_session).bulk_update_prices([("VOD", "", Decimal("-1"))])
+
+        assert "cannot be negative" in str(exc_info.value)
+
+
+class TestSecurityMaster:
+    """Test security master linking and single-holding price updates."""
+
+    async def test_get_or_create_reuses_security(self, db_session):
+        """Test the same listing resolves to one security row."""
+        service = SecurityMasterService(db_session)
+
+        first = await service.get_or_create_security("vod", security_name="Vodafone")
+        second = await service.get_or_create_security("VOD ")
+        other_exchange = await service.get_or_create_security("VOD", exchange="NASDAQ")
+        await db_session.commit()
+
+        assert first.id == second.id
+        assert first.ticker == "VOD"
+        assert other_exchange.id != first.id
+
+    async def test_manual_price_overrides_one_holding_only(self, db_session):
+        """Test a manual price edit reprices only the edited holding, not the shared security."""
+        vod = await _create_security(db_session, "VOD", price=Decimal("0.75"))
+        user_a, holdings_a = await _create_user_with_holdings(db_session, "a@example.com", [(vod, "0.70", False)])
+        user_b, holdings_b = await _create_user_with_holdings(db_session, "b@example.com", [(vod, "0.80", False)])
+
+        mock_redis = AsyncMock()
+        with patch('services.investment.asset_allocation_service.redis_client', mock_redis):
+            holding = await PortfolioService(db_session).update_holding_price(
+                holdings_a[0].id, Decimal("0.90")
+            )
+
+        # Only the editing user's analytics cache is invalidated
+        deleted_keys = set(mock_redis.delete.call_args[0])
+        assert deleted_keys == {AssetAllocationService.cache_key(user_a.id)}
+
+        assert holding.market_price == Decimal("0.90")
+
+        db_session.expunge_all()
+        other = await db_session.get(InvestmentHolding, holdings_b[0].id)
+        assert other.market_price == Decimal("0.75")
+        security = await db_session.get(Security, vod.id)
+        assert security.current_price == Decimal("0.75")
+
+        # The feed still reprices the security, but not the overridden holding
+        with patch('services.investment.price_update_service.redis_client', AsyncMock()), \
+                patch('services.investment.asset_allocation_service.redis_client', AsyncMock()):
+            await PriceUpdateService(db_session).bulk_update_prices([("VOD", "", Decimal("1.00"))])
+        db_session.expunge_all()
+        edited = await db_session.get(InvestmentHolding, holdings_a[0].id)
+        other = await db_session.get(InvestmentHolding, holdings_b[0].id)
+        assert edited.market_price == Decimal("0.90")
+        assert other.market_price == Decimal("1.00")
+
+    async def test_unlisted_holding_uses_own_price(self, db_session):
+        """Test holdings without a priced security fall back to current_price."""
+        unpriced = await _create_security(db_session, "NEW")
+        _, holdings = await _create_user_with_holdings(db_session, "a@example.com", [(unpriced, "2.00", False)])
+
+        assert holdings[0].market_price == Decimal("2.00")
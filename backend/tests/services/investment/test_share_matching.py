@@ -0,0 +1,366 @@
+"""
+UK Share Matching Service Tests
+
+Test suite for the UK CGT share identification rules including:
+- Same-day matching
+- 30-day (bed-and-breakfast) matching
+- Section 104 pool average cost
+- Incremental re-matching after a back-dated trade
+- Full replay when no pool snapshot covers earlier trades
+- Back-dated sales re-matched automatically
+- Validation errors (non-UK holdings, oversold pools)
+"""
+
+import pytest
+import uuid
+from decimal import Decimal
+from datetime import date, datetime
+
+from sqlalchemy import select
+
+from models.investment import (
+    InvestmentAccount, InvestmentHolding, TaxLot, CapitalGainRealized,
+    ShareMatch, Section104PoolSnapshot, MatchingRule, AccountType,
+    AccountCountry, AccountStatus, SecurityType, AssetClass, Region
+)
+from models.user import User, UserStatus, CountryPreference
+from services.investment.portfolio_service import PortfolioService
+from services.investment.share_matching_service import (
+    ShareMatchingService, Section104Pool, match_disposals
+)
+from utils.password import hash_password
+
+
+def _disposal(disposal_id, disposal_date, quantity):
+    return {"id": disposal_id, "disposal_date": disposal_date, "quantity": Decimal(quantity)}
+
+
+class TestMatchDisposals:
+    """Test the pure matching engine."""
+
+    def test_section_104_pool_average_cost(self):
+        """Test disposals with no nearby acquisitions use pooled average cost."""
+        result = match_disposals(
+            {
+                date(2023, 1, 10): (Decimal("100"), Decimal("1000")),
+                date(2023, 3, 10): (Decimal("100"), Decimal("2000")),
+            },
+            [_disposal("d1", date(2023, 6, 1), "50")]
+        )
+
+        matches = result["matches"]["d1"]
+        assert len(matches) == 1
+        assert matches[0]["rule"] == MatchingRule.SECTION_104
+        assert matches[0]["cost"] == Decimal("750")  # 50 * (3000 / 200)
+        assert result["pool"].quantity == Decimal("150")
+        assert result["pool"].cost == Decimal("2250")
+
+    def test_same_day_matched_first(self):
+        """Test same-day acquisitions are matched before the pool."""
+        result = match_disposals(
+            {
+                date(2023, 1, 10): (Decimal("100"), Decimal("1000")),
+                date(2023, 6, 1): (Decimal("20"), Decimal("600")),
+            },
+            [_disposal("d1", date(2023, 6, 1), "30")]
+        )
+
+        matches = result["matches"]["d1"]
+        assert [m["rule"] for m in matches] == [MatchingRule.SAME_DAY, MatchingRule.SECTION_104]
+        assert matches[0]["quantity"] == Decimal("20")
+        assert matches[0]["cost"] == Decimal("600")
+        assert matches[1]["quantity"] == Decimal("10")
+        assert matches[1]["cost"] == Decimal("100")
+
+    def test_bed_and_breakfast_within_30_days(self):
+        """Test acquisitions in the 30 days after a disposal are matched before the pool."""
+        result = match_disposals(
+            {
+                date(2023, 1, 10): (Decimal("100"), Decimal("1000")),
+                date(2023, 6, 20): (Decimal("40"), Decimal("1600")),
+                date(2023, 7, 31): (Decimal("40"), Decimal("2000")),  # Day 60: outside window
+            },
+            [_disposal("d1", date(2023, 6, 1), "100")]
+        )
+
+        matches = result["matches"]["d1"]
+        assert [m["rule"] for m in matches] == [
+            MatchingRule.BED_AND_BREAKFAST, MatchingRule.SECTION_104
+        ]
+        assert matches[0]["acquisition_date"] == date(2023, 6, 20)
+        assert matches[0]["cost"] == Decimal("1600")
+        assert matches[1]["quantity"] == Decimal("60")
+        assert matches[1]["cost"] == Decimal("600")
+        # Pool keeps 40 from January plus the July purchase
+        assert result["pool"].quantity == Decimal("80")
+        assert result["pool"].cost == Decimal("2400")
+
+    def test_30_day_acquisition_shared_by_earliest_disposal_first(self):
+        """Test an acquisition is consumed by the earliest disposal in its window."""
+        result = match_disposals(
+            {
+                date(2023, 1, 1): (Decimal("100"), Decimal("1000")),
+                date(2023, 6, 15): (Decimal("30"), Decimal("900")),
+            },
+            [
+                _disposal("d1", date(2023, 6, 1), "20"),
+                _disposal("d2", date(2023, 6, 10), "20"),
+            ]
+        )
+
+        assert result["matches"]["d1"][0]["rule"] == MatchingRule.BED_AND_BREAKFAST
+        assert result["matches"]["d1"][0]["quantity"] == Decimal("20")
+        d2 = result["matches"]["d2"]
+        assert [m["rule"] for m in d2] == [MatchingRule.BED_AND_BREAKFAST, MatchingRule.SECTION_104]
+        assert d2[0]["quantity"] == Decimal("10")
+        assert d2[1]["quantity"] == Decimal("10")
+
+    def test_same_day_disposals_split_pro_rata(self):
+        """Test several disposals on one day are matched as one and split by quantity."""
+        result = match_disposals(
+            {date(2023, 1, 1): (Decimal("100"), Decimal("1000"))},
+            [
+                _disposal("d1", date(2023, 6, 1), "30"),
+                _disposal("d2", date(2023, 6, 1), "10"),
+            ]
+        )
+
+        assert result["matches"]["d1"][0]["cost"] == Decimal("300")
+        assert result["matches"]["d2"][0]["cost"] == Decimal("100")
+
+    def test_oversold_pool_raises(self):
+        """Test disposing of more shares than acquired raises an error."""
+        with pytest.raises(ValueError) as exc_info:
+            match_disposals(
+                {date(2023, 1, 1): (Decimal("10"), Decimal("100"))},
+                [_disposal("d1", date(2023, 6, 1), "20")]
+            )
+
+        assert "Section 104 pool" in str(exc_info.value)
+
+    def test_opening_pool_is_used(self):
+        """Test matching resumes from an opening pool snapshot."""
+        result = match_disposals(
+            {},
+            [_disposal("d1", date(2023, 6, 1), "10")],
+            Section104Pool(Decimal("100"), Decimal("500"))
+        )
+
+        assert result["matches"]["d1"][0]["cost"] == Decimal("50")
+        assert result["snapshots"] == [(date(2023, 6, 1), Decimal("90"), Decimal("450"))]
+
+
+@pytest.fixture
+async def uk_holding(db_session):
+    """Create a UK GIA holding with no tax lots."""
+    user = User(
+        email="matcher@example.com",
+        password_hash=hash_password("MatcherPass123!"),
+        first_name="Share",
+        last_name="Matcher",
+        country_preference=CountryPreference.UK,
+        status=UserStatus.ACTIVE,
+        email_verified=True,
+        terms_accepted_at=datetime.utcnow(),
+        marketing_consent=False,
+    )
+    db_session.add(user)
+    await db_session.flush()
+
+    account = InvestmentAccount(
+        id=uuid.uuid4(),
+        user_id=user.id,
+        account_type=AccountType.GIA,
+        provider="Test Broker",
+        country=AccountCountry.UK,
+        base_currency="GBP",
+        status=AccountStatus.ACTIVE,
+        deleted=False
+    )
+    account.set_account_number("GIA12345")
+    db_session.add(account)
+    await db_session.flush()
+
+    holding = InvestmentHolding(
+        id=uuid.uuid4(),
+        account_id=account.id,
+        security_type=SecurityType.STOCK,
+        ticker="VOD",
+        security_name="Vodafone Group",
+        quantity=Decimal("100"),
+        purchase_date=date(2023, 1, 10),
+        purchase_price=Decimal("10.00"),
+        purchase_currency="GBP",
+        current_price=Decimal("10.00"),
+        asset_class=AssetClass.EQUITY,
+        region=Region.UK,
+        deleted=False
+    )
+    db_session.add(holding)
+    await db_session.commit()
+    return holding
+
+
+def _lot(holding_id, purchase_date, quantity, price):
+    return TaxLot(
+        id=uuid.uuid4(),
+        holding_id=holding_id,
+        purchase_date=purchase_date,
+        quantity=Decimal(quantity),
+        purchase_price=Decimal(price),
+        purchase_currency="GBP",
+        cost_basis_gbp=Decimal(quantity) * Decimal(price),
+        cost_basis_zar=Decimal(quantity) * Decimal(price) * Decimal("23.50"),
+        exchange_rate=Decimal("23.50"),
+        created_at=datetime.utcnow()
+    )
+
+
+def _gain(holding_id, disposal_date, quantity, price):
+    return CapitalGainRealized(
+        id=uuid.uuid4(),
+        holding_id=holding_id,
+        disposal_date=disposal_date,
+        quantity_sold=Decimal(quantity),
+        sale_price=Decimal(price),
+        sale_value=Decimal(quantity) * Decimal(price),
+        cost_basis=Decimal("0.00"),
+        gain_loss=Decimal(quantity) * Decimal(price),
+        tax_year="2023/24",
+        country=AccountCountry.UK,
+        created_at=datetime.utcnow()
+    )
+
+
+class TestShareMatchingService:
+    """Test persisted matching and incremental recalculation."""
+
+    async def test_recalculate_updates_gains(self, db_session, uk_holding):
+        """Test recalculation rewrites cost basis and gain using pooled cost."""
+        db_session.add_all([
+            _lot(uk_holding.id, date(2023, 1, 10), "100", "10.00"),
+            _lot(uk_holding.id, date(2023, 3, 10), "100", "20.00"),
+        ])
+        gain = _gain(uk_holding.id, date(2023, 6, 1), "50", "25.00")
+        db_session.add(gain)
+        await db_session.commit()
+
+        service = ShareMatchingService(db_session)
+        result = await service.recalculate_holding(uk_holding.id)
+
+        assert result["disposals_rematched"] == 1
+        assert result["gains_updated"] == 1
+        assert result["pool_quantity"] == Decimal("150")
+        assert result["pool_cost"] == Decimal("2250.00")
+
+        await db_session.refresh(gain)
+        assert gain.cost_basis == Decimal("750.00")
+        assert gain.gain_loss == Decimal("500.00")
+
+        matches = await service.get_disposal_matches(gain.id)
+        assert len(matches) == 1
+        assert matches[0].matching_rule == MatchingRule.SECTION_104
+
+    async def test_backdated_trade_incremental_matches_full_replay(self, db_session, uk_holding):
+        """Test a back-dated acquisition re-matches only recent disposals, matching a full replay."""
+        db_session.add_all([
+            _lot(uk_holding.id, date(2022, 1, 10), "100", "10.00"),
+            _lot(uk_holding.id, date(2022, 9, 1), "100", "14.00"),
+        ])
+        early = _gain(uk_holding.id, date(2022, 6, 1), "50", "12.00")
+        late = _gain(uk_holding.id, date(2023, 6, 1), "50", "20.00")
+        db_session.add_all([early, late])
+        await db_session.commit()
+
+        service = ShareMatchingService(db_session)
+        await service.recalculate_holding(uk_holding.id)
+
+        # Insert a back-dated purchase 10 days after the later disposal
+        db_session.add(_lot(uk_holding.id, date(2023, 6, 11), "20", "18.00"))
+        await db_session.commit()
+
+        result = await service.recalculate_holding(uk_holding.id, changed_from=date(2023, 6, 11))
+        assert result["rebuilt_from"] == date(2023, 5, 12)
+        assert result["disposals_rematched"] == 1  # The 2022 disposal is untouched
+
+        await db_session.refresh(late)
+        incremental_cost = late.cost_basis
+
+        # 20 matched at 18.00 (30-day rule) + 30 from pool at (500 + 1400) / 150
+        assert incremental_cost == Decimal("360.00") + Decimal("380.00")
+
+        full = await service.recalculate_holding(uk_holding.id)
+        assert full["disposals_rematched"] == 2
+        assert full["gains_updated"] == 0
+
+        await db_session.refresh(late)
+        assert late.cost_basis == incremental_cost
+
+        snapshots = (await db_session.execute(
+            select(Section104PoolSnapshot).where(Section104PoolSnapshot.holding_id == uk_holding.id)
+        )).scalars().all()
+        assert len(snapshots) == 5
+
+    async def test_backdated_trade_without_snapshots_replays_all(self, db_session, uk_holding):
+        """Test a back-dated trade on a never-matched holding keeps acquisitions before the window."""
+        db_session.add(_lot(uk_holding.id, date(2022, 1, 10), "100", "10.00"))
+        late = _gain(uk_holding.id, date(2023, 6, 1), "50", "20.00")
+        db_session.add(late)
+        db_session.add(_lot(uk_holding.id, date(2023, 6, 11), "20", "18.00"))
+        await db_session.commit()
+
+        result = await ShareMatchingService(db_session).recalculate_holding(
+            uk_holding.id, changed_from=date(2023, 6, 11)
+        )
+        assert result["rebuilt_from"] is None
+        assert result["pool_quantity"] == Decimal("70")
+
+        # 20 matched at 18.00 (30-day rule) + 30 from the 2022 pool at 10.00
+        await db_session.refresh(late)
+        assert late.cost_basis == Decimal("360.00") + Decimal("300.00")
+
+    async def test_backdated_sale_rematches_holding(self, db_session, uk_holding):
+        """Test selling before already-matched trades re-matches the holding in the same transaction."""
+        lot = _lot(uk_holding.id, date(2022, 1, 10), "100", "10.00")
+        lot.remaining_quantity = Decimal("50")
+        late = _gain(uk_holding.id, date(2023, 6, 1), "50", "20.00")
+        db_session.add_all([lot, late])
+        await db_session.commit()
+
+        service = ShareMatchingService(db_session)
+        await service.recalculate_holding(uk_holding.id)
+
+        sale = await PortfolioService(db_session).sell_holding(
+            uk_holding.id, Decimal("10"), Decimal("15.00"), date(2023, 3, 1)
+        )
+
+        matches = await service.get_disposal_matches(uuid.UUID(sale["capital_gain_id"]))
+        assert [m.matching_rule for m in matches] == [MatchingRule.SECTION_104]
+        assert sale["cost_basis"] == 100.0
+
+        # Later disposal re-matched against the pool after the back-dated sale
+        snapshots = (await db_session.execute(
+            select(Section104PoolSnapshot)
+            .where(Section104PoolSnapshot.holding_id == uk_holding.id)
+            .order_by(Section104PoolSnapshot.snapshot_date)
+        )).scalars().all()
+        assert [s.snapshot_date for s in snapshots] == [date(2022, 1, 10), date(2023, 3, 1), date(2023, 6, 1)]
+        assert snapshots[-1].pool_quantity == Decimal("40")
+
+    async def test_non_uk_holding_rejected(self, db_session, uk_holding):
+        """Test share matching refuses non-UK holdings."""
+        account = await db_session.get(InvestmentAccount, uk_holding.account_id)
+        account.country = AccountCountry.SA
+        await db_session.commit()
+
+        with pytest.raises(ValueError) as exc_info:
+            await ShareMatchingService(db_session).recalculate_holding(uk_holding.id)
+
+        assert "UK holdings only" in str(exc_info.value)
+
+    async def test_holding_not_found(self, db_session):
+        """Test unknown holding raises an error."""
+        with pytest.raises(ValueError) as exc_info:
+            await ShareMatchingService(db_session).recalculate_holding(uuid.uuid4())
+
+        assert "Holding not found" in str(exc_info.value)
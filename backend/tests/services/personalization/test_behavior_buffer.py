@@ -0,0 +1,146 @@
+"""
+Tests for the behavior tracking write-behind buffer.
+
+Tests cover:
+- Events are written on flush, in one batch
+- Size-triggered flushes
+- Overflow drops and metrics
+- Shutdown writes remaining events
+- Tracking does not write on the request path
+- Daily aggregates are updated as events flush
+"""
+
+import asyncio
+import json
+import pytest
+from datetime import datetime
+
+from sqlalchemy import select, func
+
+from models.personalization import UserBehavior, UserBehaviorDaily, ActionType
+from services.personalization.behavior_buffer import BehaviorBuffer
+from services.personalization.preference_service import PreferenceService
+
+
+async def _count_behaviors(db_session) -> int:
+    result = await db_session.execute(select(func.count(UserBehavior.id)))
+    return result.scalar()
+
+
+@pytest.mark.asyncio
+async def test_events_written_on_flush(db_session, test_user):
+    """Test buffered events are only written when flushed."""
+    buffer = BehaviorBuffer(flush_size=100, flush_interval=60)
+
+    for page in ("dashboard", "goals", "savings"):
+        event = buffer.record(test_user.id, ActionType.PAGE_VIEW, {"page": page})
+        assert event["timestamp"] <= datetime.utcnow()
+
+    assert await _count_behaviors(db_session) == 0
+
+    assert await buffer.flush() == 3
+    assert await _count_behaviors(db_session) == 3
+
+    stats = buffer.stats()
+    assert stats["buffered"] == 0
+    assert stats["flushed"] == 3
+    assert stats["flushes"] == 1
+    assert stats["last_flush_at"] is not None
+
+    result = await db_session.execute(select(UserBehavior.action_context))
+    assert sorted(json.loads(context)["page"] for context in result.scalars()) == ["dashboard", "goals", "savings"]
+
+    await buffer.close()
+
+
+@pytest.mark.asyncio
+async def test_flush_triggered_by_size(db_session, test_user):
+    """Test reaching flush_size writes the buffer in the background."""
+    buffer = BehaviorBuffer(flush_size=5, flush_interval=60)
+
+    for _ in range(5):
+        buffer.record(test_user.id, ActionType.CLICK, {"element": "save_button"})
+
+    # Let the scheduled flush run
+    for _ in range(50):
+        if buffer.stats()["flushes"]:
+            break
+        await asyncio.sleep(0.01)
+
+    assert buffer.stats()["flushed"] == 5
+    assert await _count_behaviors(db_session) == 5
+
+    await buffer.close()
+
+
+@pytest.mark.asyncio
+async def test_overflow_drops_new_events(db_session, test_user):
+    """Test a full buffer drops new events and counts them."""
+    buffer = BehaviorBuffer(max_size=3, flush_size=100, flush_interval=60)
+
+    accepted = [
+        buffer.record(test_user.id, ActionType.PAGE_VIEW, {"page": f"page_{i}"})
+        for i in range(5)
+    ]
+
+    assert [event is not None for event in accepted] == [True, True, True, False, False]
+    stats = buffer.stats()
+    assert stats["buffered"] == 3
+    assert stats["recorded"] == 3
+    assert stats["dropped"] == 2
+
+    await buffer.close()
+    assert await _count_behaviors(db_session) == 3
+
+
+@pytest.mark.asyncio
+async def test_close_writes_remaining_events(db_session, test_user):
+    """Test shutdown flushes whatever is still buffered."""
+    buffer = BehaviorBuffer(flush_size=100, flush_interval=60)
+    buffer.record(test_user.id, ActionType.FEATURE_USAGE, {"feature": "goal_tracking"})
+
+    await buffer.close()
+
+    assert await _count_behaviors(db_session) == 1
+    assert buffer.stats()["buffered"] == 0
+
+
+@pytest.mark.asyncio
+async def test_track_behavior_is_buffered(db_session, test_user):
+    """Test tracking doesn't write, and analysis sees buffered actions."""
+    buffer = BehaviorBuffer(flush_size=100, flush_interval=60)
+    service = PreferenceService(db_session, buffer=buffer)
+
+    behavior = await service.track_behavior(
+        test_user.id, ActionType.PAGE_VIEW, {"page": "dashboard"}
+    )
+
+    assert behavior.user_id == test_user.id
+    assert await _count_behaviors(db_session) == 0
+
+    analysis = await service.analyze_behavior(test_user.id)
+    assert analysis["total_actions"] == 1
+    assert analysis["most_viewed_pages"] == ["dashboard"]
+
+    await buffer.close()
+
+
+@pytest.mark.asyncio
+async def test_flush_updates_daily_aggregates(db_session, test_user):
+    """Test flushed events are folded into the user's daily counters."""
+    buffer = BehaviorBuffer(flush_size=100, flush_interval=60)
+    buffer.record(test_user.id, ActionType.PAGE_VIEW, {"page": "goals"})
+    buffer.record(test_user.id, ActionType.PAGE_VIEW, {"page": "goals"})
+    buffer.record(test_user.id, ActionType.FEATURE_USAGE, {"feature": "goal_tracking"})
+    await buffer.flush()
+
+    buffer.record(test_user.id, ActionType.PAGE_VIEW, {"page": "savings"})
+    await buffer.close()
+
+    result = await db_session.execute(select(UserBehaviorDaily))
+    rows = result.scalars().all()
+    assert len(rows) == 1
+    assert rows[0].total_actions == 4
+    assert rows[0].page_views == {"goals": 2, "savings": 1}
+    assert rows[0].feature_uses == {"goal_tracking": 1}
+    assert sum(rows[0].hourly_actions) == 4
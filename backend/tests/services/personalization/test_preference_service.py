@@ -22,6 +22,8 @@ from models.personalization import (
     UserPreference, UserBehavior, PersonalizedInsight,
     PreferenceType, ActionType, InsightType
 )
+from services.personalization.behavior_aggregates import write_behavior_events
+from services.personalization.behavior_buffer import BehaviorBuffer
 from services.personalization.preference_service import PreferenceService
 
 
@@ -31,8 +33,10 @@ from services.personalization.preference_service import PreferenceService
 
 @pytest.fixture
 async def preference_service(db_session):
-    """Create PreferenceService instance."""
-    return PreferenceService(db_session)
+    """Create PreferenceService instance with its own behavior buffer."""
+    buffer = BehaviorBuffer()
+    yield PreferenceService(db_session, buffer=buffer)
+    await buffer.close()
 
 
 @pytest.fixture
@@ -516,17 +520,15 @@ async def test_multiple_users_isolated(preference_service, test_user, other_user
 async def test_analyze_behavior_with_invalid_json_context(preference_service, test_user, db_session):
     """Test analyzing behavior handles invalid JSON gracefully."""
     # Manually create behavior with invalid JSON
-    from models.personalization import UserBehavior
     import uuid
 
-    behavior = UserBehavior(
-        id=uuid.uuid4(),
-        user_id=test_user.id,
-        action_type=ActionType.PAGE_VIEW,
-        action_context="INVALID JSON",  # Invalid JSON
-        timestamp=datetime.utcnow()
-    )
-    db_session.add(behavior)
+    await write_behavior_events(db_session, [{
+        'id': uuid.uuid4(),
+        'user_id': test_user.id,
+        'action_type': ActionType.PAGE_VIEW,
+        'action_context': "INVALID JSON",  # Invalid JSON
+        'timestamp': datetime.utcnow()
+    }])
     await db_session.commit()
 
     # Analyze behavior (should not crash)
@@ -540,28 +542,26 @@ async def test_analyze_behavior_with_invalid_json_context(preference_service, te
 @pytest.mark.asyncio
 async def test_behavior_analysis_respects_time_range(preference_service, test_user, db_session):
     """Test behavior analysis only includes data from specified time range."""
-    from models.personalization import UserBehavior
     import uuid
 
-    # Create old behavior (40 days ago)
-    old_behavior = UserBehavior(
-        id=uuid.uuid4(),
-        user_id=test_user.id,
-        action_type=ActionType.PAGE_VIEW,
-        action_context=json.dumps({"page": "old_page"}),
-        timestamp=datetime.utcnow() - timedelta(days=40)
-    )
-    db_session.add(old_behavior)
-
-    # Create recent behavior (10 days ago)
-    recent_behavior = UserBehavior(
-        id=uuid.uuid4(),
-        user_id=test_user.id,
-        action_type=ActionType.PAGE_VIEW,
-        action_context=json.dumps({"page": "recent_page"}),
-        timestamp=datetime.utcnow() - timedelta(days=10)
-    )
-    db_session.add(recent_behavior)
+    await write_behavior_events(db_session, [
+        # Create old behavior (40 days ago)
+        {
+            'id': uuid.uuid4(),
+            'user_id': test_user.id,
+            'action_type': ActionType.PAGE_VIEW,
+            'action_context': json.dumps({"page": "old_page"}),
+            'timestamp': datetime.utcnow() - timedelta(days=40)
+        },
+        # Create recent behavior (10 days ago)
+        {
+            'id': uuid.uuid4(),
+            'user_id': test_user.id,
+            'action_type': ActionType.PAGE_VIEW,
+            'action_context': json.dumps({"page": "recent_page"}),
+            'timestamp': datetime.utcnow() - timedelta(days=10)
+        },
+    ])
 
     await db_session.commit()
 
@@ -9,6 +9,7 @@ Tests comprehensive AA calculations including:
 - Annual allowance usage tracking
 - Annual allowance charge calculations
 - Edge cases and thresholds
+- Multi-year allowance ledger (FIFO carry forward, MPAA date, taper, caching)
 
 Target: >85% coverage
 """
@@ -17,13 +18,14 @@ import pytest
 import uuid
 from datetime import date
 from decimal import Decimal
+from unittest.mock import patch
 
 from models.retirement import (
     UKPension, UKPensionContribution, AnnualAllowanceTracking,
     PensionType, ContributionFrequency
 )
 from models.user import User, UserStatus
-from services.retirement import AnnualAllowanceService
+from services.retirement import AnnualAllowanceService, UKPensionService
 
 
 
@@ -496,3 +498,129 @@ class TestEdgeCases:
         assert usage['total_contributions'] == Decimal('0.00')
         assert usage['excess'] == Decimal('0.00')
         assert usage['allowance_remaining'] > Decimal('0.00')
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis_client wrapper."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, expire=None):
+        self.store[key] = value
+        return True
+
+    async def delete(self, *keys):
+        return sum(1 for key in keys if self.store.pop(key, None) is not None)
+
+
+def _contribution(pension_id, amount, tax_year):
+    """Build an annual employee contribution for a tax year."""
+    start_year = int(tax_year[:4])
+    return UKPensionContribution(
+        id=uuid.uuid4(),
+        pension_id=pension_id,
+        employee_contribution=Decimal(amount),
+        frequency=ContributionFrequency.ANNUAL,
+        contribution_date=date(start_year, 6, 1),
+        tax_year=tax_year,
+        effective_from=date(start_year, 6, 1)
+    )
+
+
+class TestAllowanceLedger:
+    """Tests for the multi-year allowance ledger."""
+
+    async def test_carry_forward_drawn_oldest_first(self, aa_service, test_user, test_pension, db_session):
+        """Test carry forward used by an earlier year is not available later."""
+        # 2022/23 over-contributes by £40,000, drawing on 2021/22 first
+        db_session.add(_contribution(test_pension.id, '100000.00', '2022/23'))
+        await db_session.commit()
+
+        ledger = await aa_service.get_allowance_ledger(test_user.id, '2024/25')
+
+        assert ledger['2022/23']['carry_forward_used'] == Decimal('40000.00')
+        assert ledger['2022/23']['excess'] == Decimal('0.00')
+        assert ledger['2024/25']['carry_forward'] == {
+            '2021/22': Decimal('20000.00'),
+            '2023/24': Decimal('60000.00'),
+        }
+        assert ledger['2024/25']['total_available'] == Decimal('140000.00')
+
+    async def test_mpaa_applies_from_trigger_year(self, aa_service, test_user, db_session):
+        """Test MPAA only reduces allowances from the tax year it was triggered."""
+        db_session.add(UKPension(
+            id=uuid.uuid4(),
+            user_id=test_user.id,
+            pension_type=PensionType.SIPP,
+            provider='MPAA Provider',
+            scheme_reference_encrypted='encrypted_mpaa',
+            start_date=date(2015, 1, 1),
+            expected_retirement_date=date(2050, 1, 1),
+            mpaa_triggered=True,
+            mpaa_date=date(2024, 4, 5),  # Last day of 2023/24
+            is_deleted=False
+        ))
+        await db_session.commit()
+
+        ledger = await aa_service.get_allowance_ledger(test_user.id, '2024/25')
+
+        assert ledger['2022/23']['annual_allowance'] == Decimal('60000.00')
+        assert ledger['2023/24']['annual_allowance'] == Decimal('10000.00')
+        assert ledger['2023/24']['mpaa_applies'] is True
+
+    async def test_taper_from_tracked_adjusted_income(self, aa_service, test_user, db_session):
+        """Test a tracked adjusted income tapers that year's allowance and carry forward."""
+        db_session.add(AnnualAllowanceTracking(
+            id=uuid.uuid4(),
+            user_id=test_user.id,
+            tax_year='2023/24',
+            total_contributions=Decimal('10000.00'),
+            annual_allowance_limit=Decimal('40000.00'),
+            adjusted_income=Decimal('300000.00'),
+            allowance_used=Decimal('10000.00'),
+            allowance_remaining=Decimal('30000.00'),
+            tapered_allowance=True
+        ))
+        await db_session.commit()
+
+        usage = await aa_service.calculate_allowance_usage(test_user.id, '2023/24')
+        carry_forward = await aa_service.calculate_carry_forward(test_user.id, '2024/25')
+
+        assert usage['annual_allowance'] == Decimal('40000.00')
+        assert usage['tapered'] is True
+        assert usage['tapered_allowance'] is True
+        assert carry_forward['2023/24'] == Decimal('30000.00')
+
+    async def test_ledger_cached_until_contribution_added(self, aa_service, test_user, test_pension, db_session):
+        """Test the ledger is memoized and invalidated by a new contribution."""
+        fake_redis = FakeRedis()
+
+        with patch('services.retirement.annual_allowance_service.redis_client', fake_redis):
+            first = await aa_service.calculate_allowance_usage(test_user.id, '2024/25')
+            assert AnnualAllowanceService.cache_key(test_user.id) in fake_redis.store
+
+            with patch.object(aa_service, '_build_ledger') as build:
+                cached = await aa_service.calculate_allowance_usage(test_user.id, '2024/25')
+            build.assert_not_called()
+            assert cached['total_available'] == first['total_available'] == Decimal('240000.00')
+
+            await UKPensionService(db_session).add_contribution(
+                test_pension.id,
+                test_user.id,
+                {
+                    'employee_contribution': Decimal('5000.00'),
+                    'frequency': ContributionFrequency.ANNUAL,
+                    'contribution_date': date(2024, 6, 1),
+                    'tax_year': '2024/25',
+                    'effective_from': date(2024, 6, 1)
+                }
+            )
+            assert fake_redis.store == {}
+
+            updated = await aa_service.calculate_allowance_usage(test_user.id, '2024/25')
+
+        assert updated['total_contributions'] == Decimal('5000.00')
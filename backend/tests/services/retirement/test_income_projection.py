@@ -3,12 +3,13 @@ Tests for Income Projection Service
 
 Tests retirement income projection calculations including:
 - DC pension pot projection with contributions
-- Drawdown income calculations with pot depletion
+- Drawdown income calculations with pot depletion (closed form and grid)
 - Annuity income calculations
 - Total retirement income aggregation
 - Income gap analysis
 - Retirement projection creation
 - Edge cases and scenarios
+- Retirement inputs loaded with a fixed number of queries
 
 Target: >85% coverage
 """
@@ -17,6 +18,7 @@ import pytest
 import uuid
 from datetime import date
 from decimal import Decimal
+from unittest.mock import patch
 
 from models.retirement import (
     UKPension, UKPensionDBDetails, StatePensionForecast,
@@ -145,6 +147,67 @@ class TestCalculateDrawdownIncome:
         assert result['annual_income'] == Decimal('25000.00')
         assert result['pot_lasts'] == True  # Should definitely last
 
+    async def test_depletion_age_matches_yearly_simulation(self, projection_service):
+        """Test closed-form depletion age matches a year-by-year simulation."""
+        pot_value = Decimal('300000.00')
+        inflation_rate = Decimal('2.50')
+
+        for drawdown_rate in [Decimal('4.00'), Decimal('6.00'), Decimal('8.00'), Decimal('12.00')]:
+            for growth_rate in [Decimal('0.00'), Decimal('2.50'), Decimal('3.00'), Decimal('7.00')]:
+                # Withdraw at start of year, grow, then raise withdrawal with inflation
+                remaining_pot = pot_value
+                withdrawal = pot_value * drawdown_rate / Decimal('100')
+                expected_age = None
+                for age in range(65, 95):
+                    remaining_pot -= withdrawal
+                    if remaining_pot <= 0:
+                        expected_age = age
+                        break
+                    remaining_pot *= Decimal('1') + growth_rate / Decimal('100')
+                    withdrawal *= Decimal('1') + inflation_rate / Decimal('100')
+
+                result = projection_service.calculate_drawdown_income(
+                    pot_value=pot_value,
+                    drawdown_rate=drawdown_rate,
+                    start_age=65,
+                    growth_rate=growth_rate,
+                    inflation_rate=inflation_rate,
+                    life_expectancy=95
+                )
+
+                assert result['depletion_age'] == expected_age, (drawdown_rate, growth_rate)
+                assert result['pot_lasts'] == (expected_age is None)
+
+    async def test_drawdown_grid_matches_single_calculations(self, projection_service):
+        """Test drawdown grid agrees with individual drawdown calculations."""
+        start_ages = [60, 65, 68]
+        drawdown_rates = [Decimal('3.00'), Decimal('5.00'), Decimal('9.00')]
+        growth_rates = [Decimal('2.00'), Decimal('6.00')]
+
+        grid = projection_service.calculate_drawdown_grid(
+            pot_value=Decimal('250000.00'),
+            start_ages=start_ages,
+            drawdown_rates=drawdown_rates,
+            growth_rates=growth_rates,
+            inflation_rate=Decimal('2.50'),
+            life_expectancy=95
+        )
+
+        assert len(grid) == 18
+        for row in grid:
+            single = projection_service.calculate_drawdown_income(
+                pot_value=Decimal('250000.00'),
+                drawdown_rate=row['drawdown_rate'],
+                start_age=row['start_age'],
+                growth_rate=row['growth_rate'],
+                inflation_rate=Decimal('2.50'),
+                life_expectancy=95
+            )
+            assert row['annual_income'] == single['annual_income'].quantize(Decimal('0.01'))
+            assert row['depletion_age'] == single['depletion_age']
+            assert row['pot_lasts'] == single['pot_lasts']
+            assert row['years_lasting'] == single['years_lasting']
+
 
 class TestCalculateAnnuityIncome:
     """Tests for annuity income calculation."""
@@ -508,3 +571,71 @@ class TestEdgeCases:
         assert income['dc_drawdown_income'] == Decimal('0.00')
         assert income['total_annual_income'] == Decimal('0.00')
         assert len(income['breakdown']) == 0
+
+
+class TestRetirementInputs:
+    """Tests for the shared retirement inputs bundle."""
+
+    async def test_fixed_queries_regardless_of_db_pensions(self, projection_service, test_user, db_session):
+        """Test DB details are loaded eagerly and inputs reused across calculations."""
+        for index in range(3):
+            pension = UKPension(
+                id=uuid.uuid4(),
+                user_id=test_user.id,
+                pension_type=PensionType.OCCUPATIONAL_DB,
+                provider=f'DB Provider {index}',
+                scheme_reference_encrypted=f'encrypted_db_{index}',
+                start_date=date(2010, 1, 1),
+                expected_retirement_date=date(2040, 1, 1),
+                is_deleted=False
+            )
+            db_session.add(pension)
+            await db_session.flush()
+            db_session.add(UKPensionDBDetails(
+                id=uuid.uuid4(),
+                pension_id=pension.id,
+                accrual_rate='1/60',
+                pensionable_service_years=Decimal('10.00'),
+                scheme_type=DBSchemeType.FINAL_SALARY,
+                normal_retirement_age=65,
+                guaranteed_pension_amount=Decimal('5000.00')
+            ))
+        await db_session.commit()
+        db_session.expunge_all()
+
+        with patch.object(db_session, 'execute', wraps=db_session.execute) as execute:
+            income = await projection_service.calculate_total_retirement_income(
+                test_user.id,
+                target_retirement_age=67
+            )
+            gap = await projection_service.calculate_retirement_income_gap(
+                test_user.id,
+                target_retirement_age=67,
+                annual_income_needed=Decimal('20000.00')
+            )
+
+        # Pensions (with selectin-loaded DB details) and state pension only
+        assert execute.call_count == 2
+        assert income['db_pension_income'] == Decimal('15000.00')
+        assert gap['income_gap'] == Decimal('-5000.00')
+
+    async def test_invalidate_reloads_inputs(self, projection_service, test_user, db_session):
+        """Test invalidation picks up a newly added state pension forecast."""
+        await projection_service.calculate_total_retirement_income(test_user.id, 67)
+
+        db_session.add(StatePensionForecast(
+            id=uuid.uuid4(),
+            user_id=test_user.id,
+            forecast_date=date(2024, 1, 1),
+            qualifying_years=35,
+            years_needed_for_full=35,
+            estimated_weekly_amount=Decimal('203.85'),
+            estimated_annual_amount=Decimal('11203.85'),
+            state_pension_age=67
+        ))
+        await db_session.commit()
+
+        projection_service.invalidate_retirement_inputs(test_user.id)
+        income = await projection_service.calculate_total_retirement_income(test_user.id, 67)
+
+        assert income['state_pension_income'] == Decimal('11203.85')
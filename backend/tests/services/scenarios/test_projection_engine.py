@@ -0,0 +1,157 @@
+"""
+Tests for the scenario projection engine.
+
+Tests:
+- Vectorized UK/SA tax schedules match the tax services
+- Bucket projections match a year-by-year calculation
+- Pension contributions, drawdown and debt repayment
+- Goal funding projections
+"""
+
+import pytest
+import numpy as np
+from decimal import Decimal
+
+from services.scenarios.projection_engine import (
+    project_buckets, project_goals,
+    uk_income_tax, uk_national_insurance, uk_dividend_tax,
+    sa_income_tax, sa_dividend_tax
+)
+from services.tax.uk_tax_service import uk_tax_service
+from services.tax.sa_tax_service import sa_tax_service
+
+
+INCOMES = [0, 8000, 12570, 30000, 50270, 75000, 100000, 110000, 125140, 200000]
+
+
+def test_uk_schedules_match_tax_service():
+    """Test UK income tax, NI and dividend tax match UKTaxService."""
+    for income in INCOMES:
+        expected_tax = uk_tax_service.calculate_income_tax(Decimal(income))['tax_owed']
+        expected_ni = uk_tax_service.calculate_national_insurance(Decimal(income))['ni_owed']
+        expected_dividend_tax = uk_tax_service.calculate_dividend_tax(
+            Decimal('20000'), Decimal(income)
+        )['dividend_tax_owed']
+
+        assert uk_income_tax(income) == pytest.approx(float(expected_tax), abs=0.01)
+        assert uk_national_insurance(income) == pytest.approx(float(expected_ni), abs=0.01)
+        assert uk_dividend_tax(20000, income) == pytest.approx(float(expected_dividend_tax), abs=0.01)
+
+    # Arrays are taxed element-wise
+    assert uk_income_tax(np.array(INCOMES)).shape == (len(INCOMES),)
+
+
+def test_sa_schedules_match_tax_service():
+    """Test SA income tax (with age rebates) and dividend tax match SATaxService."""
+    for income in INCOMES:
+        zar_income = income * 10
+        for age in (40, 68, 80):
+            expected = sa_tax_service.calculate_income_tax(Decimal(zar_income), age=age)['tax_owed']
+            assert sa_income_tax(zar_income, age) == pytest.approx(float(expected), abs=0.01)
+
+        expected_dividend_tax = sa_tax_service.calculate_dividend_tax(Decimal(zar_income))['dividend_tax_owed']
+        assert sa_dividend_tax(zar_income) == pytest.approx(float(expected_dividend_tax), abs=0.01)
+
+
+def test_buckets_match_yearly_calculation():
+    """Test tax-free bucket balances match growing and contributing year by year."""
+    buckets = [
+        {'name': 'ISA', 'kind': 'isa', 'country': 'UK', 'balance': 20000,
+         'annual_contribution': 4000, 'growth_rate': 0.05},
+        {'name': 'TFSA', 'kind': 'tfsa', 'country': 'SA', 'balance': 50000,
+         'annual_contribution': 0, 'growth_rate': 0.07},
+    ]
+
+    projection = project_buckets(buckets, 30, inflation_rate=0.02, start_age=30, retirement_age=67)
+
+    isa, tfsa = 20000.0, 50000.0
+    for year in range(1, 31):
+        isa = isa * 1.05 + 4000 * 1.02 ** (year - 1)
+        tfsa = tfsa * 1.07
+        assert projection['balances'][0, year] == pytest.approx(isa)
+        assert projection['balances'][1, year] == pytest.approx(tfsa)
+        assert projection['net_worth'][year] == pytest.approx(isa + tfsa)
+
+    # No taxable income, so no tax
+    assert projection['taxes']['total'].sum() == 0
+    assert projection['real_net_worth'][30] == pytest.approx(projection['net_worth'][30] / 1.02 ** 30)
+
+
+def test_salary_and_investment_income_taxed():
+    """Test salary is taxed until retirement and investment tax drags net worth."""
+    buckets = [
+        {'name': 'Savings', 'kind': 'cash', 'country': 'UK', 'balance': 100000, 'growth_rate': 0.04},
+    ]
+
+    projection = project_buckets(
+        buckets, 10, inflation_rate=0.0, salary=60000, start_age=60, retirement_age=65
+    )
+
+    taxes = projection['taxes']
+    # Working years: tax on salary plus interest; NI on salary only
+    interest = 100000 * 0.04
+    assert taxes['income_tax'][0] == pytest.approx(float(uk_income_tax(60000 + interest)))
+    assert taxes['national_insurance'][0] == pytest.approx(float(uk_national_insurance(60000)))
+    assert taxes['investment_tax'][0] == pytest.approx(interest * 0.40)
+
+    # Retired: no salary or NI
+    assert projection['salary'][5] == 0
+    assert taxes['national_insurance'][5] == 0
+
+    # Tax on interest reduces net worth below the gross balance
+    assert projection['net_worth'][10] < projection['balances'][0, 10]
+
+
+def test_pension_contributions_and_drawdown():
+    """Test pension contributions stop at retirement and drawdown follows."""
+    buckets = [
+        {'name': 'SIPP', 'kind': 'pension', 'country': 'UK', 'balance': 100000,
+         'annual_contribution': 10000, 'growth_rate': 0.05},
+    ]
+
+    projection = project_buckets(buckets, 20, inflation_rate=0.0, start_age=55, retirement_age=60)
+
+    pot = 100000.0
+    for _ in range(5):
+        pot = pot * 1.05 + 10000
+    assert projection['pension_pot_at_retirement'] == pytest.approx(pot)
+    assert projection['retirement_income'] == pytest.approx(pot * 0.04)
+
+    pension_income = projection['pension_income']
+    assert np.all(pension_income[:5] == 0)
+    assert pension_income[5] == pytest.approx(pot * 0.04)
+    assert projection['balances'][0, 6] == pytest.approx(pot * 1.05 - pot * 0.04)
+
+    # Drawdown is taxed with 25% tax-free
+    assert projection['taxes']['income_tax'][5] == pytest.approx(float(uk_income_tax(pot * 0.04 * 0.75)))
+
+
+def test_debt_repaid_and_floored():
+    """Test debts accrue interest, are repaid and never go below zero."""
+    buckets = [
+        {'name': 'House', 'kind': 'property', 'country': 'UK', 'balance': 300000, 'growth_rate': 0.0},
+        {'name': 'Mortgage', 'kind': 'debt', 'country': 'UK', 'balance': 100000,
+         'annual_contribution': 30000, 'growth_rate': 0.05, 'contribution_years': 10},
+    ]
+
+    projection = project_buckets(buckets, 10, inflation_rate=0.03)
+
+    assert projection['balances'][1, 1] == pytest.approx(100000 * 1.05 - 30000)
+    assert projection['balances'][1, 10] == 0
+    assert projection['net_worth'][0] == pytest.approx(200000)
+    assert projection['net_worth'][10] == pytest.approx(300000)
+
+
+def test_project_goals():
+    """Test goals are projected from their own savings and contributions."""
+    goals = [
+        {'current_amount': 5000, 'target_amount': 10000, 'annual_contribution': 2000},
+        {'current_amount': 0, 'target_amount': 50000, 'annual_contribution': 1000},
+    ]
+
+    results = project_goals(goals, [3, 5], growth_rate=0.0)
+
+    assert results[0] == {'projected_amount': 11000.0, 'shortfall': 0.0, 'achieved': True}
+    assert results[1]['projected_amount'] == pytest.approx(5000)
+    assert results[1]['shortfall'] == pytest.approx(45000)
+    assert results[1]['achieved'] is False
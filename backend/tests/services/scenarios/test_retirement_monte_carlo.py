@@ -4,14 +4,17 @@ Tests for RetirementAgeScenarioService and MonteCarloService.
 Tests:
 - Retirement age modeling
 - Retirement age optimization
-- Monte Carlo simulations
+- Retirement age sweeps (ages x growth rates) and their cache
+- Monte Carlo simulations and their cache
 - Safe withdrawal rate calculation
 """
 
 import pytest
 from decimal import Decimal
+from unittest.mock import patch
 
 from services.scenarios import RetirementAgeScenarioService, MonteCarloService
+from services.scenarios.monte_carlo_service import monte_carlo_cache
 
 
 @pytest.mark.asyncio
@@ -89,6 +92,136 @@ async def test_optimize_retirement_age(db_session, test_user):
     assert 'reasoning' in result
 
 
+@pytest.mark.asyncio
+async def test_model_retirement_ages_matches_single_age(db_session, test_user):
+    """Test a multi-age sweep matches modeling each age individually."""
+    service = RetirementAgeScenarioService(db_session)
+    inputs = dict(
+        current_age=40,
+        current_pension_pot=Decimal('80000.00'),
+        annual_contributions=Decimal('6000.00'),
+        growth_rate=Decimal('1.00'),
+        life_expectancy=95
+    )
+
+    sweep = await service.model_retirement_ages(test_user.id, [55, 60, 67, 70], **inputs)
+
+    assert [result['retirement_age'] for result in sweep] == [55, 60, 67, 70]
+    for result in sweep:
+        single = await service.model_retirement_age(
+            test_user.id, result['retirement_age'], **inputs
+        )
+        assert result == single
+
+    # Pot grows with each extra working year
+    pots = [result['pension_pot_at_retirement'] for result in sweep]
+    assert pots == sorted(pots)
+
+
+@pytest.mark.asyncio
+async def test_model_retirement_age_matches_compound_interest(db_session, test_user):
+    """Test projected pot and depletion age match a year-by-year calculation."""
+    service = RetirementAgeScenarioService(db_session)
+
+    result = await service.model_retirement_age(
+        user_id=test_user.id,
+        retirement_age=60,
+        current_age=50,
+        current_pension_pot=Decimal('100000.00'),
+        annual_contributions=Decimal('5000.00'),
+        growth_rate=Decimal('-3.00'),
+        life_expectancy=90
+    )
+
+    pot = Decimal('100000.00')
+    for _ in range(10):
+        pot = pot * Decimal('0.97') + Decimal('5000.00')
+    assert result['pension_pot_at_retirement'] == pytest.approx(float(pot))
+
+    # Grow then withdraw 4% of the post-lump-sum pot each year
+    remaining = pot * Decimal('0.75')
+    withdrawal = remaining * Decimal('0.04')
+    expected_age = None
+    for age in range(60, 90):
+        remaining = remaining * Decimal('0.97') - withdrawal
+        if remaining <= 0:
+            expected_age = age
+            break
+    assert expected_age is not None
+    assert result['pot_depletion_age'] == expected_age
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis_client wrapper."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, expire=None):
+        self.store[key] = value
+        return True
+
+
+@pytest.mark.asyncio
+async def test_sweep_retirement_ages_matches_single_age(db_session, test_user):
+    """Test each sweep point matches modeling that age and growth rate alone."""
+    service = RetirementAgeScenarioService(db_session)
+
+    with patch('services.scenarios.retirement_age_scenario.redis_client', FakeRedis()):
+        sweep = await service.sweep_retirement_ages(
+            user_id=test_user.id,
+            current_age=58,
+            current_pension_pot=Decimal('150000.00'),
+            annual_contributions=Decimal('8000.00'),
+            growth_rates=[Decimal('2.00'), Decimal('6.00')]
+        )
+
+    assert sweep['retirement_ages'] == list(range(58, 71))
+    assert sweep['growth_rates'] == [2.0, 6.0]
+    assert len(sweep['scenarios']) == 26
+
+    for point in sweep['scenarios']:
+        single = await service.model_retirement_age(
+            test_user.id,
+            point['retirement_age'],
+            current_age=58,
+            current_pension_pot=Decimal('150000.00'),
+            annual_contributions=Decimal('8000.00'),
+            growth_rate=Decimal(str(point['growth_rate']))
+        )
+        for key, value in single.items():
+            assert point[key] == pytest.approx(value), key
+
+
+@pytest.mark.asyncio
+async def test_sweep_retirement_ages_cached_per_inputs(db_session, test_user):
+    """Test sweeps are cached per input hash."""
+    service = RetirementAgeScenarioService(db_session)
+    fake_redis = FakeRedis()
+    inputs = dict(
+        user_id=test_user.id,
+        current_age=35,
+        current_pension_pot=Decimal('50000.00'),
+        annual_contributions=Decimal('5000.00')
+    )
+
+    with patch('services.scenarios.retirement_age_scenario.redis_client', fake_redis):
+        first = await service.sweep_retirement_ages(**inputs)
+        assert len(fake_redis.store) == 1
+
+        with patch.object(service, '_model_grid', side_effect=AssertionError("not cached")):
+            second = await service.sweep_retirement_ages(
+                **inputs, growth_rates=[Decimal('4'), Decimal('6.0'), Decimal('8.00')]
+            )
+        assert second == first
+
+        await service.sweep_retirement_ages(**inputs, life_expectancy=95)
+        assert len(fake_redis.store) == 2
+
+
 @pytest.mark.asyncio
 async def test_retirement_age_invalid_inputs(db_session, test_user):
     """Test validation of retirement age inputs."""
@@ -248,3 +381,70 @@ async def test_monte_carlo_invalid_inputs(db_session, test_user):
             target_annual_income=Decimal('25000.00'),
             simulations=1000
         )
+
+
+@pytest.mark.asyncio
+async def test_monte_carlo_cached_per_quantized_inputs(db_session, test_user):
+    """Test repeated simulations are served from the LRU, then Redis."""
+    service = MonteCarloService(db_session)
+    fake_redis = FakeRedis()
+    inputs = dict(
+        user_id=test_user.id,
+        retirement_age=65,
+        life_expectancy=90,
+        target_annual_income=Decimal('25000.00'),
+        simulations=1000
+    )
+    monte_carlo_cache.clear()
+
+    with patch('services.scenarios.monte_carlo_service.redis_client', fake_redis):
+        first = await service.run_monte_carlo_retirement(starting_pot=Decimal('400000.00'), **inputs)
+        assert len(fake_redis.store) == 1
+
+        with patch.object(service, '_simulate_retirement', side_effect=AssertionError("not cached")):
+            # Same amount to the penny and same rates share the entry
+            second = await service.run_monte_carlo_retirement(
+                starting_pot=Decimal('400000.001'), mean_return=Decimal('6'), **inputs
+            )
+            assert second == first
+
+            # Evicted from the process: served from Redis
+            monte_carlo_cache.clear()
+            third = await service.run_monte_carlo_retirement(starting_pot=Decimal('400000'), **inputs)
+            assert third == first
+
+        stats = monte_carlo_cache.stats()
+        assert stats['redis_hits'] == 1
+        assert stats['misses'] == 0
+        assert stats['compute_seconds_saved'] > 0
+
+        await service.run_monte_carlo_retirement(starting_pot=Decimal('400000.01'), **inputs)
+        assert len(fake_redis.store) == 2
+
+    stats = monte_carlo_cache.stats()
+    assert stats['misses'] == 1
+    assert stats['hit_rate'] == 50.0
+    monte_carlo_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_monte_carlo_cache_evicts_least_recently_used(db_session, test_user):
+    """Test the in-process cache keeps at most max_entries."""
+    service = MonteCarloService(db_session)
+    monte_carlo_cache.clear()
+
+    with patch('services.scenarios.monte_carlo_service.redis_client', FakeRedis()), \
+            patch.object(monte_carlo_cache, 'max_entries', 2):
+        for pot in ('100000', '200000', '300000'):
+            await service.run_monte_carlo_retirement(
+                user_id=test_user.id,
+                starting_pot=Decimal(pot),
+                retirement_age=65,
+                life_expectancy=70,
+                target_annual_income=Decimal('10000'),
+                simulations=1000
+            )
+
+        assert monte_carlo_cache.stats()['entries'] == 2
+
+    monte_carlo_cache.clear()
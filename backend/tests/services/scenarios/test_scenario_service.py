@@ -3,8 +3,8 @@ Tests for ScenarioService.
 
 Tests:
 - Scenario CRUD operations
-- Scenario execution
-- Scenario comparison
+- Scenario execution (bucket projections with tax and goals)
+- Scenario comparison (run together on a shared baseline)
 - Scenario limits and validation
 """
 
@@ -14,6 +14,11 @@ from decimal import Decimal
 import uuid
 
 from models.scenario import ScenarioType, ScenarioStatus
+from models.savings_account import SavingsAccount, AccountType, AccountCountry, Currency
+from models.retirement import UKPension, UKPensionContribution, PensionType, ContributionFrequency
+from models.income import UserIncome, IncomeType, IncomeFrequency
+from models.goal import FinancialGoal, GoalType, GoalPriority, GoalStatus
+from schemas.scenario import ScenarioComparisonResponse, ScenarioResultResponse
 from services.scenarios import ScenarioService
 from services.scenarios.scenario_service import (
     ValidationError, NotFoundError, PermissionError, ScenarioLimitError
@@ -241,3 +246,210 @@ async def test_run_scenario(db_session, test_user, test_savings_account):
     # Verify scenario status updated
     await db_session.refresh(scenario)
     assert scenario.status == ScenarioStatus.CALCULATED
+
+
+@pytest.mark.asyncio
+async def test_run_scenario_projects_buckets(db_session, test_user):
+    """Test scenario runs project savings, pensions, tax and goals."""
+    test_user.date_of_birth = date(date.today().year - 40, 1, 1)
+    pension_id = uuid.uuid4()
+    db_session.add_all([
+        SavingsAccount(
+            user_id=test_user.id,
+            bank_name="Test Bank",
+            account_name="Savings",
+            account_number_encrypted="encrypted_1234",
+            account_type=AccountType.SAVINGS,
+            currency=Currency.GBP,
+            current_balance=Decimal('50000.00'),
+            interest_rate=Decimal('4.00'),
+            country=AccountCountry.UK,
+            is_active=True
+        ),
+        UKPension(
+            id=pension_id,
+            user_id=test_user.id,
+            pension_type=PensionType.SIPP,
+            provider='SIPP Provider',
+            scheme_reference_encrypted='encrypted_sipp',
+            current_value=Decimal('100000.00'),
+            start_date=date(2015, 1, 1),
+            expected_retirement_date=date(2050, 1, 1),
+            is_deleted=False
+        ),
+        UKPensionContribution(
+            pension_id=pension_id,
+            employee_contribution=Decimal('500.00'),
+            employer_contribution=Decimal('300.00'),
+            frequency=ContributionFrequency.MONTHLY,
+            contribution_date=date(2024, 4, 6),
+            tax_year='2024/25',
+            effective_from=date(2024, 4, 6)
+        ),
+        UserIncome(
+            user_id=test_user.id,
+            income_type=IncomeType.EMPLOYMENT,
+            source_country='UK',
+            amount=Decimal('5000.00'),
+            currency='GBP',
+            frequency=IncomeFrequency.MONTHLY,
+            income_date=date(2024, 5, 31)
+        ),
+        FinancialGoal(
+            user_id=test_user.id,
+            goal_name="Car",
+            goal_type=GoalType.VEHICLE_PURCHASE,
+            target_amount=Decimal('10000.00'),
+            current_amount=Decimal('8000.00'),
+            currency='GBP',
+            target_date=date.today() + timedelta(days=3 * 365),
+            start_date=date.today(),
+            priority=GoalPriority.MEDIUM,
+            status=GoalStatus.IN_PROGRESS
+        ),
+    ])
+    await db_session.commit()
+
+    service = ScenarioService(db_session)
+    scenario = await service.create_scenario(test_user.id, {
+        'scenario_name': "Retire at 60",
+        'scenario_type': ScenarioType.RETIREMENT_AGE_CHANGE,
+        'assumptions': [
+            {
+                'assumption_type': 'retirement',
+                'assumption_key': 'retirement_age',
+                'assumption_value': '60',
+                'unit': 'years'
+            }
+        ]
+    })
+
+    result = await service.run_scenario(scenario.id, test_user.id, {
+        'projection_years': 30,
+        'growth_rate': Decimal('5.00'),
+        'inflation_rate': Decimal('2.00')
+    })
+
+    buckets = {bucket['name']: bucket for bucket in result.detailed_breakdown['buckets']}
+    assert buckets['Savings']['kind'] == 'cash'
+    assert buckets['SIPP Provider']['kind'] == 'pension'
+    assert len(buckets['SIPP Provider']['values']) == 31
+
+    # Salary of £60,000 taxed under the UK schedule while working
+    tax_rows = result.tax_liability_series.to_rows()
+    first_year_tax = tax_rows[0]
+    assert first_year_tax['income_tax'] > 0
+    assert first_year_tax['national_insurance'] > 0
+    assert tax_rows[25]['national_insurance'] == 0
+
+    # Pension receives £9,600 a year until 60
+    pot = Decimal('100000')
+    for year in range(20):
+        pot = pot * Decimal('1.05') + Decimal('9600') * Decimal('1.02') ** year
+    assert result.retirement_income_projection['pension_pot_at_retirement'] == pytest.approx(float(pot))
+    assert result.retirement_adequacy_ratio is not None
+
+    assert result.final_net_worth == pytest.approx(
+        Decimal(str(result.net_worth_series.column('net_worth')[-1])), abs=Decimal('0.01')
+    )
+    assert result.total_lifetime_tax > 0
+
+    # Goal reaches £8,000 x 1.05^3 < £10,000 without contributions
+    assert result.goal_achievement_projection['total_goals'] == 1
+    assert result.goals_achieved_count == 0
+
+    # API responses still expand series to year-by-year objects
+    response = ScenarioResultResponse.model_validate(result)
+    assert response.tax_liability_projection == tax_rows
+    assert response.net_worth_projection[0]['year'] == 1
+
+    # Ranges are read without the full series
+    series = await service.get_result_series(
+        scenario.id, test_user.id, 'net_worth', start_year=11, end_year=20, max_points=4
+    )
+    assert series['total_points'] == 30
+    assert series['columns']['year'] == [11, 14, 17, 20]
+    assert series['columns']['age'] == [51, 54, 57, 60]
+
+    with pytest.raises(ValidationError):
+        await service.get_result_series(scenario.id, test_user.id, 'cash_flow')
+
+
+@pytest.mark.asyncio
+async def test_run_and_compare_scenarios(db_session, test_user, monkeypatch):
+    """Test scenarios run on one baseline, save in one commit and compare."""
+    test_user.date_of_birth = date(date.today().year - 40, 1, 1)
+    db_session.add(SavingsAccount(
+        user_id=test_user.id,
+        bank_name="Test Bank",
+        account_name="Savings",
+        account_number_encrypted="encrypted_1234",
+        account_type=AccountType.SAVINGS,
+        currency=Currency.GBP,
+        current_balance=Decimal('50000.00'),
+        interest_rate=Decimal('4.00'),
+        country=AccountCountry.UK,
+        is_active=True
+    ))
+    await db_session.commit()
+
+    service = ScenarioService(db_session)
+    scenarios = [
+        await service.create_scenario(test_user.id, {
+            'scenario_name': f"Retire at {age}",
+            'scenario_type': ScenarioType.RETIREMENT_AGE_CHANGE,
+            'assumptions': [
+                {
+                    'assumption_type': 'retirement',
+                    'assumption_key': 'retirement_age',
+                    'assumption_value': str(age),
+                    'unit': 'years'
+                }
+            ]
+        })
+        for age in (60, 67)
+    ]
+
+    baseline_builds = []
+    build_user_baseline = service._build_user_baseline
+
+    async def counting_build_user_baseline(user_id):
+        baseline_builds.append(user_id)
+        return await build_user_baseline(user_id)
+
+    commits = []
+    commit = db_session.commit
+
+    async def counting_commit():
+        commits.append(True)
+        await commit()
+
+    monkeypatch.setattr(service, '_build_user_baseline', counting_build_user_baseline)
+    monkeypatch.setattr(db_session, 'commit', counting_commit)
+
+    comparison = await service.run_and_compare_scenarios(
+        [scenario.id for scenario in scenarios], test_user.id, {'projection_years': 10}
+    )
+
+    assert len(baseline_builds) == 1
+    assert len(commits) == 1
+
+    for scenario in scenarios:
+        assert scenario.status == ScenarioStatus.CALCULATED
+        assert scenario.results.projection_years == 10
+
+    # Same savings, so only retirement age separates the scenarios
+    assert [entry['name'] for entry in comparison['scenarios']] == ["Retire at 60", "Retire at 67"]
+    net_worth_values = comparison['metric_comparisons']['final_net_worth']['values']
+    assert net_worth_values[0]['value'] == pytest.approx(net_worth_values[1]['value'])
+
+    ScenarioComparisonResponse.model_validate(comparison)
+
+
+@pytest.mark.asyncio
+async def test_run_and_compare_requires_two_scenarios(db_session, test_user):
+    """Test running a comparison needs at least two scenarios."""
+    service = ScenarioService(db_session)
+
+    with pytest.raises(ValidationError):
+        await service.run_and_compare_scenarios([uuid.uuid4()], test_user.id, {})
@@ -0,0 +1,87 @@
+"""
+Tests for Encryption Key Rotation Service
+
+Test Coverage:
+- Rows encrypted under a retired key are re-encrypted under the current key
+- Values no configured key can decrypt are left unchanged and counted
+- Chunked (keyset) iteration covers every row
+"""
+
+import pytest
+from decimal import Decimal
+
+from cryptography.fernet import Fernet
+from sqlalchemy import select
+
+import utils.encryption
+from models.savings_account import (
+    SavingsAccount, AccountType, AccountCountry, Currency
+)
+from services.encryption_key_rotation import EncryptionKeyRotationService
+from utils.encryption import decrypt_value
+
+
+@pytest.fixture
+def use_keys(monkeypatch):
+    """Switch the encryption keys (primary, previous) for one test."""
+    def _use_keys(primary, previous=None):
+        monkeypatch.setenv('ENCRYPTION_KEY', primary)
+        if previous:
+            monkeypatch.setenv('ENCRYPTION_KEYS_PREVIOUS', previous)
+        else:
+            monkeypatch.delenv('ENCRYPTION_KEYS_PREVIOUS', raising=False)
+        monkeypatch.setattr(utils.encryption, '_fernet', None)
+
+    yield _use_keys
+    utils.encryption._fernet = None
+
+
+def _account(user_id, number):
+    """Savings account with an encrypted account number."""
+    account = SavingsAccount(
+        user_id=user_id,
+        bank_name="Bank A",
+        account_name=f"Account {number}",
+        account_type=AccountType.SAVINGS,
+        currency=Currency.GBP,
+        current_balance=Decimal("1000"),
+        country=AccountCountry.UK
+    )
+    account.set_account_number(number)
+    return account
+
+
+@pytest.mark.asyncio
+async def test_rotate_all_reencrypts_under_current_key(db_session, test_user, use_keys):
+    """Test rotation leaves every row readable with only the new key."""
+    old_key = Fernet.generate_key().decode()
+    new_key = Fernet.generate_key().decode()
+
+    use_keys(old_key)
+    numbers = [f"1234{i:04d}" for i in range(5)]
+    for number in numbers:
+        db_session.add(_account(test_user.id, number))
+    db_session.add(SavingsAccount(
+        user_id=test_user.id,
+        bank_name="Bank B",
+        account_name="Unreadable",
+        account_number_encrypted="not_encrypted",
+        account_type=AccountType.SAVINGS,
+        currency=Currency.GBP,
+        current_balance=Decimal("1000"),
+        country=AccountCountry.UK
+    ))
+    await db_session.commit()
+
+    use_keys(new_key, previous=old_key)
+    results = await EncryptionKeyRotationService(db_session).rotate_all(chunk_size=2)
+
+    assert results['savings_accounts'] == {'rows': 6, 'rotated': 5, 'failed': 1}
+
+    use_keys(new_key)
+    stored = (await db_session.execute(
+        select(SavingsAccount.account_name, SavingsAccount.account_number_encrypted)
+    )).all()
+    tokens = dict(stored)
+    assert tokens.pop("Unreadable") == "not_encrypted"
+    assert sorted(decrypt_value(token) for token in tokens.values()) == numbers
@@ -9,6 +9,7 @@ Test Coverage:
 - Approaching limit warnings (80%, 95%)
 - Historical tax year queries
 - Leap year handling
+- Allowance ledgers kept in step with contributions
 """
 
 import pytest
@@ -16,13 +17,16 @@ import uuid
 from datetime import date
 from decimal import Decimal
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.user import User, UserStatus, CountryPreference
 from models.savings_account import (
     ISAContribution,
     TFSAContribution,
-    TFSAContributionType
+    TFSAContributionType,
+    ISAAllowanceLedger,
+    TFSAAllowanceLedger
 )
 from services.isa_tfsa_tracking import (
     get_current_uk_tax_year,
@@ -460,6 +464,94 @@ class TestTFSATracking:
         assert allowance_2025['annual_used'] == Decimal('25000.00')
 
 
+# ===== ALLOWANCE LEDGER TESTS =====
+
+class TestAllowanceLedgers:
+    """Test ledgers track contributions however they are written."""
+
+    async def test_isa_ledger_follows_inserts_updates_and_deletes(self, db_session: AsyncSession, test_user: User, isa_service: ISATrackingService):
+        """Test the ISA ledger row tracks direct contribution writes."""
+        contribution = ISAContribution(
+            user_id=test_user.id,
+            tax_year="2024/25",
+            contribution_amount=Decimal('5000.00'),
+            contribution_date=date(2024, 6, 1)
+        )
+        db_session.add(contribution)
+        await db_session.commit()
+
+        ledger = await db_session.get(ISAAllowanceLedger, (test_user.id, "2024/25"))
+        assert ledger.used == Decimal('5000.00')
+        assert ledger.contribution_count == 1
+
+        # Moving a contribution to another tax year moves its amount too
+        contribution.contribution_amount = Decimal('7000.00')
+        contribution.tax_year = "2025/26"
+        await db_session.commit()
+        assert await isa_service.get_isa_used(test_user.id, "2024/25") == Decimal('0.00')
+        assert await isa_service.get_isa_used(test_user.id, "2025/26") == Decimal('7000.00')
+
+        await db_session.delete(contribution)
+        await db_session.commit()
+        assert await isa_service.get_isa_used(test_user.id, "2025/26") == Decimal('0.00')
+
+    async def test_tfsa_lifetime_total_spans_tax_years(self, db_session: AsyncSession, test_user: User, tfsa_service: TFSATrackingService):
+        """Test every TFSA ledger row carries the running lifetime total."""
+        for tax_year, contribution_date in (("2022/23", date(2022, 6, 1)), ("2023/24", date(2023, 6, 1))):
+            await tfsa_service.record_tfsa_contribution(
+                user_id=test_user.id,
+                account_id=None,
+                amount=Decimal('30000.00'),
+                contribution_type='DEPOSIT',
+                contribution_date=contribution_date
+            )
+
+        ledgers = (await db_session.execute(
+            select(TFSAAllowanceLedger).where(TFSAAllowanceLedger.user_id == test_user.id)
+        )).scalars().all()
+        assert {ledger.tax_year: ledger.annual_used for ledger in ledgers} == {
+            "2022/23": Decimal('30000.00'), "2023/24": Decimal('30000.00')
+        }
+        assert {ledger.lifetime_used for ledger in ledgers} == {Decimal('60000.00')}
+
+        # A tax year without contributions still sees the lifetime total
+        annual_used, lifetime_used = await tfsa_service.get_tfsa_used(test_user.id, "2024/25")
+        assert annual_used == Decimal('0.00')
+        assert lifetime_used == Decimal('60000.00')
+
+
+    async def test_locked_read_creates_missing_ledger(self, db_session: AsyncSession, test_user: User, isa_service: ISATrackingService, tfsa_service: TFSATrackingService):
+        """Test a locked read before the first contribution of a year creates a row to lock."""
+        assert await db_session.get(ISAAllowanceLedger, (test_user.id, "2024/25")) is None
+
+        assert await isa_service.get_isa_used(test_user.id, "2024/25", for_update=True) == Decimal('0.00')
+        ledger = await db_session.get(ISAAllowanceLedger, (test_user.id, "2024/25"))
+        assert ledger.used == Decimal('0.00')
+        assert ledger.contribution_count == 0
+
+        # The contribution's flush updates that row instead of inserting a second one
+        await isa_service.record_isa_contribution(
+            user_id=test_user.id,
+            account_id=None,
+            amount=Decimal('2000.00'),
+            contribution_date=date(2024, 6, 1)
+        )
+        assert await isa_service.get_isa_used(test_user.id, "2024/25", for_update=True) == Decimal('2000.00')
+
+        # A new TFSA tax year row starts from the user's lifetime total
+        await tfsa_service.record_tfsa_contribution(
+            user_id=test_user.id,
+            account_id=None,
+            amount=Decimal('10000.00'),
+            contribution_type='DEPOSIT',
+            contribution_date=date(2023, 6, 1)
+        )
+        annual_used, lifetime_used = await tfsa_service.get_tfsa_used(test_user.id, "2024/25", for_update=True)
+        assert annual_used == Decimal('0.00')
+        assert lifetime_used == Decimal('10000.00')
+        ledger = await db_session.get(TFSAAllowanceLedger, (test_user.id, "2024/25"))
+        assert ledger.lifetime_used == Decimal('10000.00')
+
 # ===== APPROACHING LIMIT TESTS =====
 
 class TestApproachingLimit:
@@ -6,21 +6,47 @@ This module tests:
 - Account number encryption/decryption
 - Error handling
 - Key generation
+- Masked display suffixes
+- Batch encryption and key rotation
 """
 
 import pytest
 import os
 from cryptography.fernet import Fernet
 
+import utils.encryption
 from utils.encryption import (
     encrypt_value,
     decrypt_value,
     encrypt_account_number,
     decrypt_account_number,
-    generate_encryption_key
+    generate_encryption_key,
+    masked_suffix,
+    mask_value,
+    encrypt_values,
+    decrypt_values,
+    rotate_values,
+    encrypt_values_async,
+    decrypt_values_async,
+    BATCH_THRESHOLD
 )
 
 
+@pytest.fixture
+def use_keys(monkeypatch):
+    """Switch the encryption keys (primary, previous) for one test."""
+    def _use_keys(primary, previous=None):
+        monkeypatch.setenv('ENCRYPTION_KEY', primary)
+        if previous:
+            monkeypatch.setenv('ENCRYPTION_KEYS_PREVIOUS', previous)
+        else:
+            monkeypatch.delenv('ENCRYPTION_KEYS_PREVIOUS', raising=False)
+        monkeypatch.setattr(utils.encryption, '_fernet', None)
+
+    yield _use_keys
+    utils.encryption._fernet = None
+
+
 class TestEncryption:
     """Test encryption utilities."""
 
@@ -196,6 +222,14 @@ class TestEncryption:
             decrypted = decrypt_account_number(encrypted)
             assert decrypted == account_number
 
+    def test_masked_suffix_and_mask_value(self):
+        """Test masked display values are built from the stored suffix."""
+        assert masked_suffix("GB29NWBK60161331926819") == "6819"
+        assert masked_suffix("123") == "123"
+
+        assert mask_value("6819") == "****6819"
+        assert mask_value(None) == "****"
+
     def test_encryption_with_missing_key_in_testing_mode(self):
         """Test that encryption works in testing mode even without ENCRYPTION_KEY set."""
         # This test verifies that _get_fernet() generates a key when TESTING=true
@@ -207,3 +241,53 @@ class TestEncryption:
         decrypted = decrypt_value(encrypted)
 
         assert decrypted == value
+
+
+class TestBatchEncryption:
+    """Test batch encryption and key rotation."""
+
+    def test_batch_round_trip(self):
+        """Test batch encryption decrypts back to the same values in order."""
+        values = [f"value_{i}" for i in range(10)]
+
+        encrypted = encrypt_values(values)
+
+        assert len(encrypted) == len(values)
+        assert decrypt_values(encrypted) == values
+        assert decrypt_value(encrypted[3]) == "value_3"
+
+    def test_lenient_decrypt_returns_none_for_invalid(self):
+        """Test strict=False returns None for values that fail to decrypt."""
+        encrypted = encrypt_values(["a", "b"])
+
+        with pytest.raises(ValueError):
+            decrypt_values([encrypted[0], "not_encrypted"])
+
+        assert decrypt_values([encrypted[0], "not_encrypted", encrypted[1]], strict=False) == ["a", None, "b"]
+
+    @pytest.mark.asyncio
+    async def test_async_batch_on_compute_pool(self):
+        """Test batches above the threshold give the same results off the event loop."""
+        values = [f"value_{i}" for i in range(BATCH_THRESHOLD * 5)]
+
+        encrypted = await encrypt_values_async(values)
+
+        assert await decrypt_values_async(encrypted) == values
+
+    def test_previous_keys_decrypt_and_rotate(self, use_keys):
+        """Test retired keys still decrypt and rotation moves values to the new key."""
+        old_key = Fernet.generate_key().decode()
+        new_key = Fernet.generate_key().decode()
+
+        use_keys(old_key)
+        encrypted = encrypt_values(["1234567890", "secret"])
+
+        use_keys(new_key, previous=old_key)
+        assert decrypt_values(encrypted) == ["1234567890", "secret"]
+        rotated = rotate_values(encrypted + ["not_encrypted"])
+        assert rotated[2] is None
+
+        use_keys(new_key)
+        assert decrypt_values(rotated[:2]) == ["1234567890", "secret"]
+        with pytest.raises(ValueError):
+            decrypt_value(encrypted[0])
@@ -0,0 +1,130 @@
+"""
+Tests for keyset pagination helpers.
+
+Test Coverage:
+- Cursors round-trip typed sort values
+- Cursors issued for another sort order or malformed tokens are rejected
+- keyset_condition handles mixed sort directions
+- camelCase response fields map to snake_case columns for projection
+- The count cache is skipped quietly when Redis isn't connected
+"""
+
+import logging
+
+import pytest
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import uuid4
+
+from sqlalchemy import Column, Date, Integer, MetaData, String, Table, func, select
+
+from database import engine
+from models.income import UserIncome
+from schemas.income import IncomeResponse
+from utils.pagination import (
+    PageParams, decode_cursor, encode_cursor, keyset_condition, list_count_cache, projectable_columns
+)
+
+
+metadata = MetaData()
+rows_table = Table(
+    'pagination_rows', metadata,
+    Column('id', Integer, primary_key=True),
+    Column('day', Date),
+    Column('name', String)
+)
+
+
+def test_cursor_round_trip():
+    """Test every supported value type decodes to the encoded value."""
+    order_by = [(rows_table.c.day, True), (rows_table.c.name, False), (rows_table.c.id, True)]
+    values = [datetime(2025, 1, 2, 3, 4, 5), "b", uuid4()]
+    assert decode_cursor(encode_cursor(order_by, values), order_by) == values
+
+    for value in (date(2025, 1, 2), Decimal("10.50"), 7):
+        order = [(rows_table.c.id, False)]
+        assert decode_cursor(encode_cursor(order, [value]), order) == [value]
+
+
+def test_cursor_rejects_other_sort_order():
+    """Test a cursor can't be replayed against a different sort."""
+    token = encode_cursor([(rows_table.c.day, True), (rows_table.c.id, True)], [date(2025, 1, 1), 1])
+
+    with pytest.raises(ValueError):
+        decode_cursor(token, [(rows_table.c.day, False), (rows_table.c.id, False)])
+
+
+@pytest.mark.parametrize("token", ["not-a-cursor", "", "e30"])
+def test_cursor_rejects_malformed_token(token):
+    """Test malformed tokens raise ValueError."""
+    with pytest.raises(ValueError):
+        decode_cursor(token, [(rows_table.c.id, True)])
+
+
+def test_page_params_ignores_skip_with_cursor():
+    """Test OFFSET paging is dropped once a cursor is given."""
+    assert PageParams(limit=10, skip=5).skip == 5
+    assert PageParams(cursor="abc", limit=10, skip=5).skip == 0
+    assert not PageParams().paginated
+    assert PageParams(fields="a, b,,").fields == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_keyset_condition_mixed_directions():
+    """Test walking pages with day descending, name ascending visits rows in order."""
+    data = [
+        {'id': i, 'day': date(2025, 1, 1 + i % 3), 'name': name}
+        for i, name in enumerate("edcbafg")
+    ]
+    order_by = [(rows_table.c.day, True), (rows_table.c.name, False), (rows_table.c.id, False)]
+    expected = sorted(data, key=lambda r: (-r['day'].toordinal(), r['name'], r['id']))
+
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+        try:
+            await conn.execute(rows_table.insert(), data)
+
+            seen, values = [], None
+            while True:
+                stmt = select(rows_table).order_by(
+                    rows_table.c.day.desc(), rows_table.c.name.asc(), rows_table.c.id.asc()
+                ).limit(2)
+                if values is not None:
+                    stmt = stmt.where(keyset_condition(order_by, values))
+                page = (await conn.execute(stmt)).mappings().all()
+                if not page:
+                    break
+                seen.extend(dict(row) for row in page)
+                last = page[-1]
+                values = decode_cursor(
+                    encode_cursor(order_by, [last['day'], last['name'], last['id']]), order_by
+                )
+        finally:
+            await conn.run_sync(metadata.drop_all)
+
+    assert seen == expected
+
+
+def test_projectable_columns_maps_camel_case_fields():
+    """Test camelCase schema fields project from their snake_case columns."""
+    mapping = projectable_columns(UserIncome, IncomeResponse)
+
+    assert mapping['incomeDate'] is UserIncome.income_date
+    assert mapping['taxYearUk'] is UserIncome.tax_year_uk
+    assert mapping['amount'] is UserIncome.amount
+    assert 'taxWithholding' not in mapping
+
+    override = projectable_columns(UserIncome, IncomeResponse, {'amount': UserIncome.amount_in_gbp})
+    assert override['amount'] is UserIncome.amount_in_gbp
+
+
+@pytest.mark.asyncio
+async def test_count_cache_skipped_without_redis(db_session, test_user, caplog):
+    """Test counts come straight from the database without logging Redis errors."""
+    caplog.set_level(logging.DEBUG, logger='utils.pagination')
+    stmt = select(func.count()).select_from(UserIncome).where(UserIncome.user_id == test_user.id)
+
+    assert await list_count_cache.count(db_session, UserIncome, test_user.id, stmt) == 0
+    await list_count_cache.invalidate(UserIncome, test_user.id)
+
+    assert not [r for r in caplog.records if r.levelno >= logging.WARNING]
@@ -0,0 +1,86 @@
+"""
+Tests for columnar projection series storage.
+
+This module tests:
+- Round trips through the stored JSON form
+- Range decoding across base64 block boundaries
+- Year ranges and downsampling
+- Legacy per-year object lists
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from utils.projection_series import ProjectionSeries
+
+
+def _series(length):
+    """Series with an int year column and a float value column."""
+    return ProjectionSeries.from_columns(
+        {
+            'year': np.arange(1, length + 1),
+            'net_worth': np.linspace(1000.0, 2000.0, length) + 0.01
+        },
+        int_columns=('year',)
+    )
+
+
+class TestProjectionSeries:
+    """Test projection series encoding and lazy decoding."""
+
+    def test_round_trip_through_json(self):
+        """Test values survive storage in a JSON column exactly."""
+        series = _series(30)
+
+        stored = json.loads(json.dumps(series.to_json()))
+        loaded = ProjectionSeries.load(stored)
+
+        assert len(loaded) == 30
+        assert loaded.column_names == ['year', 'net_worth']
+        assert np.array_equal(loaded.column('net_worth'), series.column('net_worth'))
+
+        rows = loaded.to_rows()
+        assert rows[0] == {'year': 1, 'net_worth': pytest.approx(1000.01)}
+        assert isinstance(rows[0]['year'], int)
+
+    def test_range_decoding_matches_full_column(self):
+        """Test every range decodes the same values as the full column."""
+        series = _series(11)
+        full = series.column('net_worth').copy()
+
+        for start in range(12):
+            for stop in range(start, 12):
+                fresh = ProjectionSeries.load(series.to_json())
+                assert np.array_equal(fresh.column('net_worth', start, stop), full[start:stop])
+
+    def test_year_range_and_downsampling(self):
+        """Test year ranges are inclusive and downsampling keeps both ends."""
+        series = _series(30)
+
+        start, stop = series.index_range(5, 10)
+        assert series.window(start, stop)['year'] == [5, 6, 7, 8, 9, 10]
+
+        window = series.window(max_points=4, columns=['year'])
+        assert window == {'year': [1, 11, 20, 30]}
+
+        # Fewer points than the limit are returned as-is
+        assert len(series.window(0, 3, max_points=10)['year']) == 3
+
+    def test_legacy_rows_accepted(self):
+        """Test lists of per-year objects load as series."""
+        rows = [
+            {'year': 1, 'tax': 100.5},
+            {'year': 2, 'tax': 200.25},
+        ]
+
+        series = ProjectionSeries.load(rows)
+
+        assert series.to_rows() == rows
+        assert ProjectionSeries.load(None) is None
+
+    def test_mismatched_columns_rejected(self):
+        """Test columns of different lengths are rejected."""
+        with pytest.raises(ValueError):
+            ProjectionSeries.from_columns({'year': [1, 2], 'tax': [1.0]})
@@ -9,29 +9,51 @@ Security:
 - Keys stored in environment variables
 - Automatic key generation for development
 - Constant-time decryption to prevent timing attacks
+- Key rotation via MultiFernet: ENCRYPTION_KEY encrypts, retired keys in
+  ENCRYPTION_KEYS_PREVIOUS (comma-separated) still decrypt until rows are
+  re-encrypted (see services/encryption_key_rotation.py)
 
 Performance:
 - Symmetric encryption is fast (<1ms per operation)
 - Keys are cached in memory
 - Suitable for encrypting individual fields
+- Masked display values (****1234) come from a plaintext suffix stored
+  alongside the ciphertext, so listing records never decrypts
+- Batch APIs (list in, list out) run large batches on the compute pool so
+  bulk imports and key rotation don't block the event loop
 """
 
+import asyncio
+import functools
 import os
 import base64
-from typing import Optional
-from cryptography.fernet import Fernet, InvalidToken
+from typing import Callable, List, Optional
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
 
+from compute_pool import compute_pool
 
-# Global Fernet instance (initialized once)
-_fernet: Optional[Fernet] = None
 
+# Global MultiFernet instance (initialized once)
+_fernet: Optional[MultiFernet] = None
 
-def _get_fernet() -> Fernet:
+# Batches smaller than this run inline; larger ones run on the compute pool
+BATCH_THRESHOLD = 64
+# Values per compute pool task
+BATCH_CHUNK_SIZE = 256
+
+# Characters of sensitive numbers kept in plaintext for masked display
+MASKED_SUFFIX_LENGTH = 4
+
+
+def _get_fernet() -> MultiFernet:
     """
-    Get or initialize the Fernet encryption instance.
+    Get or initialize the MultiFernet encryption instance.
+
+    The primary key (ENCRYPTION_KEY) encrypts; it and any retired keys in
+    ENCRYPTION_KEYS_PREVIOUS decrypt.
 
     Returns:
-        Fernet: Initialized Fernet instance
+        MultiFernet: Initialized MultiFernet instance
 
     Raises:
         ValueError: If ENCRYPTION_KEY is not set and not in testing mode
@@ -54,14 +76,28 @@ def _get_fernet() -> Fernet:
                 "Generate one using: python -c 'from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())'"
             )
 
-    # Ensure key is bytes
-    if isinstance(encryption_key, str):
-        encryption_key = encryption_key.encode()
-
-    _fernet = Fernet(encryption_key)
+    _fernet = build_multi_fernet(encryption_key, os.getenv('ENCRYPTION_KEYS_PREVIOUS'))
     return _fernet
 
 
+def build_multi_fernet(primary_key, previous_keys: Optional[str] = None) -> MultiFernet:
+    """
+    Build a MultiFernet from a primary key and retired keys.
+
+    Args:
+        primary_key: Key used to encrypt (str or bytes)
+        previous_keys: Comma-separated retired keys, accepted for decryption
+
+    Returns:
+        MultiFernet: Encrypts with the primary key, decrypts with any key
+    """
+    keys = [primary_key] + [key.strip() for key in (previous_keys or '').split(',') if key.strip()]
+    return MultiFernet([
+        Fernet(key.encode() if isinstance(key, str) else key)
+        for key in keys
+    ])
+
+
 def encrypt_value(value: str) -> str:
     """
     Encrypt a string value using Fernet symmetric encryption.
@@ -186,6 +222,141 @@ def decrypt_account_number(encrypted_account_number: str) -> str:
     return decrypt_value(encrypted_account_number)
 
 
+def encrypt_values(values: List[str]) -> List[str]:
+    """
+    Encrypt a batch of values.
+
+    Args:
+        values: Plain text values
+
+    Returns:
+        List[str]: Encrypted values, in input order
+
+    Raises:
+        TypeError: If any value is not a string
+        ValueError: If any value is empty
+    """
+    return [encrypt_value(value) for value in values]
+
+
+def decrypt_values(encrypted_values: List[str], strict: bool = True) -> List[Optional[str]]:
+    """
+    Decrypt a batch of values.
+
+    Args:
+        encrypted_values: Encrypted values
+        strict: Raise on the first invalid value; if False, invalid values
+                decrypt to None
+
+    Returns:
+        List[Optional[str]]: Plain text values, in input order
+
+    Raises:
+        TypeError, ValueError: If strict and any value cannot be decrypted
+    """
+    if strict:
+        return [decrypt_value(value) for value in encrypted_values]
+
+    decrypted = []
+    for value in encrypted_values:
+        try:
+            decrypted.append(decrypt_value(value))
+        except (TypeError, ValueError):
+            decrypted.append(None)
+    return decrypted
+
+
+def rotate_values(encrypted_values: List[str]) -> List[Optional[str]]:
+    """
+    Re-encrypt a batch of values with the primary key.
+
+    Values encrypted with any configured key (primary or retired) are
+    decrypted and encrypted again with the primary key.
+
+    Args:
+        encrypted_values: Encrypted values
+
+    Returns:
+        List[Optional[str]]: Re-encrypted values, in input order; None for
+        values no configured key can decrypt
+    """
+    fernet = _get_fernet()
+
+    rotated = []
+    for value in encrypted_values:
+        try:
+            rotated.append(fernet.rotate(value.encode()).decode())
+        except (InvalidToken, AttributeError):
+            rotated.append(None)
+    return rotated
+
+
+async def _run_batched(func: Callable[[List], List], values: List) -> List:
+    """
+    Run a batch function inline or, for large batches, on the compute pool.
+
+    Large batches are split into chunks so they are spread across pool
+    workers and the event loop stays free.
+    """
+    if len(values) < BATCH_THRESHOLD:
+        return func(values)
+
+    chunks = await asyncio.gather(*(
+        compute_pool.run(func, values[start:start + BATCH_CHUNK_SIZE])
+        for start in range(0, len(values), BATCH_CHUNK_SIZE)
+    ))
+    return [value for chunk in chunks for value in chunk]
+
+
+async def encrypt_values_async(values: List[str]) -> List[str]:
+    """Encrypt a batch of values off the event loop (see encrypt_values)."""
+    return await _run_batched(encrypt_values, values)
+
+
+async def decrypt_values_async(encrypted_values: List[str], strict: bool = True) -> List[Optional[str]]:
+    """Decrypt a batch of values off the event loop (see decrypt_values)."""
+    return await _run_batched(functools.partial(decrypt_values, strict=strict), encrypted_values)
+
+
+async def rotate_values_async(encrypted_values: List[str]) -> List[Optional[str]]:
+    """Re-encrypt a batch of values off the event loop (see rotate_values)."""
+    return await _run_batched(rotate_values, encrypted_values)
+
+
+def masked_suffix(value: str) -> str:
+    """
+    Get the suffix of a sensitive value that may be stored for display.
+
+    Args:
+        value: Plain text value (e.g. account number)
+
+    Returns:
+        str: Last MASKED_SUFFIX_LENGTH characters (whole value if shorter)
+
+    Example:
+        >>> masked_suffix("GB29NWBK60161331926819")
+        '6819'
+    """
+    return value[-MASKED_SUFFIX_LENGTH:]
+
+
+def mask_value(suffix: Optional[str]) -> str:
+    """
+    Build a masked display value from a stored suffix.
+
+    Args:
+        suffix: Stored suffix, or None if unknown
+
+    Returns:
+        str: "****" followed by the suffix, or "****" if no suffix
+
+    Example:
+        >>> mask_value("6819")
+        '****6819'
+    """
+    return f"****{suffix}" if suffix else "****"
+
+
 def generate_encryption_key() -> str:
     """
     Generate a new Fernet encryption key.
@@ -0,0 +1,545 @@
+"""
+Keyset pagination, field projection and cached list counts for list endpoints.
+
+List endpoints keep returning a JSON array. Paging metadata travels in
+response headers so existing clients are unaffected:
+
+    GET /api/v1/user/income?limit=50
+    X-Next-Cursor: eyJvIjoi...      (absent on the last page)
+    X-Total-Count: 1234
+
+    GET /api/v1/user/income?limit=50&cursor=eyJvIjoi...&fields=id,amount
+
+Pagination:
+- Keyset ("seek") paging on the endpoint's sort columns plus id, so every
+  page costs the same however deep it is (OFFSET scans every skipped row)
+- Cursors are opaque, URL-safe tokens carrying the last row's sort values;
+  a cursor only works with the sort order it was issued for
+- Without limit or cursor, endpoints return every row as before
+
+Projection:
+- fields=a,b,c selects only those columns (id is always included)
+- Response fields backed by a column (same name, alias or snake_case
+  spelling) or by an expression the endpoint supplies can be requested;
+  values are serialized with the schema's field types
+
+Counts:
+- Totals are cached in Redis per user and list, keyed by the filter set
+- Cached totals for a user are dropped whenever a row of that list's model
+  is written for the user (see ListCountCache.register); a TTL bounds any
+  missed invalidation
+"""
+
+import asyncio
+import base64
+import enum
+import hashlib
+import json
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Type
+from uuid import UUID
+
+from fastapi import HTTPException, Query, Response, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, create_model
+from sqlalchemy import and_, event, func, inspect, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+MAX_PAGE_SIZE = 500
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+# (column attribute, descending)
+OrderSpec = Sequence[Tuple[Any, bool]]
+
+# (session, instances) -> owning user ID of each instance
+OwnersResolver = Callable[[Session, Sequence[Any]], List[Optional[UUID]]]
+
+
+# ============================================================================
+# CURSORS
+# ============================================================================
+
+def _encode_value(value: Any) -> List[Any]:
+    """Tag a sort value so it decodes to the same type."""
+    if isinstance(value, datetime):
+        return ['dt', value.isoformat()]
+    if isinstance(value, date):
+        return ['d', value.isoformat()]
+    if isinstance(value, UUID):
+        return ['u', str(value)]
+    if isinstance(value, enum.Enum):
+        return ['s', value.value]
+    if isinstance(value, Decimal):
+        return ['n', str(value)]
+    return ['s' if isinstance(value, str) else 'i', value]
+
+
+def _decode_value(tagged: List[Any]) -> Any:
+    """Inverse of _encode_value."""
+    tag, value = tagged
+    if tag == 'dt':
+        return datetime.fromisoformat(value)
+    if tag == 'd':
+        return date.fromisoformat(value)
+    if tag == 'u':
+        return UUID(value)
+    if tag == 'n':
+        return Decimal(value)
+    if tag in ('s', 'i'):
+        return value
+    raise ValueError(f"Unknown cursor value tag: {tag}")
+
+
+def _order_signature(order_by: OrderSpec) -> str:
+    """Short identifier of a sort order (e.g. 'created_at-,id-')."""
+    return ','.join(f"{column.key}{'-' if descending else '+'}" for column, descending in order_by)
+
+
+def encode_cursor(order_by: OrderSpec, values: Sequence[Any]) -> str:
+    """
+    Build an opaque cursor pointing after a row.
+
+    Args:
+        order_by: Sort columns the page was fetched with
+        values: The last row's values for those columns
+
+    Returns:
+        URL-safe cursor token
+    """
+    payload = {'o': _order_signature(order_by), 'v': [_encode_value(value) for value in values]}
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token: str, order_by: OrderSpec) -> List[Any]:
+    """
+    Read the sort values from a cursor.
+
+    Raises:
+        ValueError: If the token is malformed or was issued for another sort order
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        payload = json.loads(raw)
+        values = [_decode_value(tagged) for tagged in payload['v']]
+    except (ValueError, TypeError, KeyError, IndexError) as e:
+        raise ValueError("Malformed cursor") from e
+
+    if payload.get('o') != _order_signature(order_by) or len(values) != len(order_by):
+        raise ValueError("Cursor does not match this list's sort order")
+    return values
+
+
+def keyset_condition(order_by: OrderSpec, values: Sequence[Any]):
+    """
+    WHERE clause selecting rows that sort after the given values.
+
+    Expands to (a > x) OR (a = x AND b > y) OR ..., with < for descending
+    columns, so mixed sort directions work on every database.
+    """
+    clauses = []
+    for i, (column, descending) in enumerate(order_by):
+        after = column < values[i] if descending else column > values[i]
+        clauses.append(and_(*(order_by[j][0] == values[j] for j in range(i)), after))
+    return or_(*clauses)
+
+
+# ============================================================================
+# REQUEST PARAMETERS
+# ============================================================================
+
+class PageParams:
+    """
+    Pagination and projection parameters of a list request.
+
+    Attributes:
+        cursor: Cursor token from a previous page's X-Next-Cursor header
+        limit: Page size (None returns every row)
+        fields: Requested response fields (None returns full objects)
+        skip: Rows to skip (deprecated OFFSET paging; ignored with a cursor)
+    """
+
+    def __init__(
+        self,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        fields: Optional[str] = None,
+        skip: int = 0
+    ):
+        self.cursor = cursor
+        self.limit = limit
+        self.fields = [name.strip() for name in fields.split(',') if name.strip()] if fields else None
+        self.skip = 0 if cursor else skip
+
+    @property
+    def paginated(self) -> bool:
+        """Whether a page (rather than the whole list) was requested."""
+        return self.limit is not None or self.cursor is not None
+
+
+def page_params(default_limit: Optional[int] = None, max_limit: int = MAX_PAGE_SIZE) -> Callable[..., PageParams]:
+    """
+    FastAPI dependency reading PageParams from the query string.
+
+    Args:
+        default_limit: Page size when limit isn't given (None: all rows)
+        max_limit: Largest accepted page size
+
+    Usage:
+        page: PageParams = Depends(page_params())
+    """
+    def dependency(
+        cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
+        limit: Optional[int] = Query(default_limit, ge=1, le=max_limit, description="Page size"),
+        fields: Optional[str] = Query(None, description="Comma-separated fields to return (default: all)")
+    ) -> PageParams:
+        return PageParams(cursor=cursor, limit=limit, fields=fields)
+
+    return dependency
+
+
+@dataclass
+class Page:
+    """One page of a list endpoint."""
+    items: List[Any]
+    next_cursor: Optional[str]
+    total: int
+    projected: bool
+
+    def headers(self) -> Dict[str, str]:
+        """Paging response headers."""
+        headers = {TOTAL_COUNT_HEADER: str(self.total)}
+        if self.next_cursor:
+            headers[NEXT_CURSOR_HEADER] = self.next_cursor
+        return headers
+
+    def respond(self, response: Response):
+        """
+        Return value for the endpoint.
+
+        Full objects go through the endpoint's response_model with the paging
+        headers added to response; projected rows (already serialized) are
+        returned directly.
+        """
+        if self.projected:
+            return JSONResponse(content=self.items, headers=self.headers())
+        response.headers.update(self.headers())
+        return self.items
+
+
+# ============================================================================
+# PROJECTION
+# ============================================================================
+
+@lru_cache(maxsize=256)
+def _partial_schema(schema: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """Schema with only the given fields (all optional), for serialization."""
+    return create_model(
+        f"{schema.__name__}Fields",
+        **{name: (Optional[schema.model_fields[name].annotation], None) for name in fields}
+    )
+
+
+def _snake_case(name: str) -> str:
+    """camelCase -> camel_case."""
+    return re.sub(r'(?<!^)(?=[A-Z])', '_', name).lower()
+
+
+def projectable_columns(
+    model,
+    schema: Type[BaseModel],
+    columns: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Map response fields to the SQL expressions that produce them.
+
+    A schema field maps to the model column of the same name, its alias, or
+    its snake_case spelling (camelCase schemas). Endpoints whose response
+    computes a field from something other than the same-named column pass it
+    in columns so projected and full responses agree.
+
+    Args:
+        model: Listed model
+        schema: Response schema
+        columns: Extra or overriding {field: expression} entries
+
+    Returns:
+        {field: expression}
+    """
+    attrs = {attr.key: getattr(model, attr.key) for attr in inspect(model).column_attrs}
+    mapping = {}
+    for name, info in schema.model_fields.items():
+        for candidate in (name, info.alias, _snake_case(name)):
+            if candidate in attrs:
+                mapping[name] = attrs[candidate]
+                break
+    if columns:
+        mapping.update({name: expr for name, expr in columns.items() if name in schema.model_fields})
+    return mapping
+
+
+def projectable_fields(model, schema: Type[BaseModel], columns: Optional[Dict[str, Any]] = None) -> List[str]:
+    """Response fields that can be selected with fields=."""
+    return list(projectable_columns(model, schema, columns))
+
+
+def _projection(mapping: Dict[str, Any], fields: List[str]) -> List[str]:
+    """
+    Validate requested fields and return them with id first.
+
+    Raises:
+        HTTPException: 400 if a field can't be projected
+    """
+    unknown = [name for name in fields if name not in mapping]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown or non-selectable fields: {', '.join(unknown)}. Allowed: {', '.join(mapping)}"
+        )
+    return ['id'] + [name for name in dict.fromkeys(fields) if name != 'id']
+
+
+# ============================================================================
+# COUNT CACHE
+# ============================================================================
+
+class ListCountCache:
+    """
+    Redis-cached row counts for list endpoints.
+
+    Each user's counts for one model live under one key as
+    {filter signature: count}, so a write drops them with a single DELETE.
+    """
+
+    KEY_PREFIX = "list_count"
+    CACHE_TTL = 300  # 5 minutes (upper bound on a missed invalidation)
+
+    def __init__(self):
+        """Initialize count cache with no registered models."""
+        self._owners: Dict[type, OwnersResolver] = {}
+        # Strong references to in-flight invalidations (the loop only keeps weak ones)
+        self._pending_tasks: Set[asyncio.Task] = set()
+
+    def register(self, model, owners: Optional[OwnersResolver] = None) -> None:
+        """
+        Invalidate a model's cached counts when its rows are written.
+
+        Args:
+            model: Model class listed by a paginated endpoint
+            owners: Returns the owning user IDs of a flush's instances, in
+                order (default: each instance's user_id)
+        """
+        self._owners[model] = owners or (lambda session, instances: [i.user_id for i in instances])
+
+    @classmethod
+    def _key(cls, model, user_id: UUID) -> str:
+        return f"{cls.KEY_PREFIX}:{model.__tablename__}:{user_id}"
+
+    async def count(self, db: AsyncSession, model, user_id: UUID, count_stmt) -> int:
+        """
+        Count rows matching count_stmt, using the cached total if present.
+
+        Args:
+            db: Database session
+            model: Listed model
+            user_id: Owning user
+            count_stmt: SELECT COUNT(...) with the list's filters
+
+        Returns:
+            Row count
+        """
+        # Skip the cache if Redis not connected (e.g., in tests)
+        if not redis_client.client:
+            return (await db.execute(count_stmt)).scalar() or 0
+
+        compiled = count_stmt.compile()
+        signature = hashlib.sha256(
+            (str(compiled) + repr(sorted(compiled.params.items()))).encode()
+        ).hexdigest()[:16]
+        key = self._key(model, user_id)
+
+        counts = {}
+        try:
+            counts = await redis_client.get(key, deserialize=True) or {}
+            if signature in counts:
+                return counts[signature]
+        except Exception as e:
+            logger.warning(f"Redis count cache read error: {e}")
+
+        total = (await db.execute(count_stmt)).scalar() or 0
+
+        try:
+            counts[signature] = total
+            await redis_client.set(key, json.dumps(counts), expire=self.CACHE_TTL)
+        except Exception as e:
+            logger.warning(f"Redis count cache write error: {e}")
+        return total
+
+    async def invalidate(self, model, user_id: UUID) -> None:
+        """Drop a user's cached counts for a model."""
+        if not redis_client.client:
+            return
+        try:
+            await redis_client.delete(self._key(model, user_id))
+        except Exception as e:
+            logger.warning(f"Redis count cache delete error: {e}")
+
+    def _task_done(self, task: asyncio.Task) -> None:
+        """Release a finished invalidation and log its failure, if any."""
+        self._pending_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Redis count cache invalidation failed: {task.exception()}")
+
+    def _collect(self, session: Session) -> None:
+        """Record (model, user) pairs written in this flush."""
+        pending = session.info.setdefault('list_count_invalidations', set())
+        written: Dict[type, List[Any]] = {}
+        for instance in (*session.new, *session.dirty, *session.deleted):
+            if type(instance) in self._owners:
+                written.setdefault(type(instance), []).append(instance)
+        for model, instances in written.items():
+            for user_id in self._owners[model](session, instances):
+                if user_id is not None:
+                    pending.add((model, user_id))
+
+    def _dispatch(self, session: Session) -> None:
+        """Invalidate counts written by a committed transaction."""
+        pending = session.info.pop('list_count_invalidations', None)
+        if not pending or not redis_client.client:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No event loop (e.g. sync scripts); the TTL applies
+        for model, user_id in pending:
+            task = loop.create_task(self.invalidate(model, user_id))
+            self._pending_tasks.add(task)
+            task.add_done_callback(self._task_done)
+
+
+# Global list count cache instance
+list_count_cache = ListCountCache()
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_list_count_invalidations(session, flush_context, instances):
+    list_count_cache._collect(session)
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_list_count_invalidations(session):
+    list_count_cache._dispatch(session)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_list_count_invalidations(session):
+    session.info.pop('list_count_invalidations', None)
+
+
+# ============================================================================
+# PAGINATION
+# ============================================================================
+
+async def paginate(
+    db: AsyncSession,
+    model,
+    conditions: Sequence[Any],
+    order_by: OrderSpec,
+    page: PageParams,
+    user_id: UUID,
+    schema: Type[BaseModel],
+    map_item: Optional[Callable[[Any], Any]] = None,
+    columns: Optional[Dict[str, Any]] = None
+) -> Page:
+    """
+    Fetch one page (or the whole list) of a model.
+
+    Args:
+        db: Database session
+        model: Model to list
+        conditions: Filter conditions (ownership, soft delete, query filters)
+        order_by: Sort columns, ending with a unique column (id)
+        page: Request paging parameters
+        user_id: Owning user (for the count cache)
+        schema: Response schema (for projection)
+        map_item: Maps a model instance to its response (default: identity)
+        columns: Projection expressions for fields that map_item doesn't
+            read from the same-named column (see projectable_columns)
+
+    Returns:
+        Page with items, next cursor and total count
+
+    Raises:
+        HTTPException: 400 for a malformed cursor or unknown fields
+    """
+    where = and_(*conditions)
+
+    stmt_conditions = [where]
+    if page.cursor is not None:
+        try:
+            stmt_conditions.append(keyset_condition(order_by, decode_cursor(page.cursor, order_by)))
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    fields = None
+    if page.fields:
+        mapping = projectable_columns(model, schema, columns)
+        fields = _projection(mapping, page.fields)
+        # Sort columns ride along under their own labels for the next cursor
+        stmt = select(
+            *(mapping[name].label(name) for name in fields),
+            *(column.label(f'_sort_{i}') for i, (column, _) in enumerate(order_by))
+        )
+    else:
+        stmt = select(model)
+
+    stmt = stmt.where(*stmt_conditions).order_by(
+        *(column.desc() if descending else column.asc() for column, descending in order_by)
+    )
+    if page.skip:
+        stmt = stmt.offset(page.skip)
+    if page.limit is not None:
+        stmt = stmt.limit(page.limit + 1)
+
+    result = await db.execute(stmt)
+    rows = result.mappings().all() if fields is not None else result.scalars().all()
+
+    next_cursor = None
+    if page.limit is not None and len(rows) > page.limit:
+        rows = rows[:page.limit]
+        last = rows[-1]
+        if fields is not None:
+            values = [last[f'_sort_{i}'] for i in range(len(order_by))]
+        else:
+            values = [getattr(last, column.key) for column, _ in order_by]
+        next_cursor = encode_cursor(order_by, values)
+
+    if page.paginated:
+        total = await list_count_cache.count(
+            db, model, user_id, select(func.count()).select_from(model).where(where)
+        )
+    else:
+        total = len(rows)
+
+    if fields is not None:
+        partial = _partial_schema(schema, tuple(fields))
+        items = [
+            partial.model_validate({name: row[name] for name in fields}).model_dump(mode='json')
+            for row in rows
+        ]
+    else:
+        items = [map_item(row) for row in rows] if map_item else list(rows)
+
+    return Page(items=items, next_cursor=next_cursor, total=total, projected=fields is not None)
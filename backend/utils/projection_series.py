@@ -0,0 +1,220 @@
+"""
+Compact storage for year-by-year projection series.
+
+Projections were stored as JSON lists of per-year objects, repeating every
+key in every year. This module stores them column by column instead, each
+column packed as little-endian float64 and base64 encoded:
+
+    {
+        "format": "columnar",
+        "version": 1,
+        "length": 30,
+        "int_columns": ["year", "age"],
+        "columns": {"year": "<base64>", "net_worth": "<base64>", ...}
+    }
+
+Decoding is lazy. A column is only decoded when it is read, and reading a
+range or a downsampled series decodes only the base64 blocks that cover the
+range (3 values = 24 bytes = 32 base64 characters), so a long series never
+has to be materialized to return part of it.
+
+Legacy lists of per-year objects are still accepted on load.
+
+Performance:
+- Storage is ~11 characters per value against ~25-40 for keyed JSON
+- Range reads are O(range), not O(series length)
+"""
+
+import base64
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+SERIES_FORMAT = "columnar"
+SERIES_VERSION = 1
+
+_DTYPE = np.dtype('<f8')
+# Smallest run of values that maps to whole base64 quads (24 bytes)
+_VALUES_PER_BLOCK = 3
+_CHARS_PER_BLOCK = 32
+
+
+def _encode_column(values) -> str:
+    """Pack a column as base64 little-endian float64."""
+    return base64.b64encode(np.asarray(values, dtype=_DTYPE).tobytes()).decode('ascii')
+
+
+def _decode_column_range(encoded: str, start: int, stop: int) -> np.ndarray:
+    """Decode values [start, stop) of a packed column."""
+    if stop <= start:
+        return np.empty(0, dtype=_DTYPE)
+
+    first_block = start // _VALUES_PER_BLOCK
+    last_block = -(-stop // _VALUES_PER_BLOCK)
+    data = base64.b64decode(encoded[first_block * _CHARS_PER_BLOCK:last_block * _CHARS_PER_BLOCK])
+    values = np.frombuffer(data, dtype=_DTYPE)
+
+    offset = start - first_block * _VALUES_PER_BLOCK
+    return values[offset:offset + stop - start]
+
+
+class ProjectionSeries:
+    """
+    Columnar projection series with lazy decoding.
+
+    Build with from_columns() or from_rows(), persist with to_json() and
+    read stored values back with load().
+    """
+
+    def __init__(self, encoded: Dict[str, Any]):
+        """Wrap a stored (encoded) series."""
+        self._encoded = encoded
+        self._decoded: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def from_columns(
+        cls,
+        columns: Dict[str, Sequence[float]],
+        int_columns: Iterable[str] = ()
+    ) -> "ProjectionSeries":
+        """
+        Build a series from equal-length columns.
+
+        Args:
+            columns: Column name -> values (any array-like)
+            int_columns: Columns returned as ints (e.g. year, age)
+
+        Raises:
+            ValueError: If columns differ in length
+        """
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("Projection series columns must have the same length")
+
+        return cls({
+            'format': SERIES_FORMAT,
+            'version': SERIES_VERSION,
+            'length': lengths.pop() if lengths else 0,
+            'int_columns': [name for name in int_columns if name in columns],
+            'columns': {name: _encode_column(values) for name, values in columns.items()}
+        })
+
+    @classmethod
+    def from_rows(cls, rows: List[Dict[str, Any]]) -> "ProjectionSeries":
+        """Build a series from a list of per-year objects (legacy layout)."""
+        names = list(rows[0].keys()) if rows else []
+        int_columns = [name for name in names if all(isinstance(row[name], int) for row in rows)]
+        return cls.from_columns(
+            {name: [row[name] for row in rows] for name in names},
+            int_columns=int_columns
+        )
+
+    @classmethod
+    def load(cls, stored: Any) -> Optional["ProjectionSeries"]:
+        """
+        Load a stored series, accepting the columnar or legacy row layout.
+
+        Returns:
+            ProjectionSeries, or None if nothing is stored
+        """
+        if stored is None:
+            return None
+        if isinstance(stored, ProjectionSeries):
+            return stored
+        if isinstance(stored, list):
+            return cls.from_rows(stored)
+        if stored.get('format') != SERIES_FORMAT:
+            raise ValueError(f"Unknown projection series format: {stored.get('format')}")
+        return cls(stored)
+
+    def to_json(self) -> Dict[str, Any]:
+        """Stored (encoded) form for a JSON column."""
+        return self._encoded
+
+    def __len__(self) -> int:
+        return self._encoded['length']
+
+    @property
+    def column_names(self) -> List[str]:
+        """Column names in stored order."""
+        return list(self._encoded['columns'].keys())
+
+    def column(self, name: str, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """
+        Values [start, stop) of one column.
+
+        Full columns are decoded once and cached; ranges decode only the
+        blocks they cover.
+
+        Raises:
+            KeyError: If the column does not exist
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if name in self._decoded:
+            return self._decoded[name][start:stop]
+
+        encoded = self._encoded['columns'][name]
+        if start == 0 and stop == len(self):
+            self._decoded[name] = _decode_column_range(encoded, 0, len(self))
+            return self._decoded[name]
+        return _decode_column_range(encoded, start, stop)
+
+    def index_range(
+        self,
+        start_value: Optional[float] = None,
+        end_value: Optional[float] = None,
+        key: str = 'year'
+    ) -> Tuple[int, int]:
+        """
+        Positions [start, stop) where start_value <= key <= end_value.
+
+        The key column must be ascending (e.g. year).
+        """
+        keys = self.column(key)
+        start = 0 if start_value is None else int(np.searchsorted(keys, start_value, side='left'))
+        stop = len(self) if end_value is None else int(np.searchsorted(keys, end_value, side='right'))
+        return start, max(start, stop)
+
+    def window(
+        self,
+        start: int = 0,
+        stop: Optional[int] = None,
+        max_points: Optional[int] = None,
+        columns: Optional[Iterable[str]] = None
+    ) -> Dict[str, List[Any]]:
+        """
+        Columnar values for a range, optionally downsampled.
+
+        Downsampling picks evenly spaced points and always keeps the first
+        and last point of the range.
+
+        Args:
+            start: First position
+            stop: Position after the last (default: end of series)
+            max_points: Maximum points to return (default: all)
+            columns: Columns to return (default: all)
+
+        Returns:
+            Dict of column name -> list of values
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        stop = max(start, stop)
+
+        positions = None
+        if max_points is not None and stop - start > max_points:
+            positions = np.unique(np.linspace(0, stop - start - 1, max(max_points, 1)).round().astype(int))
+
+        int_columns = set(self._encoded.get('int_columns', []))
+        window = {}
+        for name in (columns if columns is not None else self.column_names):
+            values = self.column(name, start, stop)
+            if positions is not None:
+                values = values[positions]
+            window[name] = [int(value) for value in values] if name in int_columns else values.tolist()
+        return window
+
+    def to_rows(self, start: int = 0, stop: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Materialize per-year objects (the legacy layout) for a range."""
+        window = self.window(start, stop)
+        names = list(window.keys())
+        return [dict(zip(names, values)) for values in zip(*window.values())]